@@ -8,6 +8,7 @@ from .horse_info_api import HorseInfoAPI
 from .odds_api import OddsAPI
 from .training_evaluation_api import TrainingEvaluationAPI
 from .searched_race_api import SearchedRaceAPI
+from .common import NetkeibaClient
 
 
 __all__ = [
@@ -17,4 +18,5 @@ __all__ = [
     'OddsAPI',
     'TrainingEvaluationAPI',
     'SearchedRaceAPI',
+    'NetkeibaClient',
 ]
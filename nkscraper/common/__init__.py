@@ -4,13 +4,72 @@
 
 from .netkeiba_field_id import NetkeibaFieldID
 from .netkeiba_category import NetkeibaCategory
+from .netkeiba_archive_mode import NetkeibaArchiveMode
+from .netkeiba_frontier_state import NetkeibaFrontierState
+from .netkeiba_priority import NetkeibaPriority
+from .netkeiba_parser import NetkeibaParser, NetkeibaStrainer, NetkeibaUnavailableError
+from .netkeiba_stream_parser import NetkeibaStreamParser
+from .netkeiba_selector import NetkeibaSelector, NetkeibaTableSelector
+from .netkeiba_table_row import NetkeibaTableRow
+from .netkeiba_race_header import NetkeibaRaceHeader
+from .netkeiba_extractor import NetkeibaExtractor
+from .netkeiba_soup_extractor import NetkeibaSoupExtractor
+from .netkeiba_lxml_extractor import NetkeibaLxmlExtractor
 from .netkeiba_contents import NetkeibaContents
+from .netkeiba_snapshot import NetkeibaSnapshot, NetkeibaRecord
+from .netkeiba_result import NetkeibaResult
+from .netkeiba_rate_limiter import NetkeibaRateLimiter
+from .netkeiba_shared_rate_limiter import NetkeibaSharedRateLimiter
+from .netkeiba_priority_semaphore import NetkeibaPrioritySemaphore
+from .netkeiba_host_controller import NetkeibaHostController, NetkeibaCircuitOpenError
+from .netkeiba_cache import NetkeibaCache, NetkeibaCacheEntry
+from .netkeiba_archive import NetkeibaArchive
+from .netkeiba_packed_archive import NetkeibaPackedArchive, NetkeibaArchiveEntry
+from .netkeiba_response import NetkeibaResponse
+from .netkeiba_transport import NetkeibaTransport
+from .netkeiba_aiohttp_transport import NetkeibaAiohttpTransport
+from .netkeiba_httpx_transport import NetkeibaHttpxTransport
+from .netkeiba_client import NetkeibaClient
 from .netkeiba_requests import NetkeibaRequests
+from .netkeiba_frontier import NetkeibaFrontier
 
 
 __all__ = [
     'NetkeibaCategory',
     'NetkeibaContents',
+    'NetkeibaSnapshot',
+    'NetkeibaRecord',
+    'NetkeibaTableRow',
+    'NetkeibaRaceHeader',
+    'NetkeibaSelector',
+    'NetkeibaTableSelector',
+    'NetkeibaExtractor',
+    'NetkeibaSoupExtractor',
+    'NetkeibaLxmlExtractor',
+    'NetkeibaParser',
+    'NetkeibaStrainer',
+    'NetkeibaUnavailableError',
+    'NetkeibaStreamParser',
+    'NetkeibaResult',
+    'NetkeibaClient',
+    'NetkeibaResponse',
+    'NetkeibaTransport',
+    'NetkeibaAiohttpTransport',
+    'NetkeibaHttpxTransport',
+    'NetkeibaRateLimiter',
+    'NetkeibaSharedRateLimiter',
+    'NetkeibaPriority',
+    'NetkeibaPrioritySemaphore',
+    'NetkeibaHostController',
+    'NetkeibaCircuitOpenError',
+    'NetkeibaCache',
+    'NetkeibaCacheEntry',
+    'NetkeibaArchive',
+    'NetkeibaPackedArchive',
+    'NetkeibaArchiveEntry',
+    'NetkeibaArchiveMode',
     'NetkeibaRequests',
+    'NetkeibaFrontier',
+    'NetkeibaFrontierState',
     'NetkeibaFieldID',
 ]
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+""" netkeiba aiohttp トランスポートモジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.common import NetkeibaTransport, NetkeibaResponse
+
+# OSS
+import aiohttp
+
+# for type declaration only
+from typing import Any, Callable, Mapping
+
+
+class NetkeibaAiohttpTransport(NetkeibaTransport):
+    """ netkeiba aiohttp トランスポートクラス
+
+    コネクションプールを持つ aiohttp.ClientSession で通信する (HTTP/1.1).
+    """
+
+    __ERR_MESSAGE_1701: str = 'セッションが開かれていません.'
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 10, keepalive_timeout: float = 30.0,
+                 connect_timeout: float | None = None, read_timeout: float | None = None,
+                 verify: bool = True) -> None:
+        """ コンストラクタ
+
+        Args:
+            limit (int): コネクションプール全体の最大接続数
+            limit_per_host (int): ホストごとの最大接続数
+            keepalive_timeout (float): Keep-Alive 接続の保持時間 [sec]
+            connect_timeout (float | None): 1リクエストあたりの接続のタイムアウト [sec] (None の場合は aiohttp の既定値)
+            read_timeout (float | None): 1リクエストあたりの読み込みのタイムアウト [sec] (None の場合は制限しない)
+            verify (bool): False の場合, TLS証明書を検証しない (自己署名証明書のテストサーバー用)
+        """
+        self.__limit: int = limit
+        self.__limit_per_host: int = limit_per_host
+        self.__keepalive_timeout: float = keepalive_timeout
+        self.__connect_timeout: float | None = connect_timeout
+        self.__read_timeout: float | None = read_timeout
+        self.__verify: bool = verify
+        self.__session: aiohttp.ClientSession | None = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession | None:
+        """ aiohttp.ClientSession
+
+        Returns:
+            aiohttp.ClientSession | None: コネクションプールを共有するセッション (開かれていない場合はNone)
+        """
+        return self.__session
+
+    @property
+    def is_open(self) -> bool:
+        """ 開かれているか
+
+        Returns:
+            bool: 開かれていればTrue, そうでなければFalse
+        """
+        return self.__session is not None and not self.__session.closed
+
+    async def open(self) -> None:
+        """ セッションを開く
+        """
+        options: dict[str, Any] = {} if self.__verify else {'ssl': False}
+        connector: aiohttp.TCPConnector = aiohttp.TCPConnector(
+            limit=self.__limit,
+            limit_per_host=self.__limit_per_host,
+            keepalive_timeout=self.__keepalive_timeout,
+            **options)
+        timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(
+            total=aiohttp.client.DEFAULT_TIMEOUT.total,
+            sock_connect=aiohttp.client.DEFAULT_TIMEOUT.sock_connect
+            if self.__connect_timeout is None else self.__connect_timeout,
+            sock_read=self.__read_timeout)
+        self.__session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+    async def close(self) -> None:
+        """ セッションを閉じる
+        """
+        if self.__session is not None:
+            await self.__session.close()
+        self.__session = None
+
+    async def request(self, method: str, url: str,
+                      headers: dict[str, str] | None = None) -> NetkeibaResponse:
+        """ リクエストを送信し, レスポンスボディまで読み込む
+
+        Args:
+            method (str): HTTPメソッド (GET, HEAD)
+            url (str): URL
+            headers (dict[str, str] | None): リクエストヘッダー
+
+        Returns:
+            NetkeibaResponse: HTTPレスポンス (HTTPステータスコードが 400 未満の場合)
+
+        Raises:
+            aiohttp.ClientResponseError: HTTPステータスコードが 400 以上の場合
+            aiohttp.ClientError: 通信に失敗した場合
+        """
+        if self.__session is None:
+            raise aiohttp.ClientConnectionError(NetkeibaAiohttpTransport.__ERR_MESSAGE_1701)
+        async with self.__session.request(method, url, headers=headers) as response:
+            response.raise_for_status()
+            body: bytes = await response.read()
+            return NetkeibaResponse(response.status, response.headers, body)
+
+    async def stream(self, method: str, url: str, headers: dict[str, str] | None,
+                     sink: Callable[[bytes], None]) -> NetkeibaResponse:
+        """ リクエストを送信し, 受信したレスポンスボディの断片を順に sink に渡す
+
+        Args:
+            method (str): HTTPメソッド (GET)
+            url (str): URL
+            headers (dict[str, str] | None): リクエストヘッダー
+            sink (Callable[[bytes], None]): レスポンスボディの断片を受け取る関数
+
+        Returns:
+            NetkeibaResponse: HTTPレスポンス (レスポンスボディは空. HTTPステータスコードが 400 未満の場合)
+
+        Raises:
+            aiohttp.ClientResponseError: HTTPステータスコードが 400 以上の場合
+            aiohttp.ClientError: 通信に失敗した場合
+        """
+        if self.__session is None:
+            raise aiohttp.ClientConnectionError(NetkeibaAiohttpTransport.__ERR_MESSAGE_1701)
+        async with self.__session.request(method, url, headers=headers) as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_any():
+                sink(chunk)
+            return NetkeibaResponse(response.status, response.headers, b'')
+
+    def get_error_status(self, error: BaseException) -> int | None:
+        """ request で発生した例外から HTTPステータスコードを取得する
+
+        Args:
+            error (BaseException): 発生した例外
+
+        Returns:
+            int | None: HTTPステータスコード (HTTPステータスコードによる例外でない場合はNone)
+        """
+        return error.status if isinstance(error, aiohttp.ClientResponseError) else None
+
+    def get_error_headers(self, error: BaseException) -> Mapping[str, str] | None:
+        """ request で発生した例外からレスポンスヘッダーを取得する
+
+        Args:
+            error (BaseException): 発生した例外
+
+        Returns:
+            Mapping[str, str] | None: レスポンスヘッダー (HTTPステータスコードによる例外でない場合はNone)
+        """
+        return error.headers if isinstance(error, aiohttp.ClientResponseError) else None
+
+    def is_connection_error(self, error: BaseException) -> bool:
+        """ request で発生した例外が接続エラー・タイムアウトか判定する
+
+        Args:
+            error (BaseException): 発生した例外
+
+        Returns:
+            bool: 接続エラー・タイムアウトであればTrue, そうでなければFalse
+        """
+        return isinstance(error, aiohttp.ClientError) and not isinstance(error, aiohttp.ClientResponseError)
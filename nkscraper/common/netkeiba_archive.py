@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+""" netkeiba Webページアーカイブモジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.common import NetkeibaArchiveMode
+
+# build-in
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+# for type declaration only
+from nkscraper.url import NetkeibaURL
+
+
+class NetkeibaArchive():
+    """ netkeiba Webページアーカイブクラス
+
+    RECORD モードでは, 取得した Webページのレスポンスボディとメタデータをディレクトリに保存する.
+    REPLAY モードでは, 通信せずに保存済みの Webページを返す.
+    """
+
+    def __init__(self, directory: str,
+                 mode: NetkeibaArchiveMode = NetkeibaArchiveMode.REPLAY) -> None:
+        """ コンストラクタ
+
+        Args:
+            directory (str): アーカイブディレクトリ
+            mode (NetkeibaArchiveMode): アーカイブモード
+        """
+        self.__directory: str = directory
+        self.__mode: NetkeibaArchiveMode = mode
+
+    @property
+    def mode(self) -> NetkeibaArchiveMode:
+        """ アーカイブモード
+
+        Returns:
+            NetkeibaArchiveMode: アーカイブモード
+        """
+        return self.__mode
+
+    @property
+    def directory(self) -> str:
+        """ アーカイブディレクトリ
+
+        Returns:
+            str: アーカイブディレクトリ
+        """
+        return self.__directory
+
+    def load(self, url: NetkeibaURL) -> bytes:
+        """ アーカイブから Webページを読み込む
+
+        Args:
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+
+        Returns:
+            bytes: Webページ
+
+        Raises:
+            FileNotFoundError: アーカイブに存在しない場合
+        """
+        body_path, meta_path = self.__get_paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as meta_file:
+                meta: dict = json.load(meta_file)
+            if meta.get('url') != url.url:
+                raise FileNotFoundError(body_path)
+            with open(body_path, 'rb') as body_file:
+                return body_file.read()
+        except (FileNotFoundError, ValueError):
+            raise FileNotFoundError(f'アーカイブに存在しません: {url.url}') from None
+
+    def save(self, url: NetkeibaURL, body: bytes, status: int = 200,
+             headers: dict[str, str] | None = None) -> None:
+        """ Webページをアーカイブに保存する
+
+        Args:
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+            body (bytes): Webページ
+            status (int): HTTPステータスコード
+            headers (dict[str, str] | None): レスポンスヘッダー
+        """
+        body_path, meta_path = self.__get_paths(url)
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        meta: dict = {
+            'url': url.url,
+            'category': url.category.name,
+            'status': status,
+            'headers': {} if headers is None else headers,
+            'size': len(body),
+            'sha256': hashlib.sha256(body).hexdigest(),
+            'fetched_at': time.time(),
+        }
+        self.__write_atomic(body_path, body)
+        self.__write_atomic(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+
+    def __get_paths(self, url: NetkeibaURL) -> tuple[str, str]:
+        """ アーカイブファイルのパスを取得する
+
+        Args:
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+
+        Returns:
+            tuple[str, str]: (レスポンスボディのパス, メタデータのパス)
+        """
+        key: str = hashlib.sha256(url.url.encode('utf-8')).hexdigest()
+        directory: str = os.path.join(self.__directory, url.category.name.lower(), key[:2])
+        return os.path.join(directory, f'{key}.body'), os.path.join(directory, f'{key}.json')
+
+    @staticmethod
+    def __write_atomic(path: str, data: bytes) -> None:
+        """ 一時ファイルに書き込んでから置き換える
+        """
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
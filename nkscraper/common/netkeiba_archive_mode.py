@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+""" netkeiba アーカイブモードモジュール
+"""
+
+# built-in
+from enum import Enum
+
+
+class NetkeibaArchiveMode(Enum):
+    """ netkeiba アーカイブモード
+    """
+    RECORD = 0  # 取得したWebページをアーカイブに保存する
+    REPLAY = 1  # 通信せずにアーカイブからWebページを読み込む
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+""" netkeiba HTTPキャッシュモジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.common import NetkeibaCategory
+
+# build-in
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+# for type declaration only
+from nkscraper.url import NetkeibaURL
+
+
+class NetkeibaCacheEntry():
+    """ netkeiba HTTPキャッシュエントリークラス
+    """
+
+    def __init__(self, body: bytes, stored_at: float,
+                 etag: str | None = None, last_modified: str | None = None) -> None:
+        """ コンストラクタ
+
+        Args:
+            body (bytes): レスポンスボディ
+            stored_at (float): 保存 (再検証) 日時 [UNIX時間]
+            etag (str | None): ETag ヘッダー
+            last_modified (str | None): Last-Modified ヘッダー
+        """
+        self.__body: bytes = body
+        self.__stored_at: float = stored_at
+        self.__etag: str | None = etag
+        self.__last_modified: str | None = last_modified
+
+    @property
+    def body(self) -> bytes:
+        """ レスポンスボディ
+
+        Returns:
+            bytes: レスポンスボディ
+        """
+        return self.__body
+
+    @property
+    def stored_at(self) -> float:
+        """ 保存 (再検証) 日時
+
+        Returns:
+            float: 保存 (再検証) 日時 [UNIX時間]
+        """
+        return self.__stored_at
+
+    @property
+    def etag(self) -> str | None:
+        """ ETag ヘッダー
+
+        Returns:
+            str | None: ETag ヘッダー
+        """
+        return self.__etag
+
+    @property
+    def last_modified(self) -> str | None:
+        """ Last-Modified ヘッダー
+
+        Returns:
+            str | None: Last-Modified ヘッダー
+        """
+        return self.__last_modified
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """ 条件付きGET用のリクエストヘッダー
+
+        Returns:
+            dict[str, str]: If-None-Match / If-Modified-Since ヘッダー
+        """
+        headers: dict[str, str] = {}
+        if self.__etag is not None:
+            headers['If-None-Match'] = self.__etag
+        if self.__last_modified is not None:
+            headers['If-Modified-Since'] = self.__last_modified
+        return headers
+
+
+class NetkeibaCache():
+    """ netkeiba HTTPキャッシュクラス
+
+    NetkeibaURL.url をキーに, レスポンスボディをディスクに保存する.
+    有効期限 (TTL) は NetkeibaCategory ごとに設定し, 期限切れのエントリーは ETag / Last-Modified で再検証する.
+    """
+
+    # NOTE: None は期限なし
+    DEFAULT_TTL: dict[NetkeibaCategory, float | None] = {
+        NetkeibaCategory.SHUTUBA_TABLE: 10 * 60,
+        NetkeibaCategory.RACE_RESULT: None,
+        NetkeibaCategory.ODDS: 60,
+        NetkeibaCategory.TRAINING_EVALUATION: 60 * 60,
+        NetkeibaCategory.HORSE_INFO: 7 * 24 * 60 * 60,
+        NetkeibaCategory.SEARCHED_RACE: 24 * 60 * 60,
+    }
+
+    def __init__(self, directory: str,
+                 ttl: dict[NetkeibaCategory, float | None] | None = None) -> None:
+        """ コンストラクタ
+
+        Args:
+            directory (str): キャッシュディレクトリ
+            ttl (dict[NetkeibaCategory, float | None] | None): カテゴリーごとの有効期限 [sec]
+                (指定しないカテゴリーは DEFAULT_TTL を使用する. None は期限なし)
+        """
+        self.__directory: str = directory
+        self.__ttl: dict[NetkeibaCategory, float | None] = dict(NetkeibaCache.DEFAULT_TTL)
+        if ttl is not None:
+            self.__ttl.update(ttl)
+
+    def load(self, url: NetkeibaURL) -> NetkeibaCacheEntry | None:
+        """ キャッシュを読み込む
+
+        Args:
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+
+        Returns:
+            NetkeibaCacheEntry | None: キャッシュエントリー (キャッシュがない場合はNoneを返す)
+        """
+        body_path, meta_path = self.__get_paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as meta_file:
+                meta: dict = json.load(meta_file)
+            with open(body_path, 'rb') as body_file:
+                body: bytes = body_file.read()
+        except (OSError, ValueError):
+            return None
+
+        # NOTE: ハッシュ衝突に備えてURLを確認する
+        if meta.get('url') != url.url:
+            return None
+        return NetkeibaCacheEntry(body, meta['stored_at'], meta.get('etag'), meta.get('last_modified'))
+
+    def save(self, url: NetkeibaURL, body: bytes,
+             etag: str | None = None, last_modified: str | None = None) -> None:
+        """ キャッシュを保存する
+
+        Args:
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+            body (bytes): レスポンスボディ
+            etag (str | None): ETag ヘッダー
+            last_modified (str | None): Last-Modified ヘッダー
+        """
+        body_path, meta_path = self.__get_paths(url)
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        self.__write_atomic(body_path, body)
+        self.__write_meta(meta_path, url, etag, last_modified)
+
+    def refresh(self, url: NetkeibaURL, entry: NetkeibaCacheEntry) -> None:
+        """ 再検証済み (304 Not Modified) のキャッシュの保存日時を更新する
+
+        Args:
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+            entry (NetkeibaCacheEntry): キャッシュエントリー
+        """
+        _, meta_path = self.__get_paths(url)
+        self.__write_meta(meta_path, url, entry.etag, entry.last_modified)
+
+    def is_fresh(self, url: NetkeibaURL, entry: NetkeibaCacheEntry) -> bool:
+        """ キャッシュが有効期限内か判定する
+
+        Args:
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+            entry (NetkeibaCacheEntry): キャッシュエントリー
+
+        Returns:
+            bool: 有効期限内であればTrue, 期限切れであればFalse
+        """
+        ttl: float | None = self.__ttl.get(url.category)
+        if ttl is None:
+            return True
+        return time.time() - entry.stored_at < ttl
+
+    def __get_paths(self, url: NetkeibaURL) -> tuple[str, str]:
+        """ キャッシュファイルのパスを取得する
+
+        Args:
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+
+        Returns:
+            tuple[str, str]: (レスポンスボディのパス, メタデータのパス)
+        """
+        key: str = hashlib.sha256(url.url.encode('utf-8')).hexdigest()
+        directory: str = os.path.join(self.__directory, url.category.name.lower(), key[:2])
+        return os.path.join(directory, f'{key}.body'), os.path.join(directory, f'{key}.json')
+
+    def __write_meta(self, meta_path: str, url: NetkeibaURL,
+                     etag: str | None, last_modified: str | None) -> None:
+        """ メタデータを書き込む
+        """
+        meta: dict = {
+            'url': url.url,
+            'stored_at': time.time(),
+            'etag': etag,
+            'last_modified': last_modified,
+        }
+        self.__write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+
+    @staticmethod
+    def __write_atomic(path: str, data: bytes) -> None:
+        """ 一時ファイルに書き込んでから置き換える
+        """
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
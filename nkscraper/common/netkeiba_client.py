@@ -0,0 +1,690 @@
+# -*- coding: utf-8 -*-
+""" netkeiba HTTP クライアントモジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.utils import NKScraperLogger
+from nkscraper.common import NetkeibaRateLimiter, NetkeibaSharedRateLimiter, NetkeibaPrioritySemaphore
+from nkscraper.common import NetkeibaCategory, NetkeibaPriority
+from nkscraper.common import NetkeibaHostController, NetkeibaCircuitOpenError
+from nkscraper.common import NetkeibaTransport, NetkeibaAiohttpTransport
+
+# build-in
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+import asyncio
+import concurrent.futures
+import random
+import sys
+import threading
+import time
+
+# OSS
+import aiohttp
+
+# for type declaration only
+from nkscraper.common import NetkeibaCache, NetkeibaArchive, NetkeibaPackedArchive, NetkeibaExtractor
+from concurrent.futures import Executor
+from logging import Logger
+from types import TracebackType
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, Iterator, Mapping, Optional, Type, TypeVar
+
+
+T = TypeVar('T')
+
+
+class NetkeibaClient():
+    """ netkeiba HTTP クライアントクラス
+
+    HTTPトランスポート (既定は aiohttp.ClientSession) を保持し, 複数回の通信で接続を使い回す.
+    非同期コンテキストマネージャ (async with) または同期コンテキストマネージャ (with) として使用する.
+    同期コンテキストマネージャ (または start) で開いた場合は, バックグラウンドスレッドでイベントループを実行し,
+    複数のスレッドから同期APIで共有できる.
+    """
+
+    HOSTS: tuple[str, ...] = (
+        'https://race.netkeiba.com',
+        'https://db.netkeiba.com',
+    )
+
+    DEFAULT_PRIORITY: dict[NetkeibaCategory, NetkeibaPriority] = {
+        NetkeibaCategory.SHUTUBA_TABLE: NetkeibaPriority.NORMAL,
+        NetkeibaCategory.RACE_RESULT: NetkeibaPriority.LOW,
+        NetkeibaCategory.ODDS: NetkeibaPriority.HIGH,
+        NetkeibaCategory.TRAINING_EVALUATION: NetkeibaPriority.NORMAL,
+        NetkeibaCategory.HORSE_INFO: NetkeibaPriority.LOW,
+        NetkeibaCategory.SEARCHED_RACE: NetkeibaPriority.NORMAL,
+    }
+
+    # NOTE: 重複リクエスト (hedging) の待機時間の計算に使用する, カテゴリーごとの直近の応答時間の数
+    LATENCY_WINDOW: int = 100
+    # NOTE: 重複リクエストを送信するために必要な応答時間の数
+    HEDGE_MIN_SAMPLES: int = 20
+
+    # NOTE: NetkeibaClient.priority の with 文の中で有効な優先度
+    __priority_context: ContextVar[NetkeibaPriority | None] = ContextVar('nkscraper_priority', default=None)
+    # NOTE: NetkeibaClient.deadline の with 文の中で有効な締め切り [time.monotonic()]
+    __deadline_context: ContextVar[float | None] = ContextVar('nkscraper_deadline', default=None)
+
+    __ERR_MESSAGE_1301: str = 'NetkeibaClient が開かれていません. with 文, または, async with 文で使用してください.'
+    __ERR_MESSAGE_1302: str = 'async with 文で開いた NetkeibaClient は同期APIから使用できません.'
+    __ERR_MESSAGE_1303: str = 'NetkeibaClient のイベントループ上では同期APIを使用できません. 非同期APIを使用してください.'
+    __ERR_MESSAGE_1304: str = 'aiohttp 以外のトランスポートを使用しているため, aiohttp.ClientSession を取得できません.'
+    __WARN_MESSAGE_1301: str = '事前接続に失敗しました.'
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 10,
+                 keepalive_timeout: float = 30.0, preconnect: bool = False,
+                 max_in_flight: int = 10,
+                 requests_per_second: float | dict[str, float] | None = None,
+                 max_attempts: int = 3, backoff_base: float = 0.5,
+                 backoff_max: float = 10.0, cache: NetkeibaCache | None = None,
+                 archive: NetkeibaArchive | NetkeibaPackedArchive | None = None,
+                 parse_executor: Executor | None = None, partial_parse: bool = False,
+                 priority: dict[NetkeibaCategory, NetkeibaPriority] | None = None,
+                 adaptive_concurrency: bool = False, latency_threshold: float | None = None,
+                 failure_threshold: int | None = None, recovery_timeout: float = 30.0,
+                 connect_timeout: float | None = None, read_timeout: float | None = None,
+                 hedge: dict[NetkeibaCategory, float] | None = None,
+                 rate_limit_store: str | None = None, transport: NetkeibaTransport | None = None,
+                 lazy_parse: bool = False, extractor: NetkeibaExtractor | None = None,
+                 stream_parse: bool = False) -> None:
+        """ コンストラクタ
+
+        Args:
+            limit (int): コネクションプール全体の最大接続数
+            limit_per_host (int): ホスト (race.netkeiba.com, db.netkeiba.com) ごとの最大接続数
+            keepalive_timeout (float): Keep-Alive 接続の保持時間 [sec]
+            preconnect (bool): True の場合, 開始時に各ホストへ事前接続する
+            max_in_flight (int): 同時に実行するリクエストの最大数
+            requests_per_second (float | dict[str, float] | None): ホストごとの1秒あたりの最大リクエスト数
+                (dict の場合はホスト名 (例: 'db.netkeiba.com') ごとに指定する. None の場合は制限しない)
+            max_attempts (int): 1リクエストあたりの最大試行回数
+            backoff_base (float): 再試行時の待機時間の基準値 [sec]
+            backoff_max (float): 再試行時の待機時間の上限 [sec]
+            cache (NetkeibaCache | None): HTTPキャッシュ (None の場合はキャッシュしない)
+            archive (NetkeibaArchive | NetkeibaPackedArchive | None): 記録・再生用の Webページアーカイブ (None の場合は使用しない)
+            parse_executor (Executor | None): Webページを解析する Executor
+                (ThreadPoolExecutor, または, ProcessPoolExecutor. None の場合はイベントループ上で解析する.
+                ProcessPoolExecutor はスナップショットを作成する場合のみ子プロセスで解析し, それ以外は取得時に解析しない)
+            partial_parse (bool): True の場合, 各APIが参照する要素のみを既知の文字コードで解析する
+                (NetkeibaParser.STRAINER_TARGETS, NetkeibaParser.ENCODINGS を参照)
+            priority (dict[NetkeibaCategory, NetkeibaPriority] | None): カテゴリーごとのリクエスト優先度
+                (指定しないカテゴリーは DEFAULT_PRIORITY を使用する)
+            adaptive_concurrency (bool): True の場合, ホストごとの同時実行数を 1 ~ limit_per_host の範囲で
+                応答時間・エラー率に応じて調整する (AIMD)
+            latency_threshold (float | None): 混雑とみなす応答時間 [sec] (None の場合は応答時間で判定しない)
+            failure_threshold (int | None): ホストへの送信を停止する連続失敗回数 (None の場合は停止しない)
+            recovery_timeout (float): ホストへの送信を停止する時間 [sec]
+            connect_timeout (float | None): 1リクエストあたりの接続のタイムアウト [sec] (None の場合は aiohttp の既定値)
+            read_timeout (float | None): 1リクエストあたりの読み込みのタイムアウト [sec] (None の場合は制限しない)
+            hedge (dict[NetkeibaCategory, float] | None): 重複リクエストを送信するカテゴリーと応答時間のパーセンタイル
+                (例: {NetkeibaCategory.ODDS: 0.95}. 応答が直近の応答時間のパーセンタイルを超えた場合,
+                同じリクエストをもう1つ送信し, 先に成功した方を使用する)
+            rate_limit_store (str | None): requests_per_second を複数のプロセスで共有する SQLite データベースファイル
+                (同じファイルを指定した全てのプロセスの合計で制限する. None の場合はプロセスごとに制限する)
+            transport (NetkeibaTransport | None): HTTPトランスポート (例: NetkeibaHttpxTransport.
+                None の場合は limit, limit_per_host, keepalive_timeout, connect_timeout, read_timeout から
+                NetkeibaAiohttpTransport を作成する)
+            lazy_parse (bool): True の場合, 取得時には解析せず, NetkeibaContents.soup に初めてアクセスした時点で解析する
+                (取得した Webページを保存・選別するだけの場合に解析を省略できる. parse_executor は使用しない)
+            extractor (NetkeibaExtractor | None): 各APIが表から値を取り出す抽出エンジン (例: NetkeibaLxmlExtractor.
+                None の場合は NetkeibaSoupExtractor. BeautifulSoup を使用しない抽出エンジンの場合, 取得時には解析しない)
+            stream_parse (bool): True の場合, HTML の Webページを受信しながら lxml で逐次解析し, バイト列を保持しない
+                (NetkeibaLxmlExtractor で大きな Webページの待ち時間と使用メモリを減らす. cache, archive を指定した場合,
+                バイト列を保存するため使用しない. hedge, parse_executor, lazy_parse は使用しない)
+        """
+        self.__logger: Logger = NKScraperLogger.create(__name__)
+
+        self.__limit_per_host: int = limit_per_host
+        self.__preconnect: bool = preconnect
+        self.__max_in_flight: int = max_in_flight
+        self.__requests_per_second: float | dict[str, float] | None = requests_per_second
+        self.__max_attempts: int = max(1, max_attempts)
+        self.__backoff_base: float = backoff_base
+        self.__backoff_max: float = backoff_max
+        self.__cache: NetkeibaCache | None = cache
+        self.__archive: NetkeibaArchive | NetkeibaPackedArchive | None = archive
+        self.__parse_executor: Executor | None = parse_executor
+        self.__partial_parse: bool = partial_parse
+        self.__lazy_parse: bool = lazy_parse
+        self.__extractor: NetkeibaExtractor | None = extractor
+        self.__stream_parse: bool = stream_parse
+        self.__priority: dict[NetkeibaCategory, NetkeibaPriority] = dict(NetkeibaClient.DEFAULT_PRIORITY)
+        if priority is not None:
+            self.__priority.update(priority)
+        self.__adaptive_concurrency: bool = adaptive_concurrency
+        self.__latency_threshold: float | None = latency_threshold
+        self.__failure_threshold: int | None = failure_threshold
+        self.__recovery_timeout: float = recovery_timeout
+        self.__hedge: dict[NetkeibaCategory, float] = {} if hedge is None else dict(hedge)
+        self.__rate_limit_store: str | None = rate_limit_store
+        self.__latencies: dict[NetkeibaCategory, deque[float]] = {}
+
+        self.__transport: NetkeibaTransport = NetkeibaAiohttpTransport(
+            limit, limit_per_host, keepalive_timeout, connect_timeout, read_timeout) \
+            if transport is None else transport
+        self.__loop: asyncio.AbstractEventLoop | None = None
+        self.__thread: threading.Thread | None = None
+        self.__thread_lock: threading.Lock = threading.Lock()
+        self.__semaphore: NetkeibaPrioritySemaphore | None = None
+        self.__rate_limiters: dict[str, NetkeibaRateLimiter | NetkeibaSharedRateLimiter | None] = {}
+        self.__host_controllers: dict[str, NetkeibaHostController] = {}
+        # NOTE: {キー: [実行中のタスク, 待機中の呼び出し元の数]}
+        self.__in_flight: dict[str, list[Any]] = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """ aiohttp.ClientSession (NetkeibaAiohttpTransport を使用している場合)
+
+        Returns:
+            aiohttp.ClientSession: コネクションプールを共有するセッション
+        """
+        transport: NetkeibaTransport = self.transport
+        if not isinstance(transport, NetkeibaAiohttpTransport) or transport.session is None:
+            self.__logger.error(NetkeibaClient.__ERR_MESSAGE_1304)
+            sys.exit()
+        return transport.session
+
+    @property
+    def transport(self) -> NetkeibaTransport:
+        """ HTTPトランスポート
+
+        Returns:
+            NetkeibaTransport: 接続を共有するHTTPトランスポート
+        """
+        if not self.__transport.is_open:
+            self.__logger.error(NetkeibaClient.__ERR_MESSAGE_1301)
+            sys.exit()
+        return self.__transport
+
+    @property
+    def max_attempts(self) -> int:
+        """ 1リクエストあたりの最大試行回数
+
+        Returns:
+            int: 1リクエストあたりの最大試行回数
+        """
+        return self.__max_attempts
+
+    @property
+    def cache(self) -> NetkeibaCache | None:
+        """ HTTPキャッシュ
+
+        Returns:
+            NetkeibaCache | None: HTTPキャッシュ (キャッシュしない場合はNone)
+        """
+        return self.__cache
+
+    @property
+    def archive(self) -> NetkeibaArchive | NetkeibaPackedArchive | None:
+        """ 記録・再生用の Webページアーカイブ
+
+        Returns:
+            NetkeibaArchive | NetkeibaPackedArchive | None: Webページアーカイブ (使用しない場合はNone)
+        """
+        return self.__archive
+
+    @property
+    def parse_executor(self) -> Executor | None:
+        """ Webページを解析する Executor
+
+        Returns:
+            Executor | None: Executor (イベントループ上で解析する場合はNone)
+        """
+        return self.__parse_executor
+
+    @property
+    def partial_parse(self) -> bool:
+        """ 各APIが参照する要素のみを解析するか
+
+        Returns:
+            bool: 部分解析する場合はTrue, Webページ全体を解析する場合はFalse
+        """
+        return self.__partial_parse
+
+    @property
+    def lazy_parse(self) -> bool:
+        """ 取得時の解析を省略するか
+
+        Returns:
+            bool: NetkeibaContents.soup にアクセスした時点で解析する場合はTrue, 取得時に解析する場合はFalse
+        """
+        return self.__lazy_parse
+
+    @property
+    def extractor(self) -> NetkeibaExtractor | None:
+        """ 抽出エンジン
+
+        Returns:
+            NetkeibaExtractor | None: 各APIが表から値を取り出す抽出エンジン (None の場合は NetkeibaSoupExtractor)
+        """
+        return self.__extractor
+
+    @property
+    def stream_parse(self) -> bool:
+        """ 受信しながら逐次解析するか
+
+        Returns:
+            bool: HTML の Webページを受信しながら逐次解析する場合はTrue, そうでなければFalse
+        """
+        return self.__stream_parse
+
+    @property
+    def is_open(self) -> bool:
+        """ セッションが開かれているか
+
+        Returns:
+            bool: セッションが開かれていればTrue, そうでなければFalse
+        """
+        return self.__transport.is_open
+
+    async def open(self) -> None:
+        """ セッションを開く
+
+        preconnect が True の場合は, 続けて各ホストへ事前接続する.
+        """
+        if self.is_open:
+            return
+
+        await self.__transport.open()
+        self.__semaphore = NetkeibaPrioritySemaphore(self.__max_in_flight)
+        self.__rate_limiters = {}
+        self.__host_controllers = {}
+        self.__in_flight = {}
+
+        if self.__preconnect:
+            await self.preconnect()
+
+    async def close(self) -> None:
+        """ セッションを閉じる
+        """
+        await self.__transport.close()
+        for rate_limiter in self.__rate_limiters.values():
+            if isinstance(rate_limiter, NetkeibaSharedRateLimiter):
+                rate_limiter.close()
+        self.__rate_limiters = {}
+
+    async def preconnect(self) -> None:
+        """ 各ホストへ事前接続する
+
+        DNS解決, TCP/TLSハンドシェイクを済ませた Keep-Alive 接続をコネクションプールに残す.
+        """
+        async def __async_process(host: str) -> None:
+            """ 非同期処理
+            """
+            try:
+                await self.transport.request('HEAD', f'{host}/')
+            except Exception as e:
+                self.__logger.warning(f'{NetkeibaClient.__WARN_MESSAGE_1301} {host}: {e}')
+
+        await asyncio.gather(*[__async_process(host) for host in NetkeibaClient.HOSTS])
+
+    @contextmanager
+    def priority(self, priority: NetkeibaPriority) -> Iterator[None]:
+        """ with 文の中で開始するリクエストの優先度を指定する
+
+        カテゴリーごとの優先度より優先する. with 文の中で作成したタスクにも引き継がれる.
+
+        Args:
+            priority (NetkeibaPriority): リクエスト優先度
+        """
+        token = NetkeibaClient.__priority_context.set(priority)
+        try:
+            yield
+        finally:
+            NetkeibaClient.__priority_context.reset(token)
+
+    @contextmanager
+    def deadline(self, timeout: float) -> Iterator[None]:
+        """ with 文の中で開始するリクエストの締め切りを指定する
+
+        with 文に入った時点から timeout 秒後までに取得できなかったリクエストは中止し, 失敗とする.
+        with 文の中で作成したタスクにも引き継がれる. 入れ子にした場合は, 早い方の締め切りを使用する.
+
+        Args:
+            timeout (float): 締め切りまでの時間 [sec]
+        """
+        deadline: float = time.monotonic() + timeout
+        outer_deadline: float | None = NetkeibaClient.__deadline_context.get()
+        if outer_deadline is not None:
+            deadline = min(deadline, outer_deadline)
+        token = NetkeibaClient.__deadline_context.set(deadline)
+        try:
+            yield
+        finally:
+            NetkeibaClient.__deadline_context.reset(token)
+
+    def get_remaining_time(self) -> float | None:
+        """ 締め切りまでの残り時間を取得する
+
+        Returns:
+            float | None: 残り時間 [sec] (締め切りが指定されていない場合はNone)
+        """
+        deadline: float | None = NetkeibaClient.__deadline_context.get()
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+
+    def record_latency(self, category: NetkeibaCategory, latency: float) -> None:
+        """ 応答時間を記録する
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+            latency (float): 応答時間 [sec]
+        """
+        if category not in self.__latencies:
+            self.__latencies[category] = deque(maxlen=NetkeibaClient.LATENCY_WINDOW)
+        self.__latencies[category].append(latency)
+
+    def get_hedge_delay(self, category: NetkeibaCategory) -> float | None:
+        """ 重複リクエストを送信するまでの待機時間を取得する
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+
+        Returns:
+            float | None: 待機時間 [sec] (重複リクエストを送信しない場合はNoneを返す)
+        """
+        percentile: float | None = self.__hedge.get(category)
+        latencies: deque[float] | None = self.__latencies.get(category)
+        if percentile is None or latencies is None or len(latencies) < NetkeibaClient.HEDGE_MIN_SAMPLES:
+            return None
+        sorted_latencies: list[float] = sorted(latencies)
+        index: int = min(len(sorted_latencies) - 1, int(percentile * len(sorted_latencies)))
+        return sorted_latencies[index]
+
+    def get_priority(self, category: NetkeibaCategory) -> NetkeibaPriority:
+        """ リクエストの優先度を取得する
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+
+        Returns:
+            NetkeibaPriority: priority の with 文で指定された優先度, または, カテゴリーごとの優先度
+        """
+        priority: NetkeibaPriority | None = NetkeibaClient.__priority_context.get()
+        if priority is not None:
+            return priority
+        return self.__priority.get(category, NetkeibaPriority.NORMAL)
+
+    @asynccontextmanager
+    async def slot(self, url: str,
+                   priority: NetkeibaPriority = NetkeibaPriority.NORMAL) -> AsyncIterator[None]:
+        """ リクエストの実行枠を取得する
+
+        ホストごとの実行枠 (NetkeibaHostController) を取得し, ホストごとのレートリミッターでトークンを取得した後,
+        同時実行数が max_in_flight 未満になるまで待機する.
+        実行枠の待機中は, 優先度の高いリクエストから順に実行枠を割り当てる.
+        トークンは実行枠を取得する前に待つため, レート制限中のホストへのリクエストが実行枠を占有しない.
+        リクエストの結果 (応答時間, 混雑・障害による失敗, Retry-After) はホストごとの実行枠に反映する.
+
+        Args:
+            url (str): リクエスト先URL
+            priority (NetkeibaPriority): リクエスト優先度
+
+        Raises:
+            NetkeibaCircuitOpenError: ホストへの送信を停止している場合
+        """
+        if self.__semaphore is None:
+            self.__logger.error(NetkeibaClient.__ERR_MESSAGE_1301)
+            sys.exit()
+
+        host: str = urlsplit(url).netloc
+        host_controller: NetkeibaHostController = self.get_host_controller(host)
+        probe: bool = await host_controller.acquire(priority.value)
+
+        semaphore: NetkeibaPrioritySemaphore = self.__semaphore
+        start: float = time.monotonic()
+        failure: bool | None = None
+        retry_after: float | None = None
+        try:
+            # NOTE: トークンの待機中に実行枠を占有すると, 優先度の高い他のホストへのリクエストが待たされる
+            rate_limiter: NetkeibaRateLimiter | NetkeibaSharedRateLimiter | None = self.__get_rate_limiter(host)
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            await semaphore.acquire(priority.value)
+            try:
+                # NOTE: 待機中にホストへの送信を停止した場合は, 送信せずに失敗させる
+                if not probe:
+                    probe = host_controller.check()
+                start = time.monotonic()
+                yield
+            finally:
+                semaphore.release()
+            failure = False
+        except NetkeibaCircuitOpenError:
+            # NOTE: 送信していないため, 結果に反映しない
+            raise
+        except Exception as e:
+            failure = self.is_retryable(e)
+            retry_after = self.__get_retry_after(e)
+            raise
+        finally:
+            host_controller.release(time.monotonic() - start, failure, retry_after, probe)
+
+    def get_host_controller(self, host: str) -> NetkeibaHostController:
+        """ ホストの実行枠を取得する
+
+        Args:
+            host (str): ホスト名 (例: 'db.netkeiba.com')
+
+        Returns:
+            NetkeibaHostController: ホストの実行枠 (同時実行数, サーキットブレーカー)
+        """
+        if host not in self.__host_controllers:
+            self.__host_controllers[host] = NetkeibaHostController(
+                self.__limit_per_host,
+                adaptive=self.__adaptive_concurrency,
+                latency_threshold=self.__latency_threshold,
+                failure_threshold=self.__failure_threshold,
+                recovery_timeout=self.__recovery_timeout)
+        return self.__host_controllers[host]
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """ ホストの混雑・障害による (再試行すべき) 失敗か判定する
+
+        Args:
+            error (BaseException): 発生した例外
+
+        Returns:
+            bool: 混雑・障害 (408, 429, 5xx, 接続エラー, タイムアウト) であればTrue, そうでなければFalse
+        """
+        status: int | None = self.__transport.get_error_status(error)
+        if status is not None:
+            return status in (408, 429) or status >= 500
+        return self.__transport.is_connection_error(error) or isinstance(error, asyncio.TimeoutError)
+
+    def __get_retry_after(self, error: BaseException) -> float | None:
+        """ Retry-After ヘッダーを取得する
+
+        Args:
+            error (BaseException): 発生した例外
+
+        Returns:
+            float | None: 待機時間 [sec] (Retry-After ヘッダーがない場合はNoneを返す)
+        """
+        headers: Mapping[str, str] | None = self.__transport.get_error_headers(error)
+        if headers is None:
+            return None
+        value: str | None = headers.get('Retry-After')
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    async def coalesce(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """ 同じキーの処理を1つにまとめて実行する (Single-flight)
+
+        同じキーの処理が実行中であれば新たに実行せず, その結果を共有する.
+        全ての呼び出し元がキャンセルされた場合は, 実行中の処理もキャンセルする.
+
+        Args:
+            key (str): キー (例: URL)
+            factory (Callable[[], Awaitable[T]]): 処理を開始する関数
+
+        Returns:
+            T: 処理の戻り値
+        """
+        flight: list[Any] | None = self.__in_flight.get(key)
+        if flight is None:
+            task: asyncio.Future[T] = asyncio.ensure_future(factory())
+            flight = [task, 0]
+            self.__in_flight[key] = flight
+
+            def __done(_: asyncio.Future[T]) -> None:
+                """ 完了した処理を登録から除外する
+                """
+                if self.__in_flight.get(key) is flight:
+                    del self.__in_flight[key]
+
+            task.add_done_callback(__done)
+
+        flight[1] += 1
+        try:
+            return await asyncio.shield(flight[0])
+        finally:
+            flight[1] -= 1
+            if flight[1] == 0 and not flight[0].done():
+                flight[0].cancel()
+
+    def backoff(self, attempt: int) -> float:
+        """ 再試行までの待機時間を計算する
+
+        指数バックオフ (上限 backoff_max) の範囲で一様乱数を取る (Full Jitter).
+
+        Args:
+            attempt (int): 失敗した試行の回数 (1始まり)
+
+        Returns:
+            float: 待機時間 [sec]
+        """
+        ceiling: float = min(self.__backoff_max, self.__backoff_base * (2 ** (attempt - 1)))
+        return random.uniform(0.0, ceiling)
+
+    def __get_rate_limiter(self, host: str) -> NetkeibaRateLimiter | NetkeibaSharedRateLimiter | None:
+        """ ホストのレートリミッターを取得する
+
+        Args:
+            host (str): ホスト名
+
+        Returns:
+            NetkeibaRateLimiter | NetkeibaSharedRateLimiter | None: レートリミッター (制限しない場合はNoneを返す)
+        """
+        if host not in self.__rate_limiters:
+            rate: float | None = self.__requests_per_second \
+                if not isinstance(self.__requests_per_second, dict) \
+                else self.__requests_per_second.get(host)
+            if rate is None:
+                self.__rate_limiters[host] = None
+            elif self.__rate_limit_store is not None:
+                self.__rate_limiters[host] = NetkeibaSharedRateLimiter(self.__rate_limit_store, host, rate)
+            else:
+                self.__rate_limiters[host] = NetkeibaRateLimiter(rate)
+        return self.__rate_limiters[host]
+
+    def start(self) -> NetkeibaClient:
+        """ バックグラウンドスレッドでイベントループを開始し, セッションを開く
+
+        開始後は, 複数のスレッドから同期API (create, create_by_list 等) で同じ NetkeibaClient を共有できる.
+        with 文で使用する場合は自動で呼び出される. 終了時は stop を呼び出す.
+
+        Returns:
+            NetkeibaClient: 自身
+        """
+        with self.__thread_lock:
+            if self.__loop is not None:
+                return self
+            loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+            thread: threading.Thread = threading.Thread(
+                target=NetkeibaClient.__run_loop, args=(loop,), name='nkscraper-client', daemon=True)
+            thread.start()
+            self.__loop = loop
+            self.__thread = thread
+        self.run(self.open())
+        return self
+
+    def stop(self) -> None:
+        """ セッションを閉じ, バックグラウンドスレッドのイベントループを終了する
+        """
+        with self.__thread_lock:
+            loop: asyncio.AbstractEventLoop | None = self.__loop
+            thread: threading.Thread | None = self.__thread
+            if loop is None or thread is None:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self.close(), loop).result()
+            finally:
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+                loop.close()
+                self.__loop = None
+                self.__thread = None
+
+    def run(self, coroutine: Coroutine[Any, Any, Any]) -> Any:
+        """ バックグラウンドスレッドのイベントループ上でコルーチンを実行し, 完了まで待機する
+
+        スレッドセーフであり, 複数のスレッドから同時に呼び出せる.
+        呼び出し元のコンテキスト (priority, deadline の with 文) はコルーチンに引き継がれる.
+
+        Args:
+            coroutine (Coroutine): 実行するコルーチン
+
+        Returns:
+            Any: コルーチンの戻り値
+        """
+        loop: asyncio.AbstractEventLoop | None = self.__loop
+        if loop is None:
+            coroutine.close()
+            if self.is_open:
+                self.__logger.error(NetkeibaClient.__ERR_MESSAGE_1302)
+            else:
+                self.__logger.error(NetkeibaClient.__ERR_MESSAGE_1301)
+            sys.exit()
+        if threading.current_thread() is self.__thread:
+            coroutine.close()
+            self.__logger.error(NetkeibaClient.__ERR_MESSAGE_1303)
+            sys.exit()
+
+        future: concurrent.futures.Future[Any] = asyncio.run_coroutine_threadsafe(coroutine, loop)
+        try:
+            return future.result()
+        except BaseException:
+            # NOTE: 呼び出し元が中断された場合 (KeyboardInterrupt 等) は, イベントループ上の処理もキャンセルする
+            future.cancel()
+            raise
+
+    @staticmethod
+    def __run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        """ バックグラウンドスレッドでイベントループを実行する
+        """
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    # Context Manager ---------------------------------------------------------
+    def __enter__(self) -> NetkeibaClient:
+        return self.start()
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.stop()
+
+    async def __aenter__(self) -> NetkeibaClient:
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type: Optional[Type[BaseException]],
+                        exc_value: Optional[BaseException],
+                        traceback: Optional[TracebackType]) -> None:
+        await self.close()
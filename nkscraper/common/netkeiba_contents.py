@@ -2,26 +2,65 @@
 """ netkeiba Webページコンテンツモジュール
 """
 
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.utils import NKScraperLogger
+from nkscraper.common import NetkeibaParser, NetkeibaSoupExtractor
+
+# build-in
+import sys
+
+# OSS
+from lxml import html
+
 # for type declaration only
-from nkscraper.common import NetkeibaCategory
+from nkscraper.common import NetkeibaCategory, NetkeibaExtractor
 from nkscraper.url import NetkeibaURL
+from logging import Logger
+from typing import Any
 from bs4 import BeautifulSoup
 
 
 class NetkeibaContents():
     """ netkeiba Webページコンテンツクラス
+
+    Webページのバイト列を保持し, soup に初めてアクセスした時点で解析する.
+    解析結果は release で解放でき, 次にアクセスした時点で再度解析する.
+    受信しながら逐次解析した場合は, バイト列の代わりに lxml のルート要素 (document) を保持する.
+    解析済みの soup のみから作成した場合 (取得時に解析した場合) は, バイト列を保持しない代わりに release で解放できない.
+    同じ NetkeibaContents を複数のスクレイピングAPIが共有する場合 (重複したURLなど) に備えて, 参照するAPIの数を数え,
+    全てのAPIが detach した時点で soup を decompose する.
     """
 
-    def __init__(self, url: NetkeibaURL, soup: BeautifulSoup) -> None:
+    __ERR_MESSAGE_1901: str = 'soup, html_byte, document のいずれかを指定してください.'
+    __ERR_MESSAGE_1902: str = '解析結果を解放済みのため, 再解析できません.'
+
+    def __init__(self, url: NetkeibaURL, soup: BeautifulSoup | None = None,
+                 html_byte: bytes | None = None, partial: bool = False,
+                 extractor: NetkeibaExtractor | None = None, document: Any | None = None) -> None:
         """ コンストラクタ
 
         Args:
             url (NetkeibaURL): NetkeibaURL オブジェクト
-            soup (BeautifulSoup): netkeiba Webページ BeautifulSoupオブジェクト
+            soup (BeautifulSoup | None): netkeiba Webページ BeautifulSoupオブジェクト (解析済みの場合)
+            html_byte (bytes | None): netkeiba Webページ (soup を省略した場合は, アクセスした時点で解析する)
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+            extractor (NetkeibaExtractor | None): 各APIが表から値を取り出す抽出エンジン (省略時は NetkeibaSoupExtractor)
+            document (Any | None): 逐次解析した lxml のルート要素 (html_byte を保持しない場合)
         """
+        if soup is None and html_byte is None and document is None:
+            logger: Logger = NKScraperLogger.create(__name__)
+            logger.error(NetkeibaContents.__ERR_MESSAGE_1901)
+            sys.exit()
         self.__url: str = url.url
         self.__category: NetkeibaCategory = url.category
-        self.__soup: BeautifulSoup = soup
+        self.__soup: BeautifulSoup | None = soup
+        self.__html_byte: bytes | None = html_byte
+        self.__partial: bool = partial
+        self.__document: Any | None = document
+        self.__extractor: NetkeibaExtractor = NetkeibaSoupExtractor() if extractor is None else extractor
+        self.__num_attached: int = 0
 
     @property
     def category(self) -> NetkeibaCategory:
@@ -36,11 +75,61 @@ class NetkeibaContents():
     def soup(self) -> BeautifulSoup:
         """ BeautifulSoupオブジェクト
 
+        未解析の場合は, Webページを解析する.
+        バイト列を保持していない場合は, document を HTML に変換して解析する.
+
         Returns:
             BeautifulSoup: BeautifulSoupオブジェクト
         """
+        if self.__soup is None:
+            if self.__html_byte is None and self.__document is None:
+                logger: Logger = NKScraperLogger.create(__name__)
+                logger.error(NetkeibaContents.__ERR_MESSAGE_1902)
+                sys.exit()
+            html_byte: bytes | None = self.__html_byte
+            if html_byte is None:
+                # NOTE: 文字コードを指定して変換し, partial の場合と同じ文字コードで解析する
+                html_byte = html.tostring(
+                    self.__document, encoding=NetkeibaParser.ENCODINGS.get(self.__category) or 'utf-8')
+            self.__soup = NetkeibaParser.parse(html_byte, self.__category, self.__partial)
         return self.__soup
 
+    @property
+    def extractor(self) -> NetkeibaExtractor:
+        """ 抽出エンジン
+
+        Returns:
+            NetkeibaExtractor: 各APIが表から値を取り出す抽出エンジン
+        """
+        return self.__extractor
+
+    @property
+    def html_byte(self) -> bytes | None:
+        """ Webページのバイト列
+
+        Returns:
+            bytes | None: Webページ (解析済みの soup, または, 逐次解析した document のみから作成した場合はNone)
+        """
+        return self.__html_byte
+
+    @property
+    def document(self) -> Any | None:
+        """ 逐次解析した lxml のルート要素
+
+        Returns:
+            Any | None: lxml のルート要素 (受信しながら逐次解析していない場合はNone)
+        """
+        return self.__document
+
+    @property
+    def is_parsed(self) -> bool:
+        """ 解析済みか
+
+        Returns:
+            bool: 解析済みであればTrue, そうでなければFalse
+        """
+        return self.__soup is not None
+
     @property
     def url(self) -> str:
         """ netkeiba WebページURL
@@ -49,3 +138,48 @@ class NetkeibaContents():
             str: netkeiba WebページURL
         """
         return self.__url
+
+    def release(self, decompose: bool = False) -> None:
+        """ 解析結果 (soup) を解放する
+
+        Webページのバイト列, または, document を保持していない場合は, 再解析できないため解放しない.
+
+        Args:
+            decompose (bool): True の場合, soup を decompose して木の参照の循環を切り, ガベージコレクションを待たずに解放する
+                (attach したスクレイピングAPIが残っている場合は, 表の要素を参照しているため decompose しない)
+        """
+        if self.__html_byte is not None or self.__document is not None:
+            if decompose and self.__soup is not None and self.__num_attached == 0:
+                NetkeibaContents.__decompose(self.__soup)
+            self.__soup = None
+
+    def attach(self) -> None:
+        """ スクレイピングAPIが参照を開始する (スクレイピングAPIのコンストラクタで呼び出す)
+        """
+        self.__num_attached += 1
+
+    def detach(self) -> None:
+        """ スクレイピングAPIが参照を終了する (スナップショットを作成して解放する時点で呼び出す)
+
+        全てのスクレイピングAPIが参照を終了した場合は, soup を decompose して解放する.
+        バイト列, または, document を保持していない場合は, 以降 soup を参照できない.
+        """
+        self.__num_attached = max(0, self.__num_attached - 1)
+        if self.__num_attached == 0 and self.__soup is not None:
+            NetkeibaContents.__decompose(self.__soup)
+            self.__soup = None
+
+    @staticmethod
+    def __decompose(soup: BeautifulSoup) -> None:
+        """ soup を decompose して木の参照の循環を切る
+
+        BeautifulSoup オブジェクト自体の decompose では子孫要素を破棄しないため, 最上位の子要素ごとに decompose する.
+
+        Args:
+            soup (BeautifulSoup): BeautifulSoupオブジェクト
+        """
+        for child in list(soup.contents):
+            child.decompose()
+        # NOTE: 解析終了時の状態 (currentTag, tagStack) が BeautifulSoup オブジェクト自身を参照している
+        soup.currentTag = None
+        soup.tagStack = []
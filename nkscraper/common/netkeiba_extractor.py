@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+""" netkeiba 抽出エンジンモジュール
+"""
+
+from __future__ import annotations
+
+# built-in
+from abc import ABC, abstractmethod
+
+# for type declaration only
+from nkscraper.common import NetkeibaSelector, NetkeibaTableSelector, NetkeibaTableRow
+from typing import Any, TYPE_CHECKING
+if TYPE_CHECKING:
+    from nkscraper.common import NetkeibaContents
+
+
+class NetkeibaExtractor(ABC):
+    """ netkeiba 抽出エンジンインターフェース
+
+    各APIが宣言した NetkeibaTableSelector, NetkeibaSelector で Webページの表から値を取り出す.
+    どの実装でも, 同じ Webページからは同じ値 (文字列) を取り出し, 要素がない場合は同じ例外を送出する.
+    """
+
+    @property
+    @abstractmethod
+    def uses_soup(self) -> bool:
+        """ BeautifulSoup で解析した Webページを使用するか
+
+        Returns:
+            bool: BeautifulSoupオブジェクトを使用する場合はTrue, そうでなければFalse
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def parse(self, contents: NetkeibaContents) -> Any:
+        """ Webページを解析する
+
+        Args:
+            contents (NetkeibaContents): netkeiba Webページコンテンツ
+
+        Returns:
+            Any: 解析した文書 (実装ごとの型)
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def find_rows(self, document: Any, table: NetkeibaTableSelector) -> list[Any] | None:
+        """ 表の行を取得する
+
+        Args:
+            document (Any): parse で解析した文書
+            table (NetkeibaTableSelector): netkeiba 表セレクター
+
+        Returns:
+            list[Any] | None: 行 (tr) 配列 (表がない場合はNone)
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def create_row(self, row: Any) -> NetkeibaTableRow:
+        """ 表の行の子孫要素を走査して NetkeibaTableRow を作成する
+
+        Args:
+            row (Any): find_rows で取得した行 (tr)
+
+        Returns:
+            NetkeibaTableRow: netkeiba 表の行
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def extract(self, row: NetkeibaTableRow, selector: NetkeibaSelector) -> str:
+        """ 表の行から値を取り出す
+
+        Args:
+            row (NetkeibaTableRow): netkeiba 表の行
+            selector (NetkeibaSelector): netkeiba セレクター
+
+        Returns:
+            str: 子ノードの文字列, または, 属性値
+
+        Raises:
+            AttributeError: 要素が存在しない場合
+            IndexError: セル・子ノードが存在しない場合
+            KeyError: 属性が存在しない場合
+        """
+        raise NotImplementedError()
@@ -0,0 +1,401 @@
+# -*- coding: utf-8 -*-
+""" netkeiba クロールフロンティアモジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.utils import NKScraperLogger
+from nkscraper.common import NetkeibaCategory, NetkeibaFrontierState, NetkeibaClient, NetkeibaRequests
+from nkscraper.url import NetkeibaURLFactory
+
+# build-in
+import asyncio
+from contextlib import contextmanager
+import inspect
+import os
+import socket
+import sqlite3
+import sys
+import time
+import uuid
+import zlib
+
+# for type declaration only
+from nkscraper.common import NetkeibaContents, NetkeibaResult
+from nkscraper.url import NetkeibaURL
+from logging import Logger
+from types import TracebackType
+from typing import Any, Callable, Iterable, Iterator, Optional, Type
+
+
+class NetkeibaFrontier():
+    """ netkeiba クロールフロンティアクラス
+
+    取得する (カテゴリー, ID) と取得状態 (未取得, 取得中, 取得済み, 取得失敗), 試行回数を SQLite に保存する.
+    クロールが中断しても, 同じファイルを指定して再開すれば未取得のIDから取得を続ける.
+    一度追加したIDは, 取得済みであっても再度追加されない.
+
+    複数のプロセスで分担する場合は, 同じファイルを共有する (取り出しは排他的に行う) か,
+    shard を指定してプロセスごとのファイルに担当するIDのみを追加する.
+    取り出したIDには, 取り出したワーカー (worker_id) と取り出した時刻をリースとして記録する.
+    リースは取得中に更新し, 期限 (lease_duration) が切れたIDのみを他のワーカーが取り戻す.
+    そのため, 同じファイルを共有する他のプロセスが取得中のIDを重複して取得しない.
+    """
+
+    __ERR_MESSAGE_1501: str = 'クロールフロンティアに対応していないカテゴリーです.'
+    __ERR_MESSAGE_1502: str = 'シャードの指定が不正です. (番号, シャード数) を 0 <= 番号 < シャード数 で指定してください.'
+
+    def __init__(self, path: str, max_attempts: int = 3, shard: tuple[int, int] | None = None,
+                 worker_id: str | None = None, lease_duration: float = 600.0, wal: bool = False) -> None:
+        """ コンストラクタ
+
+        Args:
+            path (str): SQLite データベースファイル
+            max_attempts (int): 1つのIDあたりの最大試行回数 (到達した場合は取得失敗とする)
+            shard (tuple[int, int] | None): 担当するシャード (番号, シャード数).
+                指定した場合, get_shard が番号と一致するIDのみを追加する (None の場合は全て追加する)
+            worker_id (str | None): リースに記録するワーカーID (None の場合は ホスト名:プロセスID:乱数).
+                再開時に同じ値を指定すると, リースの期限を待たずに自身が取得中のままにしたIDを取り戻す
+            lease_duration (float): リースの期限 [sec] (取得中に更新しないまま経過したIDは, 他のワーカーが取り戻す)
+            wal (bool): True の場合, WAL モードで書き込む (ネットワークファイルシステム上のファイルでは使用できないため,
+                既定はロールバックジャーナル)
+        """
+        self.__logger: Logger = NKScraperLogger.create(__name__)
+        self.__max_attempts: int = max(1, max_attempts)
+        if shard is not None and not 0 <= shard[0] < shard[1]:
+            self.__logger.error(f'{NetkeibaFrontier.__ERR_MESSAGE_1502} {shard}')
+            sys.exit()
+        self.__shard: tuple[int, int] | None = shard
+        self.__worker_id: str = worker_id if worker_id is not None \
+            else f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+        self.__lease_duration: float = max(1.0, lease_duration)
+
+        # NOTE: 同期APIでは NetkeibaClient のバックグラウンドスレッドから更新するため, スレッドの確認を無効にする
+        self.__connection: sqlite3.Connection = sqlite3.connect(
+            path, timeout=60.0, isolation_level=None, check_same_thread=False)
+        # NOTE: WAL は共有メモリを使用するため, ネットワークファイルシステムでは正しく排他制御できない
+        if wal:
+            self.__connection.execute('PRAGMA journal_mode=WAL')
+            self.__connection.execute('PRAGMA synchronous=NORMAL')
+        self.__connection.execute(
+            'CREATE TABLE IF NOT EXISTS frontier ('
+            'category INTEGER NOT NULL, '
+            'id INTEGER NOT NULL, '
+            'state INTEGER NOT NULL, '
+            'attempts INTEGER NOT NULL DEFAULT 0, '
+            'error TEXT, '
+            'updated_at REAL NOT NULL, '
+            'owner TEXT, '
+            'claimed_at REAL, '
+            'PRIMARY KEY (category, id)) WITHOUT ROWID')
+        # NOTE: リースの列がない (以前のバージョンで作成した) ファイルには列を追加する
+        columns: set[str] = {row[1] for row in self.__connection.execute('PRAGMA table_info(frontier)')}
+        for column, column_type in (('owner', 'TEXT'), ('claimed_at', 'REAL')):
+            if column not in columns:
+                self.__connection.execute(f'ALTER TABLE frontier ADD COLUMN {column} {column_type}')
+        self.__connection.execute(
+            'CREATE INDEX IF NOT EXISTS frontier_state ON frontier (state, category, id)')
+
+    @property
+    def worker_id(self) -> str:
+        """ リースに記録するワーカーID
+
+        Returns:
+            str: ワーカーID
+        """
+        return self.__worker_id
+
+    @staticmethod
+    def get_shard(netkeiba_id: int, num_shards: int) -> int:
+        """ IDを担当するシャード番号を取得する
+
+        レースID・競走馬IDは年や開催場所の桁が偏るため, 剰余ではなくハッシュ値 (CRC32) で分割する.
+        プロセスやマシンによらず同じ値を返す.
+
+        Args:
+            netkeiba_id (int): netkeiba ID (レースID, 競走馬ID)
+            num_shards (int): シャード数
+
+        Returns:
+            int: シャード番号 (0 ~ num_shards - 1)
+        """
+        return zlib.crc32(str(int(netkeiba_id)).encode('ascii')) % num_shards
+
+    def add(self, category: NetkeibaCategory, id_list: Iterable[int]) -> int:
+        """ 取得するIDを追加する
+
+        追加済みのIDは無視する. shard を指定した場合, 担当しないIDも無視する.
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+            id_list (Iterable[int]): netkeiba ID (レースID, 競走馬ID) 配列
+
+        Returns:
+            int: 新たに追加したIDの数
+        """
+        if not NetkeibaURLFactory.is_supported(category):
+            self.__logger.error(f'{NetkeibaFrontier.__ERR_MESSAGE_1501} {category.name}')
+            sys.exit()
+
+        now: float = time.time()
+        with self.__transaction():
+            before: int = self.__connection.total_changes
+            self.__connection.executemany(
+                'INSERT OR IGNORE INTO frontier (category, id, state, updated_at) VALUES (?, ?, ?, ?)',
+                ((category.value, int(netkeiba_id), NetkeibaFrontierState.PENDING.value, now)
+                 for netkeiba_id in id_list if self.__is_assigned(netkeiba_id)))
+            return self.__connection.total_changes - before
+
+    def is_seen(self, category: NetkeibaCategory, netkeiba_id: int) -> bool:
+        """ 追加済みのIDか判定する
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+            netkeiba_id (int): netkeiba ID
+
+        Returns:
+            bool: 追加済みであればTrue, そうでなければFalse
+        """
+        row: Any = self.__connection.execute(
+            'SELECT 1 FROM frontier WHERE category = ? AND id = ?', (category.value, int(netkeiba_id))).fetchone()
+        return row is not None
+
+    def count(self, state: NetkeibaFrontierState | None = None,
+              category: NetkeibaCategory | None = None) -> int:
+        """ IDの数を数える
+
+        Args:
+            state (NetkeibaFrontierState | None): 取得状態 (None の場合は全て)
+            category (NetkeibaCategory | None): netkeiba Webページカテゴリー (None の場合は全て)
+
+        Returns:
+            int: IDの数
+        """
+        conditions: list[str] = []
+        parameters: list[int] = []
+        if state is not None:
+            conditions.append('state = ?')
+            parameters.append(state.value)
+        if category is not None:
+            conditions.append('category = ?')
+            parameters.append(category.value)
+        where: str = '' if len(conditions) == 0 else ' WHERE ' + ' AND '.join(conditions)
+        return self.__connection.execute(f'SELECT COUNT(*) FROM frontier{where}', parameters).fetchone()[0]
+
+    def recover(self) -> int:
+        """ 中断したクロールで取得中のままになっているIDを未取得に戻す
+
+        リースの期限が切れたID, または, このワーカー (worker_id) が取得中のIDのみを戻す.
+        他のワーカーが取得中 (リースが有効) のIDは戻さない.
+
+        Returns:
+            int: 未取得に戻したIDの数
+        """
+        now: float = time.time()
+        cursor: sqlite3.Cursor = self.__connection.execute(
+            'UPDATE frontier SET state = ?, owner = NULL, claimed_at = NULL, updated_at = ? '
+            'WHERE state = ? AND (owner IS NULL OR owner = ? OR claimed_at < ?)',
+            (NetkeibaFrontierState.PENDING.value, now, NetkeibaFrontierState.IN_FLIGHT.value,
+             self.__worker_id, now - self.__lease_duration))
+        return cursor.rowcount
+
+    def retry_failed(self) -> int:
+        """ 取得に失敗したIDを未取得に戻し, 試行回数をリセットする
+
+        Returns:
+            int: 未取得に戻したIDの数
+        """
+        return self.__set_state(NetkeibaFrontierState.FAILED, NetkeibaFrontierState.PENDING, reset_attempts=True)
+
+    def crawl(self, handler: Callable[[int, NetkeibaContents], Any],
+              client: NetkeibaClient | None = None, chunk_size: int = 100) -> None:
+        """ 未取得のIDを全て取得する
+
+        Args:
+            handler (Callable[[int, NetkeibaContents], Any]): 取得に成功した Webページを処理する関数
+                (引数は netkeiba ID, NetkeibaContents. 処理が完了した時点で取得済みとする)
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時はクロール中のみセッションを作成する)
+            chunk_size (int): 一度に取り出すIDの数
+        """
+        if client is None:
+            asyncio.run(self.acrawl(handler, client, chunk_size))
+        else:
+            client.run(self.acrawl(handler, client, chunk_size))
+
+    async def acrawl(self, handler: Callable[[int, NetkeibaContents], Any],
+                     client: NetkeibaClient | None = None, chunk_size: int = 100) -> None:
+        """ 未取得のIDを全て取得する (非同期)
+
+        開始時に, 中断したクロールで取得中のままになっているID (リースの期限切れ, または, このワーカーのID) を未取得に戻す.
+        handler で例外が発生した場合はクロールを中断する
+        (処理中のIDは, リースの期限が切れた後, または, 同じ worker_id で再開した時に再度取得する).
+
+        Args:
+            handler (Callable[[int, NetkeibaContents], Any]): 取得に成功した Webページを処理する関数
+                (引数は netkeiba ID, NetkeibaContents. コルーチン関数も指定できる. 処理が完了した時点で取得済みとする)
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (async with 文で開いたもの.
+                省略時はクロール中のみセッションを作成する)
+            chunk_size (int): 一度に取り出すIDの数
+        """
+        self.recover()
+        if client is None:
+            async with NetkeibaClient() as client:
+                await self.__crawl_process(handler, client, chunk_size)
+        else:
+            await self.__crawl_process(handler, client, chunk_size)
+
+    def close(self) -> None:
+        """ データベースを閉じる
+        """
+        self.__connection.close()
+
+    async def __crawl_process(self, handler: Callable[[int, NetkeibaContents], Any],
+                              client: NetkeibaClient, chunk_size: int) -> None:
+        """ 未取得のIDがなくなるまで, 取り出して取得する
+
+        Args:
+            handler (Callable[[int, NetkeibaContents], Any]): 取得に成功した Webページを処理する関数
+            client (NetkeibaClient): netkeiba HTTP クライアント
+            chunk_size (int): 一度に取り出すIDの数
+        """
+        requests: NetkeibaRequests = NetkeibaRequests(client)
+        renewed_at: float = time.time()
+        while True:
+            claimed_list: list[tuple[NetkeibaCategory, int, int]] = self.__claim(max(1, chunk_size))
+            if len(claimed_list) == 0:
+                return
+
+            claimed_dict: dict[str, tuple[NetkeibaCategory, int, int]] = {}
+            url_list: list[NetkeibaURL] = []
+            for category, netkeiba_id, attempts in claimed_list:
+                url: NetkeibaURL = NetkeibaURLFactory.create(category, netkeiba_id)
+                claimed_dict[url.url] = (category, netkeiba_id, attempts)
+                url_list.append(url)
+
+            result: NetkeibaResult
+            async for result in requests.aiter_results_by_list(url_list, chunk_size):
+                # NOTE: 取得中のIDを他のワーカーが取り戻さないよう, 期限の半分が経過するごとにリースを更新する
+                if time.time() - renewed_at >= self.__lease_duration / 2:
+                    renewed_at = self.__renew()
+                category, netkeiba_id, attempts = claimed_dict[result.url.url]
+                if result.is_success:
+                    handled: Any = handler(netkeiba_id, result.contents)
+                    if inspect.isawaitable(handled):
+                        await handled
+                    self.__finish(category, netkeiba_id, NetkeibaFrontierState.DONE)
+                else:
+                    state: NetkeibaFrontierState = NetkeibaFrontierState.FAILED \
+                        if attempts >= self.__max_attempts else NetkeibaFrontierState.PENDING
+                    self.__finish(category, netkeiba_id, state, f'{type(result.error).__name__} {result.error}')
+
+    def __is_assigned(self, netkeiba_id: int) -> bool:
+        """ 担当するIDか判定する
+
+        Args:
+            netkeiba_id (int): netkeiba ID
+
+        Returns:
+            bool: 担当するIDであればTrue, そうでなければFalse
+        """
+        if self.__shard is None:
+            return True
+        index, num_shards = self.__shard
+        return NetkeibaFrontier.get_shard(netkeiba_id, num_shards) == index
+
+    def __claim(self, size: int) -> list[tuple[NetkeibaCategory, int, int]]:
+        """ 未取得のID (または, リースの期限が切れた取得中のID) を取り出し, このワーカーの取得中にする
+
+        Args:
+            size (int): 取り出すIDの数
+
+        Returns:
+            list[tuple[NetkeibaCategory, int, int]]: (カテゴリー, ID, 試行回数) 配列
+        """
+        with self.__transaction():
+            now: float = time.time()
+            rows: list[tuple[int, int, int]] = self.__connection.execute(
+                'SELECT category, id, attempts FROM frontier WHERE state = ? ORDER BY category, id LIMIT ?',
+                (NetkeibaFrontierState.PENDING.value, size)).fetchall()
+            if len(rows) < size:
+                rows += self.__connection.execute(
+                    'SELECT category, id, attempts FROM frontier WHERE state = ? AND claimed_at < ? '
+                    'ORDER BY category, id LIMIT ?',
+                    (NetkeibaFrontierState.IN_FLIGHT.value, now - self.__lease_duration, size - len(rows))).fetchall()
+            self.__connection.executemany(
+                'UPDATE frontier SET state = ?, attempts = attempts + 1, owner = ?, claimed_at = ?, updated_at = ? '
+                'WHERE category = ? AND id = ?',
+                ((NetkeibaFrontierState.IN_FLIGHT.value, self.__worker_id, now, now, category, netkeiba_id)
+                 for category, netkeiba_id, _ in rows))
+        return [(NetkeibaCategory(category), netkeiba_id, attempts + 1) for category, netkeiba_id, attempts in rows]
+
+    def __renew(self) -> float:
+        """ このワーカーが取得中のIDのリースを更新する
+
+        Returns:
+            float: 更新した時刻
+        """
+        now: float = time.time()
+        self.__connection.execute(
+            'UPDATE frontier SET claimed_at = ? WHERE state = ? AND owner = ?',
+            (now, NetkeibaFrontierState.IN_FLIGHT.value, self.__worker_id))
+        return now
+
+    def __finish(self, category: NetkeibaCategory, netkeiba_id: int,
+                 state: NetkeibaFrontierState, error: str | None = None) -> None:
+        """ 取得状態を更新する (リースの期限が切れて他のワーカーが取り戻したIDは更新しない)
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+            netkeiba_id (int): netkeiba ID
+            state (NetkeibaFrontierState): 取得状態
+            error (str | None): 取得に失敗した場合のエラー
+        """
+        self.__connection.execute(
+            'UPDATE frontier SET state = ?, error = ?, owner = NULL, claimed_at = NULL, updated_at = ? '
+            'WHERE category = ? AND id = ? AND state = ? AND owner = ?',
+            (state.value, error, time.time(), category.value, netkeiba_id,
+             NetkeibaFrontierState.IN_FLIGHT.value, self.__worker_id))
+
+    def __set_state(self, before: NetkeibaFrontierState, after: NetkeibaFrontierState,
+                    reset_attempts: bool = False) -> int:
+        """ 取得状態をまとめて変更する
+
+        Args:
+            before (NetkeibaFrontierState): 変更前の取得状態
+            after (NetkeibaFrontierState): 変更後の取得状態
+            reset_attempts (bool): True の場合, 試行回数を0に戻す
+
+        Returns:
+            int: 変更したIDの数
+        """
+        attempts: str = ', attempts = 0' if reset_attempts else ''
+        cursor: sqlite3.Cursor = self.__connection.execute(
+            f'UPDATE frontier SET state = ?, updated_at = ?{attempts} WHERE state = ?',
+            (after.value, time.time(), before.value))
+        return cursor.rowcount
+
+    @contextmanager
+    def __transaction(self) -> Iterator[None]:
+        """ 書き込みトランザクションを実行する (他のプロセスと同じIDを取り出さないよう, 開始時にロックを取得する)
+
+        Yields:
+            None: トランザクション中
+        """
+        self.__connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except BaseException:
+            self.__connection.execute('ROLLBACK')
+            raise
+        self.__connection.execute('COMMIT')
+
+    # Context Manager ---------------------------------------------------------
+    def __enter__(self) -> NetkeibaFrontier:
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
+
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+""" netkeiba クロール状態モジュール
+"""
+
+# built-in
+from enum import Enum
+
+
+class NetkeibaFrontierState(Enum):
+    """ netkeiba クロール状態
+    """
+    PENDING = 0  # 未取得
+    IN_FLIGHT = 1  # 取得中
+    DONE = 2  # 取得済み
+    FAILED = 3  # 取得失敗 (最大試行回数に到達)
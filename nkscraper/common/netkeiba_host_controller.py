@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+""" netkeiba ホスト制御モジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.common import NetkeibaPrioritySemaphore
+
+# build-in
+import asyncio
+import time
+
+
+class NetkeibaCircuitOpenError(Exception):
+    """ ホストへの送信を停止している (サーキットブレーカーが開いている) 場合の例外
+    """
+
+
+class NetkeibaHostController():
+    """ netkeiba ホスト制御クラス
+
+    ホストごとの同時実行数を AIMD (加算増加・乗算減少) で調整する.
+    連続して失敗した場合は一定時間送信を停止し (サーキットブレーカー), 待機中のリクエストも即座に失敗させる.
+    Retry-After を受け取った場合は, 指定された時間が経過するまで送信を待機する.
+    """
+
+    # NOTE: Retry-After の上限 [sec]
+    MAX_RETRY_AFTER: float = 300.0
+
+    def __init__(self, max_limit: int, adaptive: bool = False, min_limit: int = 1,
+                 latency_threshold: float | None = None, decrease_factor: float = 0.5,
+                 failure_threshold: int | None = None, recovery_timeout: float = 30.0) -> None:
+        """ コンストラクタ
+
+        Args:
+            max_limit (int): 同時実行数の上限
+            adaptive (bool): True の場合, 同時実行数を AIMD で調整する (False の場合は max_limit で固定)
+            min_limit (int): 同時実行数の下限
+            latency_threshold (float | None): 混雑とみなす応答時間 [sec] (None の場合は応答時間で判定しない)
+            decrease_factor (float): 混雑時に同時実行数に掛ける係数
+            failure_threshold (int | None): 送信を停止する連続失敗回数 (None の場合は停止しない)
+            recovery_timeout (float): 送信を停止する時間 [sec]
+        """
+        self.__max_limit: int = max(1, max_limit)
+        self.__min_limit: int = max(1, min(min_limit, self.__max_limit))
+        self.__adaptive: bool = adaptive
+        self.__latency_threshold: float | None = latency_threshold
+        self.__decrease_factor: float = decrease_factor
+        self.__failure_threshold: int | None = failure_threshold
+        self.__recovery_timeout: float = recovery_timeout
+
+        self.__limit: float = float(max(self.__min_limit, self.__max_limit // 2)) \
+            if adaptive else float(self.__max_limit)
+        self.__semaphore: NetkeibaPrioritySemaphore = NetkeibaPrioritySemaphore(int(self.__limit))
+        self.__latency: float | None = None
+        self.__decreased_at: float = 0.0
+        self.__paused_until: float = 0.0
+        self.__num_failures: int = 0
+        self.__opened_until: float | None = None
+        self.__probing: bool = False
+
+    @property
+    def limit(self) -> int:
+        """ 現在の同時実行数の上限
+
+        Returns:
+            int: 同時実行数の上限
+        """
+        return self.__semaphore.limit
+
+    @property
+    def latency(self) -> float | None:
+        """ 応答時間の指数移動平均
+
+        Returns:
+            float | None: 応答時間 [sec] (未計測の場合はNone)
+        """
+        return self.__latency
+
+    @property
+    def is_open(self) -> bool:
+        """ 送信を停止しているか (サーキットブレーカーが開いているか)
+
+        Returns:
+            bool: 送信を停止している場合はTrue, そうでなければFalse
+        """
+        return self.__opened_until is not None
+
+    async def acquire(self, priority: int = 0) -> bool:
+        """ 送信枠を取得する
+
+        Retry-After による待機中であれば, 待機時間が経過するまで待つ.
+
+        Args:
+            priority (int): 優先度 (値が小さいほど優先する)
+
+        Returns:
+            bool: 送信停止後の試験的な送信であればTrue, そうでなければFalse
+
+        Raises:
+            NetkeibaCircuitOpenError: 送信を停止している場合
+        """
+        probe: bool = self.__check_circuit()
+        try:
+            while True:
+                delay: float = self.__paused_until - time.monotonic()
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+                if not probe:
+                    probe = self.__check_circuit()
+            await self.__semaphore.acquire(priority)
+        except BaseException:
+            if probe:
+                self.__probing = False
+            raise
+        return probe
+
+    def check(self) -> bool:
+        """ 送信を停止しているか確認する
+
+        送信枠を取得した後, 送信の直前に呼び出す (待機中に送信を停止した場合は, 送信せずに失敗させる).
+        停止時間が経過していれば, 1件だけ試験的な送信を許可する (half-open).
+
+        Returns:
+            bool: 試験的な送信を許可した場合はTrue, 送信を停止していなければFalse
+
+        Raises:
+            NetkeibaCircuitOpenError: 送信を停止している場合
+        """
+        return self.__check_circuit()
+
+    def release(self, latency: float, failure: bool | None,
+                retry_after: float | None = None, probe: bool = False) -> None:
+        """ 送信枠を解放し, 結果を同時実行数・サーキットブレーカーに反映する
+
+        Args:
+            latency (float): 応答時間 [sec]
+            failure (bool | None): 混雑・障害による失敗であればTrue, 応答があればFalse (キャンセル等はNone)
+            retry_after (float | None): Retry-After [sec]
+            probe (bool): 送信停止後の試験的な送信であればTrue (acquire の戻り値)
+        """
+        self.__semaphore.release()
+        if retry_after is not None:
+            self.__paused_until = max(
+                self.__paused_until, time.monotonic() + min(retry_after, NetkeibaHostController.MAX_RETRY_AFTER))
+
+        if probe:
+            self.__probing = False
+        if failure is None:
+            return
+
+        self.__update_latency(latency)
+        congested: bool = failure or (
+            self.__latency_threshold is not None and latency > self.__latency_threshold)
+        if congested:
+            self.__decrease()
+        else:
+            self.__increase()
+
+        if failure:
+            self.__num_failures += 1
+            if probe or (
+                    self.__failure_threshold is not None and self.__num_failures >= self.__failure_threshold):
+                self.__opened_until = time.monotonic() + self.__recovery_timeout
+        else:
+            self.__num_failures = 0
+            self.__opened_until = None
+
+    def __check_circuit(self) -> bool:
+        """ 送信を停止しているか確認する
+
+        停止時間が経過していれば, 1件だけ試験的な送信を許可する (half-open).
+
+        Returns:
+            bool: 試験的な送信を許可した場合はTrue, 送信を停止していなければFalse
+
+        Raises:
+            NetkeibaCircuitOpenError: 送信を停止している場合
+        """
+        if self.__opened_until is None:
+            return False
+        if not self.__probing and time.monotonic() >= self.__opened_until:
+            self.__probing = True
+            return True
+        raise NetkeibaCircuitOpenError(f'連続して失敗したため, 送信を停止しています ({self.__num_failures}回).')
+
+    def __update_latency(self, latency: float) -> None:
+        """ 応答時間の指数移動平均を更新する
+        """
+        self.__latency = latency if self.__latency is None else 0.8 * self.__latency + 0.2 * latency
+
+    def __increase(self) -> None:
+        """ 同時実行数を加算で増やす (同時実行数分の成功でおよそ1増える)
+        """
+        if not self.__adaptive:
+            return
+        self.__limit = min(float(self.__max_limit), self.__limit + 1.0 / self.__limit)
+        self.__semaphore.limit = int(self.__limit)
+
+    def __decrease(self) -> None:
+        """ 同時実行数を乗算で減らす (同じ混雑による連続した減少を避けるため, 応答時間あたり1回まで)
+        """
+        if not self.__adaptive:
+            return
+        now: float = time.monotonic()
+        if now - self.__decreased_at < (self.__latency or 0.0):
+            return
+        self.__decreased_at = now
+        self.__limit = max(float(self.__min_limit), self.__limit * self.__decrease_factor)
+        self.__semaphore.limit = int(self.__limit)
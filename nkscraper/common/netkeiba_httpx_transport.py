@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+""" netkeiba httpx トランスポートモジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.utils import NKScraperLogger
+from nkscraper.common import NetkeibaTransport, NetkeibaResponse
+
+# build-in
+import importlib.util
+import sys
+
+# OSS
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# for type declaration only
+from logging import Logger
+from typing import Callable, Mapping
+
+
+class NetkeibaHttpxTransport(NetkeibaTransport):
+    """ netkeiba httpx トランスポートクラス
+
+    httpx.AsyncClient で通信する. HTTP/2 を使用する場合, 同じホストへの複数のリクエストを少数の接続で多重化する.
+    """
+
+    __ERR_MESSAGE_1801: str = 'httpx トランスポートを使用するには "httpx" をインストールしてください.'
+    __ERR_MESSAGE_1802: str = 'HTTP/2 を使用するには "h2" をインストールしてください (pip install httpx[http2]).'
+    __ERR_MESSAGE_1803: str = 'HTTP クライアントが開かれていません.'
+
+    def __init__(self, http2: bool = True, max_connections: int = 100,
+                 max_keepalive_connections: int = 20, keepalive_expiry: float = 30.0,
+                 connect_timeout: float | None = None, read_timeout: float | None = None,
+                 verify: bool = True) -> None:
+        """ コンストラクタ
+
+        Args:
+            http2 (bool): True の場合, サーバーが対応していれば HTTP/2 を使用する
+            max_connections (int): 全体の最大接続数
+            max_keepalive_connections (int): 保持する Keep-Alive 接続の最大数
+            keepalive_expiry (float): Keep-Alive 接続の保持時間 [sec]
+            connect_timeout (float | None): 1リクエストあたりの接続のタイムアウト [sec] (None の場合は30秒)
+            read_timeout (float | None): 1リクエストあたりの読み込みのタイムアウト [sec] (None の場合は制限しない)
+            verify (bool): False の場合, TLS証明書を検証しない (自己署名証明書のテストサーバー用)
+        """
+        self.__logger: Logger = NKScraperLogger.create(__name__)
+        if httpx is None:
+            self.__logger.error(NetkeibaHttpxTransport.__ERR_MESSAGE_1801)
+            sys.exit()
+        if http2 and importlib.util.find_spec('h2') is None:
+            self.__logger.error(NetkeibaHttpxTransport.__ERR_MESSAGE_1802)
+            sys.exit()
+
+        self.__http2: bool = http2
+        self.__limits: httpx.Limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry)
+        self.__timeout: httpx.Timeout = httpx.Timeout(
+            None, connect=30.0 if connect_timeout is None else connect_timeout, read=read_timeout)
+        self.__verify: bool = verify
+        self.__client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient | None:
+        """ httpx.AsyncClient
+
+        Returns:
+            httpx.AsyncClient | None: 接続を共有する HTTP クライアント (開かれていない場合はNone)
+        """
+        return self.__client
+
+    @property
+    def is_open(self) -> bool:
+        """ 開かれているか
+
+        Returns:
+            bool: 開かれていればTrue, そうでなければFalse
+        """
+        return self.__client is not None and not self.__client.is_closed
+
+    async def open(self) -> None:
+        """ HTTP クライアントを開く
+        """
+        # NOTE: aiohttp と同様にリダイレクトをたどる (httpx の既定では 3xx の応答をそのまま返す)
+        self.__client = httpx.AsyncClient(
+            http2=self.__http2, limits=self.__limits, timeout=self.__timeout, verify=self.__verify,
+            follow_redirects=True)
+
+    async def close(self) -> None:
+        """ HTTP クライアントを閉じる
+        """
+        if self.__client is not None:
+            await self.__client.aclose()
+        self.__client = None
+
+    async def request(self, method: str, url: str,
+                      headers: dict[str, str] | None = None) -> NetkeibaResponse:
+        """ リクエストを送信し, レスポンスボディまで読み込む
+
+        Args:
+            method (str): HTTPメソッド (GET, HEAD)
+            url (str): URL
+            headers (dict[str, str] | None): リクエストヘッダー
+
+        Returns:
+            NetkeibaResponse: HTTPレスポンス (HTTPステータスコードが 400 未満の場合)
+
+        Raises:
+            httpx.HTTPStatusError: HTTPステータスコードが 400 以上の場合
+            httpx.TransportError: 通信に失敗した場合
+        """
+        if self.__client is None:
+            raise httpx.TransportError(NetkeibaHttpxTransport.__ERR_MESSAGE_1803)
+        response: httpx.Response = await self.__client.request(method, url, headers=headers)
+        # NOTE: httpx は 304 などの 3xx も raise_for_status で例外とするため, 400 以上のみ判定する
+        if response.status_code >= 400:
+            response.raise_for_status()
+        return NetkeibaResponse(response.status_code, response.headers, response.content)
+
+    async def stream(self, method: str, url: str, headers: dict[str, str] | None,
+                     sink: Callable[[bytes], None]) -> NetkeibaResponse:
+        """ リクエストを送信し, 受信したレスポンスボディの断片を順に sink に渡す
+
+        Args:
+            method (str): HTTPメソッド (GET)
+            url (str): URL
+            headers (dict[str, str] | None): リクエストヘッダー
+            sink (Callable[[bytes], None]): レスポンスボディの断片を受け取る関数
+
+        Returns:
+            NetkeibaResponse: HTTPレスポンス (レスポンスボディは空. HTTPステータスコードが 400 未満の場合)
+
+        Raises:
+            httpx.HTTPStatusError: HTTPステータスコードが 400 以上の場合
+            httpx.TransportError: 通信に失敗した場合
+        """
+        if self.__client is None:
+            raise httpx.TransportError(NetkeibaHttpxTransport.__ERR_MESSAGE_1803)
+        async with self.__client.stream(method, url, headers=headers) as response:
+            if response.status_code >= 400:
+                response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                sink(chunk)
+            return NetkeibaResponse(response.status_code, response.headers, b'')
+
+    def get_error_status(self, error: BaseException) -> int | None:
+        """ request で発生した例外から HTTPステータスコードを取得する
+
+        Args:
+            error (BaseException): 発生した例外
+
+        Returns:
+            int | None: HTTPステータスコード (HTTPステータスコードによる例外でない場合はNone)
+        """
+        return error.response.status_code if isinstance(error, httpx.HTTPStatusError) else None
+
+    def get_error_headers(self, error: BaseException) -> Mapping[str, str] | None:
+        """ request で発生した例外からレスポンスヘッダーを取得する
+
+        Args:
+            error (BaseException): 発生した例外
+
+        Returns:
+            Mapping[str, str] | None: レスポンスヘッダー (HTTPステータスコードによる例外でない場合はNone)
+        """
+        return error.response.headers if isinstance(error, httpx.HTTPStatusError) else None
+
+    def is_connection_error(self, error: BaseException) -> bool:
+        """ request で発生した例外が接続エラー・タイムアウトか判定する
+
+        Args:
+            error (BaseException): 発生した例外
+
+        Returns:
+            bool: 接続エラー・タイムアウトであればTrue, そうでなければFalse
+        """
+        return isinstance(error, httpx.TransportError)
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+""" netkeiba lxml 抽出エンジンモジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.utils import NKScraperLogger
+from nkscraper.common import NetkeibaExtractor, NetkeibaTableRow, NetkeibaParser
+
+# build-in
+import sys
+
+# OSS
+from lxml import etree, html
+
+# for type declaration only
+from nkscraper.common import NetkeibaSelector, NetkeibaTableSelector
+from logging import Logger
+from typing import Any, TYPE_CHECKING
+if TYPE_CHECKING:
+    from nkscraper.common import NetkeibaContents
+
+
+class NetkeibaLxmlExtractor(NetkeibaExtractor):
+    """ netkeiba lxml 抽出エンジンクラス
+
+    BeautifulSoup を使用せずに Webページを lxml で解析し, コンパイル済みの XPath で表の行を取得する.
+    各セレクターも XPath にコンパイルし, 行の子孫要素を走査せずに値を取り出す.
+    NetkeibaSoupExtractor と同じ値を取り出す.
+    """
+
+    __ERR_MESSAGE_2001: str = 'lxml 抽出エンジンを使用するには, Webページのバイト列 (html_byte), または, document を保持した NetkeibaContents を指定してください.'
+    __ERR_MESSAGE_2002: str = '要素が見つかりませんでした.'
+    __ERR_MESSAGE_2003: str = 'セル・子ノードが見つかりませんでした.'
+
+    __NAMESPACES: dict[str, str] = {'re': 'http://exslt.org/regular-expressions'}
+    # NOTE: 負の番号は末尾から数える (BeautifulSoup の contents のインデックスと同じ)
+    __NODE_XPATH: etree.XPath = etree.XPath('node()[position() = $index + 1 or position() = last() + 1 + $index]')
+    __COUNT_CELL_XPATH: etree.XPath = etree.XPath('count(descendant::td)')
+
+    def __init__(self) -> None:
+        """ コンストラクタ
+        """
+        self.__logger: Logger = NKScraperLogger.create(__name__)
+        self.__xpath_dict: dict[tuple[str, bool, bool], tuple[etree.XPath, etree.XPath]] = {}
+        self.__selector_dict: dict[NetkeibaSelector, etree.XPath] = {}
+
+    @property
+    def uses_soup(self) -> bool:
+        """ BeautifulSoup で解析した Webページを使用するか
+
+        Returns:
+            bool: False
+        """
+        return False
+
+    def parse(self, contents: NetkeibaContents) -> html.HtmlElement:
+        """ Webページを解析する
+
+        NetkeibaParser.ENCODINGS にカテゴリーの文字コードがあれば, その文字コードでデコードする.
+        受信しながら逐次解析した NetkeibaContents の場合は, 解析済みの document を返す.
+
+        Args:
+            contents (NetkeibaContents): netkeiba Webページコンテンツ
+
+        Returns:
+            html.HtmlElement: ルート要素
+        """
+        if contents.document is not None:
+            return contents.document
+        html_byte: bytes | None = contents.html_byte
+        if html_byte is None:
+            self.__logger.error(NetkeibaLxmlExtractor.__ERR_MESSAGE_2001)
+            sys.exit()
+        parser: html.HTMLParser = html.HTMLParser(
+            encoding=NetkeibaParser.ENCODINGS.get(contents.category))
+        return html.document_fromstring(html_byte, parser=parser)
+
+    def find_rows(self, document: html.HtmlElement,
+                  table: NetkeibaTableSelector) -> list[html.HtmlElement] | None:
+        """ 表の行を取得する
+
+        Args:
+            document (html.HtmlElement): ルート要素
+            table (NetkeibaTableSelector): netkeiba 表セレクター
+
+        Returns:
+            list[html.HtmlElement] | None: 行 (tr) 配列 (表がない場合はNone)
+        """
+        table_xpath, row_xpath = self.__compile(table)
+        # NOTE: 属性値は XPath 変数で渡し, 引用符のエスケープを不要にする
+        table_list: list[html.HtmlElement] = table_xpath(document, value=table.value)
+        if len(table_list) == 0:
+            return None
+        row_list: list[html.HtmlElement] = row_xpath(table_list[0], row_class=table.row_class or '')
+        return row_list[table.skip:]
+
+    def create_row(self, row: html.HtmlElement) -> NetkeibaTableRow:
+        """ 表の行を NetkeibaTableRow で包む (子孫要素は走査せず, extract でコンパイル済みの XPath を評価する)
+
+        Args:
+            row (html.HtmlElement): 行 (tr)
+
+        Returns:
+            NetkeibaTableRow: netkeiba 表の行
+        """
+        return NetkeibaTableRow(element=row)
+
+    def extract(self, row: NetkeibaTableRow, selector: NetkeibaSelector) -> str:
+        """ 表の行から値を取り出す
+
+        セレクターごとにコンパイルした XPath で要素を選択し, 子ノードの XPath で値を取り出す.
+
+        Args:
+            row (NetkeibaTableRow): netkeiba 表の行
+            selector (NetkeibaSelector): netkeiba セレクター
+
+        Returns:
+            str: 子ノードの文字列, または, 属性値
+
+        Raises:
+            AttributeError: 要素が存在しない場合
+            IndexError: セル・子ノードが存在しない場合
+            KeyError: 属性が存在しない場合
+        """
+        element_list: list[html.HtmlElement] = self.__compile_selector(selector)(
+            row.element, cell=selector.cell or 0, class_name=selector.class_name or '',
+            pattern=selector.pattern or '')
+        if len(element_list) == 0:
+            # NOTE: NetkeibaSoupExtractor と同じ例外を送出するため, セル番号が範囲外か確認する
+            if selector.cell is not None:
+                num_cell: int = int(NetkeibaLxmlExtractor.__COUNT_CELL_XPATH(row.element))
+                if not -num_cell <= selector.cell < num_cell:
+                    raise IndexError(NetkeibaLxmlExtractor.__ERR_MESSAGE_2003)
+            raise AttributeError(NetkeibaLxmlExtractor.__ERR_MESSAGE_2002)
+
+        element: html.HtmlElement = element_list[0]
+        if selector.attr is not None:
+            return str(element.attrib[selector.attr])
+        node_list: list[Any] = NetkeibaLxmlExtractor.__NODE_XPATH(element, index=selector.node)
+        if len(node_list) == 0:
+            raise IndexError(NetkeibaLxmlExtractor.__ERR_MESSAGE_2003)
+        return NetkeibaLxmlExtractor.__to_string(node_list[0])
+
+    @staticmethod
+    def __to_string(node: Any) -> str:
+        """ 子ノード (BeautifulSoup の contents の要素) を文字列に変換する
+
+        Args:
+            node (Any): 子ノード (文字列ノード, コメント, 要素)
+
+        Returns:
+            str: 文字列ノードは文字列, コメントは内容, 要素は HTML
+        """
+        # NOTE: XPath の文字列ノードは親要素への参照を持つため, str に変換する
+        if isinstance(node, str):
+            return str(node)
+        if node.tag is etree.Comment:
+            return node.text or ''
+        return html.tostring(node, encoding='unicode', with_tail=False)
+
+    def __compile_selector(self, selector: NetkeibaSelector) -> etree.XPath:
+        """ セレクターを, 行 (tr) から要素を選択する XPath にコンパイルする (セレクターごとに初回のみ)
+
+        cell は (descendant::td)[番号], class_name は class 属性値の空白区切りの一致, pattern は EXSLT の正規表現,
+        path は各段の最初の子孫要素に変換する. 値は XPath 変数 (cell, class_name, pattern) で渡す.
+        pattern は class 属性値全体に対して検索する (空白・^・$ を含まない正規表現では, 各 class 属性値に対する検索と同じ結果になる).
+
+        Args:
+            selector (NetkeibaSelector): netkeiba セレクター
+
+        Returns:
+            etree.XPath: 要素を選択する XPath (要素がない場合は空の配列を返す)
+        """
+        if selector not in self.__selector_dict:
+            if selector.cell is not None:
+                # NOTE: 負のセル番号は末尾から数える (list のインデックスと同じ)
+                path: str = '(descendant::td)[position() = $cell + 1 or position() = last() + 1 + $cell]'
+            elif selector.pattern is not None:
+                path = f'(descendant::{selector.name}[re:test(@class, $pattern)])[1]'
+            elif selector.class_name is not None:
+                path = f'(descendant::{selector.name}' \
+                    '[contains(concat(" ", normalize-space(@class), " "), concat(" ", $class_name, " "))])[1]'
+            else:
+                path = f'(descendant::{selector.name})[1]'
+            for name in selector.path:
+                path += f'/descendant::{name}[1]'
+            self.__selector_dict[selector] = etree.XPath(path, namespaces=NetkeibaLxmlExtractor.__NAMESPACES)
+        return self.__selector_dict[selector]
+
+    def __compile(self, table: NetkeibaTableSelector) -> tuple[etree.XPath, etree.XPath]:
+        """ 表・行を取得する XPath をコンパイルする (表セレクターごとに初回のみ)
+
+        Args:
+            table (NetkeibaTableSelector): netkeiba 表セレクター
+
+        Returns:
+            tuple[etree.XPath, etree.XPath]: (表を取得する XPath, 表から行を取得する XPath)
+        """
+        key: tuple[str, bool, bool] = (table.attr, table.row_class is not None, table.tbody)
+        if key not in self.__xpath_dict:
+            # NOTE: class 属性は空白区切りの値のいずれかに一致する要素を選択する (BeautifulSoup の class_ と同じ)
+            if table.attr == 'class':
+                table_condition: str = \
+                    'contains(concat(" ", normalize-space(@class), " "), concat(" ", $value, " "))'
+            else:
+                table_condition = f'@{table.attr} = $value'
+            table_path: str = f'(//table[{table_condition}])[1]'
+            if table.tbody:
+                table_path += '/descendant::tbody[1]'
+
+            row_path: str = 'descendant::tr'
+            if table.row_class is not None:
+                row_path += '[contains(concat(" ", normalize-space(@class), " "), concat(" ", $row_class, " "))]'
+
+            self.__xpath_dict[key] = (etree.XPath(table_path), etree.XPath(row_path))
+        return self.__xpath_dict[key]
@@ -0,0 +1,579 @@
+# -*- coding: utf-8 -*-
+""" netkeiba 圧縮Webページアーカイブモジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.utils import NKScraperLogger
+from nkscraper.common import NetkeibaCategory, NetkeibaArchiveMode, NetkeibaContents
+from nkscraper.url import NetkeibaURLFactory
+
+# build-in
+import mmap
+import os
+import struct
+import sys
+import time
+
+# OSS
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# for type declaration only
+from nkscraper.common import NetkeibaExtractor
+from nkscraper.url import NetkeibaURL
+from logging import Logger
+from types import TracebackType
+from typing import BinaryIO, Iterable, Iterator, Optional, Type
+
+
+class NetkeibaArchiveEntry():
+    """ netkeiba 圧縮Webページアーカイブエントリークラス
+    """
+
+    def __init__(self, category: NetkeibaCategory, netkeiba_id: int, body: bytes, fetched_at: float) -> None:
+        """ コンストラクタ
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+            netkeiba_id (int): netkeiba ID (レースID, 競走馬ID)
+            body (bytes): Webページ
+            fetched_at (float): 取得日時 (UNIX時間)
+        """
+        self.__category: NetkeibaCategory = category
+        self.__netkeiba_id: int = netkeiba_id
+        self.__body: bytes = body
+        self.__fetched_at: float = fetched_at
+
+    @property
+    def category(self) -> NetkeibaCategory:
+        """ netkeiba Webページカテゴリー
+
+        Returns:
+            NetkeibaCategory: netkeiba Webページカテゴリー
+        """
+        return self.__category
+
+    @property
+    def netkeiba_id(self) -> int:
+        """ netkeiba ID
+
+        Returns:
+            int: netkeiba ID (レースID, 競走馬ID)
+        """
+        return self.__netkeiba_id
+
+    @property
+    def body(self) -> bytes:
+        """ Webページ
+
+        Returns:
+            bytes: Webページ
+        """
+        return self.__body
+
+    @property
+    def fetched_at(self) -> float:
+        """ 取得日時
+
+        Returns:
+            float: 取得日時 (UNIX時間)
+        """
+        return self.__fetched_at
+
+    @property
+    def url(self) -> NetkeibaURL:
+        """ NetkeibaURL オブジェクト
+
+        Returns:
+            NetkeibaURL: NetkeibaURL オブジェクト
+        """
+        return NetkeibaURLFactory.create(self.__category, self.__netkeiba_id)
+
+    def create_contents(self, partial: bool = False,
+                        extractor: NetkeibaExtractor | None = None) -> NetkeibaContents:
+        """ NetkeibaContents を作成する (soup に初めてアクセスした時点で解析する)
+
+        Args:
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+            extractor (NetkeibaExtractor | None): 各APIが表から値を取り出す抽出エンジン (省略時は NetkeibaSoupExtractor)
+
+        Returns:
+            NetkeibaContents: netkeiba Webページコンテンツ
+        """
+        return NetkeibaContents(self.url, html_byte=self.__body, partial=partial, extractor=extractor)
+
+
+class NetkeibaPackedArchive():
+    """ netkeiba 圧縮Webページアーカイブクラス
+
+    Webページを zstd で圧縮し, 1つのデータファイルに追記する. 学習した辞書を使用すると, 小さな Webページでも圧縮率が高くなる.
+    (カテゴリー, ID) からデータファイル上の位置への索引はメモリマップしたハッシュテーブルで, 1ページを O(1) で読み込める.
+    全ページの走査はデータファイルを先頭から順に読み込む.
+
+    NetkeibaClient の archive に指定すると, NetkeibaArchive と同様に RECORD モードで保存, REPLAY モードで再生する.
+    同じディレクトリに書き込めるのは1つのプロセスのみ.
+    """
+
+    DATA_FILE: str = 'pages.dat'
+    INDEX_FILE: str = 'pages.idx'
+    DICTIONARY_FILE: str = 'dictionary.zstd'
+
+    # NOTE: 索引ヘッダー (マジックナンバー, バージョン, スロット数, エントリー数, 書き込み済みのデータファイルサイズ)
+    __INDEX_HEADER: struct.Struct = struct.Struct('<4sIQQQ')
+    # NOTE: 索引スロット (カテゴリー + 1 (0 は空き), ID, データファイル上の位置)
+    __INDEX_SLOT: struct.Struct = struct.Struct('<QQQ')
+    # NOTE: レコードヘッダー (マジックナンバー, カテゴリー, ID, 取得日時, 圧縮前サイズ, 圧縮後サイズ)
+    __RECORD_HEADER: struct.Struct = struct.Struct('<4sB3xQdII')
+    __INDEX_MAGIC: bytes = b'NKIX'
+    __RECORD_MAGIC: bytes = b'NKPG'
+    __VERSION: int = 1
+    __INITIAL_CAPACITY: int = 1024
+    __MAX_LOAD_FACTOR: float = 0.7
+
+    __ERR_MESSAGE_1601: str = '圧縮Webページアーカイブを使用するには "zstandard" をインストールしてください.'
+    __ERR_MESSAGE_1602: str = '辞書の学習は空のアーカイブでのみ実行できます.'
+    __WARN_MESSAGE_1601: str = 'netkeiba ID で識別できない Webページのため, アーカイブに保存しません.'
+
+    def __init__(self, directory: str, mode: NetkeibaArchiveMode = NetkeibaArchiveMode.REPLAY,
+                 level: int = 10) -> None:
+        """ コンストラクタ
+
+        Args:
+            directory (str): アーカイブディレクトリ
+            mode (NetkeibaArchiveMode): アーカイブモード (NetkeibaClient の archive に指定した場合に使用する)
+            level (int): zstd の圧縮レベル
+        """
+        self.__logger: Logger = NKScraperLogger.create(__name__)
+        if zstandard is None:
+            self.__logger.error(NetkeibaPackedArchive.__ERR_MESSAGE_1601)
+            sys.exit()
+
+        self.__directory: str = directory
+        self.__mode: NetkeibaArchiveMode = mode
+        self.__level: int = level
+        os.makedirs(directory, exist_ok=True)
+
+        self.__dictionary: bytes | None = None
+        dictionary_path: str = os.path.join(directory, NetkeibaPackedArchive.DICTIONARY_FILE)
+        if os.path.exists(dictionary_path):
+            with open(dictionary_path, 'rb') as dictionary_file:
+                self.__dictionary = dictionary_file.read()
+        self.__compressor: zstandard.ZstdCompressor
+        self.__decompressor: zstandard.ZstdDecompressor
+        self.__create_codec()
+
+        data_path: str = os.path.join(directory, NetkeibaPackedArchive.DATA_FILE)
+        self.__data_file: BinaryIO = open(data_path, 'a+b')
+        self.__index_file: BinaryIO
+        self.__index: mmap.mmap
+        index_path: str = os.path.join(directory, NetkeibaPackedArchive.INDEX_FILE)
+        if os.path.exists(index_path):
+            self.__open_index()
+        else:
+            self.rebuild_index()
+        # NOTE: 追記中に中断した場合は, 索引に登録済みの位置まで切り詰める
+        if os.path.getsize(data_path) > self.__get_data_size():
+            self.__data_file.truncate(self.__get_data_size())
+
+    @property
+    def mode(self) -> NetkeibaArchiveMode:
+        """ アーカイブモード
+
+        Returns:
+            NetkeibaArchiveMode: アーカイブモード
+        """
+        return self.__mode
+
+    @property
+    def directory(self) -> str:
+        """ アーカイブディレクトリ
+
+        Returns:
+            str: アーカイブディレクトリ
+        """
+        return self.__directory
+
+    def __len__(self) -> int:
+        """ 保存している Webページの数
+
+        Returns:
+            int: Webページの数 (同じ (カテゴリー, ID) は1つと数える)
+        """
+        return self.__read_header()[3]
+
+    def __contains__(self, key: tuple[NetkeibaCategory, int]) -> bool:
+        """ (カテゴリー, ID) の Webページを保存しているか判定する
+
+        Args:
+            key (tuple[NetkeibaCategory, int]): (netkeiba Webページカテゴリー, netkeiba ID)
+
+        Returns:
+            bool: 保存している場合はTrue, そうでなければFalse
+        """
+        return self.__lookup(key[0], key[1]) is not None
+
+    def train_dictionary(self, samples: Iterable[bytes], dict_size: int = 112640) -> None:
+        """ Webページのサンプルから zstd の辞書を学習する
+
+        以降に追加する Webページは学習した辞書で圧縮する. 空のアーカイブでのみ実行できる.
+
+        Args:
+            samples (Iterable[bytes]): Webページのサンプル (カテゴリーを混在させてもよい. 数百ページ程度を推奨)
+            dict_size (int): 辞書の最大サイズ [byte]
+        """
+        if len(self) > 0:
+            self.__logger.error(NetkeibaPackedArchive.__ERR_MESSAGE_1602)
+            sys.exit()
+        dictionary: zstandard.ZstdCompressionDict = zstandard.train_dictionary(dict_size, list(samples))
+        self.__dictionary = dictionary.as_bytes()
+        dictionary_path: str = os.path.join(self.__directory, NetkeibaPackedArchive.DICTIONARY_FILE)
+        with open(dictionary_path, 'wb') as dictionary_file:
+            dictionary_file.write(self.__dictionary)
+        self.__create_codec()
+
+    def append(self, category: NetkeibaCategory, netkeiba_id: int, body: bytes,
+               fetched_at: float | None = None) -> None:
+        """ Webページを追加する
+
+        同じ (カテゴリー, ID) の Webページを追加した場合は, 新しい Webページで置き換える.
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+            netkeiba_id (int): netkeiba ID (レースID, 競走馬ID)
+            body (bytes): Webページ
+            fetched_at (float | None): 取得日時 (UNIX時間. 省略時は現在時刻)
+        """
+        compressed: bytes = self.__compressor.compress(body)
+        offset: int = self.__get_data_size()
+        self.__data_file.seek(offset)
+        self.__data_file.write(NetkeibaPackedArchive.__RECORD_HEADER.pack(
+            NetkeibaPackedArchive.__RECORD_MAGIC, category.value, int(netkeiba_id),
+            time.time() if fetched_at is None else fetched_at, len(body), len(compressed)))
+        self.__data_file.write(compressed)
+        # NOTE: データを書き込んでから索引を更新する (中断した場合は追記前の状態に戻る)
+        self.__data_file.flush()
+        self.__insert(category, int(netkeiba_id), offset)
+        self.__set_data_size(self.__data_file.tell())
+
+    def get_entry(self, category: NetkeibaCategory, netkeiba_id: int) -> NetkeibaArchiveEntry | None:
+        """ Webページを読み込む
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+            netkeiba_id (int): netkeiba ID (レースID, 競走馬ID)
+
+        Returns:
+            NetkeibaArchiveEntry | None: アーカイブエントリー (保存していない場合はNone)
+        """
+        offset: int | None = self.__lookup(category, int(netkeiba_id))
+        if offset is None:
+            return None
+        self.__data_file.seek(offset)
+        entry: NetkeibaArchiveEntry | None = self.__read_record(self.__data_file)
+        return entry
+
+    def iter_entries(self, category: NetkeibaCategory | None = None) -> Iterator[NetkeibaArchiveEntry]:
+        """ 全ての Webページをデータファイルの先頭から順に読み込む
+
+        置き換えられた古い Webページは読み飛ばす.
+
+        Args:
+            category (NetkeibaCategory | None): netkeiba Webページカテゴリー (None の場合は全て)
+
+        Yields:
+            NetkeibaArchiveEntry: アーカイブエントリー
+        """
+        data_size: int = self.__get_data_size()
+        data_path: str = os.path.join(self.__directory, NetkeibaPackedArchive.DATA_FILE)
+        with open(data_path, 'rb') as data_file:
+            offset: int = 0
+            while offset < data_size:
+                header: bytes = data_file.read(NetkeibaPackedArchive.__RECORD_HEADER.size)
+                _, category_value, netkeiba_id, _, _, compressed_size = \
+                    NetkeibaPackedArchive.__RECORD_HEADER.unpack(header)
+                next_offset: int = offset + len(header) + compressed_size
+                if (category is not None and category_value != category.value) or \
+                        self.__lookup(NetkeibaCategory(category_value), netkeiba_id) != offset:
+                    data_file.seek(next_offset)
+                else:
+                    data_file.seek(offset)
+                    entry: NetkeibaArchiveEntry | None = self.__read_record(data_file)
+                    if entry is not None:
+                        yield entry
+                offset = next_offset
+
+    def load(self, url: NetkeibaURL) -> bytes:
+        """ アーカイブから Webページを読み込む (NetkeibaArchive 互換)
+
+        Args:
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+
+        Returns:
+            bytes: Webページ
+
+        Raises:
+            FileNotFoundError: アーカイブに存在しない場合
+        """
+        entry: NetkeibaArchiveEntry | None = None
+        if NetkeibaURLFactory.is_supported(url.category):
+            entry = self.get_entry(url.category, NetkeibaURLFactory.get_id(url))
+        if entry is None:
+            raise FileNotFoundError(f'アーカイブに存在しません: {url.url}')
+        return entry.body
+
+    def save(self, url: NetkeibaURL, body: bytes, status: int = 200,
+             headers: dict[str, str] | None = None) -> None:
+        """ Webページをアーカイブに保存する (NetkeibaArchive 互換)
+
+        Args:
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+            body (bytes): Webページ
+            status (int): HTTPステータスコード (保存しない)
+            headers (dict[str, str] | None): レスポンスヘッダー (保存しない)
+        """
+        if not NetkeibaURLFactory.is_supported(url.category):
+            self.__logger.warning(f'{NetkeibaPackedArchive.__WARN_MESSAGE_1601} {url.url}')
+            return
+        self.append(url.category, NetkeibaURLFactory.get_id(url), body)
+
+    def rebuild_index(self) -> None:
+        """ データファイルを先頭から読み込み, 索引を作り直す
+
+        索引ファイルを削除した場合などに使用する. 途中で途切れたレコード以降は無視する.
+        """
+        entries: list[tuple[int, int, int]] = []
+        self.__data_file.seek(0)
+        offset: int = 0
+        while True:
+            header: bytes = self.__data_file.read(NetkeibaPackedArchive.__RECORD_HEADER.size)
+            if len(header) < NetkeibaPackedArchive.__RECORD_HEADER.size:
+                break
+            magic, category_value, netkeiba_id, _, _, compressed_size = \
+                NetkeibaPackedArchive.__RECORD_HEADER.unpack(header)
+            next_offset: int = offset + len(header) + compressed_size
+            if magic != NetkeibaPackedArchive.__RECORD_MAGIC or \
+                    len(self.__data_file.read(compressed_size)) < compressed_size:
+                break
+            entries.append((category_value + 1, netkeiba_id, offset))
+            offset = next_offset
+        self.__write_index(entries, offset)
+
+    def flush(self) -> None:
+        """ データファイル・索引をディスクに書き込む
+        """
+        self.__data_file.flush()
+        os.fsync(self.__data_file.fileno())
+        self.__index.flush()
+
+    def close(self) -> None:
+        """ アーカイブを閉じる
+        """
+        if self.__data_file.closed:
+            return
+        self.flush()
+        self.__index.close()
+        self.__index_file.close()
+        self.__data_file.close()
+
+    def __create_codec(self) -> None:
+        """ 辞書を指定して圧縮器・展開器を作成する
+        """
+        if self.__dictionary is None:
+            self.__compressor = zstandard.ZstdCompressor(level=self.__level)
+            self.__decompressor = zstandard.ZstdDecompressor()
+        else:
+            dictionary: zstandard.ZstdCompressionDict = zstandard.ZstdCompressionDict(self.__dictionary)
+            self.__compressor = zstandard.ZstdCompressor(level=self.__level, dict_data=dictionary)
+            self.__decompressor = zstandard.ZstdDecompressor(dict_data=dictionary)
+
+    def __read_record(self, data_file: BinaryIO) -> NetkeibaArchiveEntry | None:
+        """ 現在位置のレコードを読み込む
+
+        Args:
+            data_file (BinaryIO): データファイル
+
+        Returns:
+            NetkeibaArchiveEntry | None: アーカイブエントリー (レコードが壊れている場合はNone)
+        """
+        header: bytes = data_file.read(NetkeibaPackedArchive.__RECORD_HEADER.size)
+        if len(header) < NetkeibaPackedArchive.__RECORD_HEADER.size:
+            return None
+        magic, category_value, netkeiba_id, fetched_at, size, compressed_size = \
+            NetkeibaPackedArchive.__RECORD_HEADER.unpack(header)
+        if magic != NetkeibaPackedArchive.__RECORD_MAGIC:
+            return None
+        body: bytes = self.__decompressor.decompress(data_file.read(compressed_size), max_output_size=size)
+        return NetkeibaArchiveEntry(NetkeibaCategory(category_value), netkeiba_id, body, fetched_at)
+
+    # Index -------------------------------------------------------------------
+    def __open_index(self) -> None:
+        """ 索引ファイルをメモリマップする
+        """
+        index_path: str = os.path.join(self.__directory, NetkeibaPackedArchive.INDEX_FILE)
+        self.__index_file = open(index_path, 'r+b')
+        self.__index = mmap.mmap(self.__index_file.fileno(), 0)
+        if self.__read_header()[0] != NetkeibaPackedArchive.__INDEX_MAGIC:
+            self.__index.close()
+            self.__index_file.close()
+            self.rebuild_index()
+
+    def __write_index(self, entries: list[tuple[int, int, int]], data_size: int) -> None:
+        """ 索引ファイルを作成し, メモリマップする
+
+        Args:
+            entries (list[tuple[int, int, int]]): 索引スロット ((カテゴリー + 1, ID, 位置), ...). 同じキーは後のものを優先する
+            data_size (int): 書き込み済みのデータファイルサイズ
+        """
+        capacity: int = NetkeibaPackedArchive.__INITIAL_CAPACITY
+        while len(entries) >= capacity * NetkeibaPackedArchive.__MAX_LOAD_FACTOR:
+            capacity *= 2
+
+        index_path: str = os.path.join(self.__directory, NetkeibaPackedArchive.INDEX_FILE)
+        temp_path: str = f'{index_path}.tmp'
+        with open(temp_path, 'w+b') as temp_file:
+            temp_file.truncate(NetkeibaPackedArchive.__INDEX_HEADER.size
+                               + capacity * NetkeibaPackedArchive.__INDEX_SLOT.size)
+            with mmap.mmap(temp_file.fileno(), 0) as index:
+                count: int = 0
+                for key, netkeiba_id, offset in entries:
+                    slot, found = NetkeibaPackedArchive.__find_slot(index, capacity, key, netkeiba_id)
+                    NetkeibaPackedArchive.__INDEX_SLOT.pack_into(
+                        index, NetkeibaPackedArchive.__get_slot_position(slot), key, netkeiba_id, offset)
+                    count += 0 if found else 1
+                NetkeibaPackedArchive.__INDEX_HEADER.pack_into(
+                    index, 0, NetkeibaPackedArchive.__INDEX_MAGIC, NetkeibaPackedArchive.__VERSION,
+                    capacity, count, data_size)
+                index.flush()
+        os.replace(temp_path, index_path)
+        self.__open_index()
+
+    def __read_header(self) -> tuple[bytes, int, int, int, int]:
+        """ 索引ヘッダーを読み込む
+
+        Returns:
+            tuple[bytes, int, int, int, int]: (マジックナンバー, バージョン, スロット数, エントリー数, データファイルサイズ)
+        """
+        return NetkeibaPackedArchive.__INDEX_HEADER.unpack_from(self.__index, 0)
+
+    def __get_data_size(self) -> int:
+        """ 書き込み済みのデータファイルサイズを取得する
+
+        Returns:
+            int: データファイルサイズ [byte]
+        """
+        return self.__read_header()[4]
+
+    def __set_data_size(self, data_size: int) -> None:
+        """ 書き込み済みのデータファイルサイズを更新する
+
+        Args:
+            data_size (int): データファイルサイズ [byte]
+        """
+        magic, version, capacity, count, _ = self.__read_header()
+        NetkeibaPackedArchive.__INDEX_HEADER.pack_into(self.__index, 0, magic, version, capacity, count, data_size)
+
+    def __lookup(self, category: NetkeibaCategory, netkeiba_id: int) -> int | None:
+        """ 索引からデータファイル上の位置を取得する
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+            netkeiba_id (int): netkeiba ID
+
+        Returns:
+            int | None: データファイル上の位置 (保存していない場合はNone)
+        """
+        capacity: int = self.__read_header()[2]
+        slot, found = NetkeibaPackedArchive.__find_slot(self.__index, capacity, category.value + 1, netkeiba_id)
+        if not found:
+            return None
+        return NetkeibaPackedArchive.__INDEX_SLOT.unpack_from(
+            self.__index, NetkeibaPackedArchive.__get_slot_position(slot))[2]
+
+    def __insert(self, category: NetkeibaCategory, netkeiba_id: int, offset: int) -> None:
+        """ 索引に登録する (負荷率が上限を超える場合は, スロット数を倍にして作り直す)
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+            netkeiba_id (int): netkeiba ID
+            offset (int): データファイル上の位置
+        """
+        magic, version, capacity, count, data_size = self.__read_header()
+        key: int = category.value + 1
+        slot, found = NetkeibaPackedArchive.__find_slot(self.__index, capacity, key, netkeiba_id)
+        if not found and count + 1 >= capacity * NetkeibaPackedArchive.__MAX_LOAD_FACTOR:
+            entries: list[tuple[int, int, int]] = self.__get_index_entries()
+            entries.append((key, netkeiba_id, offset))
+            self.__index.close()
+            self.__index_file.close()
+            self.__write_index(entries, data_size)
+            return
+        NetkeibaPackedArchive.__INDEX_SLOT.pack_into(
+            self.__index, NetkeibaPackedArchive.__get_slot_position(slot), key, netkeiba_id, offset)
+        if not found:
+            NetkeibaPackedArchive.__INDEX_HEADER.pack_into(
+                self.__index, 0, magic, version, capacity, count + 1, data_size)
+
+    def __get_index_entries(self) -> list[tuple[int, int, int]]:
+        """ 索引に登録済みの全スロットを取得する
+
+        Returns:
+            list[tuple[int, int, int]]: 索引スロット ((カテゴリー + 1, ID, 位置), ...)
+        """
+        capacity: int = self.__read_header()[2]
+        entries: list[tuple[int, int, int]] = []
+        for slot in range(capacity):
+            entry: tuple[int, int, int] = NetkeibaPackedArchive.__INDEX_SLOT.unpack_from(
+                self.__index, NetkeibaPackedArchive.__get_slot_position(slot))
+            if entry[0] != 0:
+                entries.append(entry)
+        return entries
+
+    @staticmethod
+    def __find_slot(index: mmap.mmap, capacity: int, key: int, netkeiba_id: int) -> tuple[int, bool]:
+        """ キーのスロット, または, 空きスロットを探す (オープンアドレス法・線形探索)
+
+        Args:
+            index (mmap.mmap): 索引
+            capacity (int): スロット数 (2のべき乗)
+            key (int): カテゴリー + 1
+            netkeiba_id (int): netkeiba ID
+
+        Returns:
+            tuple[int, bool]: (スロット番号, キーが見つかった場合はTrue)
+        """
+        mask: int = capacity - 1
+        hash_value: int = ((netkeiba_id * 0x9E3779B97F4A7C15) ^ (key * 0xC2B2AE3D27D4EB4F)) & 0xFFFFFFFFFFFFFFFF
+        slot: int = (hash_value ^ (hash_value >> 31)) & mask
+        while True:
+            slot_key, slot_id, _ = NetkeibaPackedArchive.__INDEX_SLOT.unpack_from(
+                index, NetkeibaPackedArchive.__get_slot_position(slot))
+            if slot_key == 0:
+                return slot, False
+            if slot_key == key and slot_id == netkeiba_id:
+                return slot, True
+            slot = (slot + 1) & mask
+
+    @staticmethod
+    def __get_slot_position(slot: int) -> int:
+        """ スロットの索引ファイル上の位置を取得する
+
+        Args:
+            slot (int): スロット番号
+
+        Returns:
+            int: 索引ファイル上の位置
+        """
+        return NetkeibaPackedArchive.__INDEX_HEADER.size + slot * NetkeibaPackedArchive.__INDEX_SLOT.size
+
+    # Context Manager ---------------------------------------------------------
+    def __enter__(self) -> NetkeibaPackedArchive:
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+""" netkeiba Webページ解析モジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.utils import NKScraperLogger
+from nkscraper.common import NetkeibaCategory
+
+# build-in
+import re
+
+# OSS
+from bs4 import BeautifulSoup, SoupStrainer
+
+# for type declaration only
+from logging import Logger
+from typing import Any
+
+
+class NetkeibaUnavailableError(Exception):
+    """ Webページに取得対象の内容が掲載されていない (出馬表が未確定, オッズが未発売, 検索結果が0件など) 場合の例外
+    """
+
+    def __init__(self, category: NetkeibaCategory, message: str) -> None:
+        """ コンストラクタ
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+            message (str): 掲載されていない理由
+        """
+        super().__init__(message)
+        self.__category: NetkeibaCategory = category
+
+    @property
+    def category(self) -> NetkeibaCategory:
+        """ netkeiba Webページカテゴリー
+
+        Returns:
+            NetkeibaCategory: netkeiba Webページカテゴリー
+        """
+        return self.__category
+
+
+class NetkeibaStrainer(SoupStrainer):
+    """ netkeiba 部分解析用 SoupStrainer クラス
+
+    (タグ名, 属性名, 属性値) のいずれかに一致するタグのみを解析対象とする.
+    属性名が None の場合はタグ名のみで判定する.
+    """
+
+    def __init__(self, targets: tuple[tuple[str, str | None, str | None], ...]) -> None:
+        """ コンストラクタ
+
+        Args:
+            targets (tuple[tuple[str, str | None, str | None], ...]): 解析対象 ((タグ名, 属性名, 属性値), ...)
+        """
+        self.__targets: tuple[tuple[str, str | None, str | None], ...] = targets
+        # NOTE: beautifulsoup4 4.12 以前は name に指定した関数が (タグ名, 属性) で呼び出される
+        # NOTE: BeautifulSoup の pickle に含まれるため, 名前修飾されないメソッドを渡す
+        super().__init__(self.match_tag)
+
+    def allow_tag_creation(self, nsprefix: str | None, name: str,
+                           attrs: dict[str, Any] | None) -> bool:
+        """ タグを解析対象とするか判定する (beautifulsoup4 4.13 以降)
+
+        Args:
+            nsprefix (str | None): 名前空間プレフィックス
+            name (str): タグ名
+            attrs (dict[str, Any] | None): 属性
+
+        Returns:
+            bool: 解析対象であればTrue, そうでなければFalse
+        """
+        return self.match_tag(name, attrs)
+
+    def match_tag(self, name: Any, attrs: dict[str, Any] | None = None) -> bool:
+        """ タグが解析対象に一致するか判定する
+
+        Args:
+            name (Any): タグ名
+            attrs (dict[str, Any] | None): 属性
+
+        Returns:
+            bool: 一致すればTrue, そうでなければFalse
+        """
+        if not isinstance(name, str):
+            return False
+        attrs = {} if attrs is None else dict(attrs)
+        for target_name, attr_name, attr_value in self.__targets:
+            if name != target_name:
+                continue
+            if attr_name is None:
+                return True
+            value: Any = attrs.get(attr_name)
+            values: list[str] = value.split() if isinstance(value, str) else list(value or [])
+            if attr_value in values:
+                return True
+        return False
+
+
+class NetkeibaParser():
+    """ netkeiba Webページ解析クラス
+
+    プロセスプールから呼び出せるように, 解析処理を静的メソッドとして提供する.
+    """
+
+    # NOTE: 各APIが参照する要素 ((タグ名, 属性名, 属性値), ...). None は全体を解析する
+    STRAINER_TARGETS: dict[NetkeibaCategory, tuple[tuple[str, str | None, str | None], ...] | None] = {
+        NetkeibaCategory.SHUTUBA_TABLE: (
+            ('title', None, None),
+            ('div', 'class', 'RaceName'),
+            ('div', 'class', 'RaceData01'),
+            ('div', 'class', 'RaceData02'),
+            ('table', 'class', 'Shutuba_Table'),
+        ),
+        NetkeibaCategory.RACE_RESULT: (
+            ('title', None, None),
+            ('div', 'class', 'RaceName'),
+            ('div', 'class', 'RaceData01'),
+            ('div', 'class', 'RaceData02'),
+            ('table', 'id', 'All_Result_Table'),
+        ),
+        NetkeibaCategory.ODDS: None,
+        NetkeibaCategory.TRAINING_EVALUATION: (
+            ('title', None, None),
+            ('div', 'class', 'RaceName'),
+            ('div', 'class', 'RaceData01'),
+            ('div', 'class', 'RaceData02'),
+            ('table', 'class', 'OikiriTable'),
+        ),
+        NetkeibaCategory.HORSE_INFO: (
+            ('div', 'class', 'horse_title'),
+            ('table', 'class', 'blood_table'),
+            ('table', 'class', 'db_prof_table'),
+            ('table', 'class', 'db_h_race_results'),
+        ),
+        NetkeibaCategory.SEARCHED_RACE: (
+            ('table', 'class', 'race_table_01'),
+        ),
+    }
+
+    # NOTE: None は文字コードを推定する
+    ENCODINGS: dict[NetkeibaCategory, str | None] = {
+        NetkeibaCategory.SHUTUBA_TABLE: 'EUC-JP',
+        NetkeibaCategory.RACE_RESULT: 'EUC-JP',
+        NetkeibaCategory.ODDS: None,
+        NetkeibaCategory.TRAINING_EVALUATION: 'EUC-JP',
+        NetkeibaCategory.HORSE_INFO: 'EUC-JP',
+        NetkeibaCategory.SEARCHED_RACE: 'EUC-JP',
+    }
+
+    # NOTE: 各APIが参照する表の目印 (属性値). Webページに含まれない場合は解析しても取得できない
+    TABLE_MARKERS: dict[NetkeibaCategory, bytes] = {
+        NetkeibaCategory.SHUTUBA_TABLE: b'Shutuba_Table',
+        NetkeibaCategory.RACE_RESULT: b'All_Result_Table',
+        NetkeibaCategory.TRAINING_EVALUATION: b'OikiriTable',
+        NetkeibaCategory.HORSE_INFO: b'db_prof_table',
+        NetkeibaCategory.SEARCHED_RACE: b'race_table_01',
+    }
+
+    # NOTE: 表の目印より後ろに含まれるべき行の目印 (属性値)
+    ROW_MARKERS: dict[NetkeibaCategory, bytes] = {
+        NetkeibaCategory.SHUTUBA_TABLE: b'HorseList',
+    }
+
+    # NOTE: 馬券の販売が開始されていないオッズ (JSON) の目印
+    ODDS_UNAVAILABLE_PATTERN: re.Pattern[bytes] = re.compile(rb'"status"\s*:\s*"(?:NG|yoso)"')
+
+    __WARN_MESSAGE_1401: str = '"lxml"の読み込みに失敗したため, "html.parser" を使用します.'
+    __ERR_MESSAGE_1402: str = '取得対象の表が掲載されていません.'
+    __ERR_MESSAGE_1403: str = '取得対象の表に行が掲載されていません.'
+    __ERR_MESSAGE_1404: str = 'オッズが掲載されていません. 馬券の販売が開始されていない可能性があります.'
+
+    @staticmethod
+    def check_available(html_byte: bytes, category: NetkeibaCategory | None) -> None:
+        """ 解析せずに, Webページに取得対象の内容が掲載されているか確認する
+
+        Webページのバイト列から TABLE_MARKERS, ROW_MARKERS, ODDS_UNAVAILABLE_PATTERN の目印を検索する.
+        目印は各APIが解析後に参照する要素と同じため, 掲載されていると判定した Webページの解析結果は変わらない.
+
+        Args:
+            html_byte (bytes): Webページ
+            category (NetkeibaCategory | None): netkeiba Webページカテゴリー
+
+        Raises:
+            NetkeibaUnavailableError: 取得対象の内容が掲載されていない場合
+        """
+        if category is None:
+            return
+        if category == NetkeibaCategory.ODDS:
+            if NetkeibaParser.ODDS_UNAVAILABLE_PATTERN.search(html_byte) is not None:
+                raise NetkeibaUnavailableError(category, NetkeibaParser.__ERR_MESSAGE_1404)
+            return
+
+        table_marker: bytes | None = NetkeibaParser.TABLE_MARKERS.get(category)
+        if table_marker is None:
+            return
+        position: int = html_byte.find(table_marker)
+        row_marker: bytes | None = NetkeibaParser.ROW_MARKERS.get(category)
+        NetkeibaParser.check_markers(
+            category, position >= 0,
+            row_marker is None or (position >= 0 and html_byte.find(row_marker, position) >= 0))
+
+    @staticmethod
+    def check_markers(category: NetkeibaCategory, has_table: bool, has_row: bool) -> None:
+        """ TABLE_MARKERS, ROW_MARKERS の目印の検索結果から, 取得対象の内容が掲載されているか確認する
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+            has_table (bool): 表の目印が見つかった場合はTrue
+            has_row (bool): 表の目印より後ろに行の目印が見つかった (または, 行の目印がない) 場合はTrue
+
+        Raises:
+            NetkeibaUnavailableError: 取得対象の内容が掲載されていない場合
+        """
+        if not has_table:
+            raise NetkeibaUnavailableError(category, NetkeibaParser.__ERR_MESSAGE_1402)
+        if not has_row:
+            raise NetkeibaUnavailableError(category, NetkeibaParser.__ERR_MESSAGE_1403)
+
+    @staticmethod
+    def parse(html_byte: bytes, category: NetkeibaCategory | None = None,
+              partial: bool = False) -> BeautifulSoup:
+        """ Webページを解析する
+
+        partial が True の場合, カテゴリーごとの STRAINER_TARGETS に一致する要素のみを解析し,
+        ENCODINGS の文字コードでデコードする (文字コードの推定を省略する).
+
+        Args:
+            html_byte (bytes): Webページ
+            category (NetkeibaCategory | None): netkeiba Webページカテゴリー
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+
+        Returns:
+            BeautifulSoup: BeautifulSoupオブジェクト
+        """
+        kwargs: dict[str, Any] = {}
+        if partial and category is not None:
+            targets: tuple[tuple[str, str | None, str | None], ...] | None = \
+                NetkeibaParser.STRAINER_TARGETS.get(category)
+            if targets is not None:
+                kwargs['parse_only'] = NetkeibaStrainer(targets)
+            encoding: str | None = NetkeibaParser.ENCODINGS.get(category)
+            if encoding is not None:
+                kwargs['from_encoding'] = encoding
+
+        try:
+            return BeautifulSoup(html_byte, 'lxml', **kwargs)
+        except Exception as e:
+            logger: Logger = NKScraperLogger.create(__name__)
+            logger.warning(NetkeibaParser.__WARN_MESSAGE_1401)
+            return BeautifulSoup(html_byte, 'html.parser', **kwargs)
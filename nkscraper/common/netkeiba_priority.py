@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+""" netkeiba リクエスト優先度モジュール
+"""
+
+# built-in
+from enum import Enum
+
+
+class NetkeibaPriority(Enum):
+    """ netkeiba リクエスト優先度 (値が小さいほど優先する)
+    """
+    HIGH = 0  # 直前のオッズなど, 遅延が許されないリクエスト
+    NORMAL = 10  # 通常のリクエスト
+    LOW = 20  # 過去データの一括取得など, 遅延してもよいリクエスト
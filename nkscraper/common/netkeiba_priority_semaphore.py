@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+""" netkeiba 優先度付きセマフォモジュール
+"""
+
+from __future__ import annotations
+
+# build-in
+import asyncio
+import heapq
+import itertools
+
+
+class NetkeibaPrioritySemaphore():
+    """ netkeiba 優先度付きセマフォクラス
+
+    空きがない場合, 待機中の取得要求は優先度の値が小さい順 (同じ優先度は到着順) に処理される.
+    同時に取得できる数 (limit) は実行中に変更できる.
+    """
+
+    def __init__(self, value: int) -> None:
+        """ コンストラクタ
+
+        Args:
+            value (int): 同時に取得できる数
+        """
+        self.__limit: int = max(1, value)
+        self.__in_use: int = 0
+        self.__waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        # NOTE: 待機中 (割り当て前・キャンセル前) の取得要求の数. キャンセル済みの取得要求はヒープに残るため別に数える
+        self.__num_waiters: int = 0
+        self.__counter: itertools.count[int] = itertools.count()
+
+    @property
+    def limit(self) -> int:
+        """ 同時に取得できる数
+
+        Returns:
+            int: 同時に取得できる数
+        """
+        return self.__limit
+
+    @limit.setter
+    def limit(self, value: int) -> None:
+        """ 同時に取得できる数を変更する
+
+        増やした場合は, 待機中の取得要求に割り当てる.
+        減らした場合は, 取得中の数が新しい値を下回るまで新たに割り当てない.
+
+        Args:
+            value (int): 同時に取得できる数
+        """
+        self.__limit = max(1, value)
+        self.__wake_up()
+
+    @property
+    def in_use(self) -> int:
+        """ 取得中の数
+
+        Returns:
+            int: 取得中の数
+        """
+        return self.__in_use
+
+    @property
+    def num_waiters(self) -> int:
+        """ 待機中の取得要求の数
+
+        Returns:
+            int: 待機中の取得要求の数
+        """
+        return self.__num_waiters
+
+    async def acquire(self, priority: int = 0) -> None:
+        """ セマフォを取得する
+
+        Args:
+            priority (int): 優先度 (値が小さいほど優先する)
+        """
+        if self.__in_use < self.__limit and self.__num_waiters == 0:
+            self.__in_use += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.__waiters, (priority, next(self.__counter), future))
+        self.__num_waiters += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                self.__num_waiters -= 1
+            # NOTE: 割り当て後にキャンセルされた場合は, 次の取得要求に譲る
+            else:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """ セマフォを解放する
+
+        待機中の取得要求があれば, 最も優先度の高いものに割り当てる.
+        """
+        self.__in_use -= 1
+        self.__wake_up()
+
+    def __wake_up(self) -> None:
+        """ 空きがある限り, 待機中の取得要求に優先度順に割り当てる
+        """
+        while self.__in_use < self.__limit and len(self.__waiters) > 0:
+            _, _, future = heapq.heappop(self.__waiters)
+            # NOTE: キャンセル済みの取得要求は読み飛ばす
+            if not future.done():
+                self.__in_use += 1
+                self.__num_waiters -= 1
+                future.set_result(None)
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+""" netkeiba レース情報ヘッダーモジュール
+"""
+
+from __future__ import annotations
+
+# build-in
+from datetime import datetime, time
+import re
+
+# for type declaration only
+from typing import Any, Callable, TYPE_CHECKING
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+from datetime import date
+if TYPE_CHECKING:
+    from nkscraper.utils import NKScraperHelper
+
+
+class NetkeibaRaceHeader():
+    """ netkeiba レース情報ヘッダークラス
+
+    出馬表・レース結果・調教評価の Webページに共通するレース情報 (title, RaceName, RaceData01, RaceData02) を1回だけ解析し, 値を保持する.
+    各APIの scrape_race_name などは要素を検索し直さずに, 保持した値を返す.
+    取得時に例外が発生した項目は, 値を参照すると同じ例外を送出する.
+    """
+
+    __DATE_PATTERN: re.Pattern = re.compile(r'\d{4}年\d{1,2}月\d{1,2}日')
+    __START_TIME_PATTERN: re.Pattern = re.compile(r'(\d{1,2}):(\d{2})発走')
+    __WEATHER_PATTERN: re.Pattern = re.compile(r'天候\s*:\s*([^\s/]+)')
+    __TRACK_CONDITION_PATTERN: re.Pattern = re.compile(r'馬場\s*:\s*([^\s/]+)')
+
+    def __init__(self, soup: BeautifulSoup, helper: NKScraperHelper) -> None:
+        """ コンストラクタ
+
+        Args:
+            soup (BeautifulSoup): BeautifulSoupオブジェクト
+            helper (NKScraperHelper): nkscraper ヘルパー (文字列の整形に使用する)
+        """
+        title: Tag | None = soup.find('title')
+        div_race_name: Tag | None = soup.find('div', class_='RaceName')
+        div_race_data01: Tag | None = soup.find('div', class_='RaceData01')
+        div_race_data02: Tag | None = soup.find('div', class_='RaceData02')
+
+        self.__race_name: Any = NetkeibaRaceHeader.__parse(
+            lambda: helper.arrange_string(str(div_race_name.contents[0])))  # type: ignore[union-attr]
+        self.__race_date: Any = NetkeibaRaceHeader.__parse(
+            lambda: datetime.strptime(
+                NetkeibaRaceHeader.__DATE_PATTERN.findall(str(title.contents[0]))[0],  # type: ignore[union-attr]
+                '%Y年%m月%d日').date())
+
+        # NOTE: コース種別と距離は同じ span (例: 芝2500m) から取り出す
+        course_type_distance: Any = NetkeibaRaceHeader.__parse(
+            lambda: helper.arrange_string(str(div_race_data01.find('span').contents[0])))  # type: ignore[union-attr]
+        self.__course_type: Any = NetkeibaRaceHeader.__parse(
+            lambda: course_type_distance[0], course_type_distance)
+        self.__distance: Any = NetkeibaRaceHeader.__parse(
+            lambda: int(course_type_distance[1:-1]), course_type_distance)
+
+        # NOTE: 発走時刻・天候・馬場状態は RaceData01 の文字列から取り出す (発走前の出馬表などで掲載されていない場合はNone)
+        race_data01: Any = NetkeibaRaceHeader.__parse(
+            lambda: div_race_data01.get_text())  # type: ignore[union-attr]
+        self.__start_time: Any = NetkeibaRaceHeader.__parse(
+            lambda: NetkeibaRaceHeader.__search_start_time(race_data01), race_data01)
+        self.__weather: Any = NetkeibaRaceHeader.__parse(
+            lambda: NetkeibaRaceHeader.__search(NetkeibaRaceHeader.__WEATHER_PATTERN, race_data01), race_data01)
+        self.__track_condition: Any = NetkeibaRaceHeader.__parse(
+            lambda: NetkeibaRaceHeader.__search(NetkeibaRaceHeader.__TRACK_CONDITION_PATTERN, race_data01),
+            race_data01)
+
+        self.__field_name: Any = NetkeibaRaceHeader.__parse(
+            lambda: helper.arrange_string(div_race_data02.find_all('span')[1].contents[0]))  # type: ignore[union-attr]
+
+    @property
+    def race_name(self) -> str:
+        """ レース名
+
+        Returns:
+            str: レース名
+        """
+        return NetkeibaRaceHeader.__get(self.__race_name)
+
+    @property
+    def race_date(self) -> date:
+        """ レース開催日
+
+        Returns:
+            date: レース開催日
+        """
+        return NetkeibaRaceHeader.__get(self.__race_date)
+
+    @property
+    def course_type(self) -> str:
+        """ コース種別
+
+        Returns:
+            str: コース種別 (芝 or ダ)
+        """
+        return NetkeibaRaceHeader.__get(self.__course_type)
+
+    @property
+    def distance(self) -> int:
+        """ レース距離
+
+        Returns:
+            int: レース距離
+        """
+        return NetkeibaRaceHeader.__get(self.__distance)
+
+    @property
+    def start_time(self) -> time | None:
+        """ 発走時刻
+
+        Returns:
+            time | None: 発走時刻 (掲載されていない場合はNone)
+        """
+        return NetkeibaRaceHeader.__get(self.__start_time)
+
+    @property
+    def weather(self) -> str | None:
+        """ 天候
+
+        Returns:
+            str | None: 天候 (晴, 曇 など) (掲載されていない場合はNone)
+        """
+        return NetkeibaRaceHeader.__get(self.__weather)
+
+    @property
+    def track_condition(self) -> str | None:
+        """ 馬場状態
+
+        Returns:
+            str | None: 馬場状態 (良, 稍重, 重, 不良) (掲載されていない場合はNone)
+        """
+        return NetkeibaRaceHeader.__get(self.__track_condition)
+
+    @property
+    def field_name(self) -> str:
+        """ 競馬場名
+
+        Returns:
+            str: 競馬場名
+        """
+        return NetkeibaRaceHeader.__get(self.__field_name)
+
+    @staticmethod
+    def __parse(function: Callable[[], Any], source: Any = None) -> Any:
+        """ 値を取り出す (例外が発生した場合は例外を返す)
+
+        Args:
+            function (Callable[[], Any]): 値を取り出す関数
+            source (Any): 取り出し元の値 (例外の場合は, 取り出さずに同じ例外を返す)
+
+        Returns:
+            Any: 値, または, 例外 (解析結果を参照するフレームを残さないよう traceback を切り離す)
+        """
+        if isinstance(source, BaseException):
+            return source
+        try:
+            return function()
+        except Exception as e:
+            return e.with_traceback(None)
+
+    @staticmethod
+    def __get(value: Any) -> Any:
+        """ 値を取得する (例外の場合は送出する)
+        """
+        if isinstance(value, BaseException):
+            raise value
+        return value
+
+    @staticmethod
+    def __search(pattern: re.Pattern, string: str) -> str | None:
+        """ 正規表現の最初のグループを検索する (一致しない場合はNone)
+        """
+        match: re.Match | None = pattern.search(string)
+        return None if match is None else match.group(1)
+
+    @staticmethod
+    def __search_start_time(string: str) -> time | None:
+        """ 発走時刻を検索する (一致しない場合はNone)
+        """
+        match: re.Match | None = NetkeibaRaceHeader.__START_TIME_PATTERN.search(string)
+        return None if match is None else time(int(match.group(1)), int(match.group(2)))
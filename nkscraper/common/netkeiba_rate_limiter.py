@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+""" netkeiba レートリミッターモジュール
+"""
+
+from __future__ import annotations
+
+# build-in
+import asyncio
+import time
+
+
+class NetkeibaRateLimiter():
+    """ netkeiba レートリミッタークラス
+
+    トークンバケット方式で, 1秒あたりのリクエスト数を制限する.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """ コンストラクタ
+
+        Args:
+            rate (float): 1秒あたりに補充するトークン数 (リクエスト数/秒)
+            capacity (float | None): バケット容量 (省略時は max(1, rate))
+        """
+        self.__rate: float = rate
+        self.__capacity: float = max(1.0, rate) if capacity is None else capacity
+        self.__tokens: float = self.__capacity
+        self.__updated_at: float = time.monotonic()
+        self.__lock: asyncio.Lock | None = None
+
+    @property
+    def rate(self) -> float:
+        """ 1秒あたりのリクエスト数
+
+        Returns:
+            float: 1秒あたりのリクエスト数
+        """
+        return self.__rate
+
+    async def acquire(self) -> None:
+        """ トークンを1つ取得する
+
+        トークンが不足している場合は, 補充されるまで待機する.
+        待機中のリクエストは到着順に処理される.
+        """
+        # NOTE: asyncio.Lock はイベントループ上で生成する
+        if self.__lock is None:
+            self.__lock = asyncio.Lock()
+
+        async with self.__lock:
+            while True:
+                self.__refill()
+                if self.__tokens >= 1.0:
+                    self.__tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self.__tokens) / self.__rate)
+
+    def __refill(self) -> None:
+        """ 経過時間に応じてトークンを補充する
+        """
+        now: float = time.monotonic()
+        elapsed: float = now - self.__updated_at
+        self.__tokens = min(self.__capacity, self.__tokens + elapsed * self.__rate)
+        self.__updated_at = now
@@ -2,22 +2,27 @@
 """ netkeiba HTTP Requests通信モジュール
 """
 
+from __future__ import annotations
+
 # nkscraper
-from nkscraper.utils import NKScraperLogger
+from nkscraper.utils import NKScraperLogger, NKScraperException
+from nkscraper.common import NetkeibaResult, NetkeibaArchiveMode, NetkeibaParser, NetkeibaUnavailableError
+from nkscraper.common import NetkeibaStreamParser, NetkeibaSnapshot
 
 # build-in
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 import time
 import asyncio
-import sys
-
-# OSS
-from bs4 import BeautifulSoup
-import aiohttp
 
 # for type declaration only
-from nkscraper.common import NetkeibaContents
+from nkscraper.common import NetkeibaContents, NetkeibaClient, NetkeibaCache, NetkeibaCacheEntry
+from nkscraper.common import NetkeibaArchive, NetkeibaPackedArchive, NetkeibaResponse, NetkeibaExtractor
+from concurrent.futures import Executor
 from nkscraper.url import NetkeibaURL
 from logging import Logger
+from typing import AsyncIterator, Iterator
+from bs4 import BeautifulSoup
 
 
 class NetkeibaRequests():
@@ -25,12 +30,17 @@ class NetkeibaRequests():
     """
 
     __ERR_MESSAGE_1201: str = 'Webページの読み込みに失敗しました.'
-    __WARN_MESSAGE_1201: str = '"lxml"の読み込みに失敗したため, "html.parser" を使用します.'
+    __ERR_MESSAGE_1203: str = '締め切りを過ぎたため, Webページの取得を中止しました.'
+    __WARN_MESSAGE_1202: str = 'Webページの読み込みに失敗したため, 再試行します.'
 
-    def __init__(self) -> None:
+    def __init__(self, client: NetkeibaClient | None = None) -> None:
         """ コンストラクタ
+
+        Args:
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
         """
         self.__logger: Logger = NKScraperLogger.create(__name__)
+        self.__client: NetkeibaClient | None = client
 
     def get(self, url: NetkeibaURL) -> NetkeibaContents:
         """ netkeiba HTTP通信 GET API
@@ -40,24 +50,67 @@ class NetkeibaRequests():
 
         Returns:
             NetkeibaContents: netkeiba Webページコンテンツ
+
+        Raises:
+            NKScraperException: 再試行しても取得に失敗した場合, または, 取得対象の内容が掲載されていない場合
         """
-        return asyncio.run(self.__get_process([url]))[0]
+        result: NetkeibaResult = self.get_results_by_list([url])[0]
+        if result.contents is None:
+            raise NKScraperException(result.error)
+        return result.contents
 
     def get_by_list(self, url_list: list[NetkeibaURL]) -> list[NetkeibaContents]:
         """ netkeiba HTTP通信 GET API
 
+        取得に失敗したURLはエラーログを出力して除外し, 取得に成功したコンテンツのみを返す.
+
         Args:
             url_list (list[NetkeibaURL]): NetkaibaURL配列
 
         Returns:
             list[NetkeibaContents]: netkeiba Webページコンテンツ配列
         """
-        return asyncio.run(self.__get_process(url_list))
+        return [
+            result.contents for result in self.get_results_by_list(url_list)
+            if result.contents is not None
+        ]
 
-    async def __get_process(self, url_list: list[NetkeibaURL]) -> list[NetkeibaContents]:
-        """ netkeiba HTTP通信 GET関数
+    def get_results_by_list(self, url_list: list[NetkeibaURL]) -> list[NetkeibaResult]:
+        """ netkeiba HTTP通信 GET API
 
-        引数に渡された全ての netkeiba Webページコンテンツを非同期に取得する.
+        Args:
+            url_list (list[NetkeibaURL]): NetkaibaURL配列
+
+        Returns:
+            list[NetkeibaResult]: netkeiba HTTP通信結果配列 (url_list と同じ順序)
+        """
+        if self.__client is None:
+            return asyncio.run(self.__get_process(url_list))
+        return self.__client.run(self.__get_process(url_list))
+
+    async def aget(self, url: NetkeibaURL) -> NetkeibaContents:
+        """ netkeiba HTTP通信 GET API (非同期)
+
+        実行中のイベントループ上で取得する. NetkeibaClient を指定する場合は async with 文で開いたものを使用する.
+
+        Args:
+            url (NetkeibaURL): netkaiba URL
+
+        Returns:
+            NetkeibaContents: netkeiba Webページコンテンツ
+
+        Raises:
+            NKScraperException: 再試行しても取得に失敗した場合, または, 取得対象の内容が掲載されていない場合
+        """
+        result: NetkeibaResult = (await self.aget_results_by_list([url]))[0]
+        if result.contents is None:
+            raise NKScraperException(result.error)
+        return result.contents
+
+    async def aget_by_list(self, url_list: list[NetkeibaURL]) -> list[NetkeibaContents]:
+        """ netkeiba HTTP通信 GET API (非同期)
+
+        取得に失敗したURLはエラーログを出力して除外し, 取得に成功したコンテンツのみを返す.
 
         Args:
             url_list (list[NetkeibaURL]): NetkaibaURL配列
@@ -65,38 +118,470 @@ class NetkeibaRequests():
         Returns:
             list[NetkeibaContents]: netkeiba Webページコンテンツ配列
         """
+        return [
+            result.contents for result in await self.aget_results_by_list(url_list)
+            if result.contents is not None
+        ]
+
+    async def aget_results_by_list(self, url_list: list[NetkeibaURL]) -> list[NetkeibaResult]:
+        """ netkeiba HTTP通信 GET API (非同期)
 
-        async def __async_process(session, url) -> NetkeibaContents:
-            """ 非同期処理
+        Args:
+            url_list (list[NetkeibaURL]): NetkaibaURL配列
+
+        Returns:
+            list[NetkeibaResult]: netkeiba HTTP通信結果配列 (url_list と同じ順序)
+        """
+        return await self.__get_process(url_list)
+
+    def iter_results_by_list(self, url_list: list[NetkeibaURL], chunk_size: int = 100,
+                             api_class: type | None = None) -> Iterator[NetkeibaResult]:
+        """ netkeiba HTTP通信 GET API (逐次取得)
+
+        aiter_results_by_list を同期的に反復する. 取得が完了した順に NetkeibaResult を返す.
+
+        Args:
+            url_list (list[NetkeibaURL]): NetkaibaURL配列
+            chunk_size (int): 同時に保持する (取得中・取得済みで未返却の) Webページの最大数
+            api_class (type | None): 指定した場合は, このスクレイピングAPIのスナップショット (NetkeibaResult.snapshot) を作成する
+
+        Yields:
+            NetkeibaResult: netkeiba HTTP通信結果
+        """
+        loop: asyncio.AbstractEventLoop | None = None
+        if self.__client is None:
+            loop = asyncio.new_event_loop()
+            run = loop.run_until_complete
+        else:
+            run = self.__client.run
+
+        async_iterator = self.aiter_results_by_list(url_list, chunk_size, api_class)
+        try:
+            while True:
+                try:
+                    result: NetkeibaResult = run(async_iterator.__anext__())
+                except StopAsyncIteration:
+                    break
+                yield result
+        finally:
+            run(async_iterator.aclose())
+            if loop is not None:
+                loop.close()
+
+    async def aiter_results_by_list(self, url_list: list[NetkeibaURL], chunk_size: int = 100,
+                                    api_class: type | None = None) -> AsyncIterator[NetkeibaResult]:
+        """ netkeiba HTTP通信 GET API (非同期・逐次取得)
+
+        取得が完了した順に NetkeibaResult を返す.
+        取得中・取得済みで未返却の Webページを最大 chunk_size 件に制限し, 1件返却するごとに次のURLの取得を開始する.
+        重複したURLは1回だけ返す.
+        api_class を指定した場合は, 解析結果 (NetkeibaContents) の代わりにスクレイピングAPIのスナップショットを作成する.
+        client.parse_executor が ProcessPoolExecutor の場合は, 解析と値の取り出しを子プロセスで行う.
+
+        Args:
+            url_list (list[NetkeibaURL]): NetkaibaURL配列
+            chunk_size (int): 同時に保持する (取得中・取得済みで未返却の) Webページの最大数
+            api_class (type | None): 指定した場合は, このスクレイピングAPIのスナップショット (NetkeibaResult.snapshot) を作成する
+
+        Yields:
+            NetkeibaResult: netkeiba HTTP通信結果
+        """
+        async def __iterate(client: NetkeibaClient) -> AsyncIterator[NetkeibaResult]:
+            """ 取得枠を補充しながら, 完了した順に返す
             """
+            url_iterator: Iterator[NetkeibaURL] = iter(url_list)
+            pending: set[asyncio.Future[NetkeibaResult]] = set()
+            seen_url_set: set[str] = set()
+
+            def __fill() -> None:
+                """ 取得中のURLが chunk_size 件になるまで取得を開始する
+                """
+                for url in url_iterator:
+                    # NOTE: 取得中・取得済みのURLは再度取得しない
+                    if url.url in seen_url_set:
+                        continue
+                    seen_url_set.add(url.url)
+                    pending.add(asyncio.ensure_future(self.__coalesce_process(client, url, api_class)))
+                    if len(pending) >= chunk_size:
+                        return
+
             try:
-                async with session.get(url.url) as response:
-                    html_byte = await response.read()
-                    try:
-                        soup = BeautifulSoup(html_byte, 'lxml')
-                    except Exception as e:
-                        self.__logger.warning(NetkeibaRequests.__WARN_MESSAGE_1201)
-                        soup = BeautifulSoup(html_byte, 'html.parser')
+                __fill()
+                while len(pending) > 0:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        pending.discard(task)
+                        yield task.result()
+                        __fill()
+            finally:
+                for task in pending:
+                    task.cancel()
 
-                    return NetkeibaContents(url, soup)
+        chunk_size = max(1, chunk_size)
+        # NetkeibaClient が指定されていない場合は, 今回の通信限りのセッションを作成する
+        if self.__client is None:
+            async with NetkeibaClient() as client:
+                async for result in __iterate(client):
+                    yield result
+        else:
+            async for result in __iterate(self.__client):
+                yield result
 
-            except Exception as e:
-                self.__logger.error(NetkeibaRequests.__ERR_MESSAGE_1201)
-                sys.exit()
+    async def __get_process(self, url_list: list[NetkeibaURL]) -> list[NetkeibaResult]:
+        """ netkeiba HTTP通信 GET関数
 
+        引数に渡された全ての netkeiba Webページコンテンツを非同期に取得する.
+        重複したURLは1回だけ取得し, 同じ NetkeibaResult を返す.
+
+        Args:
+            url_list (list[NetkeibaURL]): NetkaibaURL配列
+
+        Returns:
+            list[NetkeibaResult]: netkeiba HTTP通信結果配列
+        """
         process_start: float = time.perf_counter()
 
-        async with aiohttp.ClientSession() as session:
+        async def __gather(client: NetkeibaClient) -> list[NetkeibaResult]:
+            """ 全てのURLを非同期に取得する
+            """
             # 実行関数を定義
+            # NOTE: 同時実行数・リクエスト頻度は NetkeibaClient.slot で制限する
+            # NOTE: 同じURLは1回だけ取得し, 結果を共有する
+            unique_url_dict: dict[str, NetkeibaURL] = {}
+            for url in url_list:
+                unique_url_dict.setdefault(url.url, url)
             tasks = [
                 asyncio.ensure_future(
-                    __async_process(session, url)) for url in url_list
+                    self.__coalesce_process(client, url)) for url in unique_url_dict.values()
             ]
 
-            netkeiba_contents_list = await asyncio.gather(*tasks)
+            result_dict: dict[str, NetkeibaResult] = {
+                result.url.url: result for result in await asyncio.gather(*tasks)
+            }
+            return [result_dict[url.url] for url in url_list]
+
+        # NetkeibaClient が指定されていない場合は, 今回の通信限りのセッションを作成する
+        if self.__client is None:
+            async with NetkeibaClient() as client:
+                netkeiba_result_list = await __gather(client)
+        else:
+            netkeiba_result_list = await __gather(self.__client)
 
         process_end: float = time.perf_counter()
         process_time: float = process_end - process_start
-        self.__logger.info(f'{len(url_list)} requests. Time: {process_time} [sec]')
+        num_error: int = len({result.url.url for result in netkeiba_result_list if not result.is_success})
+        self.__logger.info(
+            f'{len({url.url for url in url_list})} requests. {num_error} errors. '
+            f'Time: {process_time} [sec]')
+
+        return netkeiba_result_list
+
+    async def __coalesce_process(self, client: NetkeibaClient, url: NetkeibaURL,
+                                 api_class: type | None = None) -> NetkeibaResult:
+        """ 非同期処理 (Single-flight)
+
+        同じ NetkeibaClient で同じURLを取得中の場合は, 新たに通信せずにその結果 (NetkeibaContents) を共有する.
+        スナップショットを作成する場合は, 同じURL・同じスクレイピングAPIの結果のみを共有する.
+        NetkeibaClient.deadline の締め切りを過ぎた場合は取得を中止し, 失敗とする.
+
+        Args:
+            client (NetkeibaClient): netkeiba HTTP クライアント
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+            api_class (type | None): 指定した場合は, このスクレイピングAPIのスナップショットを作成する
+
+        Returns:
+            NetkeibaResult: netkeiba HTTP通信結果
+        """
+        key: str = url.url if api_class is None else f'{url.url} {api_class.__qualname__}'
+        remaining_time: float | None = client.get_remaining_time()
+        if remaining_time is None:
+            return await client.coalesce(key, lambda: self.__async_process(client, url, api_class))
+
+        # NOTE: 締め切りを過ぎた場合は取得を中止する (他の呼び出し元と共有している取得は継続する)
+        try:
+            return await asyncio.wait_for(
+                client.coalesce(key, lambda: self.__async_process(client, url, api_class)), remaining_time)
+        except asyncio.TimeoutError:
+            error: asyncio.TimeoutError = asyncio.TimeoutError(NetkeibaRequests.__ERR_MESSAGE_1203)
+            self.__logger.error(f'{NetkeibaRequests.__ERR_MESSAGE_1203} {url.url}')
+            return NetkeibaResult(url, error=error)
+
+    async def __async_process(self, client: NetkeibaClient, url: NetkeibaURL,
+                              api_class: type | None = None) -> NetkeibaResult:
+        """ 非同期処理
+
+        通信に失敗した場合は, 指数バックオフで待機して最大 client.max_attempts 回まで再試行する.
+        取得対象の内容が掲載されていない Webページは, 解析せずに NetkeibaUnavailableError の結果を返す (再試行しない).
+        client.stream_parse が True の場合, HTML の Webページは受信しながら逐次解析する (スナップショットを作成する場合を除く).
+
+        Args:
+            client (NetkeibaClient): netkeiba HTTP クライアント
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+            api_class (type | None): 指定した場合は, このスクレイピングAPIのスナップショットを作成する
+
+        Returns:
+            NetkeibaResult: netkeiba HTTP通信結果
+        """
+        attempt: int = 0
+        while True:
+            attempt += 1
+            try:
+                if api_class is None and self.__is_streamed(client, url):
+                    return NetkeibaResult(url, await self.__stream(client, url), attempts=attempt)
+
+                html_byte: bytes = await self.__fetch(client, url)
+                NetkeibaParser.check_available(html_byte, url.category)
+                if api_class is not None:
+                    snapshot: NetkeibaSnapshot = await self.__snapshot(client, url, html_byte, api_class)
+                    return NetkeibaResult(url, attempts=attempt, snapshot=snapshot)
+                contents: NetkeibaContents = await self.__parse(client, url, html_byte)
+                return NetkeibaResult(url, contents, attempts=attempt)
+
+            except NetkeibaUnavailableError as e:
+                self.__logger.warning(f'{e} {url.url}')
+                return NetkeibaResult(url, error=e, attempts=attempt)
+            except Exception as e:
+                if attempt >= client.max_attempts or not client.is_retryable(e):
+                    self.__logger.error(
+                        f'{NetkeibaRequests.__ERR_MESSAGE_1201} {url.url}: {type(e).__name__} {e}')
+                    return NetkeibaResult(url, error=e, attempts=attempt)
+
+                delay: float = client.backoff(attempt)
+                self.__logger.warning(
+                    f'{NetkeibaRequests.__WARN_MESSAGE_1202} {url.url}: {type(e).__name__} {e} '
+                    f'({attempt}/{client.max_attempts})')
+                await asyncio.sleep(delay)
+
+    def __is_streamed(self, client: NetkeibaClient, url: NetkeibaURL) -> bool:
+        """ 受信しながら逐次解析するか判定する
+
+        バイト列を保存する HTTPキャッシュ・アーカイブを使用する場合は, 逐次解析しない.
+
+        Args:
+            client (NetkeibaClient): netkeiba HTTP クライアント
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+
+        Returns:
+            bool: 逐次解析する場合はTrue, そうでなければFalse
+        """
+        return client.stream_parse and client.cache is None and client.archive is None \
+            and NetkeibaStreamParser.is_supported(url.category)
+
+    async def __stream(self, client: NetkeibaClient, url: NetkeibaURL) -> NetkeibaContents:
+        """ Webページを受信しながら逐次解析して NetkeibaContents を作成する
+
+        受信した断片は解析後に破棄し, Webページ全体のバイト列は保持しない.
+
+        Args:
+            client (NetkeibaClient): netkeiba HTTP クライアント
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+
+        Returns:
+            NetkeibaContents: netkeiba Webページコンテンツ (document のみを保持する)
+
+        Raises:
+            NetkeibaUnavailableError: 取得対象の内容が掲載されていない場合
+        """
+        parser: NetkeibaStreamParser = NetkeibaStreamParser(url.category)
+        async with client.slot(url.url, client.get_priority(url.category)):
+            start: float = time.perf_counter()
+            await client.transport.stream('GET', url.url, None, parser.feed)
+            client.record_latency(url.category, time.perf_counter() - start)
+
+        return NetkeibaContents(
+            url, partial=client.partial_parse, extractor=client.extractor, document=parser.close())
+
+    async def __fetch(self, client: NetkeibaClient, url: NetkeibaURL) -> bytes:
+        """ Webページを取得する
+
+        アーカイブが REPLAY モードの場合は, 通信せずにアーカイブから読み込む.
+        RECORD モードの場合は, 取得した Webページをアーカイブに保存する.
+
+        Args:
+            client (NetkeibaClient): netkeiba HTTP クライアント
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+
+        Returns:
+            bytes: Webページ
+        """
+        archive: NetkeibaArchive | NetkeibaPackedArchive | None = client.archive
+        if archive is not None and archive.mode == NetkeibaArchiveMode.REPLAY:
+            return archive.load(url)
+
+        html_byte, headers = await self.__fetch_remote(client, url)
+
+        if archive is not None and archive.mode == NetkeibaArchiveMode.RECORD:
+            archive.save(url, html_byte, headers=headers)
+        return html_byte
+
+    async def __fetch_remote(self, client: NetkeibaClient,
+                             url: NetkeibaURL) -> tuple[bytes, dict[str, str]]:
+        """ Webページを通信して取得する
+
+        HTTPキャッシュが有効期限内であれば通信せずに返す.
+        期限切れの場合は条件付きGETで再検証し, 304 Not Modified であればキャッシュを返す.
+        重複リクエスト (NetkeibaClient の hedge) が有効なカテゴリーは, 応答が遅い場合に同じリクエストをもう1つ送信する.
+
+        Args:
+            client (NetkeibaClient): netkeiba HTTP クライアント
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+
+        Returns:
+            tuple[bytes, dict[str, str]]: (Webページ, レスポンスヘッダー)
+        """
+        cache: NetkeibaCache | None = client.cache
+        entry: NetkeibaCacheEntry | None = None
+        if cache is not None:
+            entry = cache.load(url)
+            if entry is not None and cache.is_fresh(url, entry):
+                return entry.body, {}
+
+        hedge_delay: float | None = client.get_hedge_delay(url.category)
+        if hedge_delay is None:
+            return await self.__get(client, url, entry)
+        return await self.__hedged_get(client, url, entry, hedge_delay)
+
+    async def __hedged_get(self, client: NetkeibaClient, url: NetkeibaURL,
+                           entry: NetkeibaCacheEntry | None,
+                           hedge_delay: float) -> tuple[bytes, dict[str, str]]:
+        """ Webページを通信して取得する (重複リクエスト)
+
+        hedge_delay 秒以内に応答がない場合は同じリクエストをもう1つ送信し, 先に成功した方を返す.
+        残ったリクエストはキャンセルする.
+
+        Args:
+            client (NetkeibaClient): netkeiba HTTP クライアント
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+            entry (NetkeibaCacheEntry | None): 再検証するキャッシュエントリー
+            hedge_delay (float): 重複リクエストを送信するまでの待機時間 [sec]
+
+        Returns:
+            tuple[bytes, dict[str, str]]: (Webページ, レスポンスヘッダー)
+        """
+        pending: set[asyncio.Future[tuple[bytes, dict[str, str]]]] = {
+            asyncio.ensure_future(self.__get(client, url, entry))
+        }
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_delay)
+            if len(done) == 0:
+                pending.add(asyncio.ensure_future(self.__get(client, url, entry)))
+
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error: BaseException = task.exception()  # type: ignore[assignment]
+                if len(pending) == 0:
+                    raise error
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def __get(self, client: NetkeibaClient, url: NetkeibaURL,
+                    entry: NetkeibaCacheEntry | None) -> tuple[bytes, dict[str, str]]:
+        """ Webページを通信して取得する (1リクエスト)
+
+        Args:
+            client (NetkeibaClient): netkeiba HTTP クライアント
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+            entry (NetkeibaCacheEntry | None): 再検証するキャッシュエントリー
+
+        Returns:
+            tuple[bytes, dict[str, str]]: (Webページ, レスポンスヘッダー)
+
+        Raises:
+            NetkeibaUnavailableError: 取得対象の内容が掲載されていない場合 (キャッシュに保存しない)
+        """
+        cache: NetkeibaCache | None = client.cache
+        request_headers: dict[str, str] = {} if entry is None else entry.validators
+        async with client.slot(url.url, client.get_priority(url.category)):
+            start: float = time.perf_counter()
+            response: NetkeibaResponse = await client.transport.request('GET', url.url, request_headers)
+            if cache is not None and entry is not None and response.status == 304:
+                cache.refresh(url, entry)
+                return entry.body, {}
+
+            html_byte: bytes = response.body
+            headers: dict[str, str] = response.headers
+            client.record_latency(url.category, time.perf_counter() - start)
+
+        # NOTE: 取得対象の内容が掲載されていない Webページ (発走前のレース結果など) は, キャッシュ・アーカイブに保存しない
+        NetkeibaParser.check_available(html_byte, url.category)
+        if cache is not None:
+            cache.save(url, html_byte, headers.get('etag'), headers.get('last-modified'))
+        return html_byte, headers
+
+    async def __parse(self, client: NetkeibaClient, url: NetkeibaURL,
+                      html_byte: bytes) -> NetkeibaContents:
+        """ Webページを解析して NetkeibaContents を作成する
+
+        client.lazy_parse が True の場合, または, client.extractor が BeautifulSoup を使用しない場合は解析せず,
+        soup に初めてアクセスした時点で解析する.
+        取得時に解析した場合は再解析しないため, バイト列は保持せず soup のみを保持する.
+        client.parse_executor が指定されている場合は, イベントループの外で解析する.
+        ProcessPoolExecutor の場合は, BeautifulSoup をプロセス間で受け渡すと再解析されるため, 取得時には解析しない
+        (子プロセスでの解析は, スナップショットを作成する場合 (__snapshot) に行う).
+
+        Args:
+            client (NetkeibaClient): netkeiba HTTP クライアント
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+            html_byte (bytes): Webページ
+
+        Returns:
+            NetkeibaContents: netkeiba Webページコンテンツ
+        """
+        executor: Executor | None = client.parse_executor
+        partial: bool = client.partial_parse
+        extractor: NetkeibaExtractor | None = client.extractor
+        if client.lazy_parse or (extractor is not None and not extractor.uses_soup) \
+                or isinstance(executor, ProcessPoolExecutor):
+            return NetkeibaContents(url, html_byte=html_byte, partial=partial, extractor=extractor)
+        if executor is None:
+            return NetkeibaContents(
+                url, NetkeibaParser.parse(html_byte, url.category, partial), partial=partial, extractor=extractor)
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        soup: BeautifulSoup = await loop.run_in_executor(
+            executor, NetkeibaParser.parse, html_byte, url.category, partial)
+        return NetkeibaContents(url, soup, partial=partial, extractor=extractor)
+
+    async def __snapshot(self, client: NetkeibaClient, url: NetkeibaURL,
+                         html_byte: bytes, api_class: type) -> NetkeibaSnapshot:
+        """ Webページを解析してスクレイピングAPIを作成し, スナップショットを作成する
+
+        client.parse_executor が指定されている場合は, イベントループの外で解析し, 値を取り出す.
+        ProcessPoolExecutor の場合, Webページは共有メモリを介して子プロセスに渡し,
+        子プロセスからはスナップショット (値のみ) を受け取る.
+
+        Args:
+            client (NetkeibaClient): netkeiba HTTP クライアント
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+            html_byte (bytes): Webページ
+            api_class (type): スクレイピングAPIクラス
+
+        Returns:
+            NetkeibaSnapshot: netkeiba スナップショット
+        """
+        executor: Executor | None = client.parse_executor
+        partial: bool = client.partial_parse
+        extractor: NetkeibaExtractor | None = client.extractor
+        if executor is None:
+            return NetkeibaSnapshot.create_by_html(api_class, url, html_byte, partial, extractor)
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if not isinstance(executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(
+                executor, NetkeibaSnapshot.create_by_html, api_class, url, html_byte, partial, extractor)
 
-        return netkeiba_contents_list
+        # NOTE: 抽出エンジンは子プロセスで作成する (コンパイル済みの XPath はプロセス間で受け渡せない)
+        extractor_class: type | None = None if extractor is None else type(extractor)
+        shared_memory: SharedMemory = SharedMemory(create=True, size=max(1, len(html_byte)))
+        try:
+            shared_memory.buf[:len(html_byte)] = html_byte
+            return await loop.run_in_executor(
+                executor, NetkeibaSnapshot.create_by_shared_memory,
+                api_class, url, shared_memory.name, len(html_byte), partial, extractor_class)
+        finally:
+            shared_memory.close()
+            shared_memory.unlink()
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+""" netkeiba HTTPレスポンスモジュール
+"""
+
+from __future__ import annotations
+
+# for type declaration only
+from typing import Mapping
+
+
+class NetkeibaResponse():
+    """ netkeiba HTTPレスポンスクラス
+
+    レスポンスヘッダーの名前は小文字で保持する (HTTP/2, httpx は小文字, aiohttp はサーバーが送信した表記のため).
+    """
+
+    def __init__(self, status: int, headers: Mapping[str, str], body: bytes) -> None:
+        """ コンストラクタ
+
+        Args:
+            status (int): HTTPステータスコード
+            headers (Mapping[str, str]): レスポンスヘッダー (名前の大文字・小文字は区別しない)
+            body (bytes): レスポンスボディ
+        """
+        self.__status: int = status
+        self.__headers: dict[str, str] = {key.lower(): value for key, value in headers.items()}
+        self.__body: bytes = body
+
+    @property
+    def status(self) -> int:
+        """ HTTPステータスコード
+
+        Returns:
+            int: HTTPステータスコード
+        """
+        return self.__status
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """ レスポンスヘッダー
+
+        Returns:
+            dict[str, str]: レスポンスヘッダー (名前は小文字. 例: etag, last-modified)
+        """
+        return self.__headers
+
+    @property
+    def body(self) -> bytes:
+        """ レスポンスボディ
+
+        Returns:
+            bytes: レスポンスボディ
+        """
+        return self.__body
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+""" netkeiba HTTP通信結果モジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.common import NetkeibaUnavailableError
+
+# for type declaration only
+from nkscraper.common import NetkeibaCategory, NetkeibaContents, NetkeibaSnapshot
+from nkscraper.url import NetkeibaURL
+
+
+class NetkeibaResult():
+    """ netkeiba HTTP通信結果クラス
+
+    1つの NetkeibaURL に対する取得結果 (NetkeibaContents, NetkeibaSnapshot, または, 発生した例外) を保持する.
+    """
+
+    def __init__(self, url: NetkeibaURL, contents: NetkeibaContents | None = None,
+                 error: BaseException | None = None, attempts: int = 1,
+                 snapshot: NetkeibaSnapshot | None = None) -> None:
+        """ コンストラクタ
+
+        Args:
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+            contents (NetkeibaContents | None): netkeiba Webページコンテンツ (取得に失敗した場合はNone)
+            error (BaseException | None): 取得に失敗した場合の例外 (成功した場合はNone)
+            attempts (int): 試行回数
+            snapshot (NetkeibaSnapshot | None): netkeiba スナップショット (スナップショットを作成した場合)
+        """
+        self.__url: NetkeibaURL = url
+        self.__contents: NetkeibaContents | None = contents
+        self.__error: BaseException | None = error
+        self.__attempts: int = attempts
+        self.__snapshot: NetkeibaSnapshot | None = snapshot
+
+    @property
+    def url(self) -> NetkeibaURL:
+        """ NetkeibaURL オブジェクト
+
+        Returns:
+            NetkeibaURL: NetkeibaURL オブジェクト
+        """
+        return self.__url
+
+    @property
+    def category(self) -> NetkeibaCategory:
+        """ netkeiba Webページカテゴリー
+
+        Returns:
+            NetkeibaCategory: netkeiba Webページカテゴリー
+        """
+        return self.__url.category
+
+    @property
+    def contents(self) -> NetkeibaContents | None:
+        """ netkeiba Webページコンテンツ
+
+        Returns:
+            NetkeibaContents | None: netkeiba Webページコンテンツ (取得に失敗した場合はNone)
+        """
+        return self.__contents
+
+    @property
+    def snapshot(self) -> NetkeibaSnapshot | None:
+        """ netkeiba スナップショット
+
+        Returns:
+            NetkeibaSnapshot | None: netkeiba スナップショット (スナップショットを作成していない, または, 取得に失敗した場合はNone)
+        """
+        return self.__snapshot
+
+    @property
+    def error(self) -> BaseException | None:
+        """ 取得に失敗した場合の例外
+
+        Returns:
+            BaseException | None: 例外 (取得に成功した場合はNone)
+        """
+        return self.__error
+
+    @property
+    def attempts(self) -> int:
+        """ 試行回数
+
+        Returns:
+            int: 試行回数
+        """
+        return self.__attempts
+
+    @property
+    def is_success(self) -> bool:
+        """ 取得に成功したか
+
+        Returns:
+            bool: 取得に成功した場合はTrue, 失敗した場合はFalse
+        """
+        return self.__contents is not None or self.__snapshot is not None
+
+    @property
+    def is_unavailable(self) -> bool:
+        """ 取得対象の内容が掲載されていないか
+
+        Returns:
+            bool: 取得対象の内容が掲載されていない (NetkeibaUnavailableError) 場合はTrue, そうでなければFalse
+        """
+        return isinstance(self.__error, NetkeibaUnavailableError)
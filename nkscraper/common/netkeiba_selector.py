@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+""" netkeiba セレクターモジュール
+"""
+
+from __future__ import annotations
+
+
+class NetkeibaTableSelector():
+    """ netkeiba 表セレクタークラス
+
+    (table タグの属性名, 属性値) で表を指定し, 表に含まれる行 (tr) を選択する.
+    """
+
+    def __init__(self, attr: str, value: str, row_class: str | None = None,
+                 tbody: bool = False, skip: int = 0) -> None:
+        """ コンストラクタ
+
+        Args:
+            attr (str): table タグの属性名 (class, id)
+            value (str): table タグの属性値
+            row_class (str | None): 行 (tr) の class 属性値 (None の場合は全ての行)
+            tbody (bool): True の場合, 最初の tbody に含まれる行のみを選択する
+            skip (int): 先頭から除外する行数 (見出し行など)
+        """
+        self.__attr: str = attr
+        self.__value: str = value
+        self.__row_class: str | None = row_class
+        self.__tbody: bool = tbody
+        self.__skip: int = skip
+
+    @property
+    def attr(self) -> str:
+        """ table タグの属性名
+
+        Returns:
+            str: table タグの属性名
+        """
+        return self.__attr
+
+    @property
+    def value(self) -> str:
+        """ table タグの属性値
+
+        Returns:
+            str: table タグの属性値
+        """
+        return self.__value
+
+    @property
+    def row_class(self) -> str | None:
+        """ 行 (tr) の class 属性値
+
+        Returns:
+            str | None: 行 (tr) の class 属性値 (None の場合は全ての行)
+        """
+        return self.__row_class
+
+    @property
+    def tbody(self) -> bool:
+        """ 最初の tbody に含まれる行のみを選択するか
+
+        Returns:
+            bool: 最初の tbody に含まれる行のみを選択する場合はTrue, そうでなければFalse
+        """
+        return self.__tbody
+
+    @property
+    def skip(self) -> int:
+        """ 先頭から除外する行数
+
+        Returns:
+            int: 先頭から除外する行数
+        """
+        return self.__skip
+
+
+class NetkeibaSelector():
+    """ netkeiba セレクタークラス
+
+    表の行から要素を1つ選択し, 子孫要素をたどって値 (子ノードの文字列, または, 属性値) を取り出す.
+    要素は cell (セル番号), pattern (class 属性値の正規表現), class_name (class 属性値) の順に判定して選択する.
+    いずれも指定しない場合は, タグ名が一致する最初の要素を選択する.
+    """
+
+    def __init__(self, name: str = 'td', class_name: str | None = None, cell: int | None = None,
+                 pattern: str | None = None, path: tuple[str, ...] = (), attr: str | None = None,
+                 node: int = 0) -> None:
+        """ コンストラクタ
+
+        Args:
+            name (str): 選択する要素のタグ名
+            class_name (str | None): 選択する要素の class 属性値
+            cell (int | None): 選択するセル (td) の番号
+            pattern (str | None): 選択する要素の class 属性値の正規表現
+            path (tuple[str, ...]): 選択した要素からたどる子孫要素のタグ名 (それぞれ最初に一致する要素をたどる)
+            attr (str | None): 取り出す属性名 (None の場合は子ノードの文字列)
+            node (int): 文字列を取り出す子ノードの番号 (attr が None の場合)
+        """
+        self.__name: str = name
+        self.__class_name: str | None = class_name
+        self.__cell: int | None = cell
+        self.__pattern: str | None = pattern
+        self.__path: tuple[str, ...] = path
+        self.__attr: str | None = attr
+        self.__node: int = node
+
+    @property
+    def name(self) -> str:
+        """ 選択する要素のタグ名
+
+        Returns:
+            str: 選択する要素のタグ名
+        """
+        return self.__name
+
+    @property
+    def class_name(self) -> str | None:
+        """ 選択する要素の class 属性値
+
+        Returns:
+            str | None: 選択する要素の class 属性値
+        """
+        return self.__class_name
+
+    @property
+    def cell(self) -> int | None:
+        """ 選択するセル (td) の番号
+
+        Returns:
+            int | None: 選択するセル (td) の番号
+        """
+        return self.__cell
+
+    @property
+    def pattern(self) -> str | None:
+        """ 選択する要素の class 属性値の正規表現
+
+        Returns:
+            str | None: 選択する要素の class 属性値の正規表現
+        """
+        return self.__pattern
+
+    @property
+    def path(self) -> tuple[str, ...]:
+        """ 選択した要素からたどる子孫要素のタグ名
+
+        Returns:
+            tuple[str, ...]: 子孫要素のタグ名
+        """
+        return self.__path
+
+    @property
+    def attr(self) -> str | None:
+        """ 取り出す属性名
+
+        Returns:
+            str | None: 取り出す属性名 (None の場合は子ノードの文字列)
+        """
+        return self.__attr
+
+    @property
+    def node(self) -> int:
+        """ 文字列を取り出す子ノードの番号
+
+        Returns:
+            int: 文字列を取り出す子ノードの番号
+        """
+        return self.__node
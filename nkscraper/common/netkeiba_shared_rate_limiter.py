@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+""" netkeiba 共有レートリミッターモジュール
+"""
+
+from __future__ import annotations
+
+# build-in
+import asyncio
+import sqlite3
+import time
+
+
+class NetkeibaSharedRateLimiter():
+    """ netkeiba 共有レートリミッタークラス
+
+    トークンバケットを SQLite に保存し, 同じファイルを指定した全てのプロセスで1秒あたりのリクエスト数を制限する.
+    複数のマシンで共有する場合は, ファイルロックに対応したファイルシステム上のファイルを指定し, 各マシンの時刻を同期する.
+    """
+
+    def __init__(self, path: str, key: str, rate: float, capacity: float | None = None) -> None:
+        """ コンストラクタ
+
+        Args:
+            path (str): SQLite データベースファイル
+            key (str): トークンバケットのキー (ホスト名など)
+            rate (float): 1秒あたりに補充するトークン数 (全プロセス合計のリクエスト数/秒)
+            capacity (float | None): バケット容量 (省略時は max(1, rate))
+        """
+        self.__path: str = path
+        self.__key: str = key
+        self.__rate: float = rate
+        self.__capacity: float = max(1.0, rate) if capacity is None else capacity
+        self.__connection: sqlite3.Connection | None = None
+        self.__lock: asyncio.Lock | None = None
+
+    @property
+    def rate(self) -> float:
+        """ 1秒あたりのリクエスト数
+
+        Returns:
+            float: 1秒あたりのリクエスト数
+        """
+        return self.__rate
+
+    async def acquire(self) -> None:
+        """ トークンを1つ取得する
+
+        トークンが不足している場合は, 補充されるまで待機する.
+        プロセス内で待機中のリクエストは到着順に処理される.
+        """
+        # NOTE: asyncio.Lock はイベントループ上で生成する
+        if self.__lock is None:
+            self.__lock = asyncio.Lock()
+
+        async with self.__lock:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            while True:
+                # NOTE: 他のプロセスのロック待ちでイベントループを止めないよう, スレッドで実行する
+                delay: float = await loop.run_in_executor(None, self.__take)
+                if delay <= 0:
+                    return
+                await asyncio.sleep(delay)
+
+    def close(self) -> None:
+        """ データベースを閉じる
+        """
+        if self.__connection is not None:
+            self.__connection.close()
+        self.__connection = None
+
+    def __take(self) -> float:
+        """ 経過時間に応じてトークンを補充し, トークンを1つ取得する
+
+        Returns:
+            float: トークンが不足している場合は補充されるまでの時間 [sec], 取得できた場合は0
+        """
+        connection: sqlite3.Connection = self.__connect()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            row: tuple[float, float] | None = connection.execute(
+                'SELECT tokens, updated_at FROM buckets WHERE key = ?', (self.__key,)).fetchone()
+            # NOTE: 複数のマシンで共有するため, 単調時計ではなく時刻を使用する
+            now: float = time.time()
+            tokens: float = self.__capacity if row is None \
+                else min(self.__capacity, row[0] + max(0.0, now - row[1]) * self.__rate)
+            delay: float = 0.0
+            if tokens >= 1.0:
+                tokens -= 1.0
+            else:
+                delay = (1.0 - tokens) / self.__rate
+            connection.execute(
+                'INSERT OR REPLACE INTO buckets (key, tokens, updated_at) VALUES (?, ?, ?)',
+                (self.__key, tokens, now))
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+        return delay
+
+    def __connect(self) -> sqlite3.Connection:
+        """ データベースに接続する (初回のみ)
+
+        Returns:
+            sqlite3.Connection: SQLite 接続
+        """
+        if self.__connection is None:
+            # NOTE: acquire はプロセス内で直列に実行されるため, 接続をスレッド間で共有する
+            self.__connection = sqlite3.connect(
+                self.__path, timeout=60.0, isolation_level=None, check_same_thread=False)
+            self.__connection.execute(
+                'CREATE TABLE IF NOT EXISTS buckets ('
+                'key TEXT PRIMARY KEY, '
+                'tokens REAL NOT NULL, '
+                'updated_at REAL NOT NULL)')
+        return self.__connection
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+""" netkeiba スナップショットモジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.common import NetkeibaContents
+
+# build-in
+from multiprocessing.shared_memory import SharedMemory
+
+# for type declaration only
+from nkscraper.common import NetkeibaExtractor
+from nkscraper.url import NetkeibaURL
+from typing import Any, Callable, Iterator
+
+
+class NetkeibaRecord():
+    """ netkeiba 記録クラス
+
+    1行 (または, Webページ全体) の項目の値を保持する. 値は変更できない.
+    項目名から値の位置への辞書は, 同じ表の記録で共有する.
+    取得時に例外が発生した項目は, 値を参照すると同じ例外を送出する.
+    """
+
+    __slots__ = ('__field_index', '__values')
+
+    def __init__(self, field_index: dict[str, int], values: tuple[Any, ...]) -> None:
+        """ コンストラクタ
+
+        Args:
+            field_index (dict[str, int]): 項目名から値の位置への辞書 (同じ表の記録で共有する)
+            values (tuple[Any, ...]): 値配列 (取得時に例外が発生した項目は例外)
+        """
+        self.__field_index: dict[str, int] = field_index
+        self.__values: tuple[Any, ...] = values
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """ 項目名配列
+
+        Returns:
+            tuple[str, ...]: 項目名配列
+        """
+        return tuple(self.__field_index)
+
+    def __contains__(self, field: str) -> bool:
+        """ 項目が含まれているか
+
+        Args:
+            field (str): 項目名
+
+        Returns:
+            bool: 項目が含まれていればTrue, そうでなければFalse
+        """
+        return field in self.__field_index
+
+    def __getitem__(self, field: str) -> Any:
+        """ 項目の値を取得する
+
+        Args:
+            field (str): 項目名
+
+        Returns:
+            Any: 値
+
+        Raises:
+            KeyError: 項目が含まれていない場合
+            Exception: 取得時に例外が発生した項目の場合 (同じ例外)
+        """
+        value: Any = self.__values[self.__field_index[field]]
+        if isinstance(value, BaseException):
+            raise value
+        return value
+
+    def to_dict(self) -> dict[str, Any]:
+        """ 辞書に変換する (取得時に例外が発生した項目は例外のまま格納する)
+
+        Returns:
+            dict[str, Any]: {項目名: 値}
+        """
+        return {field: self.__values[index] for field, index in self.__field_index.items()}
+
+
+class NetkeibaSnapshot():
+    """ netkeiba スナップショットクラス
+
+    スクレイピングAPIの全ての項目を1回だけ取得し, 解析結果 (BeautifulSoup, lxml の木) から切り離して保持する.
+    値は NetkeibaRecord に保持し, 変更できない.
+    APIと同じ名前の getter (scrape_<項目名>, 行数を取得するメソッド) で値を取得する.
+    """
+
+    __slots__ = ('__header', '__records', '__record_fields', '__num_method')
+
+    __ERR_MESSAGE_2101: str = 'スナップショットに存在しない項目です.'
+
+    def __init__(self, header: NetkeibaRecord, records: tuple[NetkeibaRecord, ...],
+                 record_fields: tuple[str, ...], num_method: str) -> None:
+        """ コンストラクタ
+
+        Args:
+            header (NetkeibaRecord): Webページ全体の項目 (レース名など) の記録
+            records (tuple[NetkeibaRecord, ...]): 表の行ごとの記録
+            record_fields (tuple[str, ...]): 表の行の項目名
+            num_method (str): 行数を取得するメソッド名 (get_num_horse など)
+        """
+        self.__header: NetkeibaRecord = header
+        self.__records: tuple[NetkeibaRecord, ...] = records
+        self.__record_fields: tuple[str, ...] = record_fields
+        self.__num_method: str = num_method
+
+    @staticmethod
+    def create(api: Any, header_fields: tuple[str, ...], record_fields: tuple[str, ...],
+               num_record: int, num_method: str) -> NetkeibaSnapshot:
+        """ スクレイピングAPIの scrape_<項目名> で全ての項目を取得し, スナップショットを作成する
+
+        Args:
+            api (Any): スクレイピングAPI
+            header_fields (tuple[str, ...]): Webページ全体の項目名 (引数のない scrape_<項目名>)
+            record_fields (tuple[str, ...]): 表の行の項目名 (行インデックスを引数とする scrape_<項目名>)
+            num_record (int): 表の行数
+            num_method (str): 行数を取得するメソッド名
+
+        Returns:
+            NetkeibaSnapshot: netkeiba スナップショット
+        """
+        header_index: dict[str, int] = {field: index for index, field in enumerate(header_fields)}
+        header: NetkeibaRecord = NetkeibaRecord(header_index, tuple(
+            NetkeibaSnapshot.__scrape(getattr(api, f'scrape_{field}')) for field in header_fields))
+
+        record_index: dict[str, int] = {field: index for index, field in enumerate(record_fields)}
+        getter_list: list[Callable[..., Any]] = [getattr(api, f'scrape_{field}') for field in record_fields]
+        records: tuple[NetkeibaRecord, ...] = tuple(
+            NetkeibaRecord(record_index, tuple(NetkeibaSnapshot.__scrape(getter, index) for getter in getter_list))
+            for index in range(num_record))
+        return NetkeibaSnapshot(header, records, record_fields, num_method)
+
+    @staticmethod
+    def create_by_html(api_class: type, url: NetkeibaURL, html_byte: bytes, partial: bool = False,
+                       extractor: NetkeibaExtractor | None = None) -> NetkeibaSnapshot:
+        """ Webページを解析してスクレイピングAPIを作成し, スナップショットを作成する
+
+        Args:
+            api_class (type): スクレイピングAPIクラス (HorseInfoAPI など)
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+            html_byte (bytes): Webページ
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+            extractor (NetkeibaExtractor | None): 各APIが表から値を取り出す抽出エンジン (省略時は NetkeibaSoupExtractor)
+
+        Returns:
+            NetkeibaSnapshot: netkeiba スナップショット
+        """
+        contents: NetkeibaContents = NetkeibaContents(url, html_byte=html_byte, partial=partial, extractor=extractor)
+        return api_class(contents).snapshot()
+
+    @staticmethod
+    def create_by_shared_memory(api_class: type, url: NetkeibaURL, name: str, size: int, partial: bool = False,
+                                extractor_class: type | None = None) -> NetkeibaSnapshot:
+        """ 共有メモリ上の Webページからスナップショットを作成する (ProcessPoolExecutor の子プロセスで実行する)
+
+        解析結果 (BeautifulSoup, lxml の木) はプロセス間で受け渡せないため, 子プロセスで値を取り出し,
+        スナップショットのみを呼び出し元のプロセスに返す. 共有メモリの解放 (unlink) は呼び出し元のプロセスが行う.
+
+        Args:
+            api_class (type): スクレイピングAPIクラス (HorseInfoAPI など)
+            url (NetkeibaURL): NetkeibaURL オブジェクト
+            name (str): 共有メモリ名
+            size (int): Webページのバイト数
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+            extractor_class (type | None): 抽出エンジンクラス (省略時は NetkeibaSoupExtractor)
+
+        Returns:
+            NetkeibaSnapshot: netkeiba スナップショット
+        """
+        shared_memory: SharedMemory = SharedMemory(name=name)
+        try:
+            html_byte: bytes = bytes(shared_memory.buf[:size])
+        finally:
+            shared_memory.close()
+        extractor: NetkeibaExtractor | None = None if extractor_class is None else extractor_class()
+        return NetkeibaSnapshot.create_by_html(api_class, url, html_byte, partial, extractor)
+
+    @property
+    def header(self) -> NetkeibaRecord:
+        """ Webページ全体の項目の記録
+
+        Returns:
+            NetkeibaRecord: Webページ全体の項目 (レース名など) の記録
+        """
+        return self.__header
+
+    @property
+    def records(self) -> tuple[NetkeibaRecord, ...]:
+        """ 表の行ごとの記録
+
+        Returns:
+            tuple[NetkeibaRecord, ...]: 表の行ごとの記録
+        """
+        return self.__records
+
+    def __len__(self) -> int:
+        """ 表の行数
+
+        Returns:
+            int: 表の行数
+        """
+        return len(self.__records)
+
+    def __iter__(self) -> Iterator[NetkeibaRecord]:
+        """ 表の行ごとの記録を順に取得する
+
+        Yields:
+            NetkeibaRecord: 表の行の記録
+        """
+        return iter(self.__records)
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        """ APIと同じ名前の getter を取得する
+
+        scrape_<項目名> は, Webページ全体の項目であれば引数なし, 表の行の項目であれば行インデックスを引数とする.
+
+        Args:
+            name (str): メソッド名
+
+        Returns:
+            Callable[..., Any]: getter
+
+        Raises:
+            AttributeError: スナップショットに存在しない項目の場合
+        """
+        # NOTE: 未初期化のスロット (複製・復元中) で再帰しないよう, 内部の属性名は検索しない
+        if not name.startswith('_'):
+            if name == self.__num_method:
+                return self.__len__
+            if name.startswith('scrape_'):
+                field: str = name[len('scrape_'):]
+                if field in self.__header:
+                    return lambda: self.__header[field]
+                if field in self.__record_fields:
+                    return lambda index: self.__records[index][field]
+        raise AttributeError(f'{NetkeibaSnapshot.__ERR_MESSAGE_2101} {name}')
+
+    @staticmethod
+    def __scrape(getter: Callable[..., Any], *args: Any) -> Any:
+        """ 項目の値を取得する (例外が発生した場合は, 解析結果への参照を切り離した例外を返す)
+        """
+        try:
+            value: Any = getter(*args)
+        except Exception as e:
+            return NetkeibaSnapshot.__detach(e)
+        # NOTE: str の派生クラス (NavigableString など) は木への参照を持つため, str に変換する
+        if isinstance(value, str) and type(value) is not str:
+            return str(value)
+        return value
+
+    @staticmethod
+    def __detach(error: BaseException) -> BaseException:
+        """ 例外から traceback と連鎖した例外を切り離す (解析結果を参照するフレームを残さない)
+        """
+        error.__traceback__ = None
+        error.__context__ = None
+        error.__cause__ = None
+        for arg in error.args:
+            if isinstance(arg, BaseException):
+                NetkeibaSnapshot.__detach(arg)
+        return error
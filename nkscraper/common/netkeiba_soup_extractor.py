@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+""" netkeiba BeautifulSoup 抽出エンジンモジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.common import NetkeibaExtractor, NetkeibaTableRow
+
+# for type declaration only
+from nkscraper.common import NetkeibaSelector, NetkeibaTableSelector
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+from typing import Any, TYPE_CHECKING
+if TYPE_CHECKING:
+    from nkscraper.common import NetkeibaContents
+
+
+class NetkeibaSoupExtractor(NetkeibaExtractor):
+    """ netkeiba BeautifulSoup 抽出エンジンクラス
+
+    NetkeibaContents.soup の Tag.find で値を取り出す.
+    """
+
+    @property
+    def uses_soup(self) -> bool:
+        """ BeautifulSoup で解析した Webページを使用するか
+
+        Returns:
+            bool: True
+        """
+        return True
+
+    def parse(self, contents: NetkeibaContents) -> BeautifulSoup:
+        """ Webページを解析する
+
+        Args:
+            contents (NetkeibaContents): netkeiba Webページコンテンツ
+
+        Returns:
+            BeautifulSoup: BeautifulSoupオブジェクト (NetkeibaContents.soup)
+        """
+        return contents.soup
+
+    def find_rows(self, document: BeautifulSoup, table: NetkeibaTableSelector) -> list[Tag] | None:
+        """ 表の行を取得する
+
+        Args:
+            document (BeautifulSoup): BeautifulSoupオブジェクト
+            table (NetkeibaTableSelector): netkeiba 表セレクター
+
+        Returns:
+            list[Tag] | None: 行 (tr) 配列 (表がない場合はNone)
+        """
+        table_tag: Tag | None = document.find('table', attrs={table.attr: table.value})
+        if table_tag is not None and table.tbody:
+            table_tag = table_tag.find('tbody')
+        if table_tag is None:
+            return None
+
+        if table.row_class is None:
+            row_list: list[Tag] = table_tag.find_all('tr')
+        else:
+            row_list = table_tag.find_all('tr', class_=table.row_class)
+        return row_list[table.skip:]
+
+    def create_row(self, row: Tag) -> NetkeibaTableRow:
+        """ 表の行の子孫要素を走査して NetkeibaTableRow を作成する
+
+        Args:
+            row (Tag): 行 (tr)
+
+        Returns:
+            NetkeibaTableRow: netkeiba 表の行
+        """
+        return NetkeibaTableRow((tag.name, tag.get('class', []), tag) for tag in row.find_all(True))
+
+    def extract(self, row: NetkeibaTableRow, selector: NetkeibaSelector) -> str:
+        """ 表の行から値を取り出す
+
+        Args:
+            row (NetkeibaTableRow): netkeiba 表の行
+            selector (NetkeibaSelector): netkeiba セレクター
+
+        Returns:
+            str: 子ノードの文字列, または, 属性値
+
+        Raises:
+            AttributeError: 要素が存在しない場合
+            IndexError: セル・子ノードが存在しない場合
+            KeyError: 属性が存在しない場合
+        """
+        element: Any = row.select(selector)
+        for name in selector.path:
+            element = element.find(name)
+        if selector.attr is not None:
+            return str(element.attrs[selector.attr])
+        return str(element.contents[selector.node])
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+""" netkeiba 逐次解析モジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.common import NetkeibaParser
+
+# OSS
+from lxml import etree, html
+
+# for type declaration only
+from nkscraper.common import NetkeibaCategory
+
+
+class NetkeibaStreamParser():
+    """ netkeiba 逐次解析クラス
+
+    受信したレスポンスボディの断片を順に lxml のパーサーに渡し, 受信しながら解析する.
+    断片は解析後に破棄するため, Webページ全体のバイト列は保持しない.
+    取得対象の内容が掲載されているかは, 断片の境界をまたいで TABLE_MARKERS, ROW_MARKERS の目印を検索して確認する.
+    """
+
+    def __init__(self, category: NetkeibaCategory) -> None:
+        """ コンストラクタ
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+        """
+        self.__category: NetkeibaCategory = category
+        # NOTE: イベントを収集しない逐次解析 (feed) では, 断片が小さい場合にタグ名が辞書に登録されず,
+        #       タグ名による検索 (iter, iterdescendants) で要素が見つからないため, 行 (tr) の終了イベントを収集する
+        self.__parser: etree.HTMLPullParser = etree.HTMLPullParser(
+            events=('end',), tag='tr', encoding=NetkeibaParser.ENCODINGS.get(category))
+        self.__parser.set_element_class_lookup(html.HtmlElementClassLookup())
+        self.__table_marker: bytes | None = NetkeibaParser.TABLE_MARKERS.get(category)
+        self.__row_marker: bytes | None = NetkeibaParser.ROW_MARKERS.get(category)
+        self.__has_table: bool = self.__table_marker is None
+        self.__has_row: bool = self.__row_marker is None
+        # NOTE: 断片の境界で分割された目印を検索するため, 直前の断片の末尾を残す
+        self.__tail: bytes = b''
+        self.__size: int = 0
+
+    @staticmethod
+    def is_supported(category: NetkeibaCategory) -> bool:
+        """ 逐次解析できるカテゴリーか判定する
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+
+        Returns:
+            bool: HTML の Webページ (表の目印があるカテゴリー) であればTrue, そうでなければFalse (オッズは JSON)
+        """
+        return category in NetkeibaParser.TABLE_MARKERS
+
+    @property
+    def size(self) -> int:
+        """ 解析したバイト数
+
+        Returns:
+            int: 解析したバイト数
+        """
+        return self.__size
+
+    def feed(self, chunk: bytes) -> None:
+        """ レスポンスボディの断片を解析する
+
+        Args:
+            chunk (bytes): レスポンスボディの断片
+        """
+        self.__parser.feed(chunk)
+        # NOTE: 収集したイベントは使用しないため破棄する (要素への参照を残さない)
+        for _ in self.__parser.read_events():
+            pass
+        self.__size += len(chunk)
+        if self.__has_table and self.__has_row:
+            return
+
+        buffer: bytes = self.__tail + chunk
+        start: int = 0
+        if not self.__has_table:
+            position: int = buffer.find(self.__table_marker)  # type: ignore[arg-type]
+            if position < 0:
+                self.__tail = buffer[max(0, len(buffer) - len(self.__table_marker) + 1):]  # type: ignore[arg-type]
+                return
+            self.__has_table = True
+            start = position
+
+        if not self.__has_row:
+            if buffer.find(self.__row_marker, start) >= 0:  # type: ignore[arg-type]
+                self.__has_row = True
+                self.__tail = b''
+                return
+            self.__tail = buffer[max(start, len(buffer) - len(self.__row_marker) + 1):]  # type: ignore[arg-type]
+
+    def close(self) -> html.HtmlElement:
+        """ 解析を終了し, ルート要素を取得する
+
+        Returns:
+            html.HtmlElement: ルート要素
+
+        Raises:
+            NetkeibaUnavailableError: 取得対象の内容が掲載されていない場合
+        """
+        NetkeibaParser.check_markers(self.__category, self.__has_table, self.__has_row)
+        return self.__parser.close()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+""" netkeiba 表の行モジュール
+"""
+
+from __future__ import annotations
+
+# build-in
+import re
+
+# for type declaration only
+from nkscraper.common import NetkeibaSelector
+from typing import Any, Iterable
+
+
+class NetkeibaTableRow():
+    """ netkeiba 表の行クラス
+
+    行の子孫要素を1回だけ走査し, セル (td) 配列とタグ名, (タグ名, class 属性値) ごとの最初の要素を保持する.
+    各APIの scrape_* は行を走査し直さずに, 保持した要素から値を取り出す.
+    要素は NetkeibaExtractor の実装ごとの型 (BeautifulSoup の Tag, lxml の HtmlElement) のまま保持する.
+    子孫要素を走査せずに値を取り出す抽出エンジン (NetkeibaLxmlExtractor) は, 行 (tr) の要素のみを保持する.
+    """
+
+    def __init__(self, elements: Iterable[tuple[str, list[str], Any]] = (), element: Any | None = None) -> None:
+        """ コンストラクタ
+
+        Args:
+            elements (Iterable[tuple[str, list[str], Any]]): 行の子孫要素 ((タグ名, class 属性値配列, 要素), ...) (文書順)
+            element (Any | None): 行 (tr) の要素 (抽出エンジンが行から直接値を取り出す場合)
+        """
+        self.__element: Any | None = element
+        self.__cells: list[Any] = []
+        self.__classes: list[tuple[str, str, Any]] = []
+        self.__class_dict: dict[tuple[str, str], Any] = {}
+        self.__name_dict: dict[str, Any] = {}
+        for name, class_list, element in elements:
+            if name == 'td':
+                self.__cells.append(element)
+            self.__name_dict.setdefault(name, element)
+            for class_name in class_list:
+                self.__classes.append((name, class_name, element))
+                self.__class_dict.setdefault((name, class_name), element)
+
+    @property
+    def element(self) -> Any | None:
+        """ 行 (tr) の要素
+
+        Returns:
+            Any | None: 行 (tr) の要素 (子孫要素を走査して作成した場合はNone)
+        """
+        return self.__element
+
+    @property
+    def cells(self) -> list[Any]:
+        """ セル (td) 配列
+
+        Returns:
+            list[Any]: 行に含まれる td 要素 (row.find_all('td') と同じ順序)
+        """
+        return self.__cells
+
+    def find(self, name: str, class_name: str) -> Any | None:
+        """ class 属性値が一致する最初の要素を取得する
+
+        row.find(name, class_=class_name) と同じ要素を返す.
+
+        Args:
+            name (str): タグ名
+            class_name (str): class 属性値
+
+        Returns:
+            Any | None: 要素 (存在しない場合はNone)
+        """
+        return self.__class_dict.get((name, class_name))
+
+    def search(self, name: str, pattern: str) -> Any | None:
+        """ class 属性値が正規表現に一致する最初の要素を取得する
+
+        row.find(name, class_=re.compile(pattern)) と同じ要素を返す.
+
+        Args:
+            name (str): タグ名
+            pattern (str): class 属性値の正規表現
+
+        Returns:
+            Any | None: 要素 (存在しない場合はNone)
+        """
+        for tag_name, class_name, element in self.__classes:
+            if tag_name == name and re.search(pattern, class_name) is not None:
+                return element
+        return None
+
+    def select(self, selector: NetkeibaSelector) -> Any | None:
+        """ セレクターで指定した要素を取得する
+
+        Args:
+            selector (NetkeibaSelector): netkeiba セレクター
+
+        Returns:
+            Any | None: 要素 (存在しない場合はNone)
+
+        Raises:
+            IndexError: セル番号が範囲外の場合
+        """
+        if selector.cell is not None:
+            return self.__cells[selector.cell]
+        if selector.pattern is not None:
+            return self.search(selector.name, selector.pattern)
+        if selector.class_name is not None:
+            return self.find(selector.name, selector.class_name)
+        return self.__name_dict.get(selector.name)
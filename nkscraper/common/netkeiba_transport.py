@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+""" netkeiba HTTPトランスポートモジュール
+"""
+
+from __future__ import annotations
+
+# built-in
+from abc import ABC, abstractmethod
+
+# for type declaration only
+from nkscraper.common import NetkeibaResponse
+from typing import Callable, Mapping
+
+
+class NetkeibaTransport(ABC):
+    """ netkeiba HTTPトランスポートインターフェース
+
+    NetkeibaClient が通信に使用する HTTP クライアントを抽象化する.
+    open から close までの間, 接続を使い回す.
+    """
+
+    @property
+    @abstractmethod
+    def is_open(self) -> bool:
+        """ 開かれているか
+
+        Returns:
+            bool: 開かれていればTrue, そうでなければFalse
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def open(self) -> None:
+        """ HTTP クライアントを開く (イベントループ上で呼び出す)
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def close(self) -> None:
+        """ HTTP クライアントを閉じる
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def request(self, method: str, url: str,
+                      headers: dict[str, str] | None = None) -> NetkeibaResponse:
+        """ リクエストを送信し, レスポンスボディまで読み込む
+
+        Args:
+            method (str): HTTPメソッド (GET, HEAD)
+            url (str): URL
+            headers (dict[str, str] | None): リクエストヘッダー
+
+        Returns:
+            NetkeibaResponse: HTTPレスポンス (HTTPステータスコードが 400 未満の場合)
+
+        Raises:
+            Exception: HTTPステータスコードが 400 以上の場合, または, 通信に失敗した場合 (HTTP クライアント固有の例外)
+        """
+        raise NotImplementedError()
+
+    async def stream(self, method: str, url: str, headers: dict[str, str] | None,
+                     sink: Callable[[bytes], None]) -> NetkeibaResponse:
+        """ リクエストを送信し, 受信したレスポンスボディの断片を順に sink に渡す
+
+        既定の実装は request でレスポンスボディまで読み込み, 1つの断片として渡す.
+        断片を受信するごとに渡す実装では, レスポンスボディ全体を保持しない.
+
+        Args:
+            method (str): HTTPメソッド (GET)
+            url (str): URL
+            headers (dict[str, str] | None): リクエストヘッダー
+            sink (Callable[[bytes], None]): レスポンスボディの断片を受け取る関数
+
+        Returns:
+            NetkeibaResponse: HTTPレスポンス (レスポンスボディは空. HTTPステータスコードが 400 未満の場合)
+
+        Raises:
+            Exception: HTTPステータスコードが 400 以上の場合, または, 通信に失敗した場合 (HTTP クライアント固有の例外)
+        """
+        response: NetkeibaResponse = await self.request(method, url, headers)
+        sink(response.body)
+        return NetkeibaResponse(response.status, response.headers, b'')
+
+    @abstractmethod
+    def get_error_status(self, error: BaseException) -> int | None:
+        """ request で発生した例外から HTTPステータスコードを取得する
+
+        Args:
+            error (BaseException): 発生した例外
+
+        Returns:
+            int | None: HTTPステータスコード (HTTPステータスコードによる例外でない場合はNone)
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def get_error_headers(self, error: BaseException) -> Mapping[str, str] | None:
+        """ request で発生した例外からレスポンスヘッダーを取得する
+
+        Args:
+            error (BaseException): 発生した例外
+
+        Returns:
+            Mapping[str, str] | None: レスポンスヘッダー (HTTPステータスコードによる例外でない場合はNone)
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def is_connection_error(self, error: BaseException) -> bool:
+        """ request で発生した例外が接続エラー・タイムアウトか判定する
+
+        Args:
+            error (BaseException): 発生した例外
+
+        Returns:
+            bool: 接続エラー・タイムアウトであればTrue, そうでなければFalse
+        """
+        raise NotImplementedError()
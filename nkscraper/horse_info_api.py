@@ -7,6 +7,7 @@ from __future__ import annotations
 # nkscraper
 from nkscraper.utils import NKScraperException, NKScraperLogger, NKScraperHelper
 from nkscraper.common import NetkeibaCategory, NetkeibaContents, NetkeibaRequests
+from nkscraper.common import NetkeibaSelector, NetkeibaTableSelector, NetkeibaSnapshot
 from nkscraper.url import HorseInfoURL
 
 # build-in
@@ -15,9 +16,12 @@ import re
 import sys
 
 # for type declaration only
+from nkscraper.common import NetkeibaClient, NetkeibaExtractor, NetkeibaTableRow
+from nkscraper.common import NetkeibaPackedArchive, NetkeibaArchiveEntry
 from nkscraper.common import NetkeibaFieldID
 from nkscraper.url import NetkeibaURL
 from logging import Logger
+from typing import Any, AsyncIterator, Callable, Iterator
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 from datetime import date
@@ -27,9 +31,75 @@ class HorseInfoAPI():
     """ 競走馬情報スクレイピングAPIクラス
     """
 
+    # NOTE: to_records で取得できる項目 (scrape_<項目名> の項目名)
+    RECORD_FIELDS: tuple[str, ...] = (
+        'race_date',
+        'field_name',
+        'field_id',
+        'race_name',
+        'race_id',
+        'wakuban',
+        'umaban',
+        'tansho_odds',
+        'tansho_rank',
+        'rank',
+        'jockey_name',
+        'jockey_id',
+        'jockey_weight',
+        'course_type',
+        'distance',
+        'time',
+        'time_difference',
+        'corner_ranks',
+        'last_3f_time',
+        'horse_weight',
+        'horse_weight_fluctuation',
+    )
+
+    # NOTE: snapshot で取得するWebページ全体の項目 (引数のない scrape_<項目名> の項目名)
+    HEADER_FIELDS: tuple[str, ...] = (
+        'horse_name',
+        'horse_id',
+        'trainer_name',
+        'trainer_id',
+        'area',
+        'father_name',
+        'father_id',
+    )
+
+    # NOTE: 競走馬プロフィール表, 過去のレース成績 (行) から値を取り出すセレクター
+    PROFILE_TABLE_SELECTOR: NetkeibaTableSelector = NetkeibaTableSelector('class', 'db_prof_table')
+    TABLE_SELECTOR: NetkeibaTableSelector = NetkeibaTableSelector('class', 'db_h_race_results', tbody=True)
+    SELECTORS: dict[str, NetkeibaSelector] = {
+        'trainer_name': NetkeibaSelector('a'),
+        'trainer_id': NetkeibaSelector('a', attr='href'),
+        'area': NetkeibaSelector(cell=0, node=1),
+        'race_date': NetkeibaSelector(cell=0, path=('a',)),
+        'field_name': NetkeibaSelector(cell=1, path=('a',)),
+        'race_name': NetkeibaSelector(cell=4, path=('a',)),
+        'race_id': NetkeibaSelector(cell=4, path=('a',), attr='href'),
+        'wakuban': NetkeibaSelector(cell=7),
+        'umaban': NetkeibaSelector(cell=8),
+        'tansho_odds': NetkeibaSelector(cell=9),
+        'tansho_rank': NetkeibaSelector(cell=10),
+        'rank': NetkeibaSelector(cell=11),
+        'jockey_name': NetkeibaSelector(cell=12, path=('a',)),
+        'jockey_id': NetkeibaSelector(cell=12, path=('a',), attr='href'),
+        'jockey_weight': NetkeibaSelector(cell=13),
+        'course_type': NetkeibaSelector(cell=14),
+        'time': NetkeibaSelector(cell=17),
+        'time_difference': NetkeibaSelector(cell=18),
+        'corner_ranks': NetkeibaSelector(cell=20),
+        'last_3f_time': NetkeibaSelector(cell=22),
+        'horse_weight': NetkeibaSelector(cell=23),
+    }
+
     __ERR_MESSAGE_0201: str = 'NetkeibaContentsが競走馬情報ではありません.'
     __ERR_MESSAGE_0202: str = '競走馬情報が見つかりませんでした.'
     __ERR_MESSAGE_0203: str = '過去のレース成績が存在しないため、取得できません.'
+    __ERR_MESSAGE_0204: str = '過去のレース成績から取得できない項目が指定されました.'
+    __ERR_MESSAGE_0205: str = 'snapshot で解析結果を解放済みです. スナップショットを使用してください.'
+    __ERR_MESSAGE_0206: str = 'アーカイブに存在しません.'
     __WARN_MESSAGE_0201: str = '過去のレース成績が見つかりませんでした. 新馬の可能性があります.'
     __WARN_MESSAGE_0202: str = '枠番が取得できませんでした. 海外レースの可能性があります.'
     __WARN_MESSAGE_0203: str = '単勝オッズが取得できませんでした. 出走取消レースの場合があります.'
@@ -56,43 +126,182 @@ class HorseInfoAPI():
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0201)
             sys.exit()
 
-        self.__soup: BeautifulSoup = contents.soup
+        self.__contents: NetkeibaContents | None = contents
+        contents.attach()
+        self.__extractor: NetkeibaExtractor = contents.extractor
         self.__horse_id: int = self.__helper.get_id_from_url(contents.url)
-        self.__profile_table: list[Tag] = self.__scrape_profile_table()
-        self.__result_table: list[Tag] | None = self.__scrape_result_table()
+        document: Any = self.__extractor.parse(contents)
+        self.__profile_table: list[Any] = self.__scrape_profile_table(document)
+        self.__result_table: list[Any] | None = self.__scrape_result_table(document)
+        self.__rows: list[NetkeibaTableRow | None] = [None] * (
+            0 if self.__result_table is None else len(self.__result_table))
         self.__num_race_result: int = 0 if self.__result_table is None else len(
             self.__result_table)
 
     @staticmethod
-    def create(horse_id: int) -> HorseInfoAPI:
+    def create(horse_id: int, client: NetkeibaClient | None = None) -> HorseInfoAPI:
         """ 競走馬情報スクレイピングAPIを作成する
 
         Args:
             horse_id (int): netkeiba 競走馬ID
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
 
         Returns:
             HorseInfoAPI: 競走馬情報スクレイピングAPI
+
+        Raises:
+            NKScraperException: Webページの取得に失敗した場合, または, 取得対象の内容が掲載されていない場合
         """
-        return HorseInfoAPI.create_by_list([horse_id])[0]
+        # 競走馬情報 NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents: NetkeibaContents = reqests.get(HorseInfoURL(horse_id))
+        # 競走馬情報スクレイピングAPIを作成して返却
+        return HorseInfoAPI(contents)
 
     @staticmethod
-    def create_by_list(horse_id_list: list[int]) -> list[HorseInfoAPI]:
+    def create_by_list(horse_id_list: list[int],
+                       client: NetkeibaClient | None = None) -> list[HorseInfoAPI]:
         """ 競走馬情報スクレイピングAPIを作成する
 
         Args:
             horse_id_list (list[int]): netkeiba 競走馬ID配列
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
 
         Returns:
-            list[HorseInfoAPI]: 競走馬情報スクレイピングAPI配列
+            list[HorseInfoAPI]: 競走馬情報スクレイピングAPI配列 (Webページの取得に失敗した競走馬は含まない)
         """
         # HorseInfoURLの作成
         url_list: list[NetkeibaURL] = [HorseInfoURL(race_id) for race_id in horse_id_list]
         # 競走馬情報 NetkeibaContents の作成
-        reqests: NetkeibaRequests = NetkeibaRequests()
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
         contents_list: list[NetkeibaContents] = reqests.get_by_list(url_list)
         # 競走馬情報スクレイピングAPIを作成して返却
         return [HorseInfoAPI(contents) for contents in contents_list]
 
+    @staticmethod
+    async def acreate(horse_id: int, client: NetkeibaClient | None = None) -> HorseInfoAPI:
+        """ 競走馬情報スクレイピングAPIを非同期に作成する
+
+        Args:
+            horse_id (int): netkeiba 競走馬ID
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Returns:
+            HorseInfoAPI: 競走馬情報スクレイピングAPI
+
+        Raises:
+            NKScraperException: Webページの取得に失敗した場合, または, 取得対象の内容が掲載されていない場合
+        """
+        # 競走馬情報 NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents: NetkeibaContents = await reqests.aget(HorseInfoURL(horse_id))
+        # 競走馬情報スクレイピングAPIを作成して返却
+        return HorseInfoAPI(contents)
+
+    @staticmethod
+    async def acreate_by_list(horse_id_list: list[int],
+                              client: NetkeibaClient | None = None) -> list[HorseInfoAPI]:
+        """ 競走馬情報スクレイピングAPIを非同期に作成する
+
+        Args:
+            horse_id_list (list[int]): netkeiba 競走馬ID配列
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Returns:
+            list[HorseInfoAPI]: 競走馬情報スクレイピングAPI配列 (Webページの取得に失敗した競走馬は含まない)
+        """
+        # HorseInfoURLの作成
+        url_list: list[NetkeibaURL] = [HorseInfoURL(horse_id) for horse_id in horse_id_list]
+        # 競走馬情報 NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents_list: list[NetkeibaContents] = await reqests.aget_by_list(url_list)
+        # 競走馬情報スクレイピングAPIを作成して返却
+        return [HorseInfoAPI(contents) for contents in contents_list]
+
+    @staticmethod
+    def iter_by_list(horse_id_list: list[int], chunk_size: int = 100,
+                     client: NetkeibaClient | None = None) -> Iterator[HorseInfoAPI]:
+        """ 競走馬情報スクレイピングAPIを逐次作成する
+
+        Webページの取得が完了した順に競走馬情報スクレイピングAPIを返す.
+        取得中・取得済みで未返却の Webページは最大 chunk_size 件に制限される.
+
+        Args:
+            horse_id_list (list[int]): netkeiba 競走馬ID配列
+            chunk_size (int): 同時に保持する Webページの最大数
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Yields:
+            HorseInfoAPI: 競走馬情報スクレイピングAPI (Webページの取得に失敗した競走馬は含まない)
+        """
+        # HorseInfoURLの作成
+        url_list: list[NetkeibaURL] = [HorseInfoURL(horse_id) for horse_id in horse_id_list]
+        # 競走馬情報 NetkeibaContents を取得した順に競走馬情報スクレイピングAPIを作成して返却
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        for result in reqests.iter_results_by_list(url_list, chunk_size):
+            if result.contents is not None:
+                yield HorseInfoAPI(result.contents)
+
+    @staticmethod
+    async def aiter_by_list(horse_id_list: list[int], chunk_size: int = 100,
+                            client: NetkeibaClient | None = None) -> AsyncIterator[HorseInfoAPI]:
+        """ 競走馬情報スクレイピングAPIを非同期に逐次作成する
+
+        Webページの取得が完了した順に競走馬情報スクレイピングAPIを返す.
+        取得中・取得済みで未返却の Webページは最大 chunk_size 件に制限される.
+
+        Args:
+            horse_id_list (list[int]): netkeiba 競走馬ID配列
+            chunk_size (int): 同時に保持する Webページの最大数
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Yields:
+            HorseInfoAPI: 競走馬情報スクレイピングAPI (Webページの取得に失敗した競走馬は含まない)
+        """
+        # HorseInfoURLの作成
+        url_list: list[NetkeibaURL] = [HorseInfoURL(horse_id) for horse_id in horse_id_list]
+        # 競走馬情報 NetkeibaContents を取得した順に競走馬情報スクレイピングAPIを作成して返却
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        async for result in reqests.aiter_results_by_list(url_list, chunk_size):
+            if result.contents is not None:
+                yield HorseInfoAPI(result.contents)
+
+    @staticmethod
+    def create_by_archive(horse_id: int, archive: NetkeibaPackedArchive, partial: bool = False) -> HorseInfoAPI:
+        """ 圧縮Webページアーカイブから競走馬情報スクレイピングAPIを作成する (通信しない)
+
+        Args:
+            horse_id (int): netkeiba 競走馬ID
+            archive (NetkeibaPackedArchive): 圧縮Webページアーカイブ
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+
+        Returns:
+            HorseInfoAPI: 競走馬情報スクレイピングAPI
+
+        Raises:
+            NKScraperException: アーカイブに存在しない場合
+        """
+        entry: NetkeibaArchiveEntry | None = archive.get_entry(NetkeibaCategory.HORSE_INFO, horse_id)
+        if entry is None:
+            raise NKScraperException(f'{HorseInfoAPI.__ERR_MESSAGE_0206} {horse_id}')
+        return HorseInfoAPI(entry.create_contents(partial))
+
+    @staticmethod
+    def iter_by_archive(archive: NetkeibaPackedArchive, partial: bool = False) -> Iterator[HorseInfoAPI]:
+        """ 圧縮Webページアーカイブに保存した全ての競走馬情報から競走馬情報スクレイピングAPIを逐次作成する (通信しない)
+
+        アーカイブのデータファイルを先頭から順に読み込む.
+
+        Args:
+            archive (NetkeibaPackedArchive): 圧縮Webページアーカイブ
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+
+        Yields:
+            HorseInfoAPI: 競走馬情報スクレイピングAPI
+        """
+        for entry in archive.iter_entries(NetkeibaCategory.HORSE_INFO):
+            yield HorseInfoAPI(entry.create_contents(partial))
+
     # Public API Functions ----------------------------------------------------
     def scrape_horse_name(self) -> str:
         """ 競走馬名をスクレイピングする
@@ -119,7 +328,7 @@ class HorseInfoAPI():
         Returns:
             str: 調教師名
         """
-        trainer_name: str = str(self.__profile_table[1].a.contents[0])
+        trainer_name: str = self.__extract_profile('trainer_name')
         return self.__helper.arrange_string(trainer_name)
 
     def scrape_trainer_id(self) -> int:
@@ -128,7 +337,7 @@ class HorseInfoAPI():
         Returns:
             int: 調教師ID
         """
-        trainer_url: str = str(self.__profile_table[1].a.attrs['href'])
+        trainer_url: str = self.__extract_profile('trainer_id')
         return self.__helper.get_id_from_url(trainer_url)
 
     def scrape_area(self) -> str:
@@ -137,8 +346,7 @@ class HorseInfoAPI():
         Returns:
             str: 所属
         """
-        td_area: Tag = self.__profile_table[1].find('td')
-        area: str = str(td_area.contents[1])
+        area: str = self.__extract_profile('area')
         arranged_area: str = self.__helper.arrange_string(area)
         return arranged_area[1:-1]
 
@@ -194,8 +402,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_data: Tag = self.__result_table[index].find_all('td')[0]
-        date_str: str = str(td_data.a.contents[0])
+        date_str: str = self.__extract(index, 'race_date')
         return datetime.strptime(date_str, '%Y/%m/%d').date()
 
     def scrape_field_name(self, index: int) -> str:
@@ -210,8 +417,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_field_name: Tag = self.__result_table[index].find_all('td')[1]
-        field_name: str = str(td_field_name.a.contents[0])
+        field_name: str = self.__extract(index, 'field_name')
         arranged_field_name: str = self.__helper.arrange_string(field_name)
         return re.sub(r'[0-9]+', '', arranged_field_name)
 
@@ -239,8 +445,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_race_name: Tag = self.__result_table[index].find_all('td')[4]
-        race_name: str = str(td_race_name.a.contents[0])
+        race_name: str = self.__extract(index, 'race_name')
         return self.__helper.arrange_string(race_name)
 
     def scrape_race_id(self, index: int) -> int:
@@ -255,8 +460,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_race_name: Tag = self.__result_table[index].find_all('td')[4]
-        race_url: str = str(td_race_name.a.attrs['href'])
+        race_url: str = self.__extract(index, 'race_id')
         return self.__helper.get_id_from_url(race_url)
 
     def scrape_wakuban(self, index: int) -> int | None:
@@ -271,9 +475,8 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_wakuban: Tag = self.__result_table[index].find_all('td')[7]
         try:
-            return int(td_wakuban.contents[0])
+            return int(self.__extract(index, 'wakuban'))
 
         # 海外レースの場合
         except ValueError:
@@ -294,8 +497,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_umaban: Tag = self.__result_table[index].find_all('td')[8]
-        return int(td_umaban.contents[0])
+        return int(self.__extract(index, 'umaban'))
 
     def scrape_tansho_odds(self, index: int) -> float | None:
         """ 単勝オッズをスクレイピングする
@@ -309,9 +511,8 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_tansho_odds: Tag = self.__result_table[index].find_all('td')[9]
         try:
-            return float(td_tansho_odds.contents[0])
+            return float(self.__extract(index, 'tansho_odds'))
 
         # 出走取消レースの場合
         except ValueError:
@@ -332,9 +533,8 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_tansho_rank: Tag = self.__result_table[index].find_all('td')[10]
         try:
-            return int(td_tansho_rank.contents[0])
+            return int(self.__extract(index, 'tansho_rank'))
 
         # 出走取消レースの場合
         except ValueError:
@@ -355,9 +555,8 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_rank: Tag = self.__result_table[index].find_all('td')[11]
         try:
-            return int(td_rank.contents[0])
+            return int(self.__extract(index, 'rank'))
 
         # 出走取消レース・競走除外レースの場合
         except ValueError:
@@ -382,8 +581,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_jockey_name: Tag = self.__result_table[index].find_all('td')[12]
-        jockey_name: str = str(td_jockey_name.a.contents[0])
+        jockey_name: str = self.__extract(index, 'jockey_name')
         return self.__helper.arrange_string(jockey_name)
 
     def scrape_jockey_id(self, index: int) -> int:
@@ -398,8 +596,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_jockey_id: Tag = self.__result_table[index].find_all('td')[12]
-        jockey_url: str = td_jockey_id.a.attrs['href']
+        jockey_url: str = self.__extract(index, 'jockey_id')
         return self.__helper.get_id_from_url(jockey_url)
 
     def scrape_jockey_weight(self, index: int) -> float:
@@ -414,8 +611,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_jockey_weight: Tag = self.__result_table[index].find_all('td')[13]
-        jockey_weight: str = td_jockey_weight.contents[0]
+        jockey_weight: str = self.__extract(index, 'jockey_weight')
         arranged_jockey_weight: str = self.__helper.arrange_string(jockey_weight)
         return float(arranged_jockey_weight)
 
@@ -431,8 +627,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_course_type: Tag = self.__result_table[index].find_all('td')[14]
-        course_type_distance: str = str(td_course_type.contents[0])
+        course_type_distance: str = self.__extract(index, 'course_type')
         arranged_course_type_distance: str = self.__helper.arrange_string(
             course_type_distance)
         return arranged_course_type_distance[0]
@@ -449,8 +644,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_course_type: Tag = self.__result_table[index].find_all('td')[14]
-        course_type_distance: str = str(td_course_type.contents[0])
+        course_type_distance: str = self.__extract(index, 'course_type')
         arranged_course_type_distance: str = self.__helper.arrange_string(
             course_type_distance)
         return int(arranged_course_type_distance[1:])
@@ -467,8 +661,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_time: Tag = self.__result_table[index].find_all('td')[17]
-        time: str = str(td_time.contents[0])
+        time: str = self.__extract(index, 'time')
         arranged_time: str = self.__helper.arrange_string(time)
         # 出走取消レース・競走除外レース・タイムが取得できない海外レースの場合
         if len(arranged_time) == 1:
@@ -488,8 +681,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_time_difference: Tag = self.__result_table[index].find_all('td')[18]
-        time_difference: str = str(td_time_difference.contents[0])
+        time_difference: str = self.__extract(index, 'time_difference')
         arranged_time_difference: str = self.__helper.arrange_string(time_difference)
         # 出走取消レース・競走除外レース・海外レースの場合
         if len(arranged_time_difference) == 1:
@@ -509,8 +701,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_corner_ranks: Tag = self.__result_table[index].find_all('td')[20]
-        corner_ranks: str = str(td_corner_ranks.contents[0])
+        corner_ranks: str = self.__extract(index, 'corner_ranks')
         arranged_corner_ranks: str = self.__helper.arrange_string(corner_ranks)
         # 出走取消レース・競走除外レース・海外レースの場合
         # NOTE: 新潟1000mのような直線コースの際は、int変換でValueErrorが発生しないことを確認する
@@ -534,8 +725,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_last_3f_time: Tag = self.__result_table[index].find_all('td')[22]
-        last_3f_time: str = str(td_last_3f_time.contents[0])
+        last_3f_time: str = self.__extract(index, 'last_3f_time')
         arranged_last_3f_time: str = self.__helper.arrange_string(last_3f_time)
         # 出走取消レース・競走除外レース・海外レースの場合
         if len(arranged_last_3f_time) == 1:
@@ -555,8 +745,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_horse_weight: Tag = self.__result_table[index].find_all('td')[23]
-        horse_weight: str = str(td_horse_weight.contents[0])
+        horse_weight: str = self.__extract(index, 'horse_weight')
         arranged_horse_weight: str = self.__helper.arrange_string(horse_weight)
         # 出走取消レース・海外レースの場合
         if arranged_horse_weight == '計不':
@@ -576,8 +765,7 @@ class HorseInfoAPI():
         if self.__result_table is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0203)
             sys.exit()
-        td_horse_weight_fluctuation: Tag = self.__result_table[index].find_all('td')[23]
-        horse_weight_fluctuation: str = str(td_horse_weight_fluctuation.contents[0])
+        horse_weight_fluctuation: str = self.__extract(index, 'horse_weight')
         arranged_horse_weight_fluctuation: str = self.__helper.arrange_string(
             horse_weight_fluctuation)
         # 出走取消レース・海外レースの場合
@@ -586,23 +774,105 @@ class HorseInfoAPI():
             return None
         return int(arranged_horse_weight_fluctuation[3:-1].replace('(', ''))
 
+    def to_records(self, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """ 過去のレース成績の各行を辞書に変換する
+
+        各行の要素は1回だけ走査し, 指定した項目のみを scrape_<項目名> と同じ値で取得する.
+
+        Args:
+            fields (list[str] | None): 取得する項目 (RECORD_FIELDS の項目名. 省略時は全ての項目)
+
+        Returns:
+            list[dict[str, Any]]: 行ごとの {項目名: 値} 配列
+        """
+        field_list: list[str] = list(HorseInfoAPI.RECORD_FIELDS) if fields is None else fields
+        for field in field_list:
+            if field not in HorseInfoAPI.RECORD_FIELDS:
+                self.__logger.error(f'{HorseInfoAPI.__ERR_MESSAGE_0204} {field}')
+                sys.exit()
+        getter_list: list[tuple[str, Callable[[int], Any]]] = [
+            (field, getattr(self, f'scrape_{field}')) for field in field_list
+        ]
+        return [
+            {field: getter(index) for field, getter in getter_list} for index in range(len(self.__rows))
+        ]
+
+    def snapshot(self, release: bool = True) -> NetkeibaSnapshot:
+        """ 競走馬情報の全ての項目を1回だけ取得し, 解析結果から切り離したスナップショットを作成する
+
+        スナップショットは HEADER_FIELDS, RECORD_FIELDS の項目を保持し, このAPIと同じ getter (scrape_<項目名>, get_num_race_result) で値を取得する.
+        取得時に例外が発生した項目は, スナップショットの getter でも同じ例外を送出する.
+
+        Args:
+            release (bool): True の場合, 解析結果・表の行・NetkeibaContents への参照を解放する (以降は, このAPIではなくスナップショットを使用する)
+
+        Returns:
+            NetkeibaSnapshot: netkeiba スナップショット
+        """
+        snapshot: NetkeibaSnapshot = NetkeibaSnapshot.create(
+            self, HorseInfoAPI.HEADER_FIELDS, HorseInfoAPI.RECORD_FIELDS, self.__num_race_result, 'get_num_race_result')
+        if release:
+            self.__release()
+        return snapshot
+
     # Private Functions for Scrape Table ----------------------------------
-    def __scrape_profile_table(self) -> list[Tag]:
+    def __release(self) -> None:
+        """ 解析結果と表の行を解放し, NetkeibaContents (バイト列) への参照を切る (他のAPIと共有していなければ soup を decompose する)
+        """
+        self.__profile_table = []
+        self.__result_table = []
+        self.__rows = []
+        self.__num_race_result = 0
+        if self.__contents is not None:
+            self.__contents.detach()
+        self.__contents = None
+
+    @property
+    def __soup(self) -> BeautifulSoup:
+        """ BeautifulSoupオブジェクト (過去のレース成績以外の要素をスクレイピングする時点で解析する)
+        """
+        if self.__contents is None:
+            self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0205)
+            sys.exit()
+        return self.__contents.soup
+
+    def __get_row(self, index: int) -> NetkeibaTableRow:
+        """ 過去のレース成績の行を取得する (初回のみ行の要素を走査する)
+        """
+        row: NetkeibaTableRow | None = self.__rows[index]
+        if row is None:
+            row = self.__extractor.create_row(self.__result_table[index])  # type: ignore[index]
+            self.__rows[index] = row
+        return row
+
+    def __extract(self, index: int, key: str) -> str:
+        """ 過去のレース成績の行から SELECTORS[key] の値を取り出す
+        """
+        return self.__extractor.extract(self.__get_row(index), HorseInfoAPI.SELECTORS[key])
+
+    def __extract_profile(self, key: str) -> str:
+        """ 競走馬プロフィール表の調教師の行から SELECTORS[key] の値を取り出す
+        """
+        row: NetkeibaTableRow = self.__extractor.create_row(self.__profile_table[1])
+        return self.__extractor.extract(row, HorseInfoAPI.SELECTORS[key])
+
+    def __scrape_profile_table(self, document: Any) -> list[Any]:
         """ 競走馬プロフィール表をスクレピングする
         """
-        table_prof: Tag = self.__soup.find('table', class_='db_prof_table')
-        if table_prof is None:
+        table_row_list: list[Any] | None = self.__extractor.find_rows(
+            document, HorseInfoAPI.PROFILE_TABLE_SELECTOR)
+        if table_row_list is None:
             self.__logger.error(HorseInfoAPI.__ERR_MESSAGE_0202)
             sys.exit()
 
-        return table_prof.find_all('tr')
+        return table_row_list
 
-    def __scrape_result_table(self) -> list[Tag] | None:
+    def __scrape_result_table(self, document: Any) -> list[Any] | None:
         """ 競走馬情報レース結果表をスクレイピングする
         """
-        table_race_result: Tag = self.__soup.find('table', class_='db_h_race_results')
-        if table_race_result is None:
+        table_row_list: list[Any] | None = self.__extractor.find_rows(document, HorseInfoAPI.TABLE_SELECTOR)
+        if table_row_list is None:
             self.__logger.warning(HorseInfoAPI.__WARN_MESSAGE_0201)
             return None
 
-        return table_race_result.find('tbody').findAll('tr')
+        return table_row_list
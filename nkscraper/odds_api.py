@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 # nkscraper
-from nkscraper.utils import NKScraperLogger, NKScraperHelper
+from nkscraper.utils import NKScraperException, NKScraperLogger, NKScraperHelper
 from nkscraper.common import NetkeibaCategory, NetkeibaContents, NetkeibaRequests
 from nkscraper.url import OddsURL
 
@@ -14,8 +14,11 @@ import sys
 import json
 
 # for type declaration only
+from nkscraper.common import NetkeibaClient
+from nkscraper.common import NetkeibaPackedArchive, NetkeibaArchiveEntry
 from nkscraper.url import NetkeibaURL
 from logging import Logger
+from typing import AsyncIterator, Iterator
 from bs4 import BeautifulSoup
 
 
@@ -25,6 +28,7 @@ class OddsAPI():
 
     __ERR_MESSAGE_0301: str = 'NetkeibaContentsがオッズではありません.'
     __ERR_MESSAGE_0302: str = 'オッズを取得できませんでした. 馬券の販売が開始されていない可能性があります.'
+    __ERR_MESSAGE_0303: str = 'アーカイブに存在しません.'
     __WARN_MESSAGE_0301: str = 'オッズを取得できませんでした. 出走取消馬の可能性があります.'
     __WARN_MESSAGE_0302: str = '単勝人気を取得できませんでした. 出走取消馬の可能性があります.'
 
@@ -48,35 +52,169 @@ class OddsAPI():
         self.__num_horse: int = len(self.__tansho_odds_json)
 
     @staticmethod
-    def create(race_id: int) -> OddsAPI:
+    def create(race_id: int, client: NetkeibaClient | None = None) -> OddsAPI:
         """ オッズスクレイピングAPIを作成する
 
         Args:
             race_id (int): netkeiba レースID
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
 
         Returns:
             OddsAPI: オッズスクレイピングAPI
+
+        Raises:
+            NKScraperException: Webページの取得に失敗した場合, または, 取得対象の内容が掲載されていない場合
         """
-        return OddsAPI.create_by_list([race_id])[0]
+        # オッズ NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents: NetkeibaContents = reqests.get(OddsURL(race_id))
+        # オッズスクレイピングAPIを作成して返却
+        return OddsAPI(contents)
 
     @staticmethod
-    def create_by_list(race_id_list: list[int]) -> list[OddsAPI]:
+    def create_by_list(race_id_list: list[int],
+                       client: NetkeibaClient | None = None) -> list[OddsAPI]:
         """ オッズスクレイピングAPIを作成する
 
         Args:
             race_id_list (list[int]): netkeiba レースID配列
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
 
         Returns:
-            list[OddsAPI]: オッズスクレイピングAPI配列
+            list[OddsAPI]: オッズスクレイピングAPI配列 (Webページの取得に失敗したレースは含まない)
         """
         # OddsURLの作成
         url_list: list[NetkeibaURL] = [OddsURL(race_id) for race_id in race_id_list]
         # 出馬表 NetkeibaContents の作成
-        reqests: NetkeibaRequests = NetkeibaRequests()
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
         contents_list: list[NetkeibaContents] = reqests.get_by_list(url_list)
         # オッズスクレイピングAPIを作成して返却
         return [OddsAPI(contents) for contents in contents_list]
 
+    @staticmethod
+    async def acreate(race_id: int, client: NetkeibaClient | None = None) -> OddsAPI:
+        """ オッズスクレイピングAPIを非同期に作成する
+
+        Args:
+            race_id (int): netkeiba レースID
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Returns:
+            OddsAPI: オッズスクレイピングAPI
+
+        Raises:
+            NKScraperException: Webページの取得に失敗した場合, または, 取得対象の内容が掲載されていない場合
+        """
+        # オッズ NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents: NetkeibaContents = await reqests.aget(OddsURL(race_id))
+        # オッズスクレイピングAPIを作成して返却
+        return OddsAPI(contents)
+
+    @staticmethod
+    async def acreate_by_list(race_id_list: list[int],
+                              client: NetkeibaClient | None = None) -> list[OddsAPI]:
+        """ オッズスクレイピングAPIを非同期に作成する
+
+        Args:
+            race_id_list (list[int]): netkeiba レースID配列
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Returns:
+            list[OddsAPI]: オッズスクレイピングAPI配列 (Webページの取得に失敗したレースは含まない)
+        """
+        # OddsURLの作成
+        url_list: list[NetkeibaURL] = [OddsURL(race_id) for race_id in race_id_list]
+        # オッズ NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents_list: list[NetkeibaContents] = await reqests.aget_by_list(url_list)
+        # オッズスクレイピングAPIを作成して返却
+        return [OddsAPI(contents) for contents in contents_list]
+
+    @staticmethod
+    def iter_by_list(race_id_list: list[int], chunk_size: int = 100,
+                     client: NetkeibaClient | None = None) -> Iterator[OddsAPI]:
+        """ オッズスクレイピングAPIを逐次作成する
+
+        Webページの取得が完了した順にオッズスクレイピングAPIを返す.
+        取得中・取得済みで未返却の Webページは最大 chunk_size 件に制限される.
+
+        Args:
+            race_id_list (list[int]): netkeiba レースID配列
+            chunk_size (int): 同時に保持する Webページの最大数
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Yields:
+            OddsAPI: オッズスクレイピングAPI (Webページの取得に失敗したレースは含まない)
+        """
+        # OddsURLの作成
+        url_list: list[NetkeibaURL] = [OddsURL(race_id) for race_id in race_id_list]
+        # オッズ NetkeibaContents を取得した順にオッズスクレイピングAPIを作成して返却
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        for result in reqests.iter_results_by_list(url_list, chunk_size):
+            if result.contents is not None:
+                yield OddsAPI(result.contents)
+
+    @staticmethod
+    async def aiter_by_list(race_id_list: list[int], chunk_size: int = 100,
+                            client: NetkeibaClient | None = None) -> AsyncIterator[OddsAPI]:
+        """ オッズスクレイピングAPIを非同期に逐次作成する
+
+        Webページの取得が完了した順にオッズスクレイピングAPIを返す.
+        取得中・取得済みで未返却の Webページは最大 chunk_size 件に制限される.
+
+        Args:
+            race_id_list (list[int]): netkeiba レースID配列
+            chunk_size (int): 同時に保持する Webページの最大数
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Yields:
+            OddsAPI: オッズスクレイピングAPI (Webページの取得に失敗したレースは含まない)
+        """
+        # OddsURLの作成
+        url_list: list[NetkeibaURL] = [OddsURL(race_id) for race_id in race_id_list]
+        # オッズ NetkeibaContents を取得した順にオッズスクレイピングAPIを作成して返却
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        async for result in reqests.aiter_results_by_list(url_list, chunk_size):
+            if result.contents is not None:
+                yield OddsAPI(result.contents)
+
+    @staticmethod
+    def create_by_archive(race_id: int, archive: NetkeibaPackedArchive, partial: bool = False) -> OddsAPI:
+        """ 圧縮WebページアーカイブからオッズスクレイピングAPIを作成する (通信しない)
+
+        Args:
+            race_id (int): netkeiba レースID
+            archive (NetkeibaPackedArchive): 圧縮Webページアーカイブ
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+
+        Returns:
+            OddsAPI: オッズスクレイピングAPI
+
+        Raises:
+            NKScraperException: アーカイブに存在しない場合
+        """
+        entry: NetkeibaArchiveEntry | None = archive.get_entry(NetkeibaCategory.ODDS, race_id)
+        if entry is None:
+            raise NKScraperException(f'{OddsAPI.__ERR_MESSAGE_0303} {race_id}')
+        return OddsAPI(entry.create_contents(partial))
+
+    @staticmethod
+    def iter_by_archive(archive: NetkeibaPackedArchive, partial: bool = False) -> Iterator[OddsAPI]:
+        """ 圧縮Webページアーカイブに保存した全てのオッズからオッズスクレイピングAPIを逐次作成する (通信しない)
+
+        アーカイブのデータファイルを先頭から順に読み込む.
+
+        Args:
+            archive (NetkeibaPackedArchive): 圧縮Webページアーカイブ
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+
+        Yields:
+            OddsAPI: オッズスクレイピングAPI
+        """
+        for entry in archive.iter_entries(NetkeibaCategory.ODDS):
+            yield OddsAPI(entry.create_contents(partial))
+
     def scrape_race_id(self) -> int:
         """ レースIDをスクレイピングする.
 
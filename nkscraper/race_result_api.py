@@ -7,28 +7,89 @@ from __future__ import annotations
 # nkscraper
 from nkscraper.utils import NKScraperException, NKScraperLogger, NKScraperHelper
 from nkscraper.common import NetkeibaCategory, NetkeibaContents, NetkeibaRequests
+from nkscraper.common import NetkeibaSelector, NetkeibaTableSelector, NetkeibaSnapshot, NetkeibaRaceHeader
 from nkscraper.url import RaceResultURL
 
 # build-in
-from datetime import datetime
-import re
 import sys
 
 # for type declaration only
+from nkscraper.common import NetkeibaClient, NetkeibaExtractor, NetkeibaTableRow
+from nkscraper.common import NetkeibaPackedArchive, NetkeibaArchiveEntry
 from nkscraper.common import NetkeibaFieldID
 from nkscraper.url import NetkeibaURL
 from logging import Logger
+from typing import Any, AsyncIterator, Callable, Iterator
 from bs4 import BeautifulSoup
-from bs4.element import Tag
-from datetime import date
+from datetime import date, time
 
 
 class RaceResultAPI():
     """ レース結果スクレイピングAPIクラス
     """
 
+    # NOTE: to_records で取得できる項目 (scrape_<項目名> の項目名)
+    RECORD_FIELDS: tuple[str, ...] = (
+        'rank',
+        'wakuban',
+        'umaban',
+        'horse_name',
+        'horse_id',
+        'sex_age',
+        'jockey_weight',
+        'jockey_name',
+        'jockey_id',
+        'time',
+        'tansho_rank',
+        'tansho_odds',
+        'last_3f_time',
+        'corner_ranks',
+        'area',
+        'horse_weight',
+        'horse_weight_fluctuation',
+    )
+
+    # NOTE: snapshot で取得するWebページ全体の項目 (引数のない scrape_<項目名> の項目名)
+    HEADER_FIELDS: tuple[str, ...] = (
+        'race_name',
+        'race_id',
+        'race_date',
+        'course_type',
+        'distance',
+        'field_name',
+        'field_id',
+        'start_time',
+        'weather',
+        'track_condition',
+    )
+
+    # NOTE: レース結果表 (行) から値を取り出すセレクター
+    TABLE_SELECTOR: NetkeibaTableSelector = NetkeibaTableSelector('id', 'All_Result_Table', row_class='HorseList')
+    SELECTORS: dict[str, NetkeibaSelector] = {
+        'rank': NetkeibaSelector('div', 'Rank'),
+        'wakuban': NetkeibaSelector(pattern='Waku', path=('div',)),
+        'umaban': NetkeibaSelector(cell=2, path=('div',)),
+        'horse_name': NetkeibaSelector('span', 'Horse_Name', path=('a',)),
+        'horse_id': NetkeibaSelector('span', 'Horse_Name', path=('a',), attr='href'),
+        'sex_age': NetkeibaSelector('div', 'Horse_Info_Detail', path=('span',)),
+        'jockey_weight': NetkeibaSelector('span', 'JockeyWeight'),
+        'jockey_name': NetkeibaSelector(class_name='Jockey', path=('a',)),
+        'jockey_id': NetkeibaSelector(class_name='Jockey', path=('a',), attr='href'),
+        'time': NetkeibaSelector('span', 'RaceTime'),
+        'tansho_rank': NetkeibaSelector('span', 'OddsPeople'),
+        'tansho_odds': NetkeibaSelector(cell=10, path=('span',)),
+        'last_3f_time': NetkeibaSelector(cell=11),
+        'corner_ranks': NetkeibaSelector(class_name='PassageRate'),
+        'area': NetkeibaSelector(class_name='Trainer', path=('span',)),
+        'horse_weight': NetkeibaSelector(class_name='Weight'),
+        'horse_weight_fluctuation': NetkeibaSelector(class_name='Weight', path=('small',)),
+    }
+
     __ERR_MESSAGE_0101: str = 'NetkeibaContentsがレース結果ではありません.'
     __ERR_MESSAGE_0102: str = 'レース結果表が見つかりませんでした.'
+    __ERR_MESSAGE_0103: str = 'レース結果表から取得できない項目が指定されました.'
+    __ERR_MESSAGE_0104: str = 'snapshot で解析結果を解放済みです. スナップショットを使用してください.'
+    __ERR_MESSAGE_0105: str = 'アーカイブに存在しません.'
     __WARN_MESSAGE_0101: str = '着順を取得できませんでした. 出走取消馬・または競走除外馬の可能性があります.'
     __WARN_MESSAGE_0102: str = 'タイムを取得できませんでした. 出走取消馬・競走除外馬の可能性があります.'
     __WARN_MESSAGE_0103: str = '単勝人気を取得できませんでした. 出走取消馬の可能性があります.'
@@ -51,41 +112,179 @@ class RaceResultAPI():
             self.__logger.error(RaceResultAPI.__ERR_MESSAGE_0101)
             sys.exit()
 
-        self.__soup: BeautifulSoup = contents.soup
+        self.__contents: NetkeibaContents | None = contents
+        contents.attach()
+        self.__extractor: NetkeibaExtractor = contents.extractor
         self.__race_id: int = self.__helper.get_id_from_url(contents.url)
-        self.__table: list[Tag] = self.__scrape_race_result_table()
+        self.__header: NetkeibaRaceHeader | None = None
+        self.__table: list[Any] = self.__scrape_race_result_table()
+        self.__rows: list[NetkeibaTableRow | None] = [None] * len(self.__table)
         self.__num_horse: int = len(self.__table)
 
     @staticmethod
-    def create(race_id: int) -> RaceResultAPI:
+    def create(race_id: int, client: NetkeibaClient | None = None) -> RaceResultAPI:
         """ レース結果スクレイピングAPIを作成する
 
         Args:
             race_id (int): netkeiba レースID
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
 
         Returns:
             RaceResultAPI: レース結果スクレイピングAPI
+
+        Raises:
+            NKScraperException: Webページの取得に失敗した場合, または, 取得対象の内容が掲載されていない場合
         """
-        return RaceResultAPI.create_by_list([race_id])[0]
+        # レース結果 NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents: NetkeibaContents = reqests.get(RaceResultURL(race_id))
+        # レース結果スクレイピングAPIを作成して返却
+        return RaceResultAPI(contents)
 
     @staticmethod
-    def create_by_list(race_id_list: list[int]) -> list[RaceResultAPI]:
+    def create_by_list(race_id_list: list[int],
+                       client: NetkeibaClient | None = None) -> list[RaceResultAPI]:
         """ レース結果スクレイピングAPIを作成する
 
         Args:
             race_id_list (list[int]): netkeiba レースID配列
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
 
         Returns:
-            list[RaceResultAPI]: レース結果スクレイピングAPI配列
+            list[RaceResultAPI]: レース結果スクレイピングAPI配列 (Webページの取得に失敗したレースは含まない)
         """
         # RaceResultURLの作成
         url_list: list[NetkeibaURL] = [RaceResultURL(race_id) for race_id in race_id_list]
         # レース結果 NetkeibaContents の作成
-        reqests: NetkeibaRequests = NetkeibaRequests()
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
         contents_list: list[NetkeibaContents] = reqests.get_by_list(url_list)
         # レース結果スクレイピングAPIを作成して返却
         return [RaceResultAPI(contents) for contents in contents_list]
 
+    @staticmethod
+    async def acreate(race_id: int, client: NetkeibaClient | None = None) -> RaceResultAPI:
+        """ レース結果スクレイピングAPIを非同期に作成する
+
+        Args:
+            race_id (int): netkeiba レースID
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Returns:
+            RaceResultAPI: レース結果スクレイピングAPI
+
+        Raises:
+            NKScraperException: Webページの取得に失敗した場合, または, 取得対象の内容が掲載されていない場合
+        """
+        # レース結果 NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents: NetkeibaContents = await reqests.aget(RaceResultURL(race_id))
+        # レース結果スクレイピングAPIを作成して返却
+        return RaceResultAPI(contents)
+
+    @staticmethod
+    async def acreate_by_list(race_id_list: list[int],
+                              client: NetkeibaClient | None = None) -> list[RaceResultAPI]:
+        """ レース結果スクレイピングAPIを非同期に作成する
+
+        Args:
+            race_id_list (list[int]): netkeiba レースID配列
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Returns:
+            list[RaceResultAPI]: レース結果スクレイピングAPI配列 (Webページの取得に失敗したレースは含まない)
+        """
+        # RaceResultURLの作成
+        url_list: list[NetkeibaURL] = [RaceResultURL(race_id) for race_id in race_id_list]
+        # レース結果 NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents_list: list[NetkeibaContents] = await reqests.aget_by_list(url_list)
+        # レース結果スクレイピングAPIを作成して返却
+        return [RaceResultAPI(contents) for contents in contents_list]
+
+    @staticmethod
+    def iter_by_list(race_id_list: list[int], chunk_size: int = 100,
+                     client: NetkeibaClient | None = None) -> Iterator[RaceResultAPI]:
+        """ レース結果スクレイピングAPIを逐次作成する
+
+        Webページの取得が完了した順にレース結果スクレイピングAPIを返す.
+        取得中・取得済みで未返却の Webページは最大 chunk_size 件に制限される.
+
+        Args:
+            race_id_list (list[int]): netkeiba レースID配列
+            chunk_size (int): 同時に保持する Webページの最大数
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Yields:
+            RaceResultAPI: レース結果スクレイピングAPI (Webページの取得に失敗したレースは含まない)
+        """
+        # RaceResultURLの作成
+        url_list: list[NetkeibaURL] = [RaceResultURL(race_id) for race_id in race_id_list]
+        # レース結果 NetkeibaContents を取得した順にレース結果スクレイピングAPIを作成して返却
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        for result in reqests.iter_results_by_list(url_list, chunk_size):
+            if result.contents is not None:
+                yield RaceResultAPI(result.contents)
+
+    @staticmethod
+    async def aiter_by_list(race_id_list: list[int], chunk_size: int = 100,
+                            client: NetkeibaClient | None = None) -> AsyncIterator[RaceResultAPI]:
+        """ レース結果スクレイピングAPIを非同期に逐次作成する
+
+        Webページの取得が完了した順にレース結果スクレイピングAPIを返す.
+        取得中・取得済みで未返却の Webページは最大 chunk_size 件に制限される.
+
+        Args:
+            race_id_list (list[int]): netkeiba レースID配列
+            chunk_size (int): 同時に保持する Webページの最大数
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Yields:
+            RaceResultAPI: レース結果スクレイピングAPI (Webページの取得に失敗したレースは含まない)
+        """
+        # RaceResultURLの作成
+        url_list: list[NetkeibaURL] = [RaceResultURL(race_id) for race_id in race_id_list]
+        # レース結果 NetkeibaContents を取得した順にレース結果スクレイピングAPIを作成して返却
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        async for result in reqests.aiter_results_by_list(url_list, chunk_size):
+            if result.contents is not None:
+                yield RaceResultAPI(result.contents)
+
+    @staticmethod
+    def create_by_archive(race_id: int, archive: NetkeibaPackedArchive, partial: bool = False) -> RaceResultAPI:
+        """ 圧縮Webページアーカイブからレース結果スクレイピングAPIを作成する (通信しない)
+
+        Args:
+            race_id (int): netkeiba レースID
+            archive (NetkeibaPackedArchive): 圧縮Webページアーカイブ
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+
+        Returns:
+            RaceResultAPI: レース結果スクレイピングAPI
+
+        Raises:
+            NKScraperException: アーカイブに存在しない場合
+        """
+        entry: NetkeibaArchiveEntry | None = archive.get_entry(NetkeibaCategory.RACE_RESULT, race_id)
+        if entry is None:
+            raise NKScraperException(f'{RaceResultAPI.__ERR_MESSAGE_0105} {race_id}')
+        return RaceResultAPI(entry.create_contents(partial))
+
+    @staticmethod
+    def iter_by_archive(archive: NetkeibaPackedArchive, partial: bool = False) -> Iterator[RaceResultAPI]:
+        """ 圧縮Webページアーカイブに保存した全てのレース結果からレース結果スクレイピングAPIを逐次作成する (通信しない)
+
+        アーカイブのデータファイルを先頭から順に読み込む.
+
+        Args:
+            archive (NetkeibaPackedArchive): 圧縮Webページアーカイブ
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+
+        Yields:
+            RaceResultAPI: レース結果スクレイピングAPI
+        """
+        for entry in archive.iter_entries(NetkeibaCategory.RACE_RESULT):
+            yield RaceResultAPI(entry.create_contents(partial))
+
     # Public API Functions ----------------------------------------------------
     def scrape_race_name(self) -> str:
         """ レース名をスクレイピングする
@@ -93,9 +292,7 @@ class RaceResultAPI():
         Returns:
             str: レース名
         """
-        div_race_name: Tag = self.__soup.find('div', class_='RaceName')
-        race_name: str = str(div_race_name.contents[0])
-        return self.__helper.arrange_string(race_name)
+        return self.__race_header.race_name
 
     def scrape_race_id(self) -> int:
         """ レースIDをスクレイピングする.
@@ -111,9 +308,7 @@ class RaceResultAPI():
         Returns:
             date: レース開催日
         """
-        title: str = str(self.__soup.find('title').contents[0])
-        date_str: str = re.findall(r'\d{4}年\d{1,2}月\d{1,2}日', title)[0]
-        return datetime.strptime(date_str, '%Y年%m月%d日').date()
+        return self.__race_header.race_date
 
     def scrape_course_type(self) -> str:
         """ コース種別をスクレイピングする
@@ -121,11 +316,7 @@ class RaceResultAPI():
         Returns:
             str: コース種別 (芝 or ダ)
         """
-        div_race_data01: Tag = self.__soup.find('div', class_='RaceData01')
-        course_type_distance_span: Tag = div_race_data01.find('span')
-        course_type_distance: str = self.__helper.arrange_string(
-            str(course_type_distance_span.contents[0]))
-        return course_type_distance[0]
+        return self.__race_header.course_type
 
     def scrape_distance(self) -> int:
         """ レース距離をスクレイピングする
@@ -133,11 +324,7 @@ class RaceResultAPI():
         Returns:
             int: レース距離
         """
-        div_race_data01: Tag = self.__soup.find('div', class_='RaceData01')
-        course_type_distance_span: Tag = div_race_data01.find('span')
-        course_type_distance: str = self.__helper.arrange_string(
-            str(course_type_distance_span.contents[0]))
-        return int(course_type_distance[1:-1])
+        return self.__race_header.distance
 
     def scrape_field_name(self) -> str:
         """ 競馬場名をスクレイピングする
@@ -145,10 +332,7 @@ class RaceResultAPI():
         Returns:
             str: 競馬場名
         """
-        div_race_data02: Tag = self.__soup.find('div', class_='RaceData02')
-        field_name_span: Tag = div_race_data02.findAll('span')[1]
-        field_name: str = field_name_span.contents[0]
-        return self.__helper.arrange_string(field_name)
+        return self.__race_header.field_name
 
     def scrape_field_id(self) -> NetkeibaFieldID:
         """ NetkeibaFieldID をスクレイピングする.
@@ -159,6 +343,30 @@ class RaceResultAPI():
         field_name: str = self.scrape_field_name()
         return self.__helper.convert_field_name_to_id(field_name)
 
+    def scrape_start_time(self) -> time | None:
+        """ 発走時刻をスクレイピングする
+
+        Returns:
+            time | None: 発走時刻 (掲載されていない場合はNone)
+        """
+        return self.__race_header.start_time
+
+    def scrape_weather(self) -> str | None:
+        """ 天候をスクレイピングする
+
+        Returns:
+            str | None: 天候 (晴, 曇 など) (掲載されていない場合はNone)
+        """
+        return self.__race_header.weather
+
+    def scrape_track_condition(self) -> str | None:
+        """ 馬場状態をスクレイピングする
+
+        Returns:
+            str | None: 馬場状態 (良, 稍重, 重, 不良) (掲載されていない場合はNone)
+        """
+        return self.__race_header.track_condition
+
     def get_num_horse(self) -> int:
         """ レース出走頭数を取得する
 
@@ -176,9 +384,8 @@ class RaceResultAPI():
         Returns:
             int | None: 着順 (出走取消馬、競走除外の場合はNoneを返す)
         """
-        div_rank: Tag = self.__table[index].find('div', class_='Rank')
         try:
-            return int(div_rank.contents[0])
+            return int(self.__extract(index, 'rank'))
 
         # 出走取消馬・競走除外馬の場合
         except ValueError:
@@ -196,9 +403,7 @@ class RaceResultAPI():
         Returns:
             int: 枠番
         """
-        td_waku: Tag = self.__table[index].find('td', class_=re.compile('Waku'))
-        div_waku: Tag = td_waku.find('div')
-        return int(div_waku.contents[0])
+        return int(self.__extract(index, 'wakuban'))
 
     def scrape_umaban(self, index: int) -> int:
         """ 馬番をスクレイピングする
@@ -209,9 +414,7 @@ class RaceResultAPI():
         Returns:
             int: 馬番
         """
-        td_umaban: Tag = self.__table[index].findAll('td')[2]
-        div_umaban: Tag = td_umaban.find('div')
-        return int(div_umaban.contents[0])
+        return int(self.__extract(index, 'umaban'))
 
     def scrape_horse_name(self, index: int) -> str:
         """ 馬名をスクレイピングする
@@ -222,8 +425,7 @@ class RaceResultAPI():
         Returns:
             str: 馬名
         """
-        span_horse_name: Tag = self.__table[index].find('span', class_='Horse_Name')
-        horse_name: str = span_horse_name.a.contents[0]
+        horse_name: str = self.__extract(index, 'horse_name')
         return self.__helper.arrange_string(horse_name)
 
     def scrape_horse_id(self, index: int) -> int:
@@ -235,8 +437,7 @@ class RaceResultAPI():
         Returns:
             int: netkeiba 馬ID
         """
-        span_horse_name: Tag = self.__table[index].find('span', class_='Horse_Name')
-        horse_url: str = span_horse_name.a.attrs['href']
+        horse_url: str = self.__extract(index, 'horse_id')
         return self.__helper.get_id_from_url(horse_url)
 
     def scrape_sex_age(self, index: int) -> str:
@@ -248,10 +449,7 @@ class RaceResultAPI():
         Returns:
             str: 馬性齢
         """
-        div_horse_info_detail: Tag = self.__table[index].find(
-            'div', class_='Horse_Info_Detail')
-        span_sex_age: Tag = div_horse_info_detail.find('span')
-        sex_age: str = str(span_sex_age.contents[0])
+        sex_age: str = self.__extract(index, 'sex_age')
         return self.__helper.arrange_string(sex_age)
 
     def scrape_jockey_weight(self, index: int) -> float:
@@ -263,9 +461,7 @@ class RaceResultAPI():
         Returns:
             float: 斤量
         """
-        span_jockey_weight: Tag = self.__table[index].find(
-            'span', class_='JockeyWeight')
-        return float(span_jockey_weight.contents[0])
+        return float(self.__extract(index, 'jockey_weight'))
 
     def scrape_jockey_name(self, index: int) -> str:
         """ 騎手名をスクレイピングする
@@ -276,8 +472,7 @@ class RaceResultAPI():
         Returns:
             str: 騎手名
         """
-        td_jockey: Tag = self.__table[index].find('td', class_='Jockey')
-        jockey_name: str = td_jockey.a.contents[0]
+        jockey_name: str = self.__extract(index, 'jockey_name')
         return self.__helper.arrange_string(jockey_name)
 
     def scrape_jockey_id(self, index: int) -> int:
@@ -289,8 +484,7 @@ class RaceResultAPI():
         Returns:
             int: netkeiba 騎手ID
         """
-        td_jockey: Tag = self.__table[index].find('td', class_='Jockey')
-        jockey_url: str = td_jockey.a.attrs['href']
+        jockey_url: str = self.__extract(index, 'jockey_id')
         return self.__helper.get_id_from_url(jockey_url)
 
     def scrape_time(self, index: int) -> str | None:
@@ -302,10 +496,8 @@ class RaceResultAPI():
         Returns:
             str | None: タイム ex: 3:00.0 (出走取消馬・競走除外馬の場合はNoneを返す)
         """
-        span_race_time: Tag = self.__table[index].find(
-            'span', class_='RaceTime')
         try:
-            time: str = str(span_race_time.contents[0])
+            time: str = self.__extract(index, 'time')
             return self.__helper.arrange_string(time)
 
         # 出走取消馬・競走除外馬の場合
@@ -324,10 +516,8 @@ class RaceResultAPI():
         Returns:
             int | None: 単勝人気 (出走取消馬の場合はNoneを返す)
         """
-        span_odds_people: Tag = self.__table[index].find(
-            'span', class_='OddsPeople')
         try:
-            return int(span_odds_people.contents[0])
+            return int(self.__extract(index, 'tansho_rank'))
 
         # 出走取消馬の場合
         except IndexError:
@@ -345,10 +535,8 @@ class RaceResultAPI():
         Returns:
             int | None: 単勝オッズ (出走取消馬の場合はNoneを返す)
         """
-        td_tansho_odds: Tag = self.__table[index].findAll('td')[10]
-        span_tansho_odds: Tag = td_tansho_odds.find('span')
         try:
-            return float(span_tansho_odds.contents[0])
+            return float(self.__extract(index, 'tansho_odds'))
 
         # 出走取消馬の場合
         except IndexError:
@@ -366,9 +554,7 @@ class RaceResultAPI():
         Returns:
             int | None: 上がり3Fタイム (出走取消馬・競走除外馬の場合はNoneを返す)
         """
-        td_last_3f_time: Tag = self.__table[index].findAll('td')[11]
-        last_3f_time: str = self.__helper.arrange_string(
-            td_last_3f_time.contents[0])
+        last_3f_time: str = self.__helper.arrange_string(self.__extract(index, 'last_3f_time'))
         try:
             return float(last_3f_time)
 
@@ -388,9 +574,7 @@ class RaceResultAPI():
         Returns:
             int | None: コーナー通過順位 ex: 14-15-14-15 (出走取消馬・競走除外馬の場合はNoneを返す)
         """
-        td_passage_rate: Tag = self.__table[index].find(
-            'td', class_='PassageRate')
-        corner_ranks: str = td_passage_rate.contents[0]
+        corner_ranks: str = self.__extract(index, 'corner_ranks')
         arranged_corner_ranks: str = self.__helper.arrange_string(corner_ranks)
         if arranged_corner_ranks == '':
             self.__logger.warning(RaceResultAPI.__WARN_MESSAGE_0106)
@@ -406,9 +590,7 @@ class RaceResultAPI():
         Returns:
             str: 所属
         """
-        td_trainer: Tag = self.__table[index].find('td', class_='Trainer')
-        span_area: Tag = td_trainer.find('span')
-        area: str = span_area.contents[0]
+        area: str = self.__extract(index, 'area')
         return self.__helper.arrange_string(area)
 
     def scrape_horse_weight(self, index: int) -> int | None:
@@ -420,8 +602,7 @@ class RaceResultAPI():
         Returns:
             int | None: 馬体重 (出走取消馬の場合はNoneを返す)
         """
-        td_weight: Tag = self.__table[index].find('td', class_='Weight')
-        horse_weight: str = str(td_weight.contents[0])
+        horse_weight: str = self.__extract(index, 'horse_weight')
         try:
             return int(self.__helper.arrange_string(horse_weight))
 
@@ -441,10 +622,8 @@ class RaceResultAPI():
         Returns:
             int | None: 馬体重増減 (出走取消馬、または、前回計測不能の場合はNoneを返す)
         """
-        td_weight: Tag = self.__table[index].find('td', class_='Weight')
-        small_weight_fluctuation: Tag = td_weight.find('small')
         try:
-            weight_fluctuation: str = small_weight_fluctuation.contents[0]
+            weight_fluctuation: str = self.__extract(index, 'horse_weight_fluctuation')
             return int(weight_fluctuation[1:-1])
 
         # 出走取消馬、または、前回計測不能の場合
@@ -454,14 +633,97 @@ class RaceResultAPI():
         except Exception as e:
             raise NKScraperException(e)
 
+    def to_records(self, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """ レース結果表の各行を辞書に変換する
+
+        各行の要素は1回だけ走査し, 指定した項目のみを scrape_<項目名> と同じ値で取得する.
+
+        Args:
+            fields (list[str] | None): 取得する項目 (RECORD_FIELDS の項目名. 省略時は全ての項目)
+
+        Returns:
+            list[dict[str, Any]]: 行ごとの {項目名: 値} 配列
+        """
+        field_list: list[str] = list(RaceResultAPI.RECORD_FIELDS) if fields is None else fields
+        for field in field_list:
+            if field not in RaceResultAPI.RECORD_FIELDS:
+                self.__logger.error(f'{RaceResultAPI.__ERR_MESSAGE_0103} {field}')
+                sys.exit()
+        getter_list: list[tuple[str, Callable[[int], Any]]] = [
+            (field, getattr(self, f'scrape_{field}')) for field in field_list
+        ]
+        return [
+            {field: getter(index) for field, getter in getter_list} for index in range(len(self.__rows))
+        ]
+
+    def snapshot(self, release: bool = True) -> NetkeibaSnapshot:
+        """ レース結果表の全ての項目を1回だけ取得し, 解析結果から切り離したスナップショットを作成する
+
+        スナップショットは HEADER_FIELDS, RECORD_FIELDS の項目を保持し, このAPIと同じ getter (scrape_<項目名>, get_num_horse) で値を取得する.
+        取得時に例外が発生した項目は, スナップショットの getter でも同じ例外を送出する.
+
+        Args:
+            release (bool): True の場合, 解析結果・表の行・NetkeibaContents への参照を解放する (以降は, このAPIではなくスナップショットを使用する)
+
+        Returns:
+            NetkeibaSnapshot: netkeiba スナップショット
+        """
+        snapshot: NetkeibaSnapshot = NetkeibaSnapshot.create(
+            self, RaceResultAPI.HEADER_FIELDS, RaceResultAPI.RECORD_FIELDS, self.__num_horse, 'get_num_horse')
+        if release:
+            self.__release()
+        return snapshot
+
     # Private Functions for Scrape Race Result Table -------------------------
-    def __scrape_race_result_table(self) -> list[Tag]:
+    def __release(self) -> None:
+        """ 解析結果と表の行を解放し, NetkeibaContents (バイト列) への参照を切る (他のAPIと共有していなければ soup を decompose する)
+        """
+        self.__table = []
+        self.__rows = []
+        self.__num_horse = 0
+        if self.__contents is not None:
+            self.__contents.detach()
+        self.__contents = None
+        self.__header = None
+
+    @property
+    def __soup(self) -> BeautifulSoup:
+        """ BeautifulSoupオブジェクト (レース結果表以外の要素をスクレイピングする時点で解析する)
+        """
+        if self.__contents is None:
+            self.__logger.error(RaceResultAPI.__ERR_MESSAGE_0104)
+            sys.exit()
+        return self.__contents.soup
+
+    @property
+    def __race_header(self) -> NetkeibaRaceHeader:
+        """ レース情報ヘッダー (初回のみ title, RaceName, RaceData01, RaceData02 を解析する)
+        """
+        if self.__header is None:
+            self.__header = NetkeibaRaceHeader(self.__soup, self.__helper)
+        return self.__header
+
+    def __get_row(self, index: int) -> NetkeibaTableRow:
+        """ レース結果表の行を取得する (初回のみ行の要素を走査する)
+        """
+        row: NetkeibaTableRow | None = self.__rows[index]
+        if row is None:
+            row = self.__extractor.create_row(self.__table[index])
+            self.__rows[index] = row
+        return row
+
+    def __extract(self, index: int, key: str) -> str:
+        """ レース結果表の行から SELECTORS[key] の値を取り出す
+        """
+        return self.__extractor.extract(self.__get_row(index), RaceResultAPI.SELECTORS[key])
+
+    def __scrape_race_result_table(self) -> list[Any]:
         """ レース結果表をスクレイピングする
         """
-        table: Tag = self.__soup.find('table', id='All_Result_Table')
+        table_row_list: list[Any] | None = self.__extractor.find_rows(
+            self.__extractor.parse(self.__contents), RaceResultAPI.TABLE_SELECTOR)
         # レース結果表がない場合
-        if table is None:
+        if table_row_list is None:
             self.__logger.error(RaceResultAPI.__ERR_MESSAGE_0102)
             sys.exit()
-        table_row_list: list[Tag] = table.findAll('tr', class_='HorseList')
         return table_row_list
@@ -7,6 +7,7 @@ from __future__ import annotations
 # nkscraper
 from nkscraper.utils import NKScraperException, NKScraperLogger, NKScraperHelper
 from nkscraper.common import NetkeibaCategory, NetkeibaContents, NetkeibaRequests, NetkeibaFieldID
+from nkscraper.common import NetkeibaSelector, NetkeibaTableSelector, NetkeibaSnapshot
 from nkscraper.url import SearchedRaceURL
 
 # build-in
@@ -14,10 +15,10 @@ from datetime import datetime
 import sys
 
 # for type declaration only
+from nkscraper.common import NetkeibaClient, NetkeibaExtractor, NetkeibaTableRow
 from nkscraper.url import NetkeibaURL
 from logging import Logger
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+from typing import Any, AsyncIterator, Callable, Iterator
 from datetime import date
 
 
@@ -25,8 +26,29 @@ class SearchedRaceAPI():
     """ レース検索結果スクレイピングAPIクラス
     """
 
+    # NOTE: to_records で取得できる項目 (scrape_<項目名> の項目名)
+    RECORD_FIELDS: tuple[str, ...] = (
+        'race_date',
+        'race_name',
+        'race_id',
+        'num_race_horse',
+    )
+
+    # NOTE: snapshot で取得するWebページ全体の項目 (引数のない scrape_<項目名> の項目名)
+    HEADER_FIELDS: tuple[str, ...] = ()
+
+    # NOTE: レース検索結果 (行) から値を取り出すセレクター
+    TABLE_SELECTOR: NetkeibaTableSelector = NetkeibaTableSelector('class', 'race_table_01', skip=1)
+    SELECTORS: dict[str, NetkeibaSelector] = {
+        'race_date': NetkeibaSelector(cell=0, path=('a',)),
+        'race_name': NetkeibaSelector(cell=4, path=('a',)),
+        'race_id': NetkeibaSelector(cell=4, path=('a',), attr='href'),
+        'num_race_horse': NetkeibaSelector(cell=7),
+    }
+
     __ERR_MESSAGE_0501: str = 'NetkeibaContentsがレース検索結果ではありません.'
     __ERR_MESSAGE_0502: str = '該当するレースが見つかりませんでした.'
+    __ERR_MESSAGE_0503: str = 'レース検索結果から取得できない項目が指定されました.'
 
     def __init__(self, contents: NetkeibaContents) -> None:
         """ コンストラクタ
@@ -41,13 +63,17 @@ class SearchedRaceAPI():
             self.__logger.error(SearchedRaceAPI.__ERR_MESSAGE_0501)
             sys.exit()
 
-        self.__soup: BeautifulSoup = contents.soup
-        self.__race_table: list[Tag] = self.__scrape_race_table()
+        self.__contents: NetkeibaContents | None = contents
+        contents.attach()
+        self.__extractor: NetkeibaExtractor = contents.extractor
+        self.__race_table: list[Any] = self.__scrape_race_table()
+        self.__rows: list[NetkeibaTableRow | None] = [None] * len(self.__race_table)
 
     @staticmethod
     def create(race_name: str, field_id: NetkeibaFieldID, 
                distance: int, corse_type: str, start_year: int,
-               start_month: int, end_year: int, end_month: int) -> SearchedRaceAPI:
+               start_month: int, end_year: int, end_month: int,
+               client: NetkeibaClient | None = None) -> SearchedRaceAPI:
         """ レース検索結果スクレイピングAPIを作成する
 
         Args:
@@ -59,19 +85,122 @@ class SearchedRaceAPI():
             start_month (int): 検索開始月
             end_year (int): 検索終了年
             end_month (int): 検索終了年
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
 
         Returns:
             SearchedRaceAPI: レース検索結果スクレイピングAPI
+
+        Raises:
+            NKScraperException: Webページの取得に失敗した場合, または, 取得対象の内容が掲載されていない場合
         """
         # SearchedRaceURLの作成
         url: NetkeibaURL = SearchedRaceURL(race_name, field_id, distance, corse_type,
                                            start_year, start_month, end_year, end_month)
         # レース検索結果 NetkeibaContents の作成
-        reqests: NetkeibaRequests = NetkeibaRequests()
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
         contents: NetkeibaContents = reqests.get(url)
         # レース検索結果スクレイピングAPIを作成して返却
         return SearchedRaceAPI(contents)
 
+    @staticmethod
+    async def acreate(race_name: str, field_id: NetkeibaFieldID,
+                      distance: int, corse_type: str, start_year: int,
+                      start_month: int, end_year: int, end_month: int,
+                      client: NetkeibaClient | None = None) -> SearchedRaceAPI:
+        """ レース検索結果スクレイピングAPIを非同期に作成する
+
+        Args:
+            race_name (str): レース名
+            field_id (NetkeibaFieldID): netkeiba 競馬場ID
+            distance (int): 距離
+            corse_type (str): '芝' or 'ダ'
+            start_year (int): 検索開始年
+            start_month (int): 検索開始月
+            end_year (int): 検索終了年
+            end_month (int): 検索終了年
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Returns:
+            SearchedRaceAPI: レース検索結果スクレイピングAPI
+
+        Raises:
+            NKScraperException: Webページの取得に失敗した場合, または, 取得対象の内容が掲載されていない場合
+        """
+        # SearchedRaceURLの作成
+        url: NetkeibaURL = SearchedRaceURL(race_name, field_id, distance, corse_type,
+                                           start_year, start_month, end_year, end_month)
+        # レース検索結果 NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents: NetkeibaContents = await reqests.aget(url)
+        # レース検索結果スクレイピングAPIを作成して返却
+        return SearchedRaceAPI(contents)
+
+    @staticmethod
+    async def acreate_by_list(url_list: list[SearchedRaceURL],
+                              client: NetkeibaClient | None = None) -> list[SearchedRaceAPI]:
+        """ レース検索結果スクレイピングAPIを非同期に作成する
+
+        検索条件はIDで表せないため, 検索条件ごとに作成した SearchedRaceURL を指定する.
+
+        Args:
+            url_list (list[SearchedRaceURL]): netkeiba レース検索結果URL配列
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Returns:
+            list[SearchedRaceAPI]: レース検索結果スクレイピングAPI配列 (Webページの取得に失敗した検索条件は含まない)
+        """
+        # レース検索結果 NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents_list: list[NetkeibaContents] = await reqests.aget_by_list(list(url_list))
+        # レース検索結果スクレイピングAPIを作成して返却
+        return [SearchedRaceAPI(contents) for contents in contents_list]
+
+    @staticmethod
+    def iter_by_list(url_list: list[SearchedRaceURL], chunk_size: int = 100,
+                     client: NetkeibaClient | None = None) -> Iterator[SearchedRaceAPI]:
+        """ レース検索結果スクレイピングAPIを逐次作成する
+
+        Webページの取得が完了した順にレース検索結果スクレイピングAPIを返す.
+        取得中・取得済みで未返却の Webページは最大 chunk_size 件に制限される.
+        検索条件はIDで表せないため, 検索条件ごとに作成した SearchedRaceURL を指定する.
+
+        Args:
+            url_list (list[SearchedRaceURL]): netkeiba レース検索結果URL配列
+            chunk_size (int): 同時に保持する Webページの最大数
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Yields:
+            SearchedRaceAPI: レース検索結果スクレイピングAPI (Webページの取得に失敗した検索条件は含まない)
+        """
+        # レース検索結果 NetkeibaContents を取得した順にレース検索結果スクレイピングAPIを作成して返却
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        for result in reqests.iter_results_by_list(list(url_list), chunk_size):
+            if result.contents is not None:
+                yield SearchedRaceAPI(result.contents)
+
+    @staticmethod
+    async def aiter_by_list(url_list: list[SearchedRaceURL], chunk_size: int = 100,
+                            client: NetkeibaClient | None = None) -> AsyncIterator[SearchedRaceAPI]:
+        """ レース検索結果スクレイピングAPIを非同期に逐次作成する
+
+        Webページの取得が完了した順にレース検索結果スクレイピングAPIを返す.
+        取得中・取得済みで未返却の Webページは最大 chunk_size 件に制限される.
+        検索条件はIDで表せないため, 検索条件ごとに作成した SearchedRaceURL を指定する.
+
+        Args:
+            url_list (list[SearchedRaceURL]): netkeiba レース検索結果URL配列
+            chunk_size (int): 同時に保持する Webページの最大数
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Yields:
+            SearchedRaceAPI: レース検索結果スクレイピングAPI (Webページの取得に失敗した検索条件は含まない)
+        """
+        # レース検索結果 NetkeibaContents を取得した順にレース検索結果スクレイピングAPIを作成して返却
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        async for result in reqests.aiter_results_by_list(list(url_list), chunk_size):
+            if result.contents is not None:
+                yield SearchedRaceAPI(result.contents)
+
     # Public API Functions ----------------------------------------------------
     def get_num_race(self) -> int:
         """ 検索該当レース数を取得する
@@ -87,8 +216,7 @@ class SearchedRaceAPI():
         Returns:
             date: レース開催日
         """
-        td_list: list[Tag] = self.__race_table[index].find_all('td')
-        date_str: str = td_list[0].a.contents[0]
+        date_str: str = self.__extract(index, 'race_date')
         return datetime.strptime(date_str, '%Y/%m/%d').date()
 
     def scrape_race_name(self, index: int) -> str:
@@ -100,8 +228,7 @@ class SearchedRaceAPI():
         Returns:
             str: レース名
         """
-        td_list: list[Tag] = self.__race_table[index].find_all('td')
-        race_name: str = str(td_list[4].a.contents[0])
+        race_name: str = self.__extract(index, 'race_name')
         return self.__helper.arrange_string(race_name)
 
     def scrape_race_id(self, index: int) -> int:
@@ -113,8 +240,7 @@ class SearchedRaceAPI():
         Returns:
             int: netkeiba レースID
         """
-        td_list: list[Tag] = self.__race_table[index].find_all('td')
-        url: str = str(td_list[4].a.attrs['href'])
+        url: str = self.__extract(index, 'race_id')
         return self.__helper.get_id_from_url(url)
 
     def scrape_num_race_horse(self, index: int) -> int:
@@ -126,17 +252,80 @@ class SearchedRaceAPI():
         Returns:
             int: レース出走頭数
         """
-        td_list: list[Tag] = self.__race_table[index].find_all('td')
-        return int(td_list[7].contents[0])
+        return int(self.__extract(index, 'num_race_horse'))
+
+    def to_records(self, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """ レース検索結果の各行を辞書に変換する
+
+        各行の要素は1回だけ走査し, 指定した項目のみを scrape_<項目名> と同じ値で取得する.
+
+        Args:
+            fields (list[str] | None): 取得する項目 (RECORD_FIELDS の項目名. 省略時は全ての項目)
+
+        Returns:
+            list[dict[str, Any]]: 行ごとの {項目名: 値} 配列
+        """
+        field_list: list[str] = list(SearchedRaceAPI.RECORD_FIELDS) if fields is None else fields
+        for field in field_list:
+            if field not in SearchedRaceAPI.RECORD_FIELDS:
+                self.__logger.error(f'{SearchedRaceAPI.__ERR_MESSAGE_0503} {field}')
+                sys.exit()
+        getter_list: list[tuple[str, Callable[[int], Any]]] = [
+            (field, getattr(self, f'scrape_{field}')) for field in field_list
+        ]
+        return [
+            {field: getter(index) for field, getter in getter_list} for index in range(len(self.__rows))
+        ]
+
+    def snapshot(self, release: bool = True) -> NetkeibaSnapshot:
+        """ レース検索結果の全ての項目を1回だけ取得し, 解析結果から切り離したスナップショットを作成する
+
+        スナップショットは HEADER_FIELDS, RECORD_FIELDS の項目を保持し, このAPIと同じ getter (scrape_<項目名>, get_num_race) で値を取得する.
+        取得時に例外が発生した項目は, スナップショットの getter でも同じ例外を送出する.
+
+        Args:
+            release (bool): True の場合, 解析結果・表の行・NetkeibaContents への参照を解放する (以降は, このAPIではなくスナップショットを使用する)
+
+        Returns:
+            NetkeibaSnapshot: netkeiba スナップショット
+        """
+        snapshot: NetkeibaSnapshot = NetkeibaSnapshot.create(
+            self, SearchedRaceAPI.HEADER_FIELDS, SearchedRaceAPI.RECORD_FIELDS, len(self.__race_table), 'get_num_race')
+        if release:
+            self.__release()
+        return snapshot
 
     # Private Functions for Scrape Race Table ------------------------------
-    def __scrape_race_table(self) -> list[Tag]:
+    def __release(self) -> None:
+        """ 解析結果と表の行を解放し, NetkeibaContents (バイト列) への参照を切る (他のAPIと共有していなければ soup を decompose する)
+        """
+        self.__race_table = []
+        self.__rows = []
+        if self.__contents is not None:
+            self.__contents.detach()
+        self.__contents = None
+
+    def __get_row(self, index: int) -> NetkeibaTableRow:
+        """ レース検索結果の行を取得する (初回のみ行の要素を走査する)
+        """
+        row: NetkeibaTableRow | None = self.__rows[index]
+        if row is None:
+            row = self.__extractor.create_row(self.__race_table[index])
+            self.__rows[index] = row
+        return row
+
+    def __extract(self, index: int, key: str) -> str:
+        """ レース表の行から SELECTORS[key] の値を取り出す
+        """
+        return self.__extractor.extract(self.__get_row(index), SearchedRaceAPI.SELECTORS[key])
+
+    def __scrape_race_table(self) -> list[Any]:
         """ レース表をスクレイピングする
         """
-        table: Tag = self.__soup.find('table', class_='race_table_01')
+        table_row_list: list[Any] | None = self.__extractor.find_rows(
+            self.__extractor.parse(self.__contents), SearchedRaceAPI.TABLE_SELECTOR)
         # 検索該当レースがない場合
-        if table is None:
+        if table_row_list is None:
             self.__logger.error(SearchedRaceAPI.__ERR_MESSAGE_0502)
             sys.exit()
-        table_row_list: list[Tag] = table.findAll('tr')
-        return table_row_list[1:]
+        return table_row_list
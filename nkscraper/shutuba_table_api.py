@@ -7,28 +7,82 @@ from __future__ import annotations
 # nkscraper
 from nkscraper.utils import NKScraperException, NKScraperLogger, NKScraperHelper
 from nkscraper.common import NetkeibaCategory, NetkeibaContents, NetkeibaRequests
+from nkscraper.common import NetkeibaSelector, NetkeibaTableSelector, NetkeibaSnapshot, NetkeibaRaceHeader
 from nkscraper.url import ShutubaTableURL
 
 # build-in
-from datetime import datetime
-import re
 import sys
 
 # for type declaration only
+from nkscraper.common import NetkeibaClient, NetkeibaExtractor, NetkeibaTableRow
+from nkscraper.common import NetkeibaPackedArchive, NetkeibaArchiveEntry
 from nkscraper.common import NetkeibaFieldID
 from nkscraper.url import NetkeibaURL
 from logging import Logger
+from typing import Any, AsyncIterator, Callable, Iterator
 from bs4 import BeautifulSoup
-from bs4.element import Tag
-from datetime import date
+from datetime import date, time
 
 
 class ShutubaTableAPI():
     """ 出馬表スクレイピングAPIクラス
     """
 
+    # NOTE: to_records で取得できる項目 (scrape_<項目名> の項目名)
+    RECORD_FIELDS: tuple[str, ...] = (
+        'wakuban',
+        'umaban',
+        'horse_name',
+        'horse_id',
+        'sex_age',
+        'jockey_weight',
+        'jockey_name',
+        'jockey_id',
+        'area',
+        'trainer_name',
+        'trainer_id',
+        'horse_weight',
+        'horse_weight_fluctuation',
+    )
+
+    # NOTE: snapshot で取得するWebページ全体の項目 (引数のない scrape_<項目名> の項目名)
+    HEADER_FIELDS: tuple[str, ...] = (
+        'race_name',
+        'race_id',
+        'race_date',
+        'course_type',
+        'distance',
+        'field_name',
+        'field_id',
+        'start_time',
+        'weather',
+        'track_condition',
+    )
+
+    # NOTE: 出馬表 (行) から値を取り出すセレクター
+    TABLE_SELECTOR: NetkeibaTableSelector = NetkeibaTableSelector('class', 'Shutuba_Table', row_class='HorseList')
+    SELECTORS: dict[str, NetkeibaSelector] = {
+        'wakuban': NetkeibaSelector(pattern='Waku', path=('span',)),
+        'umaban': NetkeibaSelector(pattern='Umaban'),
+        'horse_name': NetkeibaSelector('span', 'HorseName', path=('a',)),
+        'horse_id': NetkeibaSelector('span', 'HorseName', path=('a',), attr='href'),
+        'sex_age': NetkeibaSelector(class_name='Barei'),
+        'age': NetkeibaSelector('span', 'Age'),
+        'jockey_weight': NetkeibaSelector(cell=5),
+        'jockey_name': NetkeibaSelector(class_name='Jockey', path=('a',)),
+        'jockey_id': NetkeibaSelector(class_name='Jockey', path=('a',), attr='href'),
+        'area': NetkeibaSelector(class_name='Trainer', path=('span',)),
+        'trainer_name': NetkeibaSelector(class_name='Trainer', path=('a',)),
+        'trainer_id': NetkeibaSelector(class_name='Trainer', path=('a',), attr='href'),
+        'horse_weight': NetkeibaSelector(class_name='Weight'),
+        'horse_weight_fluctuation': NetkeibaSelector(class_name='Weight', path=('small',)),
+    }
+
     __ERR_MESSAGE_0001: str = 'NetkeibaContentsが出馬表ではありません.'
     __ERR_MESSAGE_0002: str = '出馬表を取得できませんでした.'
+    __ERR_MESSAGE_0003: str = '出馬表から取得できない項目が指定されました.'
+    __ERR_MESSAGE_0004: str = 'snapshot で解析結果を解放済みです. スナップショットを使用してください.'
+    __ERR_MESSAGE_0005: str = 'アーカイブに存在しません.'
     __WARN_MESSAGE_0001: str = '枠番を取得できませんでした. 出馬表が確定していない可能性があります.'
     __WARN_MESSAGE_0002: str = '馬番を取得できませんでした. 出馬表が確定していない可能性があります.'
     __WARN_MESSAGE_0003: str = '騎手を取得できませんでした. 出馬表が確定していない可能性があります.'
@@ -50,42 +104,180 @@ class ShutubaTableAPI():
             self.__logger.error(ShutubaTableAPI.__ERR_MESSAGE_0001)
             sys.exit()
 
-        self.__soup: BeautifulSoup = contents.soup
+        self.__contents: NetkeibaContents | None = contents
+        contents.attach()
+        self.__extractor: NetkeibaExtractor = contents.extractor
         self.__race_id: int = self.__helper.get_id_from_url(contents.url)
-        self.__table: list[Tag] = self.__scrape_shutuba_table()
+        self.__header: NetkeibaRaceHeader | None = None
+        self.__table: list[Any] = self.__scrape_shutuba_table()
+        self.__rows: list[NetkeibaTableRow | None] = [None] * len(self.__table)
         self.__num_horse: int = len(self.__table)
 
     @staticmethod
-    def create(race_id: int) -> ShutubaTableAPI:
+    def create(race_id: int, client: NetkeibaClient | None = None) -> ShutubaTableAPI:
         """ 出馬表スクレイピングAPIを作成する
 
         Args:
             race_id (int): netkeiba レースID
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
 
         Returns:
             ShutubaTableAPI: 出馬表スクレイピングAPI
+
+        Raises:
+            NKScraperException: Webページの取得に失敗した場合, または, 取得対象の内容が掲載されていない場合
         """
-        return ShutubaTableAPI.create_by_list([race_id])[0]
+        # 出馬表 NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents: NetkeibaContents = reqests.get(ShutubaTableURL(race_id))
+        # 出馬表スクレイピングAPIを作成して返却
+        return ShutubaTableAPI(contents)
 
     @staticmethod
-    def create_by_list(race_id_list: list[int]) -> list[ShutubaTableAPI]:
+    def create_by_list(race_id_list: list[int],
+                       client: NetkeibaClient | None = None) -> list[ShutubaTableAPI]:
         """ 出馬表スクレイピングAPIを作成する
 
         Args:
             race_id_list (list[int]): netkeiba レースID配列
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
 
         Returns:
-            list[ShutubaTableAPI]: 出馬表スクレイピングAPI配列
+            list[ShutubaTableAPI]: 出馬表スクレイピングAPI配列 (Webページの取得に失敗したレースは含まない)
         """
         # ShutubaTableURLの作成
         url_list: list[NetkeibaURL] = [
             ShutubaTableURL(race_id) for race_id in race_id_list]
         # 出馬表 NetkeibaContents の作成
-        reqests: NetkeibaRequests = NetkeibaRequests()
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
         contents_list: list[NetkeibaContents] = reqests.get_by_list(url_list)
         # 出馬表スクレイピングAPIを作成して返却
         return [ShutubaTableAPI(contents) for contents in contents_list]
 
+    @staticmethod
+    async def acreate(race_id: int, client: NetkeibaClient | None = None) -> ShutubaTableAPI:
+        """ 出馬表スクレイピングAPIを非同期に作成する
+
+        Args:
+            race_id (int): netkeiba レースID
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Returns:
+            ShutubaTableAPI: 出馬表スクレイピングAPI
+
+        Raises:
+            NKScraperException: Webページの取得に失敗した場合, または, 取得対象の内容が掲載されていない場合
+        """
+        # 出馬表 NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents: NetkeibaContents = await reqests.aget(ShutubaTableURL(race_id))
+        # 出馬表スクレイピングAPIを作成して返却
+        return ShutubaTableAPI(contents)
+
+    @staticmethod
+    async def acreate_by_list(race_id_list: list[int],
+                              client: NetkeibaClient | None = None) -> list[ShutubaTableAPI]:
+        """ 出馬表スクレイピングAPIを非同期に作成する
+
+        Args:
+            race_id_list (list[int]): netkeiba レースID配列
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Returns:
+            list[ShutubaTableAPI]: 出馬表スクレイピングAPI配列 (Webページの取得に失敗したレースは含まない)
+        """
+        # ShutubaTableURLの作成
+        url_list: list[NetkeibaURL] = [ShutubaTableURL(race_id) for race_id in race_id_list]
+        # 出馬表 NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents_list: list[NetkeibaContents] = await reqests.aget_by_list(url_list)
+        # 出馬表スクレイピングAPIを作成して返却
+        return [ShutubaTableAPI(contents) for contents in contents_list]
+
+    @staticmethod
+    def iter_by_list(race_id_list: list[int], chunk_size: int = 100,
+                     client: NetkeibaClient | None = None) -> Iterator[ShutubaTableAPI]:
+        """ 出馬表スクレイピングAPIを逐次作成する
+
+        Webページの取得が完了した順に出馬表スクレイピングAPIを返す.
+        取得中・取得済みで未返却の Webページは最大 chunk_size 件に制限される.
+
+        Args:
+            race_id_list (list[int]): netkeiba レースID配列
+            chunk_size (int): 同時に保持する Webページの最大数
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Yields:
+            ShutubaTableAPI: 出馬表スクレイピングAPI (Webページの取得に失敗したレースは含まない)
+        """
+        # ShutubaTableURLの作成
+        url_list: list[NetkeibaURL] = [ShutubaTableURL(race_id) for race_id in race_id_list]
+        # 出馬表 NetkeibaContents を取得した順に出馬表スクレイピングAPIを作成して返却
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        for result in reqests.iter_results_by_list(url_list, chunk_size):
+            if result.contents is not None:
+                yield ShutubaTableAPI(result.contents)
+
+    @staticmethod
+    async def aiter_by_list(race_id_list: list[int], chunk_size: int = 100,
+                            client: NetkeibaClient | None = None) -> AsyncIterator[ShutubaTableAPI]:
+        """ 出馬表スクレイピングAPIを非同期に逐次作成する
+
+        Webページの取得が完了した順に出馬表スクレイピングAPIを返す.
+        取得中・取得済みで未返却の Webページは最大 chunk_size 件に制限される.
+
+        Args:
+            race_id_list (list[int]): netkeiba レースID配列
+            chunk_size (int): 同時に保持する Webページの最大数
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Yields:
+            ShutubaTableAPI: 出馬表スクレイピングAPI (Webページの取得に失敗したレースは含まない)
+        """
+        # ShutubaTableURLの作成
+        url_list: list[NetkeibaURL] = [ShutubaTableURL(race_id) for race_id in race_id_list]
+        # 出馬表 NetkeibaContents を取得した順に出馬表スクレイピングAPIを作成して返却
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        async for result in reqests.aiter_results_by_list(url_list, chunk_size):
+            if result.contents is not None:
+                yield ShutubaTableAPI(result.contents)
+
+    @staticmethod
+    def create_by_archive(race_id: int, archive: NetkeibaPackedArchive, partial: bool = False) -> ShutubaTableAPI:
+        """ 圧縮Webページアーカイブから出馬表スクレイピングAPIを作成する (通信しない)
+
+        Args:
+            race_id (int): netkeiba レースID
+            archive (NetkeibaPackedArchive): 圧縮Webページアーカイブ
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+
+        Returns:
+            ShutubaTableAPI: 出馬表スクレイピングAPI
+
+        Raises:
+            NKScraperException: アーカイブに存在しない場合
+        """
+        entry: NetkeibaArchiveEntry | None = archive.get_entry(NetkeibaCategory.SHUTUBA_TABLE, race_id)
+        if entry is None:
+            raise NKScraperException(f'{ShutubaTableAPI.__ERR_MESSAGE_0005} {race_id}')
+        return ShutubaTableAPI(entry.create_contents(partial))
+
+    @staticmethod
+    def iter_by_archive(archive: NetkeibaPackedArchive, partial: bool = False) -> Iterator[ShutubaTableAPI]:
+        """ 圧縮Webページアーカイブに保存した全ての出馬表から出馬表スクレイピングAPIを逐次作成する (通信しない)
+
+        アーカイブのデータファイルを先頭から順に読み込む.
+
+        Args:
+            archive (NetkeibaPackedArchive): 圧縮Webページアーカイブ
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+
+        Yields:
+            ShutubaTableAPI: 出馬表スクレイピングAPI
+        """
+        for entry in archive.iter_entries(NetkeibaCategory.SHUTUBA_TABLE):
+            yield ShutubaTableAPI(entry.create_contents(partial))
+
     # Public API Functions ----------------------------------------------------
     def scrape_race_name(self) -> str:
         """ レース名をスクレイピングする
@@ -93,9 +285,7 @@ class ShutubaTableAPI():
         Returns:
             str: レース名
         """
-        div_race_name: Tag = self.__soup.find('div', class_='RaceName')
-        race_name: str = str(div_race_name.contents[0])
-        return self.__helper.arrange_string(race_name)
+        return self.__race_header.race_name
 
     def scrape_race_id(self) -> int:
         """ レースIDをスクレイピングする.
@@ -111,9 +301,7 @@ class ShutubaTableAPI():
         Returns:
             date: レース開催日
         """
-        title: str = str(self.__soup.find('title').contents[0])
-        date_str: str = re.findall(r'\d{4}年\d{1,2}月\d{1,2}日', title)[0]
-        return datetime.strptime(date_str, '%Y年%m月%d日').date()
+        return self.__race_header.race_date
 
     def scrape_course_type(self) -> str:
         """ コース種別をスクレイピングする
@@ -121,11 +309,7 @@ class ShutubaTableAPI():
         Returns:
             str: コース種別 (芝 or ダ)
         """
-        div_race_data01: Tag = self.__soup.find('div', class_='RaceData01')
-        course_type_distance_span: Tag = div_race_data01.find('span')
-        course_type_distance: str = self.__helper.arrange_string(
-            str(course_type_distance_span.contents[0]))
-        return course_type_distance[0]
+        return self.__race_header.course_type
 
     def scrape_distance(self) -> int:
         """ レース距離をスクレイピングする
@@ -133,11 +317,7 @@ class ShutubaTableAPI():
         Returns:
             int: レース距離
         """
-        div_race_data01: Tag = self.__soup.find('div', class_='RaceData01')
-        course_type_distance_span: Tag = div_race_data01.find('span')
-        course_type_distance: str = self.__helper.arrange_string(
-            str(course_type_distance_span.contents[0]))
-        return int(course_type_distance[1:-1])
+        return self.__race_header.distance
 
     def scrape_field_name(self) -> str:
         """ 競馬場名をスクレイピングする
@@ -145,10 +325,7 @@ class ShutubaTableAPI():
         Returns:
             str: 競馬場名
         """
-        div_race_data02: Tag = self.__soup.find('div', class_='RaceData02')
-        field_name_span: Tag = div_race_data02.findAll('span')[1]
-        field_name: str = field_name_span.contents[0]
-        return self.__helper.arrange_string(field_name)
+        return self.__race_header.field_name
 
     def scrape_field_id(self) -> NetkeibaFieldID:
         """ NetkeibaFieldID をスクレイピングする.
@@ -159,6 +336,30 @@ class ShutubaTableAPI():
         field_name: str = self.scrape_field_name()
         return self.__helper.convert_field_name_to_id(field_name)
 
+    def scrape_start_time(self) -> time | None:
+        """ 発走時刻をスクレイピングする
+
+        Returns:
+            time | None: 発走時刻 (掲載されていない場合はNone)
+        """
+        return self.__race_header.start_time
+
+    def scrape_weather(self) -> str | None:
+        """ 天候をスクレイピングする
+
+        Returns:
+            str | None: 天候 (晴, 曇 など) (掲載されていない場合はNone)
+        """
+        return self.__race_header.weather
+
+    def scrape_track_condition(self) -> str | None:
+        """ 馬場状態をスクレイピングする
+
+        Returns:
+            str | None: 馬場状態 (良, 稍重, 重, 不良) (掲載されていない場合はNone)
+        """
+        return self.__race_header.track_condition
+
     def get_num_horse(self) -> int:
         """ レース出走頭数を取得する
         """
@@ -173,11 +374,8 @@ class ShutubaTableAPI():
         Returns:
             int | None: 枠番 (枠番が確定していない場合はNoneを返す)
         """
-        td_waku: Tag = self.__table[index].find(
-            'td', class_=re.compile('Waku'))
-        span_waku: Tag = td_waku.contents[0]
         try:
-            return int(span_waku.contents[0])
+            return int(self.__extract(index, 'wakuban'))
 
         # 枠番が確定されていない場合
         except IndexError:
@@ -195,10 +393,8 @@ class ShutubaTableAPI():
         Returns:
             int | None: 馬番 (馬番が確定していない場合はNoneを返す)
         """
-        td_umaban: Tag = self.__table[index].find(
-            'td', class_=re.compile('Umaban'))
         try:
-            return int(td_umaban.contents[0])
+            return int(self.__extract(index, 'umaban'))
 
         # 馬番が確定されていない場合
         except IndexError:
@@ -216,9 +412,7 @@ class ShutubaTableAPI():
         Returns:
             str: 馬名
         """
-        span_horse_name: Tag = self.__table[index].find(
-            'span', class_='HorseName')
-        horse_name: str = span_horse_name.a.contents[0]
+        horse_name: str = self.__extract(index, 'horse_name')
         return self.__helper.arrange_string(horse_name)
 
     def scrape_horse_id(self, index: int) -> int:
@@ -230,9 +424,7 @@ class ShutubaTableAPI():
         Returns:
             int: netkeiba 馬ID
         """
-        span_horse_name: Tag = self.__table[index].find(
-            'span', class_='HorseName')
-        horse_url: str = span_horse_name.a.attrs['href']
+        horse_url: str = self.__extract(index, 'horse_id')
         return self.__helper.get_id_from_url(horse_url)
 
     def scrape_sex_age(self, index: int) -> str:
@@ -245,14 +437,12 @@ class ShutubaTableAPI():
             str: 馬性齢
         """
         try:
-            td_barei: Tag = self.__table[index].find('td', class_='Barei')
-            sex_age: str = str(td_barei.contents[0])
+            sex_age: str = self.__extract(index, 'sex_age')
 
         # 出走取り消し馬の場合
         except AttributeError:
             try:
-                span_age: Tag = self.__table[index].find('span', class_='Age')
-                sex_age = str(span_age.contents[0])
+                sex_age = self.__extract(index, 'age')
             except Exception as e:
                 raise NKScraperException(e)
 
@@ -270,8 +460,7 @@ class ShutubaTableAPI():
         Returns:
             float: 斤量
         """
-        td_jockey_weight: Tag = self.__table[index].findAll('td')[5]
-        return float(td_jockey_weight.contents[0])
+        return float(self.__extract(index, 'jockey_weight'))
 
     def scrape_jockey_name(self, index: int) -> str | None:
         """ 騎手名をスクレイピングする
@@ -282,9 +471,8 @@ class ShutubaTableAPI():
         Returns:
             str | None: 騎手名 (騎手が確定していない場合はNoneを返す)
         """
-        td_jockey: Tag = self.__table[index].find('td', class_='Jockey')
         try:
-            jockey_name: str = td_jockey.a.contents[0]
+            jockey_name: str = self.__extract(index, 'jockey_name')
             return self.__helper.arrange_string(jockey_name)
 
         # 騎手が確定していない場合
@@ -303,9 +491,8 @@ class ShutubaTableAPI():
         Returns:
             int | None: netkeiba 騎手ID (騎手が確定していない場合はNoneを返す)
         """
-        td_jockey: Tag = self.__table[index].find('td', class_='Jockey')
         try:
-            jockey_url: str = td_jockey.a.attrs['href']
+            jockey_url: str = self.__extract(index, 'jockey_id')
             return self.__helper.get_id_from_url(jockey_url)
 
         # 騎手が確定していない場合
@@ -324,9 +511,7 @@ class ShutubaTableAPI():
         Returns:
             str: 所属 (栗東・美浦など)
         """
-        td_trainer: Tag = self.__table[index].find('td', class_='Trainer')
-        span_area: Tag = td_trainer.find('span')
-        area: str = span_area.contents[0]
+        area: str = self.__extract(index, 'area')
         return self.__helper.arrange_string(area)
 
     def scrape_trainer_name(self, index: int) -> str:
@@ -338,8 +523,7 @@ class ShutubaTableAPI():
         Returns:
             str: 調教師名
         """
-        td_trainer: Tag = self.__table[index].find('td', class_='Trainer')
-        trainer_name: str = str(td_trainer.a.contents[0])
+        trainer_name: str = self.__extract(index, 'trainer_name')
         return self.__helper.arrange_string(trainer_name)
 
     def scrape_trainer_id(self, index: int) -> int:
@@ -351,8 +535,7 @@ class ShutubaTableAPI():
         Returns:
             int: netkeiba 調教師ID
         """
-        td_trainer: Tag = self.__table[index].find('td', class_='Trainer')
-        trainer_url: str = str(td_trainer.a.attrs['href'])
+        trainer_url: str = self.__extract(index, 'trainer_id')
         return self.__helper.get_id_from_url(trainer_url)
 
     def scrape_horse_weight(self, index: int) -> int | None:
@@ -364,9 +547,8 @@ class ShutubaTableAPI():
         Returns:
             int | None: 馬体重 (馬体重が確定していない場合はNoneを返す)
         """
-        td_weight: Tag = self.__table[index].find('td', class_='Weight')
         try:
-            horse_weight: str = str(td_weight.contents[0])
+            horse_weight: str = self.__extract(index, 'horse_weight')
             return int(self.__helper.arrange_string(horse_weight))
 
         # 馬体重が確定していない場合
@@ -389,9 +571,8 @@ class ShutubaTableAPI():
         Returns:
             int | None: 馬体重増減 (馬体重が確定していない場合はNoneを返す)
         """
-        td_weight: Tag = self.__table[index].find('td', class_='Weight')
         try:
-            horse_weight_fluctuation: str = str(td_weight.small.contents[0])
+            horse_weight_fluctuation: str = self.__extract(index, 'horse_weight_fluctuation')
             return int(horse_weight_fluctuation[1:-1])
 
         # 馬体重が未確定・出走取消馬の場合
@@ -401,14 +582,97 @@ class ShutubaTableAPI():
         except Exception as e:
             raise NKScraperException(e)
 
+    def to_records(self, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """ 出馬表の各行を辞書に変換する
+
+        各行の要素は1回だけ走査し, 指定した項目のみを scrape_<項目名> と同じ値で取得する.
+
+        Args:
+            fields (list[str] | None): 取得する項目 (RECORD_FIELDS の項目名. 省略時は全ての項目)
+
+        Returns:
+            list[dict[str, Any]]: 行ごとの {項目名: 値} 配列
+        """
+        field_list: list[str] = list(ShutubaTableAPI.RECORD_FIELDS) if fields is None else fields
+        for field in field_list:
+            if field not in ShutubaTableAPI.RECORD_FIELDS:
+                self.__logger.error(f'{ShutubaTableAPI.__ERR_MESSAGE_0003} {field}')
+                sys.exit()
+        getter_list: list[tuple[str, Callable[[int], Any]]] = [
+            (field, getattr(self, f'scrape_{field}')) for field in field_list
+        ]
+        return [
+            {field: getter(index) for field, getter in getter_list} for index in range(len(self.__rows))
+        ]
+
+    def snapshot(self, release: bool = True) -> NetkeibaSnapshot:
+        """ 出馬表の全ての項目を1回だけ取得し, 解析結果から切り離したスナップショットを作成する
+
+        スナップショットは HEADER_FIELDS, RECORD_FIELDS の項目を保持し, このAPIと同じ getter (scrape_<項目名>, get_num_horse) で値を取得する.
+        取得時に例外が発生した項目は, スナップショットの getter でも同じ例外を送出する.
+
+        Args:
+            release (bool): True の場合, 解析結果・表の行・NetkeibaContents への参照を解放する (以降は, このAPIではなくスナップショットを使用する)
+
+        Returns:
+            NetkeibaSnapshot: netkeiba スナップショット
+        """
+        snapshot: NetkeibaSnapshot = NetkeibaSnapshot.create(
+            self, ShutubaTableAPI.HEADER_FIELDS, ShutubaTableAPI.RECORD_FIELDS, self.__num_horse, 'get_num_horse')
+        if release:
+            self.__release()
+        return snapshot
+
     # Private Functions for Scrape ShutubaTable ------------------------------
-    def __scrape_shutuba_table(self) -> list[Tag]:
+    def __release(self) -> None:
+        """ 解析結果と表の行を解放し, NetkeibaContents (バイト列) への参照を切る (他のAPIと共有していなければ soup を decompose する)
+        """
+        self.__table = []
+        self.__rows = []
+        self.__num_horse = 0
+        if self.__contents is not None:
+            self.__contents.detach()
+        self.__contents = None
+        self.__header = None
+
+    @property
+    def __soup(self) -> BeautifulSoup:
+        """ BeautifulSoupオブジェクト (出馬表以外の要素をスクレイピングする時点で解析する)
+        """
+        if self.__contents is None:
+            self.__logger.error(ShutubaTableAPI.__ERR_MESSAGE_0004)
+            sys.exit()
+        return self.__contents.soup
+
+    @property
+    def __race_header(self) -> NetkeibaRaceHeader:
+        """ レース情報ヘッダー (初回のみ title, RaceName, RaceData01, RaceData02 を解析する)
+        """
+        if self.__header is None:
+            self.__header = NetkeibaRaceHeader(self.__soup, self.__helper)
+        return self.__header
+
+    def __get_row(self, index: int) -> NetkeibaTableRow:
+        """ 出馬表の行を取得する (初回のみ行の要素を走査する)
+        """
+        row: NetkeibaTableRow | None = self.__rows[index]
+        if row is None:
+            row = self.__extractor.create_row(self.__table[index])
+            self.__rows[index] = row
+        return row
+
+    def __extract(self, index: int, key: str) -> str:
+        """ 出馬表の行から SELECTORS[key] の値を取り出す
+        """
+        return self.__extractor.extract(self.__get_row(index), ShutubaTableAPI.SELECTORS[key])
+
+    def __scrape_shutuba_table(self) -> list[Any]:
         """ 出馬表をスクレイピングする
         """
-        table: Tag = self.__soup.find('table', class_='Shutuba_Table')
-        table_row_list: list[Tag] = table.findAll('tr', class_='HorseList')
+        table_row_list: list[Any] | None = self.__extractor.find_rows(
+            self.__extractor.parse(self.__contents), ShutubaTableAPI.TABLE_SELECTOR)
         # 出馬表がない場合
-        if len(table_row_list) == 0:
+        if table_row_list is None or len(table_row_list) == 0:
             self.__logger.error(ShutubaTableAPI.__ERR_MESSAGE_0002)
             sys.exit()
         return table_row_list
@@ -7,28 +7,65 @@ from __future__ import annotations
 # nkscraper
 from nkscraper.utils import NKScraperException, NKScraperLogger, NKScraperHelper
 from nkscraper.common import NetkeibaCategory, NetkeibaContents, NetkeibaRequests
+from nkscraper.common import NetkeibaSelector, NetkeibaTableSelector, NetkeibaSnapshot, NetkeibaRaceHeader
 from nkscraper.url import TrainingEvaluationURL
 
 # build-in
-from datetime import datetime
-import re
 import sys
 
 # for type declaration only
+from nkscraper.common import NetkeibaClient, NetkeibaExtractor, NetkeibaTableRow
+from nkscraper.common import NetkeibaPackedArchive, NetkeibaArchiveEntry
 from nkscraper.common import NetkeibaFieldID
 from nkscraper.url import NetkeibaURL
 from logging import Logger
+from typing import Any, AsyncIterator, Callable, Iterator
 from bs4 import BeautifulSoup
-from bs4.element import Tag
-from datetime import date
+from datetime import date, time
 
 
 class TrainingEvaluationAPI():
     """ 調教評価スクレイピングAPIクラス
     """
 
+    # NOTE: to_records で取得できる項目 (scrape_<項目名> の項目名)
+    RECORD_FIELDS: tuple[str, ...] = (
+        'wakuban',
+        'umaban',
+        'horse_name',
+        'horse_id',
+        'training_evaluation',
+    )
+
+    # NOTE: snapshot で取得するWebページ全体の項目 (引数のない scrape_<項目名> の項目名)
+    HEADER_FIELDS: tuple[str, ...] = (
+        'race_name',
+        'race_id',
+        'race_date',
+        'course_type',
+        'race_distance',
+        'field_name',
+        'field_id',
+        'start_time',
+        'weather',
+        'track_condition',
+    )
+
+    # NOTE: 調教評価表 (行) から値を取り出すセレクター
+    TABLE_SELECTOR: NetkeibaTableSelector = NetkeibaTableSelector('class', 'OikiriTable', row_class='HorseList')
+    SELECTORS: dict[str, NetkeibaSelector] = {
+        'wakuban': NetkeibaSelector(pattern='Waku', path=('span',)),
+        'umaban': NetkeibaSelector(class_name='Umaban'),
+        'horse_name': NetkeibaSelector('div', class_name='Horse_Name', path=('a',)),
+        'horse_id': NetkeibaSelector('div', class_name='Horse_Name', path=('a',), attr='href'),
+        'training_evaluation': NetkeibaSelector(cell=5),
+    }
+
     __ERR_MESSAGE_0401: str = 'NetkeibaContentsが調教評価ではありません.'
     __ERR_MESSAGE_0402: str = '調教評価表を取得できませんでした.'
+    __ERR_MESSAGE_0403: str = '調教評価表から取得できない項目が指定されました.'
+    __ERR_MESSAGE_0404: str = 'snapshot で解析結果を解放済みです. スナップショットを使用してください.'
+    __ERR_MESSAGE_0405: str = 'アーカイブに存在しません.'
     __WARN_MESSAGE_0401: str = '枠番を取得できませんでした. 出馬表が確定していない可能性があります.'
     __WARN_MESSAGE_0402: str = '馬番を取得できませんでした. 出馬表が確定していない可能性があります.'
     __WARN_MESSAGE_0403: str = '調教評価を取得できませんでした. 調教評価に記載がない可能性があります.'
@@ -46,42 +83,180 @@ class TrainingEvaluationAPI():
             self.__logger.error(TrainingEvaluationAPI.__ERR_MESSAGE_0401)
             sys.exit()
 
-        self.__soup: BeautifulSoup = contents.soup
+        self.__contents: NetkeibaContents | None = contents
+        contents.attach()
+        self.__extractor: NetkeibaExtractor = contents.extractor
         self.__race_id: int = self.__helper.get_id_from_url(contents.url)
-        self.__table: list[Tag] = self.__scrape_training_evaluation_table()
+        self.__header: NetkeibaRaceHeader | None = None
+        self.__table: list[Any] = self.__scrape_training_evaluation_table()
+        self.__rows: list[NetkeibaTableRow | None] = [None] * len(self.__table)
         self.__num_horse: int = len(self.__table)
 
     @staticmethod
-    def create(race_id: int) -> TrainingEvaluationAPI:
+    def create(race_id: int, client: NetkeibaClient | None = None) -> TrainingEvaluationAPI:
         """ 調教評価スクレイピングAPIを作成する
 
         Args:
             race_id (int): netkeiba レースID
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
 
         Returns:
             TrainingEvaluationAPI: 調教評価スクレイピングAPI
+
+        Raises:
+            NKScraperException: Webページの取得に失敗した場合, または, 取得対象の内容が掲載されていない場合
         """
-        return TrainingEvaluationAPI.create_by_list([race_id])[0]
+        # 調教評価 NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents: NetkeibaContents = reqests.get(TrainingEvaluationURL(race_id))
+        # 調教評価スクレイピングAPIを作成して返却
+        return TrainingEvaluationAPI(contents)
 
     @staticmethod
-    def create_by_list(race_id_list: list[int]) -> list[TrainingEvaluationAPI]:
+    def create_by_list(race_id_list: list[int],
+                       client: NetkeibaClient | None = None) -> list[TrainingEvaluationAPI]:
         """ 調教評価スクレイピングAPIを作成する
 
         Args:
             race_id_list (list[int]): netkeiba レースID配列
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
 
         Returns:
-            list[TrainingEvaluationAPI]: 調教評価スクレイピングAPI配列
+            list[TrainingEvaluationAPI]: 調教評価スクレイピングAPI配列 (Webページの取得に失敗したレースは含まない)
         """
         # TrainingEvaluationURLの作成
         url_list: list[NetkeibaURL] = [
             TrainingEvaluationURL(race_id) for race_id in race_id_list]
         # 出馬表 NetkeibaContents の作成
-        reqests: NetkeibaRequests = NetkeibaRequests()
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
         contents_list: list[NetkeibaContents] = reqests.get_by_list(url_list)
         # 調教評価スクレイピングAPIを作成して返却
         return [TrainingEvaluationAPI(contents) for contents in contents_list]
 
+    @staticmethod
+    async def acreate(race_id: int, client: NetkeibaClient | None = None) -> TrainingEvaluationAPI:
+        """ 調教評価スクレイピングAPIを非同期に作成する
+
+        Args:
+            race_id (int): netkeiba レースID
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Returns:
+            TrainingEvaluationAPI: 調教評価スクレイピングAPI
+
+        Raises:
+            NKScraperException: Webページの取得に失敗した場合, または, 取得対象の内容が掲載されていない場合
+        """
+        # 調教評価 NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents: NetkeibaContents = await reqests.aget(TrainingEvaluationURL(race_id))
+        # 調教評価スクレイピングAPIを作成して返却
+        return TrainingEvaluationAPI(contents)
+
+    @staticmethod
+    async def acreate_by_list(race_id_list: list[int],
+                              client: NetkeibaClient | None = None) -> list[TrainingEvaluationAPI]:
+        """ 調教評価スクレイピングAPIを非同期に作成する
+
+        Args:
+            race_id_list (list[int]): netkeiba レースID配列
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Returns:
+            list[TrainingEvaluationAPI]: 調教評価スクレイピングAPI配列 (Webページの取得に失敗したレースは含まない)
+        """
+        # TrainingEvaluationURLの作成
+        url_list: list[NetkeibaURL] = [TrainingEvaluationURL(race_id) for race_id in race_id_list]
+        # 調教評価 NetkeibaContents の作成
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        contents_list: list[NetkeibaContents] = await reqests.aget_by_list(url_list)
+        # 調教評価スクレイピングAPIを作成して返却
+        return [TrainingEvaluationAPI(contents) for contents in contents_list]
+
+    @staticmethod
+    def iter_by_list(race_id_list: list[int], chunk_size: int = 100,
+                     client: NetkeibaClient | None = None) -> Iterator[TrainingEvaluationAPI]:
+        """ 調教評価スクレイピングAPIを逐次作成する
+
+        Webページの取得が完了した順に調教評価スクレイピングAPIを返す.
+        取得中・取得済みで未返却の Webページは最大 chunk_size 件に制限される.
+
+        Args:
+            race_id_list (list[int]): netkeiba レースID配列
+            chunk_size (int): 同時に保持する Webページの最大数
+            client (NetkeibaClient | None): netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Yields:
+            TrainingEvaluationAPI: 調教評価スクレイピングAPI (Webページの取得に失敗したレースは含まない)
+        """
+        # TrainingEvaluationURLの作成
+        url_list: list[NetkeibaURL] = [TrainingEvaluationURL(race_id) for race_id in race_id_list]
+        # 調教評価 NetkeibaContents を取得した順に調教評価スクレイピングAPIを作成して返却
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        for result in reqests.iter_results_by_list(url_list, chunk_size):
+            if result.contents is not None:
+                yield TrainingEvaluationAPI(result.contents)
+
+    @staticmethod
+    async def aiter_by_list(race_id_list: list[int], chunk_size: int = 100,
+                            client: NetkeibaClient | None = None) -> AsyncIterator[TrainingEvaluationAPI]:
+        """ 調教評価スクレイピングAPIを非同期に逐次作成する
+
+        Webページの取得が完了した順に調教評価スクレイピングAPIを返す.
+        取得中・取得済みで未返却の Webページは最大 chunk_size 件に制限される.
+
+        Args:
+            race_id_list (list[int]): netkeiba レースID配列
+            chunk_size (int): 同時に保持する Webページの最大数
+            client (NetkeibaClient | None): async with 文で開いた netkeiba HTTP クライアント (省略時は通信ごとにセッションを作成する)
+
+        Yields:
+            TrainingEvaluationAPI: 調教評価スクレイピングAPI (Webページの取得に失敗したレースは含まない)
+        """
+        # TrainingEvaluationURLの作成
+        url_list: list[NetkeibaURL] = [TrainingEvaluationURL(race_id) for race_id in race_id_list]
+        # 調教評価 NetkeibaContents を取得した順に調教評価スクレイピングAPIを作成して返却
+        reqests: NetkeibaRequests = NetkeibaRequests(client)
+        async for result in reqests.aiter_results_by_list(url_list, chunk_size):
+            if result.contents is not None:
+                yield TrainingEvaluationAPI(result.contents)
+
+    @staticmethod
+    def create_by_archive(race_id: int, archive: NetkeibaPackedArchive, partial: bool = False) -> TrainingEvaluationAPI:
+        """ 圧縮Webページアーカイブから調教評価スクレイピングAPIを作成する (通信しない)
+
+        Args:
+            race_id (int): netkeiba レースID
+            archive (NetkeibaPackedArchive): 圧縮Webページアーカイブ
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+
+        Returns:
+            TrainingEvaluationAPI: 調教評価スクレイピングAPI
+
+        Raises:
+            NKScraperException: アーカイブに存在しない場合
+        """
+        entry: NetkeibaArchiveEntry | None = archive.get_entry(NetkeibaCategory.TRAINING_EVALUATION, race_id)
+        if entry is None:
+            raise NKScraperException(f'{TrainingEvaluationAPI.__ERR_MESSAGE_0405} {race_id}')
+        return TrainingEvaluationAPI(entry.create_contents(partial))
+
+    @staticmethod
+    def iter_by_archive(archive: NetkeibaPackedArchive, partial: bool = False) -> Iterator[TrainingEvaluationAPI]:
+        """ 圧縮Webページアーカイブに保存した全ての調教評価から調教評価スクレイピングAPIを逐次作成する (通信しない)
+
+        アーカイブのデータファイルを先頭から順に読み込む.
+
+        Args:
+            archive (NetkeibaPackedArchive): 圧縮Webページアーカイブ
+            partial (bool): True の場合, 各APIが参照する要素のみを解析する
+
+        Yields:
+            TrainingEvaluationAPI: 調教評価スクレイピングAPI
+        """
+        for entry in archive.iter_entries(NetkeibaCategory.TRAINING_EVALUATION):
+            yield TrainingEvaluationAPI(entry.create_contents(partial))
+
     # Public API Functions ----------------------------------------------------
     def scrape_race_name(self) -> str:
         """ レース名をスクレイピングする
@@ -89,9 +264,7 @@ class TrainingEvaluationAPI():
         Returns:
             str: レース名
         """
-        div_race_name: Tag = self.__soup.find('div', class_='RaceName')
-        race_name: str = str(div_race_name.contents[0])
-        return self.__helper.arrange_string(race_name)
+        return self.__race_header.race_name
 
     def scrape_race_id(self) -> int:
         """ レースIDをスクレイピングする.
@@ -107,9 +280,7 @@ class TrainingEvaluationAPI():
         Returns:
             date: レース開催日
         """
-        title: str = str(self.__soup.find('title').contents[0])
-        date_str: str = re.findall(r'\d{4}年\d{1,2}月\d{1,2}日', title)[0]
-        return datetime.strptime(date_str, '%Y年%m月%d日').date()
+        return self.__race_header.race_date
 
     def scrape_course_type(self) -> str:
         """ コース種別をスクレイピングする
@@ -117,11 +288,7 @@ class TrainingEvaluationAPI():
         Returns:
             str: コース種別 (芝 or ダ)
         """
-        div_race_data01: Tag = self.__soup.find('div', class_='RaceData01')
-        course_type_distance_span: Tag = div_race_data01.find('span')
-        course_type_distance: str = self.__helper.arrange_string(
-            str(course_type_distance_span.contents[0]))
-        return course_type_distance[0]
+        return self.__race_header.course_type
 
     def scrape_race_distance(self) -> int:
         """ レース距離をスクレイピングする
@@ -129,11 +296,7 @@ class TrainingEvaluationAPI():
         Returns:
             int: レース距離
         """
-        div_race_data01: Tag = self.__soup.find('div', class_='RaceData01')
-        course_type_distance_span: Tag = div_race_data01.find('span')
-        course_type_distance: str = self.__helper.arrange_string(
-            str(course_type_distance_span.contents[0]))
-        return int(course_type_distance[1:-1])
+        return self.__race_header.distance
 
     def scrape_field_name(self) -> str:
         """ レース開催競馬場名をスクレイピングする
@@ -141,10 +304,7 @@ class TrainingEvaluationAPI():
         Returns:
             str: レース開催競馬場名
         """
-        div_race_data02: Tag = self.__soup.find('div', class_='RaceData02')
-        field_name_span: Tag = div_race_data02.findAll('span')[1]
-        field_name: str = field_name_span.contents[0]
-        return self.__helper.arrange_string(field_name)
+        return self.__race_header.field_name
 
     def scrape_field_id(self) -> NetkeibaFieldID:
         """ NetkeibaFieldID をスクレイピングする.
@@ -155,6 +315,30 @@ class TrainingEvaluationAPI():
         field_name: str = self.scrape_field_name()
         return self.__helper.convert_field_name_to_id(field_name)
 
+    def scrape_start_time(self) -> time | None:
+        """ 発走時刻をスクレイピングする
+
+        Returns:
+            time | None: 発走時刻 (掲載されていない場合はNone)
+        """
+        return self.__race_header.start_time
+
+    def scrape_weather(self) -> str | None:
+        """ 天候をスクレイピングする
+
+        Returns:
+            str | None: 天候 (晴, 曇 など) (掲載されていない場合はNone)
+        """
+        return self.__race_header.weather
+
+    def scrape_track_condition(self) -> str | None:
+        """ 馬場状態をスクレイピングする
+
+        Returns:
+            str | None: 馬場状態 (良, 稍重, 重, 不良) (掲載されていない場合はNone)
+        """
+        return self.__race_header.track_condition
+
     def get_num_horse(self) -> int:
         """ レース出走頭数を取得する
 
@@ -172,11 +356,8 @@ class TrainingEvaluationAPI():
         Returns:
             int | None: 枠番 (枠番が確定していない場合はNoneを返す)
         """
-        td_waku: Tag = self.__table[index].find(
-            'td', class_=re.compile('Waku'))
-        span_waku: Tag = td_waku.contents[0]
         try:
-            return int(span_waku.contents[0])
+            return int(self.__extract(index, 'wakuban'))
 
         # 枠番が確定されていない場合
         except IndexError:
@@ -194,10 +375,8 @@ class TrainingEvaluationAPI():
         Returns:
             int | None: 馬番 (馬番が確定していない場合はNoneを返す)
         """
-        td_umaban: Tag = self.__table[index].find(
-            'td', class_='Umaban')
         try:
-            return int(td_umaban.contents[0])
+            return int(self.__extract(index, 'umaban'))
 
         # 馬番が確定されていない場合
         except IndexError:
@@ -215,9 +394,7 @@ class TrainingEvaluationAPI():
         Returns:
             str: 馬名
         """
-        div_horse_name: Tag = self.__table[index].find(
-            'div', class_='Horse_Name')
-        horse_name: str = div_horse_name.a.contents[0]
+        horse_name: str = self.__extract(index, 'horse_name')
         return self.__helper.arrange_string(horse_name)
 
     def scrape_horse_id(self, index: int) -> int:
@@ -229,9 +406,7 @@ class TrainingEvaluationAPI():
         Returns:
             int: netkeiba 馬ID
         """
-        div_horse_name: Tag = self.__table[index].find(
-            'div', class_='Horse_Name')
-        horse_url: str = div_horse_name.a.attrs['href']
+        horse_url: str = self.__extract(index, 'horse_id')
         return self.__helper.get_id_from_url(horse_url)
 
     def scrape_training_evaluation(self, index: int) -> str | None:
@@ -243,9 +418,8 @@ class TrainingEvaluationAPI():
         Returns:
             str | None: 調教評価 (記載がない場合はNoneを返す)
         """
-        td_training_evaluation: Tag = self.__table[index].findAll('td')[5]
         try:
-            training_evaluation: str = td_training_evaluation.contents[0]
+            training_evaluation: str = self.__extract(index, 'training_evaluation')
             return self.__helper.arrange_string(training_evaluation)
 
         except IndexError:
@@ -254,16 +428,96 @@ class TrainingEvaluationAPI():
         except Exception as e:
             raise NKScraperException(e)
 
+    def to_records(self, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """ 調教評価表の各行を辞書に変換する
+
+        各行の要素は1回だけ走査し, 指定した項目のみを scrape_<項目名> と同じ値で取得する.
+
+        Args:
+            fields (list[str] | None): 取得する項目 (RECORD_FIELDS の項目名. 省略時は全ての項目)
+
+        Returns:
+            list[dict[str, Any]]: 行ごとの {項目名: 値} 配列
+        """
+        field_list: list[str] = list(TrainingEvaluationAPI.RECORD_FIELDS) if fields is None else fields
+        for field in field_list:
+            if field not in TrainingEvaluationAPI.RECORD_FIELDS:
+                self.__logger.error(f'{TrainingEvaluationAPI.__ERR_MESSAGE_0403} {field}')
+                sys.exit()
+        getter_list: list[tuple[str, Callable[[int], Any]]] = [
+            (field, getattr(self, f'scrape_{field}')) for field in field_list
+        ]
+        return [
+            {field: getter(index) for field, getter in getter_list} for index in range(len(self.__rows))
+        ]
+
+    def snapshot(self, release: bool = True) -> NetkeibaSnapshot:
+        """ 調教評価表の全ての項目を1回だけ取得し, 解析結果から切り離したスナップショットを作成する
+
+        スナップショットは HEADER_FIELDS, RECORD_FIELDS の項目を保持し, このAPIと同じ getter (scrape_<項目名>, get_num_horse) で値を取得する.
+        取得時に例外が発生した項目は, スナップショットの getter でも同じ例外を送出する.
+
+        Args:
+            release (bool): True の場合, 解析結果・表の行・NetkeibaContents への参照を解放する (以降は, このAPIではなくスナップショットを使用する)
+
+        Returns:
+            NetkeibaSnapshot: netkeiba スナップショット
+        """
+        snapshot: NetkeibaSnapshot = NetkeibaSnapshot.create(
+            self, TrainingEvaluationAPI.HEADER_FIELDS, TrainingEvaluationAPI.RECORD_FIELDS, self.__num_horse, 'get_num_horse')
+        if release:
+            self.__release()
+        return snapshot
+
     # Private Functions for Scrape Training Evaluation Table -----------------
-    def __scrape_training_evaluation_table(self) -> list[Tag]:
-        """ 調教評価表をスクレイピングする
+    def __release(self) -> None:
+        """ 解析結果と表の行を解放し, NetkeibaContents (バイト列) への参照を切る (他のAPIと共有していなければ soup を decompose する)
         """
-        try:
-            table: Tag = self.__soup.find('table', class_='OikiriTable')
-            return table.findAll('tr', class_='HorseList')
+        self.__table = []
+        self.__rows = []
+        self.__num_horse = 0
+        if self.__contents is not None:
+            self.__contents.detach()
+        self.__contents = None
+        self.__header = None
+
+    @property
+    def __soup(self) -> BeautifulSoup:
+        """ BeautifulSoupオブジェクト (調教評価表以外の要素をスクレイピングする時点で解析する)
+        """
+        if self.__contents is None:
+            self.__logger.error(TrainingEvaluationAPI.__ERR_MESSAGE_0404)
+            sys.exit()
+        return self.__contents.soup
+
+    @property
+    def __race_header(self) -> NetkeibaRaceHeader:
+        """ レース情報ヘッダー (初回のみ title, RaceName, RaceData01, RaceData02 を解析する)
+        """
+        if self.__header is None:
+            self.__header = NetkeibaRaceHeader(self.__soup, self.__helper)
+        return self.__header
+
+    def __get_row(self, index: int) -> NetkeibaTableRow:
+        """ 調教評価表の行を取得する (初回のみ行の要素を走査する)
+        """
+        row: NetkeibaTableRow | None = self.__rows[index]
+        if row is None:
+            row = self.__extractor.create_row(self.__table[index])
+            self.__rows[index] = row
+        return row
+
+    def __extract(self, index: int, key: str) -> str:
+        """ 調教評価表の行から SELECTORS[key] の値を取り出す
+        """
+        return self.__extractor.extract(self.__get_row(index), TrainingEvaluationAPI.SELECTORS[key])
 
-        except AttributeError:
+    def __scrape_training_evaluation_table(self) -> list[Any]:
+        """ 調教評価表をスクレイピングする
+        """
+        table_row_list: list[Any] | None = self.__extractor.find_rows(
+            self.__extractor.parse(self.__contents), TrainingEvaluationAPI.TABLE_SELECTOR)
+        if table_row_list is None:
             self.__logger.error(TrainingEvaluationAPI.__ERR_MESSAGE_0402)
             sys.exit()
-        except Exception as e:
-            raise NKScraperException(e)
+        return table_row_list
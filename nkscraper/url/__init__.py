@@ -9,6 +9,7 @@ from .shutuba_table_url import ShutubaTableURL
 from .odds_url import OddsURL
 from .training_evaluation_url import TrainingEvaluationURL
 from .searched_race_url import SearchedRaceURL
+from .netkeiba_url_factory import NetkeibaURLFactory
 
 
 __all__ = [
@@ -19,4 +20,5 @@ __all__ = [
     'OddsURL',
     'TrainingEvaluationURL',
     'SearchedRaceURL',
+    'NetkeibaURLFactory',
 ]
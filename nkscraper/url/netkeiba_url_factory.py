@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+""" netkeiba URLファクトリーモジュール
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.common import NetkeibaCategory
+from nkscraper.url import NetkeibaURL, ShutubaTableURL, RaceResultURL, OddsURL, TrainingEvaluationURL, HorseInfoURL
+
+# build-in
+import re
+
+# for type declaration only
+from typing import Callable
+
+
+class NetkeibaURLFactory():
+    """ netkeiba URLファクトリークラス
+
+    netkeiba ID (レースID, 競走馬ID) で一意に決まる Webページの URL を作成する.
+    """
+
+    URL_CLASSES: dict[NetkeibaCategory, Callable[[int], NetkeibaURL]] = {
+        NetkeibaCategory.SHUTUBA_TABLE: ShutubaTableURL,
+        NetkeibaCategory.RACE_RESULT: RaceResultURL,
+        NetkeibaCategory.ODDS: OddsURL,
+        NetkeibaCategory.TRAINING_EVALUATION: TrainingEvaluationURL,
+        NetkeibaCategory.HORSE_INFO: HorseInfoURL,
+    }
+
+    @staticmethod
+    def is_supported(category: NetkeibaCategory) -> bool:
+        """ netkeiba ID から URL を作成できるカテゴリーか判定する
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+
+        Returns:
+            bool: 作成できる場合はTrue, そうでなければFalse (レース検索結果など)
+        """
+        return category in NetkeibaURLFactory.URL_CLASSES
+
+    @staticmethod
+    def create(category: NetkeibaCategory, netkeiba_id: int) -> NetkeibaURL:
+        """ netkeiba URL を作成する
+
+        Args:
+            category (NetkeibaCategory): netkeiba Webページカテゴリー
+            netkeiba_id (int): netkeiba ID (レースID, 競走馬ID)
+
+        Returns:
+            NetkeibaURL: NetkeibaURL オブジェクト
+
+        Raises:
+            KeyError: netkeiba ID から URL を作成できないカテゴリーの場合
+        """
+        return NetkeibaURLFactory.URL_CLASSES[category](netkeiba_id)
+
+    @staticmethod
+    def get_id(url: NetkeibaURL) -> int:
+        """ netkeiba URL から netkeiba ID を取得する
+
+        Args:
+            url (NetkeibaURL): NetkeibaURL オブジェクト (netkeiba ID から作成できるカテゴリー)
+
+        Returns:
+            int: netkeiba ID (レースID, 競走馬ID)
+        """
+        # NOTE: netkeiba ID は URL の末尾の数字
+        return int(re.findall(r'\d+', url.url)[-1])
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+""" 抽出エンジンの適合性チェック (NetkeibaSoupExtractor と NetkeibaLxmlExtractor の比較)
+
+圧縮Webページアーカイブに保存した全ての Webページを両方の抽出エンジンで解析し,
+各APIの RECORD_FIELDS の値 (例外は型名) が全ての行で一致することを確認する (netkeiba には送信しない).
+一致しない値があれば表示し, 終了コード 1 で終了する.
+
+    python samples/extractor_conformance.py ./archive
+
+リポジトリに含める Webページでの確認は tests/test_extractor_conformance.py で行う.
+"""
+
+# nkscraper
+from nkscraper import ShutubaTableAPI, RaceResultAPI, HorseInfoAPI, TrainingEvaluationAPI, SearchedRaceAPI
+from nkscraper.common import NetkeibaCategory, NetkeibaPackedArchive, NetkeibaArchiveEntry
+from nkscraper.common import NetkeibaExtractor, NetkeibaSoupExtractor, NetkeibaLxmlExtractor
+
+# build-in
+import argparse
+import logging
+import sys
+import time
+from typing import Any
+
+
+# NOTE: (カテゴリー, API, 行数を取得するメソッド名)
+TARGETS: list[tuple[NetkeibaCategory, type, str]] = [
+    (NetkeibaCategory.SHUTUBA_TABLE, ShutubaTableAPI, 'get_num_horse'),
+    (NetkeibaCategory.RACE_RESULT, RaceResultAPI, 'get_num_horse'),
+    (NetkeibaCategory.HORSE_INFO, HorseInfoAPI, 'get_num_race_result'),
+    (NetkeibaCategory.TRAINING_EVALUATION, TrainingEvaluationAPI, 'get_num_horse'),
+    (NetkeibaCategory.SEARCHED_RACE, SearchedRaceAPI, 'get_num_race'),
+]
+
+
+def extract_all(entry: NetkeibaArchiveEntry, api_class: type, num_method: str,
+                extractor: NetkeibaExtractor) -> list[dict[str, Any]] | str:
+    """ 全ての行の RECORD_FIELDS の値を取得する (APIを作成できない場合は例外の型名)
+    """
+    try:
+        api: Any = api_class(entry.create_contents(extractor=extractor))
+    except BaseException as e:
+        return type(e).__name__
+
+    record_list: list[dict[str, Any]] = []
+    for index in range(getattr(api, num_method)()):
+        record: dict[str, Any] = {}
+        for field in api_class.RECORD_FIELDS:
+            try:
+                record[field] = getattr(api, f'scrape_{field}')(index)
+            except BaseException as e:
+                record[field] = type(e).__name__
+        record_list.append(record)
+    return record_list
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument('directory', help='圧縮Webページアーカイブのディレクトリ')
+    args: argparse.Namespace = parser.parse_args()
+    # NOTE: 取得できない項目の警告・例外のログを表示しない
+    logging.disable(logging.CRITICAL)
+
+    extractors: dict[str, NetkeibaExtractor] = {
+        'bs4': NetkeibaSoupExtractor(),
+        'lxml': NetkeibaLxmlExtractor(),
+    }
+    elapsed: dict[str, float] = {name: 0.0 for name in extractors}
+    num_page: int = 0
+    num_mismatch: int = 0
+    with NetkeibaPackedArchive(args.directory) as archive:
+        for category, api_class, num_method in TARGETS:
+            for entry in archive.iter_entries(category):
+                result: dict[str, list[dict[str, Any]] | str] = {}
+                for name, extractor in extractors.items():
+                    start: float = time.perf_counter()
+                    result[name] = extract_all(entry, api_class, num_method, extractor)
+                    elapsed[name] += time.perf_counter() - start
+                num_page += 1
+
+                expected, actual = result['bs4'], result['lxml']
+                if expected == actual:
+                    continue
+                num_mismatch += 1
+                if isinstance(expected, str) or isinstance(actual, str) or len(expected) != len(actual):
+                    print(f'{entry.url.url}: {expected if isinstance(expected, str) else len(expected)} != '
+                          f'{actual if isinstance(actual, str) else len(actual)}')
+                    continue
+                for index, (expected_record, actual_record) in enumerate(zip(expected, actual)):
+                    for field, value in expected_record.items():
+                        if value != actual_record[field]:
+                            print(f'{entry.url.url} [{index}] {field}: {value!r} != {actual_record[field]!r}')
+
+    print(f'{num_page} pages, {num_mismatch} mismatches. '
+          + ', '.join(f'{name}: {seconds:.2f} [sec]' for name, seconds in elapsed.items()))
+    if num_mismatch > 0:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+""" HTTP/2 スタブサーバー (トランスポートの検証・ベンチマーク用)
+
+固定の HTML を遅延付きで返す. /stats は接続数 (クライアントのポート数) とリクエスト数を返す.
+hypercorn が必要 (pip install hypercorn). HTTP/2 を使用するには TLS 証明書を指定する.
+
+    openssl req -x509 -newkey rsa:2048 -nodes -days 1 -subj /CN=localhost -keyout key.pem -out cert.pem
+    python samples/http2_stub_server.py --certfile cert.pem --keyfile key.pem
+"""
+
+# build-in
+import argparse
+import asyncio
+import json
+
+# OSS
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+
+PAGE: bytes = ('<html><head><title>stub</title></head><body>'
+               + '<table class="db_h_race_results"><tr><td>stub</td></tr></table>' * 100
+               + '</body></html>').encode('EUC-JP')
+
+
+def create_app(delay: float):
+    """ ASGI アプリケーションを作成する
+
+    Args:
+        delay (float): 応答までの遅延 [sec]
+    """
+    stats: dict = {'connections': set(), 'requests': 0, 'http_versions': set()}
+
+    async def app(scope, receive, send) -> None:
+        if scope['type'] != 'http':
+            return
+        if scope['path'] == '/stats':
+            body: bytes = json.dumps({
+                'connections': len(stats['connections']),
+                'requests': stats['requests'],
+                'http_versions': sorted(stats['http_versions']),
+            }).encode()
+            stats['connections'].clear()
+            stats['requests'] = 0
+            stats['http_versions'].clear()
+        else:
+            stats['connections'].add(tuple(scope['client']))
+            stats['requests'] += 1
+            stats['http_versions'].add(scope['http_version'])
+            await asyncio.sleep(delay)
+            body = PAGE
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': [(b'content-type', b'text/html; charset=EUC-JP')]})
+        await send({'type': 'http.response.body', 'body': body})
+
+    return app
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument('--bind', default='127.0.0.1:8443')
+    parser.add_argument('--certfile', default=None)
+    parser.add_argument('--keyfile', default=None)
+    parser.add_argument('--delay', type=float, default=0.05)
+    args: argparse.Namespace = parser.parse_args()
+
+    config: Config = Config()
+    config.bind = [args.bind]
+    config.certfile = args.certfile
+    config.keyfile = args.keyfile
+    asyncio.run(serve(create_app(args.delay), config))
+
+
+if __name__ == '__main__':
+    main()
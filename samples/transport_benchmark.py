@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+""" トランスポートのベンチマーク (aiohttp (HTTP/1.1) と httpx (HTTP/2) の比較)
+
+同じ URL に同時に多数のリクエストを送信し, 所要時間と使用した接続数を比較する.
+http2_stub_server.py を起動してから実行する (netkeiba には送信しない).
+
+    python samples/transport_benchmark.py --url https://127.0.0.1:8443/ --insecure --requests 500 --concurrency 100
+"""
+
+# nkscraper
+from nkscraper.common import NetkeibaClient, NetkeibaRequests, NetkeibaCategory
+from nkscraper.common import NetkeibaTransport, NetkeibaAiohttpTransport, NetkeibaHttpxTransport
+from nkscraper.url import NetkeibaURL
+
+# build-in
+import argparse
+import asyncio
+import json
+import ssl
+import time
+import urllib.request
+
+
+class BenchmarkURL(NetkeibaURL):
+    """ ベンチマーク用URLクラス
+    """
+
+    def __init__(self, url: str, index: int) -> None:
+        # NOTE: 同じ URL は1回の取得にまとめられるため, クエリで区別する
+        self.__url: str = f'{url}?i={index}'
+
+    @property
+    def category(self) -> NetkeibaCategory:
+        return NetkeibaCategory.HORSE_INFO
+
+    @property
+    def url(self) -> str:
+        return self.__url
+
+
+def get_stats(url: str, insecure: bool) -> dict:
+    """ スタブサーバーの統計を取得し, リセットする
+    """
+    context: ssl.SSLContext | None = ssl._create_unverified_context() if insecure else None
+    with urllib.request.urlopen(f'{url.rstrip("/")}/stats', context=context) as response:
+        return json.loads(response.read())
+
+
+async def run(transport: NetkeibaTransport, url: str, num_requests: int, concurrency: int) -> tuple[float, int]:
+    """ 全てのリクエストを送信し, 所要時間と成功数を返す
+    """
+    url_list: list[NetkeibaURL] = [BenchmarkURL(url, index) for index in range(num_requests)]
+    async with NetkeibaClient(max_in_flight=concurrency, limit_per_host=concurrency, transport=transport) as client:
+        start: float = time.perf_counter()
+        contents_list = await NetkeibaRequests(client).aget_by_list(url_list)
+        return time.perf_counter() - start, len(contents_list)
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser()
+    parser.add_argument('--url', default='https://127.0.0.1:8443/')
+    parser.add_argument('--insecure', action='store_true', help='TLS証明書を検証しない (自己署名証明書)')
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, default=100)
+    args: argparse.Namespace = parser.parse_args()
+
+    transports: dict[str, NetkeibaTransport] = {
+        'aiohttp (HTTP/1.1)': NetkeibaAiohttpTransport(
+            limit=args.concurrency, limit_per_host=args.concurrency, verify=not args.insecure),
+        'httpx (HTTP/2)': NetkeibaHttpxTransport(http2=True, verify=not args.insecure),
+    }
+    get_stats(args.url, args.insecure)
+    for name, transport in transports.items():
+        elapsed, num_success = asyncio.run(run(transport, args.url, args.requests, args.concurrency))
+        stats: dict = get_stats(args.url, args.insecure)
+        print(f'{name}: {elapsed:.2f} [sec], {args.requests / elapsed:.1f} [req/sec], '
+              f'success {num_success}/{args.requests}, connections {stats["connections"]}, '
+              f'HTTP {",".join(stats["http_versions"])}')
+
+
+if __name__ == '__main__':
+    main()
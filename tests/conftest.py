@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+""" テスト共通 fixture
+
+tests/fixtures の Webページを返すローカルの HTTP サーバーを起動し, 各 NetkeibaURL の URL をサーバーに向ける.
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.url import ShutubaTableURL, RaceResultURL, HorseInfoURL, TrainingEvaluationURL, SearchedRaceURL
+
+# build-in
+import asyncio
+import pathlib
+import threading
+import time
+
+# OSS
+from aiohttp import web
+import pytest
+
+# for type declaration only
+from typing import Iterator
+
+
+FIXTURE_DIR: pathlib.Path = pathlib.Path(__file__).parent / 'fixtures'
+
+# NOTE: (パスの接頭辞, Webページ)
+PAGES: list[tuple[str, str]] = [
+    ('/race/shutuba', 'shutuba_table.html'),
+    ('/race/result', 'race_result.html'),
+    ('/race/oikiri', 'training_evaluation.html'),
+    ('/horse/', 'horse_info.html'),
+    ('/', 'searched_race.html'),
+]
+
+ETAG: str = '"v1"'
+LAST_MODIFIED: str = 'Sun, 25 Dec 2022 00:00:00 GMT'
+
+# NOTE: (ID, ステータスコード配列) 指定したIDへのリクエストには, 先頭から順にステータスコードを返してから Webページを返す
+FAILURES: dict[str, list[int]] = {}
+# NOTE: (ID, 待機時間配列 [sec]) 指定したIDへのリクエストは, 先頭から順に待機してから応答する
+DELAYS: dict[str, list[float]] = {}
+# NOTE: 受信したリクエスト (path_qs, 受信時刻 (time.monotonic))
+REQUEST_LOG: list[tuple[str, float]] = []
+
+
+def load_fixture(name: str) -> bytes:
+    """ tests/fixtures の Webページを読み込む
+    """
+    return (FIXTURE_DIR / name).read_bytes()
+
+
+async def handle(request: web.Request) -> web.Response:
+    """ パスに対応する Webページを ETag, Last-Modified とともに返す
+
+    If-None-Match が一致すれば 304, 末尾が 98 ならリダイレクトを返す. FAILURES, DELAYS に指定したIDは失敗・遅延させる.
+    """
+    REQUEST_LOG.append((request.path_qs, time.monotonic()))
+    key: str | None = next((key for key in {**FAILURES, **DELAYS} if request.path_qs.endswith(key)), None)
+    if key is not None and len(DELAYS.get(key, [])) > 0:
+        await asyncio.sleep(DELAYS[key].pop(0))
+    if key is not None and len(FAILURES.get(key, [])) > 0:
+        return web.Response(status=FAILURES[key].pop(0), headers={'Retry-After': '0'})
+
+    headers: dict[str, str] = {'ETag': ETAG, 'Last-Modified': LAST_MODIFIED}
+    if request.headers.get('If-None-Match') == ETAG:
+        return web.Response(status=304, headers=headers)
+    # NOTE: 末尾が 98 のIDは, 末尾を 11 に置き換えたURLへリダイレクトする
+    if request.path_qs.endswith('98'):
+        raise web.HTTPFound(request.path_qs[:-2] + '11')
+    name: str = next(name for prefix, name in PAGES if request.path.startswith(prefix))
+    # NOTE: 末尾が 99 のIDは, 取得対象の内容が掲載されていない Webページを返す
+    unavailable: str = name.replace('.html', '_unavailable.html')
+    if request.path_qs.endswith('99') and (FIXTURE_DIR / unavailable).exists():
+        name = unavailable
+    return web.Response(body=load_fixture(name), content_type='text/html', charset='EUC-JP', headers=headers)
+
+
+@pytest.fixture
+def netkeiba_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[str]:
+    """ ローカルの HTTP サーバーを起動し, 各 NetkeibaURL の URL をサーバーに向ける
+
+    Yields:
+        str: サーバーの URL
+    """
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    app: web.Application = web.Application()
+    app.router.add_route('*', '/{tail:.*}', handle)
+    runner: web.AppRunner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    site: web.TCPSite = web.TCPSite(runner, '127.0.0.1', 0)
+    loop.run_until_complete(site.start())
+    port: int = runner.addresses[0][1]
+    thread: threading.Thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    FAILURES.clear()
+    DELAYS.clear()
+    REQUEST_LOG.clear()
+    base: str = f'http://127.0.0.1:{port}'
+    monkeypatch.setattr(ShutubaTableURL, 'URL', base + '/race/shutuba.html?race_id=')
+    monkeypatch.setattr(RaceResultURL, 'URL', base + '/race/result.html?race_id=')
+    monkeypatch.setattr(TrainingEvaluationURL, 'URL', base + '/race/oikiri.html?race_id=')
+    monkeypatch.setattr(HorseInfoURL, 'URL', base + '/horse/')
+    monkeypatch.setattr(SearchedRaceURL, 'URL', base + '/?pid=race_list&sort=date&list=100')
+    yield base
+
+    asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
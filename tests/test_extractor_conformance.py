@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+""" 抽出エンジンの適合性テスト (NetkeibaSoupExtractor と NetkeibaLxmlExtractor の比較, 部分解析と全体解析の比較)
+
+tests/fixtures の Webページを両方の抽出エンジンで解析し, 各APIの全てのセレクターと getter の値 (例外は型名) が一致することを確認する.
+また, 部分解析 (partial), 逐次解析 (NetkeibaStreamParser) で解析した場合も, 全体を解析した場合と getter の値が一致することを確認する.
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper import ShutubaTableAPI, RaceResultAPI, HorseInfoAPI, TrainingEvaluationAPI, SearchedRaceAPI
+from nkscraper.common import NetkeibaContents, NetkeibaExtractor, NetkeibaSoupExtractor, NetkeibaLxmlExtractor
+from nkscraper.common import NetkeibaFieldID, NetkeibaStreamParser
+from nkscraper.url import ShutubaTableURL, RaceResultURL, HorseInfoURL, TrainingEvaluationURL, SearchedRaceURL
+
+# tests
+from tests.conftest import load_fixture
+
+# build-in
+import logging
+
+# OSS
+import pytest
+
+# for type declaration only
+from nkscraper.url import NetkeibaURL
+from typing import Any, Callable
+
+
+# NOTE: (Webページ, API, URL, 行数を取得するメソッド名)
+CASES: list[tuple[str, type, Callable[[], NetkeibaURL], str]] = [
+    ('shutuba_table.html', ShutubaTableAPI, lambda: ShutubaTableURL(202206050811), 'get_num_horse'),
+    ('race_result.html', RaceResultAPI, lambda: RaceResultURL(202206050811), 'get_num_horse'),
+    ('race_result_irregular.html', RaceResultAPI, lambda: RaceResultURL(202206050811), 'get_num_horse'),
+    ('horse_info.html', HorseInfoAPI, lambda: HorseInfoURL(2019105219), 'get_num_race_result'),
+    ('horse_info_irregular.html', HorseInfoAPI, lambda: HorseInfoURL(2019105219), 'get_num_race_result'),
+    ('training_evaluation.html', TrainingEvaluationAPI, lambda: TrainingEvaluationURL(202206050811), 'get_num_horse'),
+    ('searched_race.html', SearchedRaceAPI,
+     lambda: SearchedRaceURL('有馬記念', NetkeibaFieldID.NAKAYAMA, 2500, '芝', 2010, 1, 2022, 12), 'get_num_race'),
+]
+
+
+@pytest.fixture(autouse=True)
+def disable_logging() -> Any:
+    """ 取得できない項目の警告・例外のログを表示しない
+    """
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def call(getter: Callable[..., Any], *args: Any) -> Any:
+    """ getter の値を取得する (例外は型名)
+    """
+    try:
+        return getter(*args)
+    except BaseException as e:
+        return type(e).__name__
+
+
+def extract_selectors(name: str, api_class: type, url: NetkeibaURL, extractor: NetkeibaExtractor) -> list[dict[str, Any]]:
+    """ 表の全ての行から, 全てのセレクターの値を取り出す
+    """
+    contents: NetkeibaContents = NetkeibaContents(url, html_byte=load_fixture(name), extractor=extractor)
+    rows: list[Any] | None = extractor.find_rows(extractor.parse(contents), api_class.TABLE_SELECTOR)
+    assert rows is not None
+    return [
+        {key: call(extractor.extract, extractor.create_row(row), selector) for key, selector in api_class.SELECTORS.items()}
+        for row in rows
+    ]
+
+
+def scrape_all(name: str, api_class: type, url: NetkeibaURL, num_method: str,
+               extractor: NetkeibaExtractor, partial: bool = False) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """ HEADER_FIELDS, 全ての行の RECORD_FIELDS の値を取得する
+    """
+    return scrape_api(api_class(NetkeibaContents(url, html_byte=load_fixture(name), partial=partial, extractor=extractor)),
+                      num_method)
+
+
+def scrape_api(api: Any, num_method: str) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """ スクレイピングAPIから HEADER_FIELDS, 全ての行の RECORD_FIELDS の値を取得する
+    """
+    api_class: type = type(api)
+    header: dict[str, Any] = {field: call(getattr(api, f'scrape_{field}')) for field in api_class.HEADER_FIELDS}
+    records: list[dict[str, Any]] = [
+        {field: call(getattr(api, f'scrape_{field}'), index) for field in api_class.RECORD_FIELDS}
+        for index in range(getattr(api, num_method)())
+    ]
+    return header, records
+
+
+@pytest.mark.parametrize('name, api_class, create_url, num_method', CASES, ids=[case[0] for case in CASES])
+def test_selectors(name: str, api_class: type, create_url: Callable[[], NetkeibaURL], num_method: str) -> None:
+    """ 全てのセレクターで, 両方の抽出エンジンが同じ値 (例外は型名) を取り出す
+    """
+    expected: list[dict[str, Any]] = extract_selectors(name, api_class, create_url(), NetkeibaSoupExtractor())
+    actual: list[dict[str, Any]] = extract_selectors(name, api_class, create_url(), NetkeibaLxmlExtractor())
+    assert len(expected) > 0
+    assert actual == expected
+
+
+@pytest.mark.parametrize('name, api_class, create_url, num_method', CASES, ids=[case[0] for case in CASES])
+def test_getters(name: str, api_class: type, create_url: Callable[[], NetkeibaURL], num_method: str) -> None:
+    """ 全ての getter で, 両方の抽出エンジンが同じ値 (例外は型名) を返す
+    """
+    expected = scrape_all(name, api_class, create_url(), num_method, NetkeibaSoupExtractor())
+    actual = scrape_all(name, api_class, create_url(), num_method, NetkeibaLxmlExtractor())
+    assert actual == expected
+
+
+@pytest.mark.parametrize('extractor_class', [NetkeibaSoupExtractor, NetkeibaLxmlExtractor])
+@pytest.mark.parametrize('name, api_class, create_url, num_method', CASES, ids=[case[0] for case in CASES])
+def test_partial_parse(name: str, api_class: type, create_url: Callable[[], NetkeibaURL], num_method: str,
+                       extractor_class: type[NetkeibaExtractor]) -> None:
+    """ 部分解析 (各APIが参照する要素のみ) でも, 全体を解析した場合と全ての getter が同じ値 (例外は型名) を返す
+    """
+    expected = scrape_all(name, api_class, create_url(), num_method, extractor_class())
+    actual = scrape_all(name, api_class, create_url(), num_method, extractor_class(), partial=True)
+    assert len(expected[1]) > 0
+    assert actual == expected
+
+
+@pytest.mark.parametrize('chunk_size', [7, 4096])
+@pytest.mark.parametrize('extractor_class', [NetkeibaSoupExtractor, NetkeibaLxmlExtractor])
+@pytest.mark.parametrize('name, api_class, create_url, num_method', CASES, ids=[case[0] for case in CASES])
+def test_stream_parse(name: str, api_class: type, create_url: Callable[[], NetkeibaURL], num_method: str,
+                      extractor_class: type[NetkeibaExtractor], chunk_size: int) -> None:
+    """ 断片ごとに逐次解析した場合も, 全体を解析した場合と全ての getter が同じ値 (例外は型名) を返す
+    """
+    url: NetkeibaURL = create_url()
+    html_byte: bytes = load_fixture(name)
+    parser: NetkeibaStreamParser = NetkeibaStreamParser(url.category)
+    for start in range(0, len(html_byte), chunk_size):
+        parser.feed(html_byte[start:start + chunk_size])
+    assert parser.size == len(html_byte)
+    contents: NetkeibaContents = NetkeibaContents(url, extractor=extractor_class(), document=parser.close())
+
+    expected = scrape_all(name, api_class, url, num_method, NetkeibaSoupExtractor())
+    actual = scrape_api(api_class(contents), num_method)
+    assert len(expected[1]) > 0
+    assert actual == expected
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+""" NetkeibaCache・トランスポートのテスト (トランスポートごとの ETag / Last-Modified の保存と再検証, リダイレクト)
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper import ShutubaTableAPI
+from nkscraper.common import NetkeibaCache, NetkeibaCacheEntry, NetkeibaCategory, NetkeibaClient, NetkeibaRequests
+from nkscraper.common import NetkeibaAiohttpTransport, NetkeibaHttpxTransport, NetkeibaTransport
+from nkscraper.url import ShutubaTableURL
+
+# tests
+from tests.conftest import ETAG, LAST_MODIFIED, load_fixture
+
+# OSS
+import pytest
+
+# for type declaration only
+from typing import Callable
+
+
+TRANSPORTS: dict[str, Callable[[], NetkeibaTransport]] = {
+    'aiohttp': NetkeibaAiohttpTransport,
+    'httpx': lambda: NetkeibaHttpxTransport(http2=False),
+}
+
+
+@pytest.mark.parametrize('transport_name', TRANSPORTS)
+def test_save_validators(netkeiba_server: str, tmp_path, transport_name: str) -> None:
+    """ ヘッダー名の表記 (httpx は小文字) によらず, ETag と Last-Modified をキャッシュに保存する
+    """
+    cache: NetkeibaCache = NetkeibaCache(str(tmp_path), ttl={NetkeibaCategory.SHUTUBA_TABLE: 0.0})
+    url: ShutubaTableURL = ShutubaTableURL(202206050811)
+    with NetkeibaClient(cache=cache, transport=TRANSPORTS[transport_name]()) as client:
+        NetkeibaRequests(client).get(url)
+
+        entry: NetkeibaCacheEntry | None = cache.load(url)
+        assert entry is not None
+        assert entry.etag == ETAG
+        assert entry.last_modified == LAST_MODIFIED
+        assert entry.body == load_fixture('shutuba_table.html')
+
+        # NOTE: 有効期限切れのエントリーは 304 で再検証し, 保存済みのボディを使用する
+        api: ShutubaTableAPI = ShutubaTableAPI(NetkeibaRequests(client).get(url))
+        assert api.get_num_horse() > 0
+        refreshed: NetkeibaCacheEntry | None = cache.load(url)
+        assert refreshed is not None and refreshed.stored_at >= entry.stored_at
+
+
+@pytest.mark.parametrize('transport_name', TRANSPORTS)
+def test_follow_redirects(netkeiba_server: str, transport_name: str) -> None:
+    """ どちらのトランスポートもリダイレクトをたどり, リダイレクト先の Webページを取得する
+    """
+    with NetkeibaClient(transport=TRANSPORTS[transport_name]()) as client:
+        api: ShutubaTableAPI = ShutubaTableAPI.create(202206050898, client)
+    assert api.get_num_horse() > 0
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+""" NetkeibaClient のテスト
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper import ShutubaTableAPI
+from nkscraper.common import NetkeibaClient, NetkeibaPriority
+
+# tests
+from tests.conftest import REQUEST_LOG
+
+# build-in
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
+import time
+
+# OSS
+import pytest
+
+
+def test_rate_limited_host_does_not_block_slots() -> None:
+    """ レート制限中のホストへの優先度の低いリクエストが, 優先度の高いリクエストの実行枠を占有しない
+    """
+    async def run() -> float:
+        async with NetkeibaClient(max_in_flight=1, requests_per_second={'db.netkeiba.com': 2.0}) as client:
+            async def backfill() -> None:
+                async with client.slot('https://db.netkeiba.com/horse/2019105219', NetkeibaPriority.LOW):
+                    await asyncio.sleep(0)
+
+            tasks: list[asyncio.Task] = [asyncio.create_task(backfill()) for _ in range(5)]
+            await asyncio.sleep(0.05)
+            start: float = time.monotonic()
+            async with client.slot('https://race.netkeiba.com/api/api_get_jra_odds.html', NetkeibaPriority.HIGH):
+                elapsed: float = time.monotonic() - start
+            await asyncio.gather(*tasks)
+            return elapsed
+
+    # NOTE: トークンは 0.5 秒ごとに補充されるため, 実行枠を占有していれば 0.5 秒近く待たされる
+    assert asyncio.run(run()) < 0.2
+
+
+async def get_current_thread() -> threading.Thread:
+    """ コルーチンを実行しているスレッドを取得する
+    """
+    return threading.current_thread()
+
+
+async def raise_error() -> None:
+    """ 例外を送出する
+    """
+    raise ValueError('error')
+
+
+def test_sync_api_from_threads(netkeiba_server: str) -> None:
+    """ 複数のスレッドから同期APIで同じ NetkeibaClient を共有し, バックグラウンドのイベントループで取得する
+    """
+    race_id_list: list[int] = [202206050801 + i for i in range(8)]
+    with NetkeibaClient() as client:
+        loop_thread: threading.Thread = client.run(get_current_thread())
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            api_list: list[ShutubaTableAPI] = list(
+                executor.map(lambda race_id: ShutubaTableAPI.create(race_id, client), race_id_list))
+
+    assert loop_thread.name == 'nkscraper-client'
+    assert loop_thread is not threading.current_thread()
+    assert [api.scrape_race_id() for api in api_list] == race_id_list
+    assert len(REQUEST_LOG) == len(race_id_list)
+
+
+def test_run_returns_result_and_raises_error() -> None:
+    """ run はコルーチンの戻り値を返し, コルーチンの例外を呼び出し元で送出する
+    """
+    with NetkeibaClient() as client:
+        assert client.run(asyncio.sleep(0, result=1)) == 1
+        with pytest.raises(ValueError):
+            client.run(raise_error())
+        # NOTE: 例外の後もイベントループは継続する
+        assert client.run(asyncio.sleep(0, result=2)) == 2
+
+
+def test_stop_shuts_down_loop(netkeiba_server: str) -> None:
+    """ stop はセッションを閉じてバックグラウンドスレッドを終了し, 再度 start できる
+    """
+    client: NetkeibaClient = NetkeibaClient().start()
+    loop_thread: threading.Thread = client.run(get_current_thread())
+    assert client.is_open
+    client.stop()
+    assert not loop_thread.is_alive()
+    assert not client.is_open
+    # NOTE: 2回目の stop は何もしない
+    client.stop()
+
+    # NOTE: 終了後の同期APIはエラーとし, 渡したコルーチンは実行せずに閉じる
+    coroutine = get_current_thread()
+    with pytest.raises(SystemExit):
+        client.run(coroutine)
+    assert coroutine.cr_frame is None
+
+    client.start()
+    try:
+        assert ShutubaTableAPI.create(202206050811, client).scrape_race_id() == 202206050811
+    finally:
+        client.stop()
+
+
+def test_async_client_cannot_be_used_from_sync_api() -> None:
+    """ async with 文で開いた NetkeibaClient は, バックグラウンドのイベントループがないため同期APIから使用できない
+    """
+    async def run() -> None:
+        async with NetkeibaClient() as client:
+            coroutine = get_current_thread()
+            with pytest.raises(SystemExit):
+                client.run(coroutine)
+            assert coroutine.cr_frame is None
+
+    asyncio.run(run())
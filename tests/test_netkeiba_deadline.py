@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+""" NetkeibaClient.deadline (締め切りの伝搬) と重複リクエスト (hedge) のテスト
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.common import NetkeibaCategory, NetkeibaClient, NetkeibaRequests, NetkeibaResult
+from nkscraper.url import ShutubaTableURL
+
+# tests
+from tests.conftest import DELAYS, REQUEST_LOG
+
+# build-in
+import asyncio
+import time
+
+
+RACE_ID: int = 202206050811
+
+
+def test_deadline_propagates_to_tasks() -> None:
+    """ 締め切りは with 文の中で作成したタスクに引き継がれ, 入れ子にした場合は早い方を使用する
+    """
+    async def run(client: NetkeibaClient) -> list[float | None]:
+        async def remaining_time() -> float | None:
+            return client.get_remaining_time()
+
+        with client.deadline(1.0):
+            outer: float | None = await asyncio.create_task(remaining_time())
+            with client.deadline(10.0):
+                nested: float | None = await asyncio.create_task(remaining_time())
+            with client.deadline(0.5):
+                inner: float | None = await asyncio.create_task(remaining_time())
+        return [outer, nested, inner, await asyncio.create_task(remaining_time())]
+
+    client: NetkeibaClient = NetkeibaClient()
+    outer, nested, inner, outside = asyncio.run(run(client))
+    assert outer is not None and 0.9 < outer <= 1.0
+    assert nested is not None and 0.9 < nested <= 1.0
+    assert inner is not None and 0.4 < inner <= 0.5
+    assert outside is None
+
+
+def test_deadline_aborts_slow_request(netkeiba_server: str) -> None:
+    """ 締め切りを過ぎたリクエストは応答を待たずに中止し, 締め切り内に取得できたリクエストは成功とする
+    """
+    DELAYS[str(RACE_ID)] = [1.0]
+    with NetkeibaClient() as client:
+        requests: NetkeibaRequests = NetkeibaRequests(client)
+        start: float = time.monotonic()
+        with client.deadline(0.2):
+            result_list: list[NetkeibaResult] = requests.get_results_by_list(
+                [ShutubaTableURL(RACE_ID), ShutubaTableURL(202206050801)])
+        elapsed: float = time.monotonic() - start
+
+    assert elapsed < 0.8
+    assert isinstance(result_list[0].error, asyncio.TimeoutError)
+    assert result_list[1].is_success
+
+
+def test_deadline_is_inherited_by_background_loop(netkeiba_server: str) -> None:
+    """ バックグラウンドのイベントループで実行する場合も, 呼び出し元の締め切りを引き継ぐ
+    """
+    DELAYS[str(RACE_ID)] = [1.0]
+    client: NetkeibaClient = NetkeibaClient().start()
+    try:
+        with client.deadline(0.2):
+            result: NetkeibaResult = NetkeibaRequests(client).get_results_by_list([ShutubaTableURL(RACE_ID)])[0]
+    finally:
+        client.stop()
+
+    assert isinstance(result.error, asyncio.TimeoutError)
+
+
+def test_hedged_request_wins(netkeiba_server: str) -> None:
+    """ 応答時間のパーセンタイルを過ぎても応答がない場合は重複リクエストを送信し, 先に応答した方を使用する
+    """
+    with NetkeibaClient(hedge={NetkeibaCategory.SHUTUBA_TABLE: 0.9}) as client:
+        for _ in range(NetkeibaClient.HEDGE_MIN_SAMPLES):
+            client.record_latency(NetkeibaCategory.SHUTUBA_TABLE, 0.05)
+        assert client.get_hedge_delay(NetkeibaCategory.SHUTUBA_TABLE) == 0.05
+
+        # NOTE: 最初のリクエストのみ遅延させる
+        DELAYS[str(RACE_ID)] = [1.0]
+        start: float = time.monotonic()
+        result: NetkeibaResult = NetkeibaRequests(client).get_results_by_list([ShutubaTableURL(RACE_ID)])[0]
+        elapsed: float = time.monotonic() - start
+
+    assert result.is_success
+    assert elapsed < 0.8
+    assert len(REQUEST_LOG) == 2
+
+
+def test_no_hedge_without_samples(netkeiba_server: str) -> None:
+    """ 応答時間の記録が少ない間は, 重複リクエストを送信しない
+    """
+    with NetkeibaClient(hedge={NetkeibaCategory.SHUTUBA_TABLE: 0.9}) as client:
+        assert client.get_hedge_delay(NetkeibaCategory.SHUTUBA_TABLE) is None
+        DELAYS[str(RACE_ID)] = [0.3]
+        assert NetkeibaRequests(client).get_results_by_list([ShutubaTableURL(RACE_ID)])[0].is_success
+
+    assert len(REQUEST_LOG) == 1
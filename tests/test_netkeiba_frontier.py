@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+""" NetkeibaFrontier のテスト (同じファイルを共有するワーカーのリース)
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.common import NetkeibaCategory, NetkeibaContents, NetkeibaFrontier, NetkeibaFrontierState
+
+# build-in
+import sqlite3
+import time
+
+# OSS
+import pytest
+
+# for type declaration only
+import pathlib
+
+
+RACE_ID_LIST: list[int] = [202206050801, 202206050802, 202206050803, 202206050804]
+
+
+def test_live_lease_is_not_reclaimed(netkeiba_server: str, tmp_path: pathlib.Path) -> None:
+    """ 他のワーカーが取得中 (リースが有効) のIDは, 同じファイルを共有するワーカーが重複して取得しない
+    """
+    path: str = str(tmp_path / 'frontier.db')
+    handled_a: list[int] = []
+    handled_b: list[int] = []
+
+    async def handle_b(race_id: int, contents: NetkeibaContents) -> None:
+        handled_b.append(race_id)
+
+    async def handle_a(race_id: int, contents: NetkeibaContents) -> None:
+        if len(handled_a) == 0:
+            with NetkeibaFrontier(path, worker_id='b') as frontier_b:
+                assert frontier_b.recover() == 0
+                await frontier_b.acrawl(handle_b)
+        handled_a.append(race_id)
+
+    with NetkeibaFrontier(path, worker_id='a') as frontier_a:
+        frontier_a.add(NetkeibaCategory.SHUTUBA_TABLE, RACE_ID_LIST)
+        frontier_a.crawl(handle_a, chunk_size=len(RACE_ID_LIST))
+        assert frontier_a.count(NetkeibaFrontierState.DONE) == len(RACE_ID_LIST)
+
+    assert sorted(handled_a) == RACE_ID_LIST
+    assert handled_b == []
+
+
+def test_expired_lease_is_reclaimed(netkeiba_server: str, tmp_path: pathlib.Path) -> None:
+    """ リースの期限が切れたID, または, 同じ worker_id で再開したワーカーのIDは取り戻す
+    """
+    path: str = str(tmp_path / 'frontier.db')
+
+    def handle_abort(race_id: int, contents: NetkeibaContents) -> None:
+        raise RuntimeError('abort')
+
+    with NetkeibaFrontier(path, worker_id='a', lease_duration=1.0) as frontier_a:
+        frontier_a.add(NetkeibaCategory.SHUTUBA_TABLE, RACE_ID_LIST)
+        with pytest.raises(RuntimeError):
+            frontier_a.crawl(handle_abort, chunk_size=len(RACE_ID_LIST))
+        assert frontier_a.count(NetkeibaFrontierState.IN_FLIGHT) == len(RACE_ID_LIST)
+
+    with NetkeibaFrontier(path, worker_id='b', lease_duration=1.0) as frontier_b:
+        assert frontier_b.recover() == 0
+    with NetkeibaFrontier(path, worker_id='a', lease_duration=1.0) as frontier_a:
+        assert frontier_a.recover() == len(RACE_ID_LIST)
+
+    # NOTE: 再度中断し, リースの期限が切れた後に他のワーカーが取り戻す
+    handled: list[int] = []
+    with NetkeibaFrontier(path, worker_id='a', lease_duration=1.0) as frontier_a:
+        with pytest.raises(RuntimeError):
+            frontier_a.crawl(handle_abort, chunk_size=len(RACE_ID_LIST))
+    time.sleep(1.1)
+    with NetkeibaFrontier(path, worker_id='b', lease_duration=1.0) as frontier_b:
+        frontier_b.crawl(lambda race_id, contents: handled.append(race_id))
+        assert frontier_b.count(NetkeibaFrontierState.DONE) == len(RACE_ID_LIST)
+    assert sorted(handled) == RACE_ID_LIST
+
+
+@pytest.mark.parametrize('wal, journal_mode', [(False, 'delete'), (True, 'wal')])
+def test_journal_mode(tmp_path: pathlib.Path, wal: bool, journal_mode: str) -> None:
+    """ WAL は指定した場合のみ使用する (既定はロールバックジャーナル)
+    """
+    path: str = str(tmp_path / 'frontier.db')
+    with NetkeibaFrontier(path, wal=wal):
+        connection: sqlite3.Connection = sqlite3.connect(path)
+        assert connection.execute('PRAGMA journal_mode').fetchone()[0] == journal_mode
+        connection.close()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+""" NetkeibaHostController のテスト (AIMD による同時実行数の調整, サーキットブレーカー)
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.common import NetkeibaCircuitOpenError, NetkeibaClient, NetkeibaHostController
+from nkscraper.common import NetkeibaRequests, NetkeibaResult
+from nkscraper.url import ShutubaTableURL
+
+# tests
+from tests.conftest import FAILURES, REQUEST_LOG
+
+# build-in
+import asyncio
+import time
+
+# OSS
+import pytest
+
+
+def request(controller: NetkeibaHostController, failure: bool | None, latency: float = 0.0) -> bool:
+    """ 送信枠を取得し, 結果を反映して解放する
+
+    Returns:
+        bool: 試験的な送信であればTrue
+    """
+    probe: bool = asyncio.run(controller.acquire())
+    controller.release(latency, failure, probe=probe)
+    return probe
+
+
+def test_limit_decreases_on_failure_and_recovers() -> None:
+    """ 失敗すると同時実行数を乗算で減らし, 成功が続くと加算で上限まで戻す
+    """
+    controller: NetkeibaHostController = NetkeibaHostController(8, adaptive=True)
+    assert controller.limit == 4
+
+    request(controller, True)
+    assert controller.limit == 2
+    request(controller, True)
+    request(controller, True)
+    assert controller.limit == 1
+
+    limits: list[int] = []
+    for _ in range(60):
+        request(controller, False)
+        limits.append(controller.limit)
+    # NOTE: 加算増加のため, 同時実行数分の成功でおよそ1ずつ増える
+    assert limits == sorted(limits)
+    assert limits[:2] == [2, 2]
+    assert limits.index(8) >= 20
+    assert limits[-1] == 8
+
+
+def test_limit_decreases_on_slow_response() -> None:
+    """ 応答時間が latency_threshold を超えた場合も混雑とみなして減らす
+    """
+    controller: NetkeibaHostController = NetkeibaHostController(8, adaptive=True, latency_threshold=0.5)
+    request(controller, False, latency=0.1)
+    assert controller.limit == 4
+    # NOTE: 直前の減少から応答時間 (指数移動平均) が経過するまでは, 同じ混雑として再度減らさない
+    request(controller, False, latency=1.0)
+    assert controller.limit == 2
+
+
+def test_limit_is_fixed_without_adaptive() -> None:
+    """ adaptive が False の場合は, 失敗しても同時実行数を変えない
+    """
+    controller: NetkeibaHostController = NetkeibaHostController(8)
+    request(controller, True)
+    assert controller.limit == 8
+
+
+def test_circuit_opens_half_opens_and_closes() -> None:
+    """ 連続して失敗すると送信を停止し, 停止時間の経過後に1件だけ試験的に送信し, 成功すれば再開する
+    """
+    controller: NetkeibaHostController = NetkeibaHostController(2, failure_threshold=2, recovery_timeout=0.1)
+    request(controller, True)
+    assert not controller.is_open
+    request(controller, True)
+    assert controller.is_open
+    with pytest.raises(NetkeibaCircuitOpenError):
+        asyncio.run(controller.acquire())
+
+    # NOTE: half-open では1件だけ試験的な送信を許可する
+    time.sleep(0.1)
+    assert asyncio.run(controller.acquire())
+    with pytest.raises(NetkeibaCircuitOpenError):
+        asyncio.run(controller.acquire())
+    controller.release(0.0, False, probe=True)
+    assert not controller.is_open
+    assert not request(controller, False)
+
+
+def test_failed_probe_reopens_circuit() -> None:
+    """ 試験的な送信が失敗した場合は, 再度送信を停止する
+    """
+    controller: NetkeibaHostController = NetkeibaHostController(2, failure_threshold=1, recovery_timeout=0.1)
+    request(controller, True)
+    time.sleep(0.1)
+    assert request(controller, True)
+    assert controller.is_open
+    with pytest.raises(NetkeibaCircuitOpenError):
+        asyncio.run(controller.acquire())
+
+
+def test_client_stops_sending_to_failing_host(netkeiba_server: str) -> None:
+    """ NetkeibaClient は送信を停止したホストへ送信せずに失敗させ, 停止時間の経過後に再開する
+    """
+    FAILURES['202206050801'] = [503]
+    FAILURES['202206050802'] = [503]
+    with NetkeibaClient(max_attempts=1, failure_threshold=2, recovery_timeout=0.2) as client:
+        requests: NetkeibaRequests = NetkeibaRequests(client)
+        for race_id in [202206050801, 202206050802]:
+            assert not requests.get_results_by_list([ShutubaTableURL(race_id)])[0].is_success
+
+        result: NetkeibaResult = requests.get_results_by_list([ShutubaTableURL(202206050803)])[0]
+        assert isinstance(result.error, NetkeibaCircuitOpenError)
+        assert len(REQUEST_LOG) == 2
+
+        time.sleep(0.2)
+        assert requests.get_results_by_list([ShutubaTableURL(202206050803)])[0].is_success
+        assert requests.get_results_by_list([ShutubaTableURL(202206050804)])[0].is_success
+        assert len(REQUEST_LOG) == 4
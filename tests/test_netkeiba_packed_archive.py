@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+""" NetkeibaPackedArchive のテスト (追加・読み込み, 置き換え, 索引の拡張・再構築, 追記中の中断)
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper import ShutubaTableAPI
+from nkscraper.common import NetkeibaArchiveEntry, NetkeibaCategory, NetkeibaPackedArchive
+from nkscraper.url import ShutubaTableURL
+from nkscraper.utils import NKScraperException
+
+# tests
+from tests.conftest import load_fixture
+
+# build-in
+import os
+
+# OSS
+import pytest
+
+# for type declaration only
+import pathlib
+
+
+pytest.importorskip('zstandard')
+
+
+def create_body(netkeiba_id: int, version: int = 1) -> bytes:
+    """ ID ごとに異なる Webページを作成する
+    """
+    return f'<html><body><h1>{netkeiba_id}</h1><p>version {version}</p></body></html>'.encode('euc-jp')
+
+
+def test_append_and_get_entry(tmp_path: pathlib.Path) -> None:
+    """ 追加した Webページを (カテゴリー, ID) で読み込め, 開き直しても保持している
+    """
+    with NetkeibaPackedArchive(str(tmp_path)) as archive:
+        archive.append(NetkeibaCategory.SHUTUBA_TABLE, 202206050811, create_body(1), fetched_at=100.0)
+        archive.append(NetkeibaCategory.HORSE_INFO, 2019105219, create_body(2), fetched_at=200.0)
+        # NOTE: カテゴリーが異なれば同じIDでも別の Webページとして扱う
+        archive.append(NetkeibaCategory.RACE_RESULT, 202206050811, create_body(3), fetched_at=300.0)
+        assert len(archive) == 3
+
+    with NetkeibaPackedArchive(str(tmp_path)) as archive:
+        entry: NetkeibaArchiveEntry | None = archive.get_entry(NetkeibaCategory.SHUTUBA_TABLE, 202206050811)
+        assert entry is not None
+        assert entry.category == NetkeibaCategory.SHUTUBA_TABLE
+        assert entry.netkeiba_id == 202206050811
+        assert entry.body == create_body(1)
+        assert entry.fetched_at == 100.0
+        assert entry.url.url == ShutubaTableURL(202206050811).url
+        assert archive.load(ShutubaTableURL(202206050811)) == create_body(1)
+        assert (NetkeibaCategory.HORSE_INFO, 2019105219) in archive
+        assert archive.get_entry(NetkeibaCategory.RACE_RESULT, 202206050811).body == create_body(3)
+        assert archive.get_entry(NetkeibaCategory.HORSE_INFO, 2019105220) is None
+        with pytest.raises(FileNotFoundError):
+            archive.load(ShutubaTableURL(202206050812))
+
+
+def test_append_replaces_entry(tmp_path: pathlib.Path) -> None:
+    """ 同じ (カテゴリー, ID) を追加した場合は置き換え, 走査では古い Webページを読み飛ばす
+    """
+    with NetkeibaPackedArchive(str(tmp_path)) as archive:
+        archive.append(NetkeibaCategory.HORSE_INFO, 2019105219, create_body(2019105219, 1))
+        archive.append(NetkeibaCategory.HORSE_INFO, 2019105220, create_body(2019105220, 1))
+        archive.append(NetkeibaCategory.HORSE_INFO, 2019105219, create_body(2019105219, 2))
+
+        assert len(archive) == 2
+        assert archive.get_entry(NetkeibaCategory.HORSE_INFO, 2019105219).body == create_body(2019105219, 2)
+        assert [(entry.netkeiba_id, entry.body) for entry in archive.iter_entries()] == [
+            (2019105220, create_body(2019105220, 1)),
+            (2019105219, create_body(2019105219, 2)),
+        ]
+        assert list(archive.iter_entries(NetkeibaCategory.SHUTUBA_TABLE)) == []
+
+
+def test_index_grows(tmp_path: pathlib.Path) -> None:
+    """ 負荷率が上限を超えると索引のスロット数を倍にし, 登録済みの Webページも引き続き読み込める
+    """
+    index_path: pathlib.Path = tmp_path / NetkeibaPackedArchive.INDEX_FILE
+    horse_id_list: list[int] = [2019100000 + i for i in range(2000)]
+    with NetkeibaPackedArchive(str(tmp_path)) as archive:
+        initial_size: int = index_path.stat().st_size
+        for horse_id in horse_id_list:
+            archive.append(NetkeibaCategory.HORSE_INFO, horse_id, create_body(horse_id))
+        assert len(archive) == len(horse_id_list)
+        assert index_path.stat().st_size > initial_size * 2
+        assert all(archive.get_entry(NetkeibaCategory.HORSE_INFO, horse_id).body == create_body(horse_id)
+                   for horse_id in horse_id_list)
+
+
+def test_rebuild_index_after_deleting_index(tmp_path: pathlib.Path) -> None:
+    """ 索引ファイルを削除しても, データファイルから索引を作り直す (置き換えた Webページは新しい方を使用する)
+    """
+    with NetkeibaPackedArchive(str(tmp_path)) as archive:
+        for race_id in range(202206050801, 202206050813):
+            archive.append(NetkeibaCategory.SHUTUBA_TABLE, race_id, create_body(race_id))
+        archive.append(NetkeibaCategory.SHUTUBA_TABLE, 202206050811, create_body(202206050811, 2))
+    os.remove(tmp_path / NetkeibaPackedArchive.INDEX_FILE)
+
+    with NetkeibaPackedArchive(str(tmp_path)) as archive:
+        assert len(archive) == 12
+        assert archive.get_entry(NetkeibaCategory.SHUTUBA_TABLE, 202206050801).body == create_body(202206050801)
+        assert archive.get_entry(NetkeibaCategory.SHUTUBA_TABLE, 202206050811).body == create_body(202206050811, 2)
+        assert len(list(archive.iter_entries())) == 12
+
+
+@pytest.mark.parametrize('delete_index', [False, True])
+def test_truncate_torn_write(tmp_path: pathlib.Path, delete_index: bool) -> None:
+    """ 追記中に中断して途切れたレコードは, 開き直した時点で切り詰め, 以降の追記に影響しない
+    """
+    data_path: pathlib.Path = tmp_path / NetkeibaPackedArchive.DATA_FILE
+    with NetkeibaPackedArchive(str(tmp_path)) as archive:
+        archive.append(NetkeibaCategory.SHUTUBA_TABLE, 202206050811, create_body(1))
+        archive.append(NetkeibaCategory.SHUTUBA_TABLE, 202206050812, create_body(2))
+    data_size: int = data_path.stat().st_size
+
+    # NOTE: 3件目のレコードを途中まで書き込んだ状態を再現する
+    with NetkeibaPackedArchive(str(tmp_path / 'other')) as other:
+        other.append(NetkeibaCategory.SHUTUBA_TABLE, 202206050813, create_body(3))
+    torn_record: bytes = (tmp_path / 'other' / NetkeibaPackedArchive.DATA_FILE).read_bytes()
+    with open(data_path, 'ab') as data_file:
+        data_file.write(torn_record[:len(torn_record) // 2])
+    if delete_index:
+        os.remove(tmp_path / NetkeibaPackedArchive.INDEX_FILE)
+
+    with NetkeibaPackedArchive(str(tmp_path)) as archive:
+        assert data_path.stat().st_size == data_size
+        assert len(archive) == 2
+        assert archive.get_entry(NetkeibaCategory.SHUTUBA_TABLE, 202206050813) is None
+        archive.append(NetkeibaCategory.SHUTUBA_TABLE, 202206050813, create_body(3))
+
+    with NetkeibaPackedArchive(str(tmp_path)) as archive:
+        assert [entry.body for entry in archive.iter_entries()] == [create_body(1), create_body(2), create_body(3)]
+
+
+def test_create_by_archive(tmp_path: pathlib.Path) -> None:
+    """ アーカイブからスクレイピングAPIを作成し, 存在しない場合は例外を送出する
+    """
+    with NetkeibaPackedArchive(str(tmp_path)) as archive:
+        archive.append(NetkeibaCategory.SHUTUBA_TABLE, 202206050811, load_fixture('shutuba_table.html'))
+        assert ShutubaTableAPI.create_by_archive(202206050811, archive).get_num_horse() > 0
+        with pytest.raises(NKScraperException, match='アーカイブに存在しません. 202206050812'):
+            ShutubaTableAPI.create_by_archive(202206050812, archive)
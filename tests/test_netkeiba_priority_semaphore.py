@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+""" NetkeibaPrioritySemaphore のテスト (優先度順の割り当て, 待機中の取得要求の数)
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.common import NetkeibaPrioritySemaphore
+
+# build-in
+import asyncio
+
+
+def test_waiters_are_woken_in_priority_order() -> None:
+    """ 待機中の取得要求は優先度の値が小さい順, 同じ優先度は到着順に割り当てる
+    """
+    async def run() -> list[str]:
+        semaphore: NetkeibaPrioritySemaphore = NetkeibaPrioritySemaphore(1)
+        await semaphore.acquire()
+        order: list[str] = []
+
+        async def worker(name: str, priority: int) -> None:
+            await semaphore.acquire(priority)
+            order.append(name)
+            semaphore.release()
+
+        tasks: list[asyncio.Task] = [
+            asyncio.create_task(worker(name, priority))
+            for name, priority in [('low', 2), ('high-1', 0), ('normal', 1), ('high-2', 0)]
+        ]
+        await asyncio.sleep(0)
+        semaphore.release()
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(run()) == ['high-1', 'high-2', 'normal', 'low']
+
+
+def test_num_waiters_counts_live_waiters() -> None:
+    """ 待機中の取得要求の数は, 待機開始で増え, キャンセル・割り当てで減る
+    """
+    async def run() -> None:
+        semaphore: NetkeibaPrioritySemaphore = NetkeibaPrioritySemaphore(1)
+        await semaphore.acquire()
+        tasks: list[asyncio.Task] = [asyncio.create_task(semaphore.acquire()) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert semaphore.num_waiters == 3
+
+        tasks[0].cancel()
+        await asyncio.gather(tasks[0], return_exceptions=True)
+        assert semaphore.num_waiters == 2
+
+        # NOTE: キャンセル済みの取得要求を読み飛ばし, 次の取得要求に割り当てる
+        semaphore.release()
+        await tasks[1]
+        assert semaphore.num_waiters == 1
+        assert semaphore.in_use == 1
+
+        semaphore.limit = 2
+        await tasks[2]
+        assert semaphore.num_waiters == 0
+        assert semaphore.in_use == 2
+
+    asyncio.run(run())
+
+
+def test_cancel_after_wake_passes_slot_on() -> None:
+    """ 割り当て後, 再開前にキャンセルされた取得要求は, 次の取得要求に譲る
+    """
+    async def run() -> None:
+        semaphore: NetkeibaPrioritySemaphore = NetkeibaPrioritySemaphore(1)
+        await semaphore.acquire()
+        first: asyncio.Task = asyncio.create_task(semaphore.acquire())
+        second: asyncio.Task = asyncio.create_task(semaphore.acquire())
+        await asyncio.sleep(0)
+
+        semaphore.release()
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        await second
+        assert first.cancelled()
+        assert semaphore.num_waiters == 0
+        assert semaphore.in_use == 1
+
+        # NOTE: 待機中の取得要求がなければ, 空きがある限り待機せずに取得する
+        semaphore.release()
+        await asyncio.wait_for(semaphore.acquire(), 0.1)
+
+    asyncio.run(run())
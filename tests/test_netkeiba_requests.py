@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+""" NetkeibaRequests のテスト
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper.common import NetkeibaArchive, NetkeibaArchiveMode, NetkeibaCache, NetkeibaClient
+from nkscraper import HorseInfoAPI, ShutubaTableAPI
+from nkscraper.common import NetkeibaContents, NetkeibaRequests, NetkeibaResult, NetkeibaParser, NetkeibaSnapshot
+from nkscraper.common import NetkeibaLxmlExtractor
+from nkscraper.url import ShutubaTableURL, HorseInfoURL
+
+# build-in
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+
+# tests
+from tests.conftest import load_fixture
+
+# OSS
+import pytest
+
+# for type declaration only
+from concurrent.futures import Executor
+from nkscraper.common import NetkeibaExtractor
+from typing import Any
+import pathlib
+
+
+def test_unavailable_page_is_not_persisted(netkeiba_server: str, tmp_path: pathlib.Path) -> None:
+    """ 取得対象の内容が掲載されていない Webページは, キャッシュ・アーカイブに保存しない
+    """
+    cache: NetkeibaCache = NetkeibaCache(str(tmp_path / 'cache'))
+    archive: NetkeibaArchive = NetkeibaArchive(str(tmp_path / 'archive'), NetkeibaArchiveMode.RECORD)
+    url: ShutubaTableURL = ShutubaTableURL(202206050899)
+    with NetkeibaClient(cache=cache, archive=archive) as client:
+        result: NetkeibaResult = NetkeibaRequests(client).get_results_by_list([url])[0]
+
+    assert result.is_unavailable
+    assert cache.load(url) is None
+    assert not any(path.is_file() for path in (tmp_path / 'archive').rglob('*'))
+
+
+@pytest.mark.parametrize('lazy_parse', [False, True])
+def test_eager_parse_drops_html_byte(netkeiba_server: str, lazy_parse: bool) -> None:
+    """ 取得時に解析した場合は soup のみを保持し, 遅延解析の場合はバイト列を保持して release で解放できる
+    """
+    with NetkeibaClient(lazy_parse=lazy_parse) as client:
+        contents: NetkeibaContents = NetkeibaRequests(client).get(ShutubaTableURL(202206050811))
+
+    assert contents.soup is not None
+    assert (contents.html_byte is not None) == lazy_parse
+    contents.release()
+    assert contents.is_parsed != lazy_parse
+
+
+def to_values(snapshot: NetkeibaSnapshot) -> list[dict[str, Any]]:
+    """ スナップショットの全ての記録を辞書に変換する (例外は型名)
+    """
+    return [
+        {field: type(value).__name__ if isinstance(value, BaseException) else value
+         for field, value in record.to_dict().items()}
+        for record in (snapshot.header, *snapshot.records)
+    ]
+
+
+@pytest.mark.parametrize('executor_type', ['none', 'thread', 'process'])
+@pytest.mark.parametrize('extractor', [None, NetkeibaLxmlExtractor()], ids=['bs4', 'lxml'])
+def test_snapshot_in_executor(netkeiba_server: str, monkeypatch: pytest.MonkeyPatch,
+                              executor_type: str, extractor: NetkeibaExtractor | None) -> None:
+    """ api_class を指定すると, parse_executor で解析して値を取り出したスナップショットを返す
+    (ProcessPoolExecutor の場合は, 呼び出し元のプロセスで解析しない)
+    """
+    url_list: list[HorseInfoURL] = [HorseInfoURL(2019105210 + index) for index in range(4)]
+    expected: dict[str, list[dict[str, Any]]] = {
+        url.url: to_values(HorseInfoAPI(NetkeibaContents(url, html_byte=load_fixture('horse_info.html'))).snapshot())
+        for url in url_list
+    }
+
+    parsed: list[bytes] = []
+    parse = NetkeibaParser.parse
+    monkeypatch.setattr(NetkeibaParser, 'parse',
+                        lambda html_byte, *args: parsed.append(html_byte) or parse(html_byte, *args))
+
+    executor: Executor | None = None
+    if executor_type == 'thread':
+        executor = ThreadPoolExecutor(2)
+    elif executor_type == 'process':
+        # NOTE: spawn で起動し, 子プロセスには monkeypatch を引き継がない
+        executor = ProcessPoolExecutor(2, mp_context=multiprocessing.get_context('spawn'))
+    try:
+        with NetkeibaClient(parse_executor=executor, extractor=extractor) as client:
+            results: list[NetkeibaResult] = list(
+                NetkeibaRequests(client).iter_results_by_list(url_list, chunk_size=2, api_class=HorseInfoAPI))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    assert len(results) == len(url_list)
+    assert all(result.contents is None and result.snapshot is not None for result in results)
+    assert all(to_values(result.snapshot) == expected[result.url.url] for result in results)  # type: ignore[arg-type]
+    assert (len(parsed) == 0) == (executor_type == 'process')
+
+
+def test_process_pool_does_not_parse_contents(netkeiba_server: str) -> None:
+    """ api_class を指定しない取得では, ProcessPoolExecutor を使用せず, 取得時には解析しない
+    """
+    with ProcessPoolExecutor(1) as executor, NetkeibaClient(parse_executor=executor) as client:
+        contents: NetkeibaContents = NetkeibaRequests(client).get(ShutubaTableURL(202206050811))
+
+    assert not contents.is_parsed
+    assert contents.html_byte is not None
+
+
+@pytest.mark.parametrize('extractor', [None, NetkeibaLxmlExtractor()])
+def test_stream_parse(netkeiba_server: str, extractor: NetkeibaExtractor | None) -> None:
+    """ 受信しながら逐次解析した場合も, バイト列から解析した場合と同じ値を取得する
+    """
+    url: ShutubaTableURL = ShutubaTableURL(202206050811)
+    with NetkeibaClient(extractor=extractor) as client:
+        expected: ShutubaTableAPI = ShutubaTableAPI(NetkeibaRequests(client).get(url))
+    with NetkeibaClient(extractor=extractor, stream_parse=True) as client:
+        contents: NetkeibaContents = NetkeibaRequests(client).get(url)
+        actual: ShutubaTableAPI = ShutubaTableAPI(contents)
+
+    # NOTE: 逐次解析した場合はバイト列を保持せず, lxml のルート要素のみを保持する
+    assert contents.html_byte is None
+    assert contents.document is not None
+    assert actual.get_num_horse() == expected.get_num_horse() > 0
+    assert actual.scrape_race_name() == expected.scrape_race_name()
+    assert [actual.scrape_horse_id(index) for index in range(actual.get_num_horse())] == \
+        [expected.scrape_horse_id(index) for index in range(expected.get_num_horse())]
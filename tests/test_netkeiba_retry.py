@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+""" NetkeibaRequests の再試行のテスト (再試行する失敗・しない失敗, 指数バックオフ, 最大試行回数)
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper import ShutubaTableAPI
+from nkscraper.common import NetkeibaClient, NetkeibaRequests, NetkeibaResult
+from nkscraper.url import ShutubaTableURL
+
+# tests
+from tests.conftest import FAILURES, REQUEST_LOG
+
+# build-in
+import random
+
+# OSS
+import pytest
+
+
+RACE_ID: int = 202206050811
+
+
+def get_result(client: NetkeibaClient, race_id: int = RACE_ID) -> NetkeibaResult:
+    """ 出馬表を取得する
+    """
+    return NetkeibaRequests(client).get_results_by_list([ShutubaTableURL(race_id)])[0]
+
+
+@pytest.mark.parametrize('statuses', [[503], [429], [500, 502], [408, 504]])
+def test_retryable_status_is_retried(netkeiba_server: str, statuses: list[int]) -> None:
+    """ 混雑・障害 (408, 429, 5xx) の失敗は再試行し, 成功した Webページを返す
+    """
+    FAILURES[str(RACE_ID)] = list(statuses)
+    with NetkeibaClient(max_attempts=3, backoff_base=0.01) as client:
+        result: NetkeibaResult = get_result(client)
+
+    assert result.is_success
+    assert result.attempts == len(statuses) + 1
+    assert len(REQUEST_LOG) == len(statuses) + 1
+
+
+@pytest.mark.parametrize('status', [400, 403, 404])
+def test_fatal_status_is_not_retried(netkeiba_server: str, status: int) -> None:
+    """ 混雑・障害以外 (4xx) の失敗は再試行しない
+    """
+    FAILURES[str(RACE_ID)] = [status]
+    with NetkeibaClient(max_attempts=3, backoff_base=0.01) as client:
+        result: NetkeibaResult = get_result(client)
+
+    assert not result.is_success
+    assert result.attempts == 1
+    assert len(REQUEST_LOG) == 1
+
+
+def test_give_up_after_max_attempts(netkeiba_server: str) -> None:
+    """ 最大試行回数まで失敗した場合は, 最後の例外を保持した結果を返す
+    """
+    FAILURES[str(RACE_ID)] = [503] * 5
+    with NetkeibaClient(max_attempts=3, backoff_base=0.01) as client:
+        result: NetkeibaResult = get_result(client)
+
+    assert not result.is_success
+    assert result.error is not None
+    assert result.attempts == 3
+    assert len(REQUEST_LOG) == 3
+
+
+def test_backoff_grows_exponentially(monkeypatch: pytest.MonkeyPatch) -> None:
+    """ 再試行までの待機時間の上限は試行ごとに2倍になり, backoff_max を超えない
+    """
+    monkeypatch.setattr(random, 'uniform', lambda low, high: high)
+    client: NetkeibaClient = NetkeibaClient(backoff_base=0.5, backoff_max=3.0)
+    assert [client.backoff(attempt) for attempt in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_backoff_is_jittered() -> None:
+    """ 待機時間は 0 ~ 上限の範囲で一様にばらつく (Full Jitter)
+    """
+    client: NetkeibaClient = NetkeibaClient(backoff_base=1.0, backoff_max=10.0)
+    delays: list[float] = [client.backoff(3) for _ in range(200)]
+    assert all(0.0 <= delay <= 4.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_retry_waits_for_backoff(netkeiba_server: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """ 再試行は待機時間 (指数バックオフ) の経過後に送信する
+    """
+    monkeypatch.setattr(random, 'uniform', lambda low, high: high)
+    FAILURES[str(RACE_ID)] = [503, 503]
+    with NetkeibaClient(max_attempts=3, backoff_base=0.1) as client:
+        assert get_result(client).is_success
+
+    intervals: list[float] = [later[1] - earlier[1] for earlier, later in zip(REQUEST_LOG, REQUEST_LOG[1:])]
+    assert intervals[0] >= 0.1
+    assert intervals[1] >= 0.2
+
+
+def test_create_by_list_keeps_successes(netkeiba_server: str) -> None:
+    """ 一部のURLが失敗しても, 成功した Webページから作成したAPIを返す
+    """
+    FAILURES['202206050801'] = [404]
+    FAILURES['202206050802'] = [503] * 5
+    race_id_list: list[int] = [202206050801, 202206050802, 202206050803, 202206050804]
+    with NetkeibaClient(max_attempts=2, backoff_base=0.01) as client:
+        api_list: list[ShutubaTableAPI] = ShutubaTableAPI.create_by_list(race_id_list, client)
+
+    assert sorted(api.scrape_race_id() for api in api_list) == [202206050803, 202206050804]
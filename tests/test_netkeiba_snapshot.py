@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+""" NetkeibaSnapshot のテスト (snapshot による解析結果の解放)
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper import ShutubaTableAPI
+from nkscraper.common import NetkeibaClient, NetkeibaContents, NetkeibaLxmlExtractor, NetkeibaParser, NetkeibaSnapshot
+from nkscraper.common import NetkeibaRequests
+from nkscraper.url import ShutubaTableURL
+
+# tests
+from tests.conftest import load_fixture
+from tests.test_extractor_conformance import CASES
+
+# build-in
+import gc
+import weakref
+
+# OSS
+import pytest
+
+# for type declaration only
+from nkscraper.common import NetkeibaExtractor
+from nkscraper.url import NetkeibaURL
+from typing import Any, Callable, Iterator
+
+
+@pytest.fixture
+def gc_disabled() -> Iterator[None]:
+    """ ガベージコレクションを停止する (参照カウントのみで解放されることを確認する)
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+@pytest.mark.parametrize('extractor', [None, NetkeibaLxmlExtractor()], ids=['bs4', 'lxml'])
+@pytest.mark.parametrize('name, api_class, create_url, num_method', CASES, ids=[case[0] for case in CASES])
+def test_snapshot_releases_contents(gc_disabled: None, name: str, api_class: type,
+                                    create_url: Callable[[], NetkeibaURL], num_method: str,
+                                    extractor: NetkeibaExtractor | None) -> None:
+    """ snapshot(release=True) の後, NetkeibaContents と BeautifulSoup の木はガベージコレクションを待たずに解放される
+    """
+    contents: NetkeibaContents = NetkeibaContents(create_url(), html_byte=load_fixture(name), extractor=extractor)
+    api: Any = api_class(contents)
+    references: list[weakref.ref[Any]] = [
+        weakref.ref(contents), weakref.ref(contents.soup), weakref.ref(contents.soup.find('table'))]
+    del contents
+
+    snapshot: NetkeibaSnapshot = api.snapshot()
+    assert [reference() is None for reference in references] == [True, True, True]
+    assert getattr(snapshot, num_method)() > 0
+
+
+def test_snapshot_releases_eager_contents(gc_disabled: None) -> None:
+    """ 取得時に解析した (soup のみを保持する) NetkeibaContents も, snapshot の後に解放される
+    """
+    url: ShutubaTableURL = ShutubaTableURL(202206050811)
+    contents: NetkeibaContents = NetkeibaContents(url, NetkeibaParser.parse(load_fixture('shutuba_table.html'), url.category))
+    api: ShutubaTableAPI = ShutubaTableAPI(contents)
+    references: list[weakref.ref[Any]] = [weakref.ref(contents.soup), weakref.ref(contents.soup.find('table'))]
+    del contents
+
+    api.snapshot()
+    assert [reference() is None for reference in references] == [True, True]
+
+
+@pytest.mark.parametrize('lazy_parse', [False, True])
+def test_shared_contents_survive_snapshot(netkeiba_server: str, gc_disabled: None, lazy_parse: bool) -> None:
+    """ 重複したURLで NetkeibaContents を共有するAPIは, 他のAPIの snapshot の後も表の要素を参照できる
+    (全てのAPIが snapshot した時点で解放される)
+    """
+    url: ShutubaTableURL = ShutubaTableURL(202206050811)
+    with NetkeibaClient(lazy_parse=lazy_parse) as client:
+        contents_list: list[NetkeibaContents] = NetkeibaRequests(client).get_by_list([url, url])
+    assert contents_list[0] is contents_list[1]
+    api_list: list[ShutubaTableAPI] = [ShutubaTableAPI(contents) for contents in contents_list]
+    expected: list[dict[str, Any]] = api_list[1].to_records()
+    soup_reference: weakref.ref[Any] = weakref.ref(contents_list[0].soup)
+    del contents_list
+
+    first: NetkeibaSnapshot = api_list[0].snapshot()
+    assert api_list[1].to_records() == expected
+    assert soup_reference() is not None
+
+    second: NetkeibaSnapshot = api_list[1].snapshot()
+    del api_list
+    assert soup_reference() is None
+    assert [record.to_dict() for record in first] == [record.to_dict() for record in second]
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+""" 逐次取得 (iter_by_list, aiter_by_list) のテスト (取得枠, 返却順, 同時に保持する解析結果の上限)
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper import HorseInfoAPI, ShutubaTableAPI
+from nkscraper.common import NetkeibaClient, NetkeibaContents
+
+# tests
+from tests.conftest import DELAYS, REQUEST_LOG
+
+# build-in
+import asyncio
+import gc
+import time
+
+
+RACE_ID_LIST: list[int] = [202206050801 + i for i in range(8)]
+HORSE_ID_LIST: list[int] = [2019105201 + i for i in range(8)]
+
+
+def count_contents() -> int:
+    """ 生存している NetkeibaContents の数を数える
+    """
+    gc.collect()
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, NetkeibaContents))
+
+
+def test_iter_by_list_limits_in_flight_requests(netkeiba_server: str) -> None:
+    """ 取得中・取得済みで未返却の Webページは chunk_size 件までで, 1件返却するごとに次の取得を開始する
+    """
+    for race_id in RACE_ID_LIST:
+        DELAYS[str(race_id)] = [0.05]
+    with NetkeibaClient() as client:
+        num_requests: list[int] = []
+        for api in ShutubaTableAPI.iter_by_list(RACE_ID_LIST, chunk_size=3, client=client):
+            # NOTE: 利用側の処理が遅くても, 返却していない分を超えて取得を開始しない
+            time.sleep(0.1)
+            num_requests.append(len(REQUEST_LOG))
+
+    assert len(num_requests) == len(RACE_ID_LIST)
+    assert num_requests[0] == 3
+    assert all(num <= 3 + index for index, num in enumerate(num_requests))
+    assert num_requests[-1] == len(RACE_ID_LIST)
+
+
+def test_iter_by_list_yields_in_completion_order(netkeiba_server: str) -> None:
+    """ 取得が完了した順に返すため, 遅い Webページの取得中も他のAPIを返す
+    """
+    DELAYS[str(RACE_ID_LIST[0])] = [0.3]
+    with NetkeibaClient() as client:
+        race_id_list: list[int] = [
+            api.scrape_race_id() for api in ShutubaTableAPI.iter_by_list(RACE_ID_LIST, chunk_size=4, client=client)
+        ]
+
+    assert sorted(race_id_list) == RACE_ID_LIST
+    assert race_id_list[-1] == RACE_ID_LIST[0]
+
+
+def test_aiter_by_list_yields_in_completion_order(netkeiba_server: str) -> None:
+    """ 非同期の逐次取得も, 取得が完了した順に返す
+    """
+    async def run() -> list[int]:
+        async with NetkeibaClient() as client:
+            return [api.scrape_race_id()
+                    async for api in ShutubaTableAPI.aiter_by_list(RACE_ID_LIST, chunk_size=4, client=client)]
+
+    DELAYS[str(RACE_ID_LIST[0])] = [0.3]
+    race_id_list: list[int] = asyncio.run(run())
+    assert sorted(race_id_list) == RACE_ID_LIST
+    assert race_id_list[-1] == RACE_ID_LIST[0]
+
+
+def test_aiter_by_list_bounds_live_contents(netkeiba_server: str) -> None:
+    """ 返却済みのAPIを破棄すれば, 同時に保持する解析結果は chunk_size 件 + 返却中の1件までに収まる
+    """
+    async def run() -> list[int]:
+        num_contents: list[int] = []
+        async with NetkeibaClient() as client:
+            async for api in HorseInfoAPI.aiter_by_list(HORSE_ID_LIST, chunk_size=2, client=client):
+                assert api.get_num_race_result() > 0
+                # NOTE: 利用側の処理中に, 取得中の Webページの取得・解析を終わらせる
+                await asyncio.sleep(0.1)
+                num_contents.append(count_contents())
+                del api
+        return num_contents
+
+    num_contents: list[int] = asyncio.run(run())
+    assert len(num_contents) == len(HORSE_ID_LIST)
+    assert max(num_contents) <= 2 + 1
+    assert count_contents() == 0
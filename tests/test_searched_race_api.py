@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+""" SearchedRaceAPI のテスト
+"""
+
+from __future__ import annotations
+
+# nkscraper
+from nkscraper import SearchedRaceAPI
+from nkscraper.common import NetkeibaClient, NetkeibaFieldID
+from nkscraper.url import SearchedRaceURL
+
+# build-in
+import asyncio
+
+
+def create_url_list() -> list[SearchedRaceURL]:
+    """ 検索条件の異なるレース検索結果URL配列を作成する
+    """
+    return [
+        SearchedRaceURL('有馬記念', NetkeibaFieldID.NAKAYAMA, 2500, '芝', year, 1, year, 12)
+        for year in range(2018, 2023)
+    ]
+
+
+def test_iter_by_list(netkeiba_server: str) -> None:
+    """ 検索条件ごとにレース検索結果スクレイピングAPIを逐次作成する
+    """
+    with NetkeibaClient() as client:
+        api_list: list[SearchedRaceAPI] = list(SearchedRaceAPI.iter_by_list(create_url_list(), chunk_size=2,
+                                                                             client=client))
+    assert len(api_list) == 5
+    assert all(api.get_num_race() > 0 for api in api_list)
+
+
+def test_aiter_by_list(netkeiba_server: str) -> None:
+    """ 検索条件ごとにレース検索結果スクレイピングAPIを非同期に逐次作成する
+    """
+    async def run() -> list[SearchedRaceAPI]:
+        async with NetkeibaClient() as client:
+            return [api async for api in SearchedRaceAPI.aiter_by_list(create_url_list(), chunk_size=2, client=client)]
+
+    api_list: list[SearchedRaceAPI] = asyncio.run(run())
+    assert len(api_list) == 5
+    assert all(api.get_num_race() > 0 for api in api_list)
+
+
+def test_acreate_by_list(netkeiba_server: str) -> None:
+    """ 検索条件ごとにレース検索結果スクレイピングAPIを非同期に作成する
+    """
+    async def run() -> list[SearchedRaceAPI]:
+        async with NetkeibaClient() as client:
+            return await SearchedRaceAPI.acreate_by_list(create_url_list(), client)
+
+    api_list: list[SearchedRaceAPI] = asyncio.run(run())
+    assert len(api_list) == 5
+    assert all(api.get_num_race() > 0 for api in api_list)